@@ -2,6 +2,7 @@
 Chapter 4 domain-model exports.
 """
 
+from .compiled_domain import CompiledDomain, compile_domain
 from .masking import (
 	render_generated_domain_text,
 	strip_methods_from_domain_text,
@@ -16,7 +17,9 @@ from .query_sequence import (
 )
 
 __all__ = [
+	"CompiledDomain",
 	"DEFAULT_TEMPORAL_SPEC_DATASET_PATH",
+	"compile_domain",
 	"infer_query_domain",
 	"load_query_sequence_records",
 	"load_temporal_specification_dataset",
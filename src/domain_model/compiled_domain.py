@@ -0,0 +1,304 @@
+"""
+Immutable per-domain index of type hierarchy, signatures and action semantics.
+
+Rendering, translation, validation and planning all need the same derived views
+of a parsed HDDL domain: the child-to-parent type map, the argument type
+signature of every predicate, action and task, the typed parameters of domain
+methods, and the parsed precondition/effect semantics of each action.
+`compile_domain` builds one `CompiledDomain` per parsed domain object and hands
+the same instance to every subsystem. Each table is computed on first use and
+then shared.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+from utils.hddl_condition_parser import HDDLConditionParser, ParsedActionSchema
+
+
+COMPILED_DOMAIN_CACHE_SIZE = 32
+
+TypeSignature = Tuple[str, ...]
+
+
+def parameter_type_name(parameter: Any) -> str:
+	"""Return the declared type of `?x - type` or `?x:type`, defaulting to `object`."""
+
+	text = str(parameter or "").strip()
+	if ":" in text:
+		return text.split(":", 1)[1].strip() or "object"
+	if "-" in text:
+		return text.split("-", 1)[1].strip() or "object"
+	return "object"
+
+
+def _symbol_token(value: Any) -> str:
+	return str(value or "").strip()
+
+
+def parameter_name_type_pairs(parameter: Any) -> Tuple[Tuple[str, str], ...]:
+	"""Split one parameter declaration into `(variable, type)` pairs."""
+
+	text = str(parameter or "").strip()
+	if not text:
+		return ()
+	if " - " in text:
+		raw_names, raw_type = text.split(" - ", 1)
+		type_name = raw_type.strip() or "object"
+		return tuple(
+			(_symbol_token(name), type_name)
+			for name in raw_names.split()
+			if _symbol_token(name)
+		)
+	if ":" in text:
+		raw_name, raw_type = text.split(":", 1)
+		name = _symbol_token(raw_name)
+		return ((name, raw_type.strip() or "object"),) if name else ()
+	name = _symbol_token(text)
+	return ((name, "object"),) if name else ()
+
+
+def build_type_parent_map(type_tokens: Any) -> Dict[str, Optional[str]]:
+	"""Build a child-to-parent type map from HDDL `:types` tokens."""
+
+	tokens = [
+		token.strip()
+		for token in (type_tokens or [])
+		if token and token.strip()
+	]
+	if not tokens:
+		return {"object": None}
+
+	parent_map: Dict[str, Optional[str]] = {}
+	pending_children: List[str] = []
+	index = 0
+	while index < len(tokens):
+		token = tokens[index]
+		if token == "-":
+			if not pending_children or index + 1 >= len(tokens):
+				raise ValueError("Malformed HDDL :types declaration (dangling '-').")
+			parent_type = tokens[index + 1]
+			for child_type in pending_children:
+				previous = parent_map.get(child_type)
+				if previous is not None and previous != parent_type:
+					raise ValueError(
+						f"Type '{child_type}' has conflicting parents "
+						f"('{previous}' vs '{parent_type}').",
+					)
+				parent_map[child_type] = parent_type
+			pending_children = []
+			index += 2
+			continue
+
+		pending_children.append(token)
+		index += 1
+
+	for child_type in pending_children:
+		parent_map.setdefault(child_type, "object")
+
+	parent_map["object"] = None
+	changed = True
+	while changed:
+		changed = False
+		for parent_type in list(parent_map.values()):
+			if parent_type is None or parent_type in parent_map:
+				continue
+			parent_map[parent_type] = "object" if parent_type != "object" else None
+			changed = True
+
+	for type_name in list(parent_map.keys()):
+		if type_name == "object":
+			parent_map[type_name] = None
+			continue
+		if parent_map[type_name] == type_name:
+			raise ValueError(f"Type '{type_name}' cannot inherit from itself.")
+
+		seen = {type_name}
+		cursor = parent_map[type_name]
+		while cursor is not None:
+			if cursor in seen:
+				raise ValueError(f"Cyclic type hierarchy detected at '{type_name}'.")
+			seen.add(cursor)
+			cursor = parent_map.get(cursor)
+
+	return parent_map
+
+
+def _signature_map(symbols: Any) -> Mapping[str, TypeSignature]:
+	mapping: Dict[str, TypeSignature] = {}
+	for symbol in symbols or ():
+		name = str(getattr(symbol, "name", "") or "").strip()
+		if not name:
+			continue
+		mapping[name] = tuple(
+			parameter_type_name(parameter)
+			for parameter in (getattr(symbol, "parameters", ()) or ())
+		)
+	return MappingProxyType(mapping)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledDomain:
+	"""Derived, read-only views of one parsed HDDL domain.
+
+	Signature and semantics maps are keyed by the declared (stripped) symbol
+	name; callers add their own alias spellings. Tables are computed lazily and
+	cached on the instance, so a domain whose `:types` block is malformed only
+	fails when its type hierarchy is requested.
+	"""
+
+	domain: Any
+
+	@cached_property
+	def type_parent_map(self) -> Mapping[str, Optional[str]]:
+		return MappingProxyType(build_type_parent_map(getattr(self.domain, "types", [])))
+
+	@cached_property
+	def type_names(self) -> FrozenSet[str]:
+		return frozenset(self.type_parent_map)
+
+	@cached_property
+	def type_ancestors(self) -> Mapping[str, FrozenSet[str]]:
+		"""Subtype closure: every declared type mapped to itself and all its ancestors."""
+
+		closure: Dict[str, FrozenSet[str]] = {}
+		for type_name in self.type_parent_map:
+			chain = [type_name]
+			cursor = self.type_parent_map.get(type_name)
+			while cursor is not None and cursor not in chain:
+				chain.append(cursor)
+				cursor = self.type_parent_map.get(cursor)
+			closure[type_name] = frozenset(chain)
+		return MappingProxyType(closure)
+
+	def is_subtype(self, candidate_type: str, expected_type: str) -> bool:
+		"""Return whether `candidate_type` equals or inherits from `expected_type`."""
+
+		if candidate_type == expected_type:
+			return True
+		ancestors = self.type_ancestors.get(candidate_type)
+		return (
+			ancestors is not None
+			and expected_type in self.type_parent_map
+			and expected_type in ancestors
+		)
+
+	@cached_property
+	def predicate_types(self) -> Mapping[str, TypeSignature]:
+		return _signature_map(getattr(self.domain, "predicates", ()))
+
+	@cached_property
+	def action_types(self) -> Mapping[str, TypeSignature]:
+		return _signature_map(getattr(self.domain, "actions", ()))
+
+	@cached_property
+	def task_types(self) -> Mapping[str, TypeSignature]:
+		return _signature_map(getattr(self.domain, "tasks", ()))
+
+	@cached_property
+	def method_parameter_types(self) -> Mapping[str, Mapping[str, str]]:
+		mapping: Dict[str, Mapping[str, str]] = {}
+		for method in getattr(self.domain, "methods", ()) or ():
+			method_name = str(getattr(method, "name", "") or "").strip()
+			if not method_name:
+				continue
+			typed_parameters: Dict[str, str] = {}
+			for parameter in getattr(method, "parameters", ()) or ():
+				for variable_name, type_name in parameter_name_type_pairs(parameter):
+					typed_parameters[variable_name] = type_name
+			mapping[method_name] = MappingProxyType(typed_parameters)
+		return MappingProxyType(mapping)
+
+	@cached_property
+	def action_parse_results(self) -> Tuple[Union[ParsedActionSchema, Exception], ...]:
+		"""`HDDLConditionParser.parse_action` result or raised error, per domain action."""
+
+		parser = HDDLConditionParser()
+		results: List[Union[ParsedActionSchema, Exception]] = []
+		for action in getattr(self.domain, "actions", ()) or ():
+			if not hasattr(action, "preconditions") or not hasattr(action, "effects"):
+				results.append(AttributeError(f"Action '{getattr(action, 'name', '')}' has no semantics."))
+				continue
+			try:
+				results.append(parser.parse_action(action))
+			except Exception as error:
+				results.append(error)
+		return tuple(results)
+
+	def parsed_action_at(self, index: int) -> ParsedActionSchema:
+		"""Return the parsed semantics of `domain.actions[index]`.
+
+		A stored parse failure is raised as a fresh error chained from it, so the
+		cached exception never collects tracebacks from later callers. A missing
+		semantics error stays an `AttributeError`; anything else is a `ValueError`.
+		"""
+
+		result = self.action_parse_results[index]
+		if isinstance(result, Exception):
+			action_name = getattr(self.domain.actions[index], "name", index)
+			error_type = AttributeError if isinstance(result, AttributeError) else ValueError
+			raise error_type(f"Action '{action_name}' could not be parsed: {result}") from result
+		return result
+
+	@cached_property
+	def parsed_actions(self) -> Mapping[str, ParsedActionSchema]:
+		"""Parsed semantics of every action that parses, by declared name."""
+
+		mapping: Dict[str, ParsedActionSchema] = {}
+		for action, result in zip(getattr(self.domain, "actions", ()) or (), self.action_parse_results):
+			action_name = str(getattr(action, "name", "") or "").strip()
+			if action_name and not isinstance(result, Exception):
+				mapping[action_name] = result
+		return MappingProxyType(mapping)
+
+	@cached_property
+	def mutable_predicates(self) -> FrozenSet[str]:
+		"""Predicates some action effect can change (equality excluded)."""
+
+		return frozenset(
+			str(effect.predicate).strip()
+			for parsed in self.parsed_actions.values()
+			for effect in parsed.effects
+			if str(effect.predicate).strip() and str(effect.predicate).strip() != "="
+		)
+
+
+_COMPILED_DOMAINS: "OrderedDict[int, CompiledDomain]" = OrderedDict()
+_COMPILED_DOMAINS_LOCK = threading.Lock()
+
+
+def _is_frozen_dataclass(value: Any) -> bool:
+	params = getattr(type(value), "__dataclass_params__", None)
+	return bool(getattr(params, "frozen", False))
+
+
+def compile_domain(domain: Any) -> CompiledDomain:
+	"""Return the shared `CompiledDomain` of a parsed domain object.
+
+	Entries are keyed by object identity. Parsed domains are frozen and shared
+	through the HDDL parse cache, so every subsystem that received the same
+	domain also receives the same compiled index. Other domain-like objects get a
+	fresh, uncached index.
+	"""
+
+	if isinstance(domain, CompiledDomain):
+		return domain
+	if not _is_frozen_dataclass(domain):
+		# Mutable stand-ins (tests, ad hoc namespaces) may change between calls.
+		return CompiledDomain(domain)
+	with _COMPILED_DOMAINS_LOCK:
+		compiled = _COMPILED_DOMAINS.get(id(domain))
+		if compiled is not None and compiled.domain is domain:
+			_COMPILED_DOMAINS.move_to_end(id(domain))
+			return compiled
+		compiled = CompiledDomain(domain)
+		_COMPILED_DOMAINS[id(domain)] = compiled
+		while len(_COMPILED_DOMAINS) > COMPILED_DOMAIN_CACHE_SIZE:
+			_COMPILED_DOMAINS.popitem(last=False)
+		return compiled
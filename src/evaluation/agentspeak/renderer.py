@@ -8,10 +8,10 @@ import re
 from collections import defaultdict
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from domain_model.compiled_domain import compile_domain
 from method_library.synthesis.schema import HTNMethod, HTNMethodLibrary
 from planning.plan_models import PANDAPlanResult
 from plan_library.models import AgentSpeakBodyStep, AgentSpeakPlan, PlanLibrary
-from utils.hddl_condition_parser import HDDLConditionParser
 
 
 class AgentSpeakRenderer:
@@ -21,7 +21,6 @@ class AgentSpeakRenderer:
     _VARIABLE_MAP_INFERENCE_CONTEXT_LIMIT = 256
 
     def __init__(self) -> None:
-        self.parser = HDDLConditionParser()
         self._object_symbol_set: set[str] = set()
         self._object_type_map: Dict[str, str] = {}
         self._type_parent_map: Dict[str, Optional[str]] = {}
@@ -169,8 +168,9 @@ class AgentSpeakRenderer:
     ) -> List[str]:
         lines = ["/* Primitive Action Plans */"]
 
-        for action in domain.actions:
-            semantics = self.parser.parse_action(action)
+        compiled = compile_domain(domain)
+        for index, action in enumerate(domain.actions):
+            semantics = compiled.parsed_action_at(index)
             task_name = self._sanitize_name(action.name)
             parameter_types = tuple(
                 self._parameter_type(parameter)
@@ -186,6 +186,7 @@ class AgentSpeakRenderer:
                 semantics.parameters,
                 args,
                 prefix_literals=self._type_guard_literals(args, parameter_types),
+                factors=semantics.precondition_factors,
             )
             body_lines = [self._call(task_name, args)]
 
@@ -2368,9 +2369,10 @@ class AgentSpeakRenderer:
         return mapping
 
     def _action_schema_map(self, domain: Any) -> Dict[str, Any]:
+        compiled = compile_domain(domain)
         mapping: Dict[str, Any] = {}
-        for action in getattr(domain, "actions", []):
-            semantics = self.parser.parse_action(action)
+        for index, action in enumerate(getattr(domain, "actions", [])):
+            semantics = compiled.parsed_action_at(index)
             mapping[action.name] = semantics
             mapping[self._sanitize_name(action.name)] = semantics
         return mapping
@@ -2999,14 +3001,37 @@ class AgentSpeakRenderer:
         parameters: Sequence[str],
         args: Sequence[str],
         prefix_literals: Sequence[Any] = (),
+        factors: Sequence[Sequence[Sequence[Any]]] = (),
     ) -> str:
         bindings = {
             parameter: value
             for parameter, value in zip(parameters, args)
         }
-        if not clauses:
+        if not clauses or any(not factor for factor in factors):
             return "__hddl_unsat_condition__"
 
+        if factors:
+            # A factored precondition keeps `clauses` as its single required
+            # clause; each factor adds one disjunctive group to the context.
+            parts = [
+                *(
+                    self._render_literal(literal, {})
+                    for literal in prefix_literals
+                ),
+                *(
+                    self._render_literal(literal, bindings)
+                    for literal in clauses[0]
+                ),
+            ]
+            for factor in factors:
+                group = self._context_from_precondition_clauses(
+                    factor,
+                    parameters,
+                    args,
+                )
+                parts.append(f"({group})" if " | " in group else group)
+            return " & ".join(parts)
+
         rendered_clauses: List[str] = []
         for clause in clauses:
             parts = [
@@ -9,7 +9,8 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
 
 from evaluation.runtime_context import render_problem_fact
-from utils.hddl_parser import HDDLParser
+from utils.hddl_parse_cache import load_parsed_problem
+from utils.symbol_table import GroundAtom, SymbolTable
 
 
 _FORMULA_ATOM_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\([^()]*\)")
@@ -28,6 +29,10 @@ _FORMULA_OPERATOR_PATTERNS = {
 	"last": re.compile(r"(?<![A-Za-z0-9_])last(?![A-Za-z0-9_])"),
 }
 
+# Goal atoms per parsed problem; entries hold the problem so its id is never reused.
+_GoalAtoms = Tuple[Tuple[str, Optional[GroundAtom]], ...]
+_GOAL_ATOM_CACHE: Dict[int, Tuple[Any, SymbolTable, _GoalAtoms]] = {}
+
 
 def ltlf_atom_count(ltlf_formula: str | None) -> int:
 	"""Count grounded task-event atoms in one LTLf formula string."""
@@ -54,26 +59,48 @@ def infer_missing_goal_facts(
 
 	if problem_file is None or not world_facts:
 		return ()
-	problem = HDDLParser.parse_problem(str(Path(problem_file).resolve()))
-	world_fact_set = {
-		canonical_fact
-		for fact in (world_facts or ())
-		if (canonical_fact := _canonical_positive_fact_atom(str(fact).strip()))
+	symbols, goal_atoms = _problem_goal_atoms(load_parsed_problem(Path(problem_file).resolve()))
+	# World facts are only looked up: a name the goals never use cannot match a goal.
+	world_atoms = {
+		atom
+		for fact in world_facts
+		if (parts := _positive_fact_parts(str(fact).strip())) is not None
+		and (atom := symbols.find(*parts)) is not None
 	}
-	missing_goal_facts = [
-		render_problem_fact(fact)
-		for fact in tuple(getattr(problem, "goal_facts", ()) or ())
-	]
 	return tuple(
 		sorted(
-			fact
-			for fact in missing_goal_facts
-			if fact and _canonical_positive_fact_atom(fact) not in world_fact_set
+			rendered
+			for rendered, atom in goal_atoms
+			if atom is None or atom not in world_atoms
 		),
 	)
 
 
-def _canonical_positive_fact_atom(fact: str) -> Optional[str]:
+def _problem_goal_atoms(problem: Any) -> Tuple[SymbolTable, _GoalAtoms]:
+	"""Return the goal-fact symbol table of a parsed problem, built once per problem.
+
+	The table is complete when it is cached and only read afterwards, so callers
+	on several threads can share it.
+	"""
+
+	cached = _GOAL_ATOM_CACHE.get(id(problem))
+	if cached is not None and cached[0] is problem:
+		return cached[1], cached[2]
+	symbols = SymbolTable()
+	goal_atoms = []
+	for fact in tuple(getattr(problem, "goal_facts", ()) or ()):
+		rendered = render_problem_fact(fact)
+		if not rendered:
+			continue
+		parts = _positive_fact_parts(rendered)
+		goal_atoms.append((rendered, None if parts is None else symbols.atom(*parts)))
+	if len(_GOAL_ATOM_CACHE) >= 32:
+		_GOAL_ATOM_CACHE.clear()
+	_GOAL_ATOM_CACHE[id(problem)] = (problem, symbols, tuple(goal_atoms))
+	return symbols, tuple(goal_atoms)
+
+
+def _positive_fact_parts(fact: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
 	text = str(fact or "").strip()
 	if not text:
 		return None
@@ -99,14 +126,16 @@ def _canonical_positive_fact_atom(fact: str) -> Optional[str]:
 	return None
 
 
-def _canonical_fact_parts(predicate: str, args: Sequence[str]) -> Optional[str]:
+def _canonical_fact_parts(
+	predicate: str,
+	args: Sequence[str],
+) -> Optional[Tuple[str, Tuple[str, ...]]]:
 	functor = re.sub(r"[^A-Za-z0-9_]+", "_", str(predicate).strip()).strip("_")
 	if not functor or functor == "_":
 		return None
 	if functor == "=":
 		return None
-	canonical_args = tuple(_strip_fact_argument_quotes(arg) for arg in args)
-	return f"{functor}({','.join(canonical_args)})" if canonical_args else functor
+	return functor, tuple(_strip_fact_argument_quotes(arg) for arg in args)
 
 
 def _strip_fact_argument_quotes(argument: str) -> str:
@@ -45,7 +45,7 @@ from temporal_specification import (
 )
 from utils.config import Config, get_config
 from utils.hddl_condition_parser import HDDLConditionParser
-from utils.hddl_parser import HDDLParser
+from utils.hddl_parse_cache import load_parsed_domain
 
 
 @dataclass(frozen=True)
@@ -433,7 +433,7 @@ def run_incremental_jason_library_evaluation(
 	"""
 
 	resolved_domain_file = Path(domain_file).expanduser().resolve()
-	domain = HDDLParser.parse_domain(str(resolved_domain_file))
+	domain = load_parsed_domain(resolved_domain_file)
 	query_sequence, temporal_specifications = load_query_sequence_records(
 		domain_file=resolved_domain_file,
 		dataset_path=query_dataset,
@@ -2,6 +2,24 @@
 Jason runtime exports for plan-library evaluation.
 """
 
-from .runner import JasonRunner, JasonValidationError, JasonValidationResult
+from .runner import (
+    JasonBatchValidationOutcome,
+    JasonRunner,
+    JasonValidationError,
+    JasonValidationJob,
+    JasonValidationResult,
+)
+from .toolchain import JasonToolchain
+from .worker_pool import JasonWorkerJob, JasonWorkerPool, JasonWorkerPoolError
 
-__all__ = ["JasonRunner", "JasonValidationError", "JasonValidationResult"]
+__all__ = [
+    "JasonBatchValidationOutcome",
+    "JasonRunner",
+    "JasonValidationError",
+    "JasonValidationJob",
+    "JasonValidationResult",
+    "JasonToolchain",
+    "JasonWorkerJob",
+    "JasonWorkerPool",
+    "JasonWorkerPoolError",
+]
@@ -0,0 +1,167 @@
+"""
+Content-addressed cache of compiled Jason runtime classes.
+
+Generated Java sources whose text does not depend on the query (the data-driven
+pipeline environment, the pipeline internal actions) are compiled once per
+source hash and toolchain version and then reused from every query directory by
+adding the cache entry to the Jason classpath.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+
+_JASON_JAR_VERSION_PATTERN = re.compile(r"jason(?:-cli)?(?:-all)?-(\d+(?:\.\d+)*(?:-[A-Za-z0-9]+)?)\.jar$")
+
+
+def content_cache_key(*parts: str) -> str:
+	"""Return a stable SHA-256 key for one ordered sequence of text parts."""
+
+	digest = hashlib.sha256()
+	for part in parts:
+		encoded = str(part).encode("utf-8")
+		digest.update(str(len(encoded)).encode("ascii"))
+		digest.update(b":")
+		digest.update(encoded)
+	return digest.hexdigest()
+
+
+def jason_jar_version(jason_jar: str | Path) -> str:
+	"""Return the Jason release encoded in a jar name, or a size/mtime fingerprint."""
+
+	path = Path(jason_jar)
+	match = _JASON_JAR_VERSION_PATTERN.search(path.name)
+	if match:
+		return match.group(1)
+	try:
+		stat = path.stat()
+	except OSError:
+		return f"{path.name}:missing"
+	return f"{path.name}:{stat.st_size}:{int(stat.st_mtime_ns)}"
+
+
+def write_class_jar(class_root: str | Path, jar_path: str | Path) -> Path:
+	"""Package every `.class` file under `class_root` into a deterministic jar."""
+
+	root = Path(class_root)
+	target = Path(jar_path)
+	class_files = sorted(path for path in root.rglob("*.class") if path.is_file())
+	with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+		archive.writestr(
+			zipfile.ZipInfo("META-INF/MANIFEST.MF", date_time=(1980, 1, 1, 0, 0, 0)),
+			"Manifest-Version: 1.0\r\nCreated-By: llm-bdi-pipeline\r\n\r\n",
+		)
+		for class_file in class_files:
+			entry = zipfile.ZipInfo(
+				class_file.relative_to(root).as_posix(),
+				date_time=(1980, 1, 1, 0, 0, 0),
+			)
+			entry.compress_type = zipfile.ZIP_DEFLATED
+			archive.writestr(entry, class_file.read_bytes())
+	return target
+
+
+def configured_class_cache_root(default_root: Path) -> Path:
+	"""Return the class-cache directory, honouring `JASON_RUNTIME_CLASS_CACHE_DIR`."""
+
+	raw_value = os.getenv("JASON_RUNTIME_CLASS_CACHE_DIR", "").strip()
+	if raw_value:
+		return Path(raw_value).expanduser().resolve()
+	return Path(default_root).resolve()
+
+
+class JasonClassCache:
+	"""Directory of immutable, content-addressed class-file entries.
+
+	Entries are built in a private staging directory and published with an atomic
+	rename, so concurrent runners (threads or processes) sharing one cache root
+	never observe a half-written entry.
+	"""
+
+	def __init__(self, root: str | Path) -> None:
+		self.root = Path(root).resolve()
+		self._lock = threading.Lock()
+		self._build_locks: Dict[Tuple[str, str], threading.Lock] = {}
+		self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+	def entry_dir(self, namespace: str, key: str) -> Path:
+		return self.root / namespace / key
+
+	def lookup(self, namespace: str, key: str, *, required: Iterable[str]) -> Optional[Path]:
+		"""Return a complete entry directory, or None when it has not been built."""
+
+		entry = self.entry_dir(namespace, key)
+		if all((entry / item).exists() for item in required):
+			return entry
+		return None
+
+	def ensure(
+		self,
+		namespace: str,
+		key: str,
+		*,
+		required: Sequence[str],
+		build: Callable[[Path], None],
+	) -> Tuple[Path, bool]:
+		"""Return `(entry_dir, cache_hit)`, building the entry on a miss.
+
+		`build` receives an empty staging directory and must leave every `required`
+		relative path inside it. An incomplete build is discarded rather than
+		published; the returned directory then lacks the required files and the
+		caller reports the missing artefact. Concurrent callers in one process that
+		miss on the same key wait for a single build instead of racing javac.
+		"""
+
+		entry = self.lookup(namespace, key, required=required)
+		if entry is not None:
+			with self._lock:
+				self.stats["hits"] += 1
+			return entry, True
+
+		with self._lock:
+			build_lock = self._build_locks.setdefault((namespace, key), threading.Lock())
+		with build_lock:
+			entry = self.lookup(namespace, key, required=required)
+			if entry is not None:
+				with self._lock:
+					self.stats["hits"] += 1
+				return entry, True
+			with self._lock:
+				self.stats["misses"] += 1
+			return self._build_entry(namespace, key, required=required, build=build), False
+
+	def _build_entry(
+		self,
+		namespace: str,
+		key: str,
+		*,
+		required: Sequence[str],
+		build: Callable[[Path], None],
+	) -> Path:
+		entry = self.entry_dir(namespace, key)
+		entry.parent.mkdir(parents=True, exist_ok=True)
+		staging = Path(tempfile.mkdtemp(prefix=f".{key[:16]}-", dir=entry.parent))
+		try:
+			build(staging)
+			if not all((staging / item).exists() for item in required):
+				return entry
+			try:
+				os.replace(staging, entry)
+			except OSError:
+				# Another runner published the same entry first; its content is identical.
+				if self.lookup(namespace, key, required=required) is None:
+					shutil.rmtree(entry, ignore_errors=True)
+					os.replace(staging, entry)
+		finally:
+			if staging.exists():
+				shutil.rmtree(staging, ignore_errors=True)
+		return entry
@@ -0,0 +1,111 @@
+"""
+Memoised query-independent rendering of one plan library.
+
+Most of the runner ASL (primitive wrappers, instrumented method plans, failure
+handlers and the per-chunk guard and ordering analysis) depends only on the
+plan library, the domain action schemas and the generated library code, not on
+the query goals or initial state. That part is rendered once per library
+fingerprint and reused; each query only adds its driver plans, goal facts,
+object beliefs and local witness grounding on top.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from evaluation.jason_runtime.class_cache import content_cache_key
+
+
+RUNNER_LIBRARY_SEGMENT_VERSION = 1
+RUNNER_LIBRARY_SEGMENT_LIMIT = 16
+
+ChunkOrderFeatures = Tuple[str, Tuple[int, ...], Tuple[Tuple[str, Tuple[str, ...]], ...]]
+
+
+@dataclass
+class RunnerLibrarySegment:
+	"""Library-level part of the runner ASL plus per-chunk analysis memos.
+
+	`library_code` is the rewritten program from the primitive action plans
+	marker onwards. The memo dictionaries are keyed by method-plan chunk text and
+	filled for the library's own chunks when the segment is built; query-specific
+	specialised chunks are analysed on demand and never stored.
+	"""
+
+	fingerprint: str
+	library_code: str
+	witness_specs: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+	guarded_chunks: Dict[str, str] = field(default_factory=dict)
+	chunk_order_features: Dict[str, ChunkOrderFeatures] = field(default_factory=dict)
+	failure_handlers: Dict[Tuple[bool, int], Tuple[str, ...]] = field(default_factory=dict)
+
+
+def _stable_json(payload: Any) -> str:
+	return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def runner_library_fingerprint(
+	library_code: str,
+	*,
+	method_library: Any = None,
+	plan_library: Any = None,
+	action_schemas: Sequence[Dict[str, Any]] = (),
+) -> str:
+	"""Hash every input the library-level rendering reads."""
+
+	return content_cache_key(
+		str(RUNNER_LIBRARY_SEGMENT_VERSION),
+		library_code,
+		_stable_json(plan_library.to_dict()) if plan_library is not None else "",
+		_stable_json(method_library.to_dict()) if method_library is not None else "",
+		_stable_json([dict(schema) for schema in action_schemas or ()]),
+	)
+
+
+class RunnerLibrarySegmentMemo:
+	"""Small process-wide LRU of rendered library segments."""
+
+	def __init__(self, limit: int = RUNNER_LIBRARY_SEGMENT_LIMIT) -> None:
+		self.limit = max(1, int(limit))
+		self._entries: "OrderedDict[str, RunnerLibrarySegment]" = OrderedDict()
+		self._lock = threading.Lock()
+		self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+	def get(self, fingerprint: str) -> Optional[RunnerLibrarySegment]:
+		with self._lock:
+			segment = self._entries.get(fingerprint)
+			if segment is None:
+				self.stats["misses"] += 1
+				return None
+			self._entries.move_to_end(fingerprint)
+			self.stats["hits"] += 1
+			return segment
+
+	def put(self, segment: RunnerLibrarySegment) -> RunnerLibrarySegment:
+		"""Store `segment`, keeping the first one published for its fingerprint."""
+
+		with self._lock:
+			existing = self._entries.get(segment.fingerprint)
+			if existing is not None:
+				self._entries.move_to_end(segment.fingerprint)
+				return existing
+			self._entries[segment.fingerprint] = segment
+			while len(self._entries) > self.limit:
+				self._entries.popitem(last=False)
+			return segment
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self.stats = {"hits": 0, "misses": 0}
+
+
+_shared_library_segment_memo = RunnerLibrarySegmentMemo()
+
+
+def shared_library_segment_memo() -> RunnerLibrarySegmentMemo:
+	return _shared_library_segment_memo
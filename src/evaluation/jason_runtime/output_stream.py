@@ -0,0 +1,757 @@
+"""
+Incremental parsing of Jason runtime output.
+
+`JasonOutputParser` consumes one output stream line by line and keeps only the
+state the runner needs: the committed action path (snapshot/restore aware), the
+bounded method trace, failed goals, the highest goal-repair pass and the
+terminal `execute success` / `execute failed` markers, and the environment status
+lines. `run_streaming_jason_process` drives a Jason JVM through pipes, feeds both
+streams to parsers as lines arrive, streams bounded artefacts to disk, keeps only
+a bounded tail of each stream in memory (`JasonOutputCapture`) and stops the JVM
+once a terminal marker has been printed, or once the run has made no progress
+for the stall window.
+`JasonAgentOutputDemux` splits the output of a packed multi-agent MAS into one
+parser per agent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+_ACTION_SUCCESS_PATTERN = re.compile(r"^runtime env action success (.+?)\s*$")
+_SNAPSHOT_PATTERN = re.compile(r"^runtime env snapshot (.+?)\s*$")
+_RESTORE_PATTERN = re.compile(r"^runtime env restore (.+?)\s*$")
+_COMMIT_PATTERN = re.compile(r"^runtime env commit (.+?)\s*$")
+_FLAT_METHOD_TRACE_PATTERN = re.compile(r"runtime trace method flat\s+(.+?)\s*$")
+_LEGACY_METHOD_TRACE_PATTERN = re.compile(r"runtime trace method\s+trace_method\((.*)\)\s*$")
+_FAILED_GOAL_PATTERN = re.compile(r"runtime goal failed\s+fail_goal\((.*)\)\s*$")
+_GOAL_REPAIR_PASS_PATTERN = re.compile(r"runtime query pass\s+([0-9]+)")
+
+METHOD_TRACE_MARKER = "runtime trace method"
+DEFAULT_STALL_TIMEOUT_SECONDS = 300.0
+DEFAULT_OUTPUT_TAIL_CHARS = 500_000
+STATUS_LINE_LIMIT = 64
+
+
+def configured_stall_timeout_seconds() -> Optional[float]:
+	"""Return the no-progress window from `JASON_RUNTIME_STALL_TIMEOUT_SECONDS`.
+
+	A value of zero or below disables the watchdog.
+	"""
+
+	raw_value = os.getenv("JASON_RUNTIME_STALL_TIMEOUT_SECONDS", "").strip()
+	if not raw_value:
+		return DEFAULT_STALL_TIMEOUT_SECONDS
+	try:
+		value = float(raw_value)
+	except ValueError:
+		return DEFAULT_STALL_TIMEOUT_SECONDS
+	return value if value > 0 else None
+
+
+def _strip_quoted_atom(text: str) -> str:
+	token = str(text).strip()
+	if len(token) >= 2 and token[0] == token[-1] and token[0] in {'"', "'"}:
+		return token[1:-1]
+	return token
+
+
+class JasonOutputParser:
+	"""Line-by-line parser for one Jason output stream."""
+
+	def __init__(
+		self,
+		*,
+		success_marker: str = "execute success",
+		failure_marker: str = "execute failed",
+		method_trace_record_limit: Optional[int] = None,
+		record_action_events: bool = False,
+	) -> None:
+		self.success_marker = success_marker
+		self.failure_marker = failure_marker
+		self.method_trace_record_limit = method_trace_record_limit
+		self.record_action_events = record_action_events
+		self.action_path: List[str] = []
+		self.action_high_water = 0
+		self._snapshots: List[Tuple[str, int]] = []
+		self.action_events: List[Tuple[str, str]] = []
+		self.method_trace: List[Dict[str, Any]] = []
+		self.method_trace_count = 0
+		self._method_trace_keys: Set[Tuple[str, Tuple[str, ...]]] = set()
+		self.failed_goals: List[str] = []
+		self._failed_goal_set: Set[str] = set()
+		self.goal_repair_pass_count = 0
+		self.saw_method_trace_marker = False
+		self.saw_success_marker = False
+		self.saw_failure_marker = False
+		self.status_lines: List[str] = []
+		self._status_line_set: Set[str] = set()
+		self.line_count = 0
+
+	@property
+	def terminal_marker(self) -> Optional[str]:
+		if self.saw_failure_marker:
+			return self.failure_marker
+		if self.saw_success_marker:
+			return self.success_marker
+		return None
+
+	def progress_marker(self) -> Tuple[int, int, int]:
+		"""Return monotone progress counters for the stall watchdog.
+
+		Progress means a longer committed action path than ever before, a method
+		application not seen before, or a new goal-repair pass. Repair loops that
+		keep replaying the same actions and methods therefore do not count.
+		"""
+
+		return (
+			self.action_high_water,
+			len(self._method_trace_keys),
+			self.goal_repair_pass_count,
+		)
+
+	def feed_text(self, text: str) -> "JasonOutputParser":
+		for line in str(text or "").splitlines():
+			self.feed(line)
+		return self
+
+	def feed(self, raw_line: str) -> bool:
+		"""Consume one line; return True when it carries a terminal marker."""
+
+		self.line_count += 1
+		line = raw_line.strip()
+		if not line:
+			return False
+		terminal = False
+		if self.success_marker in line:
+			self.saw_success_marker = True
+			terminal = True
+		if self.failure_marker in line:
+			self.saw_failure_marker = True
+			terminal = True
+		if terminal:
+			self._record_status_line(line)
+		if line.startswith("runtime env "):
+			if not self._feed_action_line(line):
+				self._record_status_line(line)
+			return terminal
+		if METHOD_TRACE_MARKER in line:
+			self.saw_method_trace_marker = True
+			self._feed_method_trace_line(line)
+			return terminal
+		if "runtime goal failed" in line:
+			match = _FAILED_GOAL_PATTERN.search(line)
+			if match is not None:
+				payload = match.group(1).strip()
+				if payload and payload not in self._failed_goal_set:
+					self._failed_goal_set.add(payload)
+					self.failed_goals.append(payload)
+			return terminal
+		if "runtime query pass" in line:
+			for match in _GOAL_REPAIR_PASS_PATTERN.finditer(line):
+				self.goal_repair_pass_count = max(self.goal_repair_pass_count, int(match.group(1)))
+		return terminal
+
+	def replay_action_events(self, events: Iterable[Tuple[str, str]]) -> None:
+		"""Continue the action-path state machine with events seen on another stream."""
+
+		for kind, payload in events:
+			self._apply_action_event(kind, payload)
+
+	def _record_status_line(self, line: str) -> None:
+		"""Keep the first few distinct status lines; the output itself is not kept."""
+
+		if line in self._status_line_set or len(self.status_lines) >= STATUS_LINE_LIMIT:
+			return
+		self._status_line_set.add(line)
+		self.status_lines.append(line)
+
+	def _feed_action_line(self, line: str) -> bool:
+		for kind, pattern in (
+			("snapshot", _SNAPSHOT_PATTERN),
+			("restore", _RESTORE_PATTERN),
+			("commit", _COMMIT_PATTERN),
+			("action", _ACTION_SUCCESS_PATTERN),
+		):
+			match = pattern.match(line)
+			if match is None:
+				continue
+			payload = match.group(1).strip()
+			if self.record_action_events:
+				self.action_events.append((kind, payload))
+			self._apply_action_event(kind, payload)
+			return True
+		return False
+
+	def _apply_action_event(self, kind: str, payload: str) -> None:
+		if kind == "snapshot":
+			self._snapshots.append((payload, len(self.action_path)))
+			return
+		if kind == "restore":
+			for index in range(len(self._snapshots) - 1, -1, -1):
+				snapshot_key, action_count = self._snapshots[index]
+				if snapshot_key != payload:
+					continue
+				del self.action_path[action_count:]
+				del self._snapshots[index:]
+				break
+			return
+		if kind == "commit":
+			for index in range(len(self._snapshots) - 1, -1, -1):
+				if self._snapshots[index][0] == payload:
+					del self._snapshots[index]
+					break
+			return
+		self.action_path.append(payload)
+		if len(self.action_path) > self.action_high_water:
+			self.action_high_water = len(self.action_path)
+
+	def _feed_method_trace_line(self, line: str) -> None:
+		record: Optional[Dict[str, Any]] = None
+		flat_match = _FLAT_METHOD_TRACE_PATTERN.search(line)
+		if flat_match is not None:
+			parts = [part.strip() for part in flat_match.group(1).strip().split("|")]
+			if parts and parts[0]:
+				record = {
+					"method_name": parts[0],
+					"task_args": [part for part in parts[1:] if part],
+				}
+		else:
+			legacy_match = _LEGACY_METHOD_TRACE_PATTERN.search(line)
+			payload = legacy_match.group(1).strip() if legacy_match is not None else ""
+			parts = [part.strip() for part in payload.split(",")] if payload else []
+			if parts and parts[0]:
+				record = {
+					"method_name": _strip_quoted_atom(parts[0]),
+					"task_args": [_strip_quoted_atom(part) for part in parts[1:] if part],
+				}
+		if record is None:
+			return
+		self.method_trace_count += 1
+		self._method_trace_keys.add((record["method_name"], tuple(record["task_args"])))
+		limit = self.method_trace_record_limit
+		if limit is None or len(self.method_trace) < limit:
+			self.method_trace.append(record)
+
+
+_AGENT_TAG_PATTERN = re.compile(r"^\[([A-Za-z][A-Za-z0-9_]*)\]\s?(.*)$")
+
+
+class JasonPackedAgents:
+	"""Completion state shared by the stdout/stderr demultiplexers of one packed MAS."""
+
+	def __init__(self, agent_names: Sequence[str]) -> None:
+		self.agent_names = tuple(agent_names)
+		self._finished: Set[str] = set()
+		self._lock = threading.Lock()
+
+	def mark_finished(self, agent_name: str) -> bool:
+		"""Record a terminal marker; return True once every agent has one."""
+
+		with self._lock:
+			self._finished.add(agent_name)
+			return len(self._finished) == len(self.agent_names)
+
+	@property
+	def all_finished(self) -> bool:
+		with self._lock:
+			return len(self._finished) == len(self.agent_names)
+
+
+class JasonAgentOutputDemux:
+	"""Route `[agent]`-tagged Jason output lines to one parser per packed agent.
+
+	Untagged lines (environment boot, JVM diagnostics) are delivered to every
+	agent. `feed` reports a terminal line only once all packed agents have printed
+	their own terminal marker, so the streaming runner stops the JVM at that point.
+	Each agent keeps a bounded `JasonOutputCapture` of the lines routed to it.
+	"""
+
+	def __init__(
+		self,
+		packed_agents: JasonPackedAgents,
+		parser_factory: Callable[[], JasonOutputParser],
+		*,
+		tail_limit_chars: int = DEFAULT_OUTPUT_TAIL_CHARS,
+	) -> None:
+		self.packed_agents = packed_agents
+		self.parsers: Dict[str, JasonOutputParser] = {
+			agent_name: parser_factory() for agent_name in packed_agents.agent_names
+		}
+		self.captures: Dict[str, JasonOutputCapture] = {
+			agent_name: JasonOutputCapture(tail_limit_chars)
+			for agent_name in packed_agents.agent_names
+		}
+
+	@property
+	def terminal_marker(self) -> Optional[str]:
+		if self.packed_agents.all_finished:
+			return "all packed agents finished"
+		return None
+
+	def progress_marker(self) -> Tuple[int, int, int]:
+		markers = [parser.progress_marker() for parser in self.parsers.values()]
+		return (
+			sum(marker[0] for marker in markers),
+			sum(marker[1] for marker in markers),
+			sum(marker[2] for marker in markers),
+		)
+
+	def feed_text(self, text: str) -> "JasonAgentOutputDemux":
+		for line in str(text or "").splitlines():
+			self.feed(line)
+		return self
+
+	def feed(self, raw_line: str) -> bool:
+		line = raw_line.rstrip("\r\n")
+		match = _AGENT_TAG_PATTERN.match(line.strip())
+		if match is not None and match.group(1) in self.parsers:
+			targets: Sequence[str] = (match.group(1),)
+			payload = match.group(2)
+		else:
+			targets = tuple(self.parsers)
+			payload = line
+		all_finished = False
+		for agent_name in targets:
+			self.captures[agent_name].append(f"{line}\n")
+			parser = self.parsers[agent_name]
+			if parser.feed(payload) or parser.terminal_marker is not None:
+				all_finished = self.packed_agents.mark_finished(agent_name) or all_finished
+		return all_finished
+
+	def agent_text(self, agent_name: str) -> str:
+		capture = self.captures.get(agent_name)
+		return capture.text() if capture is not None else ""
+
+
+@dataclass(frozen=True)
+class JasonOutputSummary:
+	"""Merged parse of the stdout/stderr pair of one Jason run."""
+
+	action_path: List[str]
+	method_trace: List[Dict[str, Any]]
+	method_trace_original_count: int
+	method_trace_truncated: bool
+	observed_failed_goals: List[str]
+	goal_repair_pass_count: int
+	terminal_marker: Optional[str]
+	status_lines: List[str]
+
+
+def bound_failed_goals(payloads: Iterable[str], *, limit: int) -> List[str]:
+	"""Deduplicate failed-goal payloads and cap them with a truncation note."""
+
+	failed_goals: List[str] = []
+	seen: Set[str] = set()
+	truncated_count = 0
+	for payload in payloads:
+		if payload in seen:
+			continue
+		seen.add(payload)
+		if len(failed_goals) < limit:
+			failed_goals.append(payload)
+		else:
+			truncated_count += 1
+	if truncated_count:
+		failed_goals.append(f"... truncated {truncated_count} additional failed goals")
+	return failed_goals
+
+
+def summarize_jason_output(
+	stdout_parser: JasonOutputParser,
+	stderr_parser: JasonOutputParser,
+	*,
+	method_trace_record_limit: int,
+	failed_goal_record_limit: int,
+) -> JasonOutputSummary:
+	"""Merge per-stream parses exactly as if stderr had been appended to stdout."""
+
+	stdout_parser.replay_action_events(stderr_parser.action_events)
+	if stderr_parser.saw_method_trace_marker:
+		trace_sources: Sequence[JasonOutputParser] = (stderr_parser,)
+	else:
+		trace_sources = (stdout_parser, stderr_parser)
+	limit = max(1, int(method_trace_record_limit))
+	method_trace: List[Dict[str, Any]] = []
+	method_trace_count = 0
+	for parser in trace_sources:
+		method_trace_count += parser.method_trace_count
+		method_trace.extend(parser.method_trace[: max(0, limit - len(method_trace))])
+
+	failed_goals = bound_failed_goals(
+		[*stdout_parser.failed_goals, *stderr_parser.failed_goals],
+		limit=failed_goal_record_limit,
+	)
+
+	terminal_marker: Optional[str] = None
+	if stdout_parser.saw_failure_marker or stderr_parser.saw_failure_marker:
+		terminal_marker = stdout_parser.failure_marker
+	elif stdout_parser.saw_success_marker or stderr_parser.saw_success_marker:
+		terminal_marker = stdout_parser.success_marker
+	status_lines = list(dict.fromkeys([*stdout_parser.status_lines, *stderr_parser.status_lines]))
+	return JasonOutputSummary(
+		action_path=list(stdout_parser.action_path),
+		method_trace=method_trace,
+		method_trace_original_count=method_trace_count,
+		method_trace_truncated=method_trace_count > limit,
+		observed_failed_goals=failed_goals,
+		goal_repair_pass_count=max(
+			stdout_parser.goal_repair_pass_count,
+			stderr_parser.goal_repair_pass_count,
+		),
+		terminal_marker=terminal_marker,
+		status_lines=status_lines,
+	)
+
+
+class JasonOutputCapture:
+	"""Bounded in-memory view of one output stream: its tail, length and digest.
+
+	Whole streams only ever live in their artefact files. The capture keeps the
+	last `tail_limit_chars` characters, plus the total length and SHA-256 of
+	everything appended, so long runs cost bounded memory.
+	"""
+
+	def __init__(self, tail_limit_chars: int = DEFAULT_OUTPUT_TAIL_CHARS) -> None:
+		self.tail_limit_chars = max(1, int(tail_limit_chars))
+		self.total_chars = 0
+		self._tail: Deque[str] = deque()
+		self._tail_chars = 0
+		self._digest = hashlib.sha256()
+
+	@classmethod
+	def from_text(
+		cls,
+		text: str,
+		tail_limit_chars: int = DEFAULT_OUTPUT_TAIL_CHARS,
+	) -> "JasonOutputCapture":
+		capture = cls(tail_limit_chars)
+		capture.append(text)
+		return capture
+
+	def append(self, text: str) -> None:
+		if not text:
+			return
+		self.total_chars += len(text)
+		self._digest.update(text.encode("utf-8"))
+		self._tail.append(text)
+		self._tail_chars += len(text)
+		while len(self._tail) > 1 and self._tail_chars - len(self._tail[0]) >= self.tail_limit_chars:
+			self._tail_chars -= len(self._tail.popleft())
+
+	@property
+	def truncated(self) -> bool:
+		return self.total_chars > self.tail_limit_chars
+
+	@property
+	def sha256(self) -> str:
+		return self._digest.hexdigest()
+
+	def text(self) -> str:
+		"""Return the last `tail_limit_chars` characters of the stream."""
+
+		return "".join(self._tail)[-self.tail_limit_chars:]
+
+	def bounded_text(self) -> str:
+		"""Return the whole stream, or its tail behind a truncation header."""
+
+		if not self.truncated:
+			return self.text()
+		return (
+			f"[truncated runtime output: original_chars={self.total_chars}, "
+			f"kept_tail_chars={self.tail_limit_chars}, sha256={self.sha256}]\n"
+			f"{self.text()}"
+		)
+
+	def sink_trailer(self, written_chars: int) -> str:
+		"""Return what completes a sink that stopped after its first `written_chars`.
+
+		That is the kept tail past `written_chars`, behind a truncation note when
+		the tail does not reach back to the end of the written head.
+		"""
+
+		if written_chars >= self.total_chars:
+			return ""
+		tail = self.text()
+		tail_start = self.total_chars - len(tail)
+		if tail_start <= written_chars:
+			return tail[written_chars - tail_start:]
+		return (
+			f"\n[truncated runtime output: original_chars={self.total_chars}, "
+			f"omitted_chars={tail_start - written_chars}, sha256={self.sha256}]\n"
+			f"{tail}"
+		)
+
+
+@dataclass(frozen=True)
+class JasonStreamedRun:
+	"""Process outcome of one streamed Jason run.
+
+	The full output is in the sink files; `stdout` and `stderr` are the tails
+	kept by the captures.
+	"""
+
+	exit_code: Optional[int]
+	timed_out: bool
+	stdout_capture: JasonOutputCapture
+	stderr_capture: JasonOutputCapture
+	early_stopped: bool
+	terminal_marker_seconds: Optional[float]
+	stalled: bool = False
+	last_progress_seconds: Optional[float] = None
+
+	@property
+	def stdout(self) -> str:
+		return self.stdout_capture.text()
+
+	@property
+	def stderr(self) -> str:
+		return self.stderr_capture.text()
+
+
+class JasonProgressTracker:
+	"""Thread-safe record of when any watched parser last made progress."""
+
+	def __init__(self, parsers: Sequence[JasonOutputParser]) -> None:
+		self._parsers = tuple(parsers)
+		self._lock = threading.Lock()
+		self.started_at = time.perf_counter()
+		self.last_progress_at = self.started_at
+		self._last_markers = tuple(parser.progress_marker() for parser in self._parsers)
+
+	def observe(self) -> bool:
+		"""Refresh the progress clock; return True when the counters moved."""
+
+		with self._lock:
+			markers = tuple(parser.progress_marker() for parser in self._parsers)
+			if markers == self._last_markers:
+				return False
+			self._last_markers = markers
+			self.last_progress_at = time.perf_counter()
+			return True
+
+	def stalled(self, stall_timeout_seconds: Optional[float], *, now: Optional[float] = None) -> bool:
+		if stall_timeout_seconds is None:
+			return False
+		current = time.perf_counter() if now is None else now
+		return current - self.last_progress_at >= stall_timeout_seconds
+
+	def stall_deadline(self, stall_timeout_seconds: Optional[float]) -> Optional[float]:
+		if stall_timeout_seconds is None:
+			return None
+		return self.last_progress_at + stall_timeout_seconds
+
+	@property
+	def last_progress_seconds(self) -> float:
+		return self.last_progress_at - self.started_at
+
+
+class JasonOutputFileTail:
+	"""Feed lines appended to an output file into a parser (worker-pool jobs)."""
+
+	def __init__(self, path: Path, parser: JasonOutputParser) -> None:
+		self.path = Path(path)
+		self.parser = parser
+		self._offset = 0
+		self._pending = b""
+
+	def poll(self, *, final: bool = False) -> None:
+		try:
+			with open(self.path, "rb") as handle:
+				handle.seek(self._offset)
+				chunk = handle.read()
+		except OSError:
+			chunk = b""
+		self._offset += len(chunk)
+		data = self._pending + chunk
+		lines = data.split(b"\n")
+		self._pending = b"" if final else lines.pop()
+		for line in lines:
+			self.parser.feed(line.decode("utf-8", errors="replace"))
+
+
+def _pump_stream(
+	stream: Any,
+	*,
+	parser: JasonOutputParser,
+	capture: JasonOutputCapture,
+	sink_path: Optional[Path],
+	sink_limit_chars: int,
+	on_terminal: Callable[[], None],
+	on_line: Optional[Callable[[], None]] = None,
+) -> None:
+	written = 0
+	sink = open(sink_path, "w", encoding="utf-8") if sink_path is not None else None
+	try:
+		for line in iter(stream.readline, ""):
+			capture.append(line)
+			if sink is not None and written < sink_limit_chars:
+				fragment = line[: sink_limit_chars - written]
+				sink.write(fragment)
+				sink.flush()
+				written += len(fragment)
+			if parser.feed(line):
+				on_terminal()
+			if on_line is not None:
+				on_line()
+	finally:
+		if sink is not None:
+			sink.write(capture.sink_trailer(written))
+			sink.close()
+		try:
+			stream.close()
+		except Exception:
+			pass
+
+
+def _stop_process(process: subprocess.Popen, *, grace_seconds: float = 2.0) -> None:
+	if process.poll() is not None:
+		return
+	try:
+		process.terminate()
+		process.wait(timeout=grace_seconds)
+	except subprocess.TimeoutExpired:
+		process.kill()
+		process.wait()
+	except OSError:
+		return
+
+
+def run_streaming_jason_process(
+	command: Sequence[str],
+	*,
+	cwd: Path,
+	timeout_seconds: float,
+	stdout_parser: JasonOutputParser,
+	stderr_parser: JasonOutputParser,
+	stdout_sink: Optional[Path] = None,
+	stderr_sink: Optional[Path] = None,
+	sink_limit_chars: int = 500_000,
+	terminal_marker_grace_seconds: float = 2.0,
+	stall_timeout_seconds: Optional[float] = None,
+) -> JasonStreamedRun:
+	"""Run Jason with piped output, parsing both streams while the JVM runs.
+
+	Once either stream prints a terminal marker the JVM is given
+	`terminal_marker_grace_seconds` to finish `.stopMAS` on its own; if it is still
+	alive after that it is stopped and the run is reported with exit code 0 and
+	`early_stopped=True`, because the MAS already reached its final statement.
+	When `stall_timeout_seconds` is set, a run whose parsers report no progress for
+	that long is stopped and reported with `stalled=True`.
+
+	Each sink receives the first `sink_limit_chars` characters of its stream as
+	they arrive and, when the stream ends, the last `sink_limit_chars` characters
+	behind a truncation note. Only those tails are kept in memory.
+	"""
+
+	start = time.perf_counter()
+	process = subprocess.Popen(
+		list(command),
+		cwd=cwd,
+		stdout=subprocess.PIPE,
+		stderr=subprocess.PIPE,
+		text=True,
+		encoding="utf-8",
+		errors="replace",
+		bufsize=1,
+	)
+	wake = threading.Event()
+	stdout_capture = JasonOutputCapture(sink_limit_chars)
+	stderr_capture = JasonOutputCapture(sink_limit_chars)
+	terminal_at: List[float] = []
+	progress = JasonProgressTracker((stdout_parser, stderr_parser))
+
+	def mark_terminal() -> None:
+		if not terminal_at:
+			terminal_at.append(time.perf_counter() - start)
+		wake.set()
+
+	readers = [
+		threading.Thread(
+			target=_pump_stream,
+			args=(process.stdout,),
+			kwargs={
+				"parser": stdout_parser,
+				"capture": stdout_capture,
+				"sink_path": stdout_sink,
+				"sink_limit_chars": sink_limit_chars,
+				"on_terminal": mark_terminal,
+				"on_line": progress.observe,
+			},
+			daemon=True,
+		),
+		threading.Thread(
+			target=_pump_stream,
+			args=(process.stderr,),
+			kwargs={
+				"parser": stderr_parser,
+				"capture": stderr_capture,
+				"sink_path": stderr_sink,
+				"sink_limit_chars": sink_limit_chars,
+				"on_terminal": mark_terminal,
+				"on_line": progress.observe,
+			},
+			daemon=True,
+		),
+	]
+	for reader in readers:
+		reader.start()
+	waiter = threading.Thread(target=lambda: (process.wait(), wake.set()), daemon=True)
+	waiter.start()
+
+	timed_out = False
+	stalled = False
+	early_stopped = False
+	deadline = start + max(float(timeout_seconds), 0.0)
+	while process.poll() is None:
+		now = time.perf_counter()
+		remaining = deadline - now
+		if remaining <= 0:
+			timed_out = True
+			_stop_process(process)
+			break
+		if not terminal_at and progress.stalled(stall_timeout_seconds, now=now):
+			stalled = True
+			_stop_process(process)
+			break
+		stall_deadline = progress.stall_deadline(stall_timeout_seconds)
+		if stall_deadline is not None:
+			remaining = min(remaining, max(stall_deadline - now, 0.0))
+		wake.wait(remaining)
+		wake.clear()
+		if terminal_at and process.poll() is None:
+			try:
+				process.wait(timeout=max(0.0, terminal_marker_grace_seconds))
+			except subprocess.TimeoutExpired:
+				early_stopped = True
+				_stop_process(process)
+			break
+
+	for reader in readers:
+		reader.join(timeout=5.0)
+	if timed_out or stalled:
+		exit_code: Optional[int] = None
+	elif early_stopped:
+		exit_code = 0
+	else:
+		exit_code = process.returncode
+	return JasonStreamedRun(
+		exit_code=exit_code,
+		timed_out=timed_out,
+		stdout_capture=stdout_capture,
+		stderr_capture=stderr_capture,
+		early_stopped=early_stopped,
+		terminal_marker_seconds=terminal_at[0] if terminal_at else None,
+		stalled=stalled,
+		last_progress_seconds=progress.last_progress_seconds,
+	)
@@ -8,26 +8,73 @@ runtime metadata for pipeline logging.
 
 from __future__ import annotations
 
+import copy
 import json
-import hashlib
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from method_library.synthesis.naming import query_root_alias_task_name
 from method_library.synthesis.schema import HTNMethodLibrary
+from evaluation.jason_runtime.class_cache import (
+	JasonClassCache,
+	configured_class_cache_root,
+	content_cache_key,
+	jason_jar_version,
+	write_class_jar,
+)
 from evaluation.jason_runtime.environment_adapter import (
 	EnvironmentAdapterResult,
 	Stage6EnvironmentAdapter,
 	build_environment_adapter,
 )
+from evaluation.jason_runtime.library_segment import (
+	RunnerLibrarySegment,
+	RunnerLibrarySegmentMemo,
+	runner_library_fingerprint,
+	shared_library_segment_memo,
+)
+from evaluation.jason_runtime.output_stream import (
+	JasonAgentOutputDemux,
+	JasonOutputCapture,
+	JasonOutputParser,
+	JasonPackedAgents,
+	bound_failed_goals,
+	configured_stall_timeout_seconds,
+	run_streaming_jason_process,
+	summarize_jason_output,
+)
+from evaluation.jason_runtime.toolchain import (
+	JasonToolchain,
+	resolve_jason_toolchain,
+	toolchain_fingerprint,
+)
+from evaluation.jason_runtime.witness_join import (
+	GroundingFactIndex,
+	join_local_witness_bindings,
+)
+from evaluation.jason_runtime.worker_pool import (
+	JasonWorkerJob,
+	JasonWorkerJobResult,
+	JasonWorkerPool,
+	JasonWorkerPoolError,
+	shared_worker_pool,
+)
 from plan_library.models import PlanLibrary
+from utils.ground_simulator import GroundActionSimulator
+from utils.symbol_table import (
+	SymbolTable,
+	agentspeak_functor,
+	agentspeak_term,
+	split_agentspeak_arguments,
+)
 
 
 class JasonValidationError(RuntimeError):
@@ -118,6 +165,124 @@ class JasonValidationResult:
 		}
 
 
+class _RunnerThreadCaches(threading.local):
+	"""Memo tables of one runner, kept per thread.
+
+	Simulators and the symbol table carry mutable per-run state, so validations
+	running concurrently on a shared runner must never see each other's entries.
+	"""
+
+	# The symbol table is cleared once it holds this many entries.
+	symbol_table_limit = 1 << 17
+
+	def __init__(self) -> None:
+		self.action_schema_lookups: Dict[int, Dict[str, Dict[str, Any]]] = {}
+		self.ground_simulators: Dict[
+			int,
+			Tuple[Sequence[Dict[str, Any]], GroundActionSimulator],
+		] = {}
+		self.symbols = SymbolTable()
+
+
+@dataclass(frozen=True)
+class _JasonMasRun:
+	"""Raw outcome of one Jason MAS execution before per-agent validation.
+
+	`output_artifacts_streamed` is set when the stdout/stderr artefact files
+	already hold the bounded output, so validation must not rewrite them.
+	"""
+
+	exit_code: Optional[int]
+	timed_out: bool
+	stalled: bool
+	early_stopped: bool
+	stdout_capture: JasonOutputCapture
+	stderr_capture: JasonOutputCapture
+	stdout_parser: Any
+	stderr_parser: Any
+	worker_result: Optional[JasonWorkerJobResult]
+	worker_error: Optional[str]
+	output_artifacts_streamed: bool = False
+
+
+@dataclass(frozen=True)
+class JasonValidationJob:
+	"""One independent `JasonRunner.validate` call for `validate_many`."""
+
+	agentspeak_code: str
+	action_schemas: Sequence[Dict[str, Any]]
+	domain_name: str
+	output_dir: str | Path
+	method_library: HTNMethodLibrary | None = None
+	plan_library: PlanLibrary | None = None
+	seed_facts: Sequence[str] = ()
+	runtime_objects: Sequence[str] = ()
+	object_types: Optional[Dict[str, str]] = None
+	type_parent_map: Optional[Dict[str, Optional[str]]] = None
+	query_goals: Sequence[Any] = ()
+	goal_facts: Sequence[str] = ()
+	problem_file: str | Path | None = None
+	job_id: str = ""
+
+	def validate_kwargs(self) -> Dict[str, Any]:
+		return {
+			"agentspeak_code": self.agentspeak_code,
+			"action_schemas": self.action_schemas,
+			"method_library": self.method_library,
+			"plan_library": self.plan_library,
+			"seed_facts": self.seed_facts,
+			"runtime_objects": self.runtime_objects,
+			"object_types": self.object_types,
+			"type_parent_map": self.type_parent_map,
+			"query_goals": self.query_goals,
+			"goal_facts": self.goal_facts,
+			"domain_name": self.domain_name,
+			"problem_file": self.problem_file,
+			"output_dir": self.output_dir,
+		}
+
+
+@dataclass(frozen=True)
+class JasonBatchValidationOutcome:
+	"""Result of one `validate_many` job; exactly one of `result`/`error` is set."""
+
+	job_id: str
+	output_dir: str
+	result: Optional[JasonValidationResult]
+	error: Optional[JasonValidationError]
+	queue_seconds: float
+	wall_seconds: float
+
+	@property
+	def succeeded(self) -> bool:
+		return self.result is not None and self.result.status == "success"
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			"job_id": self.job_id,
+			"output_dir": self.output_dir,
+			"succeeded": self.succeeded,
+			"result": self.result.to_compact_dict() if self.result is not None else None,
+			"error": str(self.error) if self.error is not None else None,
+			"error_metadata": dict(self.error.metadata) if self.error is not None else None,
+			"queue_seconds": self.queue_seconds,
+			"wall_seconds": self.wall_seconds,
+		}
+
+
+def configured_batch_worker_count() -> int:
+	"""Return the `validate_many` concurrency from `JASON_RUNTIME_BATCH_WORKERS`."""
+
+	default_count = os.cpu_count() or 1
+	raw_value = os.getenv("JASON_RUNTIME_BATCH_WORKERS", "").strip()
+	if not raw_value:
+		return default_count
+	try:
+		return max(1, int(raw_value))
+	except ValueError:
+		return default_count
+
+
 def _tail_text(text: str, *, limit: int = 4000) -> str:
 	value = str(text or "")
 	if len(value) <= limit:
@@ -152,9 +317,11 @@ class JasonRunner:
 	failed_goal_record_limit = 64
 	runtime_output_artifact_limit_chars = 500_000
 	method_trace_record_limit = 2_000
+	terminal_marker_grace_seconds = 2.0
 	min_java_major = 17
 	max_java_major = 23
 	environment_class_name = "JasonPipelineEnvironment"
+	internal_action_jar_name = "pipeline-internal-actions.jar"
 
 	def __init__(
 		self,
@@ -163,6 +330,10 @@ class JasonRunner:
 		timeout_seconds: int = 120,
 		environment_adapter: Stage6EnvironmentAdapter | None = None,
 		environment_adapter_name: str | None = None,
+		worker_pool: JasonWorkerPool | None = None,
+		class_cache: JasonClassCache | None = None,
+		toolchain: JasonToolchain | None = None,
+		stall_timeout_seconds: float | None = None,
 	) -> None:
 		base_dir = (
 			Path(runtime_dir).resolve()
@@ -172,13 +343,26 @@ class JasonRunner:
 		self.runtime_dir = base_dir
 		self.jason_src_dir = self.runtime_dir / "jason_src"
 		self.timeout_seconds = timeout_seconds
+		if stall_timeout_seconds is None:
+			self.stall_timeout_seconds = configured_stall_timeout_seconds()
+		else:
+			self.stall_timeout_seconds = (
+				float(stall_timeout_seconds) if stall_timeout_seconds > 0 else None
+			)
 		adapter_name = (
 			environment_adapter_name
 			or os.getenv("JASON_RUNTIME_ENV_ADAPTER")
 			or os.getenv("STAGE6_ENV_ADAPTER")
 		)
 		self.environment_adapter = environment_adapter or build_environment_adapter(adapter_name)
-		self._action_schema_lookup_cache: Dict[int, Dict[str, Dict[str, Any]]] = {}
+		self.worker_pool = worker_pool
+		self.class_cache = class_cache or JasonClassCache(
+			configured_class_cache_root(self.runtime_dir / ".class_cache"),
+		)
+		self.toolchain = toolchain
+		# None renders every query from scratch.
+		self.library_segment_memo: Optional[RunnerLibrarySegmentMemo] = shared_library_segment_memo()
+		self._thread_caches = _RunnerThreadCaches()
 
 	def validate(
 		self,
@@ -211,73 +395,160 @@ class JasonRunner:
 		output_path.mkdir(parents=True, exist_ok=True)
 
 		runtime_resolution_start = time.perf_counter()
-		java_bin, java_major = self._select_java_binary()
-		javac_bin = self._select_javac_binary(java_bin)
-		jason_jar = self._ensure_jason_jar(java_bin)
-		log_conf = self._resolve_log_config()
+		toolchain, toolchain_source = self._resolve_toolchain()
 		timing_profile["runtime_resolution_seconds"] = (
 			time.perf_counter() - runtime_resolution_start
 		)
 
-		runner_asl_path = output_path / "agentspeak_generated.asl"
-		runtime_projection_path = output_path / "runtime_grounding_projection.asl"
 		runner_mas2j_path = output_path / "jason_runner.mas2j"
-		env_java_path = output_path / f"{self.environment_class_name}.java"
-		env_class_path = output_path / f"{self.environment_class_name}.class"
-		no_ancestor_goal_java_path = output_path / "pipeline" / "no_ancestor_goal.java"
-		no_ancestor_goal_class_path = output_path / "pipeline" / "no_ancestor_goal.class"
-		choose_runtime_choice_java_path = output_path / "pipeline" / "choose_runtime_choice.java"
-		choose_runtime_choice_class_path = output_path / "pipeline" / "choose_runtime_choice.class"
+		env_data_path = output_path / "jason_environment.json"
 		stdout_path = output_path / "jason_stdout.txt"
 		stderr_path = output_path / "jason_stderr.txt"
-		action_path_path = output_path / "action_path.txt"
-		method_trace_path = output_path / "method_trace.json"
-		validation_json_path = output_path / "jason_validation.json"
 
-		source_build_start = time.perf_counter()
-		runtime_agentspeak_code = self._strip_seed_fact_beliefs(
-			agentspeak_code,
-			seed_facts=seed_facts,
+		worker_pool = self.worker_pool or shared_worker_pool(
+			java_bin=toolchain.java_bin,
+			javac_bin=toolchain.javac_bin,
+			jason_jar=toolchain.jason_jar,
+			java_major=toolchain.java_major,
 		)
-		runner_asl = self._build_runner_asl(
-			runtime_agentspeak_code,
+
+		source_build_start = time.perf_counter()
+		grounding_stats: Dict[str, int] = {}
+		runner_asl = self._build_query_runner_asl(
+			agentspeak_code=agentspeak_code,
 			method_library=method_library,
 			plan_library=plan_library,
 			action_schemas=action_schemas,
 			seed_facts=seed_facts,
 			runtime_objects=runtime_objects,
-			object_types=object_types or {},
-			type_parent_map=type_parent_map or {},
+			object_types=object_types,
+			type_parent_map=type_parent_map,
 			query_goals=query_goals,
 			goal_facts=goal_facts,
+			grounding_stats=grounding_stats,
+		)
+		runner_mas2j = self._build_runner_mas2j(
+			domain_name,
+			asl_source_path=str(output_path) if worker_pool is not None else ".",
+			environment_data_path=env_data_path,
 		)
-		runner_mas2j = self._build_runner_mas2j(domain_name)
-		env_source = self._build_environment_java_source(
+		env_data = self._build_environment_data(
 			action_schemas=action_schemas,
 			seed_facts=seed_facts,
 		)
-		no_ancestor_goal_source = self._build_no_ancestor_goal_internal_action_source()
-		choose_runtime_choice_source = self._build_choose_runtime_choice_internal_action_source()
 		timing_profile["source_build_seconds"] = time.perf_counter() - source_build_start
 		write_sources_start = time.perf_counter()
-		runtime_plan_projection = _extract_runtime_plan_projection(runner_asl)
-		runner_asl_path.write_text(runner_asl)
-		runtime_projection_path.write_text(runtime_plan_projection)
+		source_artifacts = self._write_query_runner_sources(output_path, runner_asl)
 		runner_mas2j_path.write_text(runner_mas2j)
-		env_java_path.write_text(env_source)
-		no_ancestor_goal_java_path.parent.mkdir(parents=True, exist_ok=True)
-		no_ancestor_goal_java_path.write_text(no_ancestor_goal_source)
-		choose_runtime_choice_java_path.write_text(choose_runtime_choice_source)
+		env_data_path.write_text(json.dumps(env_data, indent=2))
 		timing_profile["write_sources_seconds"] = time.perf_counter() - write_sources_start
-		compile_start = time.perf_counter()
-		self._compile_environment_java(
-			java_bin=java_bin,
-			javac_bin=javac_bin,
-			jason_jar=jason_jar,
-			env_java_path=env_java_path,
+
+		runtime_classpath_entries, class_artifacts = self._resolve_runtime_classpath(
+			toolchain,
+			runner_asls=(runner_asl,),
+			timing_profile=timing_profile,
+		)
+		mas_run = self._run_mas(
+			toolchain,
+			worker_pool=worker_pool,
+			work_dir=output_path,
+			mas2j_path=runner_mas2j_path,
+			classpath_entries=runtime_classpath_entries,
+			stdout_path=stdout_path,
+			stderr_path=stderr_path,
+			parser_factory=lambda: (
+				self._new_output_parser(),
+				self._new_output_parser(record_action_events=True),
+			),
+			timing_profile=timing_profile,
+		)
+		return self._finish_validation(
+			toolchain,
 			output_path=output_path,
+			mas_run=mas_run,
+			source_artifacts={
+				**source_artifacts,
+				"jason_runner_mas2j": str(runner_mas2j_path),
+				"runtime_environment_data": str(env_data_path),
+				"toolchain_source": toolchain_source,
+				"local_witness_grounding": grounding_stats,
+				**class_artifacts,
+			},
+			method_library=method_library,
+			action_schemas=action_schemas,
+			seed_facts=seed_facts,
+			problem_file=problem_file,
+			timing_profile=timing_profile,
+			total_start=total_start,
 		)
-		timing_profile["environment_compile_seconds"] = time.perf_counter() - compile_start
+
+	def _build_query_runner_asl(
+		self,
+		*,
+		agentspeak_code: str,
+		method_library: HTNMethodLibrary | None,
+		plan_library: PlanLibrary | None,
+		action_schemas: Sequence[Dict[str, Any]],
+		seed_facts: Sequence[str],
+		runtime_objects: Sequence[str],
+		object_types: Optional[Dict[str, str]],
+		type_parent_map: Optional[Dict[str, Optional[str]]],
+		query_goals: Sequence[Any],
+		goal_facts: Sequence[str],
+		grounding_stats: Optional[Dict[str, int]] = None,
+	) -> str:
+		runtime_agentspeak_code = self._strip_seed_fact_beliefs(
+			agentspeak_code,
+			seed_facts=seed_facts,
+		)
+		return self._build_runner_asl(
+			runtime_agentspeak_code,
+			method_library=method_library,
+			plan_library=plan_library,
+			action_schemas=action_schemas,
+			seed_facts=seed_facts,
+			runtime_objects=runtime_objects,
+			object_types=object_types or {},
+			type_parent_map=type_parent_map or {},
+			query_goals=query_goals,
+			goal_facts=goal_facts,
+			grounding_stats=grounding_stats,
+		)
+
+	@staticmethod
+	def _write_query_runner_sources(output_path: Path, runner_asl: str) -> Dict[str, str]:
+		runner_asl_path = output_path / "agentspeak_generated.asl"
+		runtime_projection_path = output_path / "runtime_grounding_projection.asl"
+		runner_asl_path.write_text(runner_asl)
+		runtime_projection_path.write_text(_extract_runtime_plan_projection(runner_asl))
+		return {
+			"agentspeak_generated": str(runner_asl_path),
+			"runtime_grounding_projection": str(runtime_projection_path),
+		}
+
+	def _resolve_runtime_classpath(
+		self,
+		toolchain: JasonToolchain,
+		*,
+		runner_asls: Sequence[str],
+		timing_profile: Dict[str, float],
+	) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+		"""Return the cached class directories/jars the runner programs need."""
+
+		environment_class_start = time.perf_counter()
+		env_class_dir, environment_class_cache_hit = self._resolve_environment_class_dir(
+			java_bin=toolchain.java_bin,
+			java_major=toolchain.java_major,
+			javac_bin=toolchain.javac_bin,
+			jason_jar=toolchain.jason_jar,
+			env_source=self._build_environment_java_source(),
+			timing_profile=timing_profile,
+		)
+		timing_profile["environment_class_resolution_seconds"] = (
+			time.perf_counter() - environment_class_start
+		)
+		env_java_path = env_class_dir / f"{self.environment_class_name}.java"
+		env_class_path = env_class_dir / f"{self.environment_class_name}.class"
 		if not env_class_path.exists():
 			raise JasonValidationError(
 				"Jason environment class compilation completed but class file is missing.",
@@ -286,7 +557,33 @@ class JasonRunner:
 					"environment_class": str(env_class_path),
 				},
 			)
-		needs_recursive_ancestor_guard = "pipeline.no_ancestor_goal(" in runner_asl
+		runtime_classpath_entries: Tuple[str, ...] = (str(env_class_dir),)
+		internal_action_cache_hit: Optional[bool] = None
+		internal_action_jar_path: Optional[Path] = None
+		needs_recursive_ancestor_guard = any(
+			"pipeline.no_ancestor_goal(" in runner_asl for runner_asl in runner_asls
+		)
+		needs_choice_stack = any(
+			"pipeline.choose_runtime_choice(" in runner_asl for runner_asl in runner_asls
+		)
+		if needs_recursive_ancestor_guard or needs_choice_stack:
+			internal_action_start = time.perf_counter()
+			internal_action_dir, internal_action_cache_hit = self._resolve_internal_action_dir(
+				java_bin=toolchain.java_bin,
+				java_major=toolchain.java_major,
+				javac_bin=toolchain.javac_bin,
+				jason_jar=toolchain.jason_jar,
+				timing_profile=timing_profile,
+			)
+			timing_profile["internal_action_resolution_seconds"] = (
+				time.perf_counter() - internal_action_start
+			)
+			internal_action_jar_path = internal_action_dir / self.internal_action_jar_name
+			no_ancestor_goal_java_path = internal_action_dir / "pipeline" / "no_ancestor_goal.java"
+			no_ancestor_goal_class_path = internal_action_dir / "pipeline" / "no_ancestor_goal.class"
+			choose_runtime_choice_java_path = internal_action_dir / "pipeline" / "choose_runtime_choice.java"
+			choose_runtime_choice_class_path = internal_action_dir / "pipeline" / "choose_runtime_choice.class"
+			runtime_classpath_entries += (str(internal_action_jar_path),)
 		if needs_recursive_ancestor_guard and not no_ancestor_goal_class_path.exists():
 			raise JasonValidationError(
 				"Jason internal action compilation completed but class file is missing.",
@@ -295,7 +592,6 @@ class JasonRunner:
 					"internal_action_class": str(no_ancestor_goal_class_path),
 				},
 			)
-		needs_choice_stack = "pipeline.choose_runtime_choice(" in runner_asl
 		if needs_choice_stack and not choose_runtime_choice_class_path.exists():
 			raise JasonValidationError(
 				"Jason choice-stack internal action compilation completed but class file is missing.",
@@ -304,65 +600,190 @@ class JasonRunner:
 					"internal_action_class": str(choose_runtime_choice_class_path),
 				},
 			)
+		return runtime_classpath_entries, {
+			"runtime_environment_java": str(env_java_path),
+			"environment_class_cache_hit": environment_class_cache_hit,
+			"internal_action_jar": str(internal_action_jar_path) if internal_action_jar_path else None,
+			"internal_action_cache_hit": internal_action_cache_hit,
+			"runtime_environment_class": str(env_class_path),
+		}
 
-		runtime_classpath = os.pathsep.join([str(jason_jar), str(output_path)])
+	def _run_mas(
+		self,
+		toolchain: JasonToolchain,
+		*,
+		worker_pool: Optional[JasonWorkerPool],
+		work_dir: Path,
+		mas2j_path: Path,
+		classpath_entries: Tuple[str, ...],
+		stdout_path: Path,
+		stderr_path: Path,
+		parser_factory: Callable[[], Tuple[Any, Any]],
+		timing_profile: Dict[str, float],
+	) -> _JasonMasRun:
+		"""Run one MAS on the warm worker pool, falling back to a streamed subprocess."""
+
+		runtime_classpath = os.pathsep.join([str(toolchain.jason_jar), *classpath_entries])
 		command = [
-			java_bin,
+			toolchain.java_bin,
 			"-cp",
 			runtime_classpath,
 			"jason.infra.local.RunLocalMAS",
-			runner_mas2j_path.name,
+			mas2j_path.name,
 			"--log-conf",
-			str(log_conf),
+			str(toolchain.log_conf),
 		]
 
-		timed_out = False
-		exit_code: Optional[int] = None
-		raw_stdout: str | bytes = ""
-		raw_stderr: str | bytes = ""
-
-		try:
-			mas_run_start = time.perf_counter()
-			result = subprocess.run(
+		mas_run_start = time.perf_counter()
+		stdout_parser, stderr_parser = parser_factory()
+		early_stopped = False
+		stalled = False
+		worker_result: Optional[JasonWorkerJobResult] = None
+		worker_error: Optional[str] = None
+		if worker_pool is not None:
+			stdout_path.unlink(missing_ok=True)
+			stderr_path.unlink(missing_ok=True)
+			try:
+				worker_result = worker_pool.run(
+					JasonWorkerJob(
+						work_dir=work_dir,
+						mas2j_file=mas2j_path,
+						log_conf=toolchain.log_conf,
+						timeout_seconds=self.timeout_seconds,
+						stdout_file=stdout_path,
+						stderr_file=stderr_path,
+						classpath=classpath_entries,
+						stdout_parser=stdout_parser,
+						stderr_parser=stderr_parser,
+						stall_timeout_seconds=self.stall_timeout_seconds,
+					),
+				)
+			except JasonWorkerPoolError as exc:
+				worker_error = str(exc)
+		output_limit_chars = max(1, int(self.runtime_output_artifact_limit_chars))
+		if worker_result is not None:
+			exit_code = worker_result.exit_code
+			timed_out = worker_result.timed_out
+			stalled = worker_result.stalled
+			stdout_capture = JasonOutputCapture.from_text(
+				self._normalise_process_output(worker_result.stdout),
+				output_limit_chars,
+			)
+			stderr_capture = JasonOutputCapture.from_text(
+				self._normalise_process_output(worker_result.stderr),
+				output_limit_chars,
+			)
+			# The worker wrote the files itself; only oversized ones are rewritten.
+			output_artifacts_streamed = not (stdout_capture.truncated or stderr_capture.truncated)
+		else:
+			stdout_parser, stderr_parser = parser_factory()
+			streamed_run = run_streaming_jason_process(
 				command,
-				cwd=output_path,
-				text=True,
-				capture_output=True,
-				check=False,
-				timeout=self.timeout_seconds,
+				cwd=work_dir,
+				timeout_seconds=self.timeout_seconds,
+				stdout_parser=stdout_parser,
+				stderr_parser=stderr_parser,
+				stdout_sink=stdout_path,
+				stderr_sink=stderr_path,
+				sink_limit_chars=output_limit_chars,
+				terminal_marker_grace_seconds=self.terminal_marker_grace_seconds,
+				stall_timeout_seconds=self.stall_timeout_seconds,
 			)
-			exit_code = result.returncode
-			raw_stdout = result.stdout
-			raw_stderr = result.stderr
-			timing_profile["mas_run_seconds"] = time.perf_counter() - mas_run_start
-		except subprocess.TimeoutExpired as exc:
-			timed_out = True
-			raw_stdout = exc.stdout or ""
-			raw_stderr = exc.stderr or ""
-			timing_profile["mas_run_seconds"] = time.perf_counter() - mas_run_start
+			exit_code = streamed_run.exit_code
+			timed_out = streamed_run.timed_out
+			stalled = streamed_run.stalled
+			early_stopped = streamed_run.early_stopped
+			if streamed_run.last_progress_seconds is not None:
+				timing_profile["last_progress_seconds"] = streamed_run.last_progress_seconds
+			stdout_capture = streamed_run.stdout_capture
+			stderr_capture = streamed_run.stderr_capture
+			output_artifacts_streamed = True
+			if streamed_run.terminal_marker_seconds is not None:
+				timing_profile["terminal_marker_seconds"] = streamed_run.terminal_marker_seconds
+		timing_profile["mas_run_seconds"] = time.perf_counter() - mas_run_start
+		return _JasonMasRun(
+			exit_code=exit_code,
+			timed_out=timed_out,
+			stalled=stalled,
+			early_stopped=early_stopped,
+			stdout_capture=stdout_capture,
+			stderr_capture=stderr_capture,
+			stdout_parser=stdout_parser,
+			stderr_parser=stderr_parser,
+			worker_result=worker_result,
+			worker_error=worker_error,
+			output_artifacts_streamed=output_artifacts_streamed,
+		)
+
+	def _finish_validation(
+		self,
+		toolchain: JasonToolchain,
+		*,
+		output_path: Path,
+		mas_run: _JasonMasRun,
+		source_artifacts: Dict[str, Any],
+		method_library: HTNMethodLibrary | None,
+		action_schemas: Sequence[Dict[str, Any]],
+		seed_facts: Sequence[str],
+		problem_file: str | Path | None,
+		timing_profile: Dict[str, float],
+		total_start: float,
+		extra_artifacts: Optional[Dict[str, Any]] = None,
+	) -> JasonValidationResult:
+		"""Summarise one agent's output, write its artefacts and classify the run.
+
+		Everything is decided from the parsers and the bounded output tails; the
+		full output only exists in the stdout/stderr artefact files.
+		"""
+
+		java_bin = toolchain.java_bin
+		java_major = toolchain.java_major
+		javac_bin = toolchain.javac_bin
+		jason_jar = toolchain.jason_jar
+		exit_code = mas_run.exit_code
+		timed_out = mas_run.timed_out
+		stalled = mas_run.stalled
+		early_stopped = mas_run.early_stopped
+		worker_result = mas_run.worker_result
+		worker_error = mas_run.worker_error
+		stdout_capture = mas_run.stdout_capture
+		stderr_capture = mas_run.stderr_capture
+		stdout_parser = mas_run.stdout_parser
+		stderr_parser = mas_run.stderr_parser
+		stdout_path = output_path / "jason_stdout.txt"
+		stderr_path = output_path / "jason_stderr.txt"
+		action_path_path = output_path / "action_path.txt"
+		method_trace_path = output_path / "method_trace.json"
+		validation_json_path = output_path / "jason_validation.json"
 
 		output_processing_start = time.perf_counter()
-		stdout_text = self._normalise_process_output(raw_stdout)
-		stderr_text = self._normalise_process_output(raw_stderr)
-		stdout = self._combine_process_output(stdout_text, stderr_text)
-		stderr = stderr_text
-		action_path = self._extract_action_path(stdout)
-		method_trace_output = stderr_text if "runtime trace method" in stderr_text else stdout
-		raw_method_trace = self._extract_method_trace(method_trace_output)
-		method_trace, method_trace_original_count, method_trace_truncated = (
-			self._cap_method_trace_records(raw_method_trace)
+		stdout = self._combine_process_output(stdout_capture.text(), stderr_capture.text())
+		stderr = stderr_capture.text()
+		output_summary = summarize_jason_output(
+			stdout_parser,
+			stderr_parser,
+			method_trace_record_limit=self.method_trace_record_limit,
+			failed_goal_record_limit=self.failed_goal_record_limit,
+		)
+		action_path = output_summary.action_path
+		method_trace = output_summary.method_trace
+		method_trace_original_count = output_summary.method_trace_original_count
+		method_trace_truncated = output_summary.method_trace_truncated
+		observed_failed_goals = output_summary.observed_failed_goals
+		goal_repair_pass_count = output_summary.goal_repair_pass_count
+		# Status lines can be far behind the tail, so they lead the checked trace.
+		runtime_trace = self._combine_process_output(
+			"".join(f"{line}\n" for line in output_summary.status_lines),
+			stdout,
 		)
-		observed_failed_goals = self._extract_failed_goals(stdout)
-		goal_repair_pass_count = self._extract_goal_repair_pass_count(stdout)
 		timing_profile["output_processing_seconds"] = (
 			time.perf_counter() - output_processing_start
 		)
 
 		artifact_write_start = time.perf_counter()
-		stdout_artifact, stdout_truncated = self._bounded_runtime_output_artifact(stdout)
-		stderr_artifact, stderr_truncated = self._bounded_runtime_output_artifact(stderr)
-		stdout_path.write_text(stdout_artifact)
-		stderr_path.write_text(stderr_artifact)
+		if not mas_run.output_artifacts_streamed:
+			stdout_path.write_text(stdout_capture.bounded_text())
+			stderr_path.write_text(stderr_capture.bounded_text())
 		action_path_path.write_text(self._render_action_path(action_path))
 		method_trace_path.write_text(json.dumps(method_trace, indent=2))
 		timing_profile["artifact_write_seconds"] = time.perf_counter() - artifact_write_start
@@ -371,28 +792,34 @@ class JasonRunner:
 			"source_plan_library_kind": "S",
 			"runtime_projection_kind": "S_{I,g}",
 			"runtime_projection_scope": "evaluation_grounding_projection",
-			"agentspeak_generated": str(runner_asl_path),
-			"runtime_grounding_projection": str(runtime_projection_path),
-			"jason_runner_mas2j": str(runner_mas2j_path),
-			"runtime_environment_java": str(env_java_path),
-			"runtime_environment_class": str(env_class_path),
+			**source_artifacts,
 			"jason_stdout": str(stdout_path),
 			"jason_stderr": str(stderr_path),
 			"action_path": str(action_path_path),
 			"method_trace": str(method_trace_path),
 			"jason_validation": str(validation_json_path),
 			"goal_repair_pass_count": goal_repair_pass_count,
-			"stdout_artifact_truncated": stdout_truncated,
-			"stderr_artifact_truncated": stderr_truncated,
-			"stdout_chars": len(stdout),
-			"stderr_chars": len(stderr),
-			"stdout_sha256": hashlib.sha256(stdout.encode("utf-8")).hexdigest(),
-			"stderr_sha256": hashlib.sha256(stderr.encode("utf-8")).hexdigest(),
+			"stdout_artifact_truncated": stdout_capture.truncated,
+			"stderr_artifact_truncated": stderr_capture.truncated,
+			"stdout_chars": stdout_capture.total_chars,
+			"stderr_chars": stderr_capture.total_chars,
+			"stdout_sha256": stdout_capture.sha256,
+			"stderr_sha256": stderr_capture.sha256,
 			"method_trace_original_count": method_trace_original_count,
 			"method_trace_truncated": method_trace_truncated,
+			"mas_execution_mode": "worker_pool" if worker_result is not None else "subprocess",
+			"mas_early_stopped": early_stopped,
+			"runtime_stalled": stalled,
+			"stall_timeout_seconds": self.stall_timeout_seconds,
 		}
+		if worker_result is not None:
+			artifacts["jason_worker"] = worker_result.to_dict()
+		if worker_error is not None:
+			artifacts["jason_worker_fallback_reason"] = worker_error
+		if extra_artifacts:
+			artifacts.update(extra_artifacts)
 		environment_validation_start = time.perf_counter()
-		environment_result = self.environment_adapter.validate(stdout=stdout, stderr=stderr)
+		environment_result = self.environment_adapter.validate(stdout=runtime_trace, stderr=stderr)
 		timing_profile["environment_validation_seconds"] = (
 			time.perf_counter() - environment_validation_start
 		)
@@ -418,18 +845,19 @@ class JasonRunner:
 				"message": str(exc),
 			}
 		timing_profile["consistency_checks_seconds"] = time.perf_counter() - consistency_start
-		is_success = self._is_successful_run(
-			stdout=stdout,
+		is_success = not stalled and self._is_successful_run(
+			stdout=runtime_trace,
 			exit_code=exit_code,
 			timed_out=timed_out,
 			environment_result=environment_result,
 		)
 		status = "success" if is_success else "failed"
 		failure_class = None if is_success else self._failure_class(
-			stdout,
+			runtime_trace,
 			exit_code,
 			timed_out,
 			environment_result,
+			stalled=stalled,
 		)
 		failed_goals = [] if is_success else observed_failed_goals
 		artifacts["recovered_failed_goals"] = (
@@ -460,11 +888,12 @@ class JasonRunner:
 
 		if not is_success:
 			failure_reason = self._failure_reason(
-				stdout,
+				runtime_trace,
 				stderr,
 				exit_code,
 				timed_out,
 				environment_result,
+				stalled=stalled,
 			)
 			raise JasonValidationError(
 				f"Jason runtime validation failed: {failure_reason}",
@@ -473,12 +902,323 @@ class JasonRunner:
 
 		return result_payload
 
+	def validate_many(
+		self,
+		jobs: Sequence[JasonValidationJob],
+		*,
+		max_workers: int | None = None,
+	) -> List[JasonBatchValidationOutcome]:
+		"""Validate independent jobs concurrently and return outcomes in job order.
+
+		The toolchain is resolved and the environment class compiled once before any
+		job starts; every job then runs its own JVM in its own output directory with
+		its own timing profile. A job whose validation raises `JasonValidationError`
+		reports it in its outcome instead of aborting the batch.
+		"""
+
+		job_list = list(jobs)
+		if not job_list:
+			return []
+		output_dirs = self._distinct_job_output_dirs(job_list)
+
+		batch_runner = self.prepare_shared_runtime()
+		worker_count = max(1, min(len(job_list), max_workers or configured_batch_worker_count()))
+		submitted_at = time.perf_counter()
+
+		def run_job(index: int) -> JasonBatchValidationOutcome:
+			job = job_list[index]
+			started_at = time.perf_counter()
+			result: Optional[JasonValidationResult] = None
+			error: Optional[JasonValidationError] = None
+			try:
+				result = batch_runner.validate(**job.validate_kwargs())
+			except JasonValidationError as exc:
+				error = exc
+			return JasonBatchValidationOutcome(
+				job_id=job.job_id or str(index),
+				output_dir=output_dirs[index],
+				result=result,
+				error=error,
+				queue_seconds=started_at - submitted_at,
+				wall_seconds=time.perf_counter() - started_at,
+			)
+
+		with ThreadPoolExecutor(
+			max_workers=worker_count,
+			thread_name_prefix="jason-validate",
+		) as executor:
+			return list(executor.map(run_job, range(len(job_list))))
+
+	def validate_packed(
+		self,
+		jobs: Sequence[JasonValidationJob],
+		*,
+		output_dir: str | Path,
+	) -> List[JasonBatchValidationOutcome]:
+		"""Run the jobs as agents of one Jason MAS and validate each agent's output.
+
+		Jobs must share one domain and action-schema set (typically queries on one
+		problem file and plan library). Each job becomes an agent with its own world
+		inside the environment, so JVM and Jason boot are paid once for the pack. A
+		finished agent drops its intentions instead of stopping the MAS, and the JVM
+		is stopped once every agent has printed a terminal marker. Outcomes come back
+		in job order, each validated from its own agent's demultiplexed output.
+		"""
+
+		total_start = time.perf_counter()
+		job_list = list(jobs)
+		if not job_list:
+			return []
+		output_dirs = self._distinct_job_output_dirs(job_list)
+		reference_job = job_list[0]
+		if not reference_job.action_schemas:
+			raise JasonValidationError(
+				"Jason runtime requires action schemas for real environment execution.",
+				metadata={"action_schema_count": 0},
+			)
+		reference_actions = self._build_environment_data(
+			action_schemas=reference_job.action_schemas,
+			seed_facts=(),
+		)["actions"]
+		for job in job_list[1:]:
+			job_actions = self._build_environment_data(
+				action_schemas=job.action_schemas,
+				seed_facts=(),
+			)["actions"]
+			if job.domain_name != reference_job.domain_name or job_actions != reference_actions:
+				raise JasonValidationError(
+					"Packed Jason jobs must share one domain and action-schema set.",
+					metadata={"job_id": job.job_id, "domain_name": job.domain_name},
+				)
+
+		pack_path = Path(output_dir).resolve()
+		pack_path.mkdir(parents=True, exist_ok=True)
+		shared_timing: Dict[str, float] = {}
+		runtime_resolution_start = time.perf_counter()
+		toolchain, toolchain_source = self._resolve_toolchain()
+		shared_timing["runtime_resolution_seconds"] = (
+			time.perf_counter() - runtime_resolution_start
+		)
+		worker_pool = self.worker_pool or shared_worker_pool(
+			java_bin=toolchain.java_bin,
+			javac_bin=toolchain.javac_bin,
+			jason_jar=toolchain.jason_jar,
+			java_major=toolchain.java_major,
+		)
+
+		source_build_start = time.perf_counter()
+		agent_names = [f"query_{index}" for index in range(1, len(job_list) + 1)]
+		runner_asls: List[str] = []
+		job_source_artifacts: List[Dict[str, Any]] = []
+		agent_payloads: List[Dict[str, Any]] = []
+		for agent_name, job, job_output_dir in zip(agent_names, job_list, output_dirs):
+			job_output_path = Path(job_output_dir)
+			job_output_path.mkdir(parents=True, exist_ok=True)
+			grounding_stats: Dict[str, int] = {}
+			runner_asl = self._build_query_runner_asl(
+				agentspeak_code=job.agentspeak_code,
+				method_library=job.method_library,
+				plan_library=job.plan_library,
+				action_schemas=job.action_schemas,
+				seed_facts=job.seed_facts,
+				runtime_objects=job.runtime_objects,
+				object_types=job.object_types,
+				type_parent_map=job.type_parent_map,
+				query_goals=job.query_goals,
+				goal_facts=job.goal_facts,
+				grounding_stats=grounding_stats,
+			)
+			runner_asls.append(runner_asl)
+			job_source_artifacts.append(
+				{
+					**self._write_query_runner_sources(job_output_path, runner_asl),
+					"local_witness_grounding": grounding_stats,
+				},
+			)
+			(pack_path / f"{agent_name}.asl").write_text(self._packed_agent_asl(runner_asl))
+			agent_payloads.append(
+				{
+					"name": agent_name,
+					"seed_facts": self._build_environment_data(
+						action_schemas=(),
+						seed_facts=job.seed_facts,
+					)["seed_facts"],
+				},
+			)
+		env_data_path = pack_path / "jason_environment.json"
+		env_data_path.write_text(
+			json.dumps(
+				{
+					**self._build_environment_data(
+						action_schemas=reference_job.action_schemas,
+						seed_facts=(),
+					),
+					"agents": agent_payloads,
+				},
+				indent=2,
+			),
+		)
+		mas2j_path = pack_path / "jason_runner.mas2j"
+		mas2j_path.write_text(
+			self._build_runner_mas2j(
+				reference_job.domain_name,
+				asl_source_path=str(pack_path) if worker_pool is not None else ".",
+				environment_data_path=env_data_path,
+				agent_names=agent_names,
+			),
+		)
+		shared_timing["source_build_seconds"] = time.perf_counter() - source_build_start
+
+		runtime_classpath_entries, class_artifacts = self._resolve_runtime_classpath(
+			toolchain,
+			runner_asls=runner_asls,
+			timing_profile=shared_timing,
+		)
+
+		def packed_parsers() -> Tuple[JasonAgentOutputDemux, JasonAgentOutputDemux]:
+			packed_agents = JasonPackedAgents(agent_names)
+			return (
+				JasonAgentOutputDemux(
+					packed_agents,
+					self._new_output_parser,
+					tail_limit_chars=self.runtime_output_artifact_limit_chars,
+				),
+				JasonAgentOutputDemux(
+					packed_agents,
+					lambda: self._new_output_parser(record_action_events=True),
+					tail_limit_chars=self.runtime_output_artifact_limit_chars,
+				),
+			)
+
+		mas_run = self._run_mas(
+			toolchain,
+			worker_pool=worker_pool,
+			work_dir=pack_path,
+			mas2j_path=mas2j_path,
+			classpath_entries=runtime_classpath_entries,
+			stdout_path=pack_path / "jason_stdout.txt",
+			stderr_path=pack_path / "jason_stderr.txt",
+			parser_factory=packed_parsers,
+			timing_profile=shared_timing,
+		)
+
+		outcomes: List[JasonBatchValidationOutcome] = []
+		for index, (agent_name, job) in enumerate(zip(agent_names, job_list)):
+			agent_start = time.perf_counter()
+			stdout_parser = mas_run.stdout_parser.parsers[agent_name]
+			stderr_parser = mas_run.stderr_parser.parsers[agent_name]
+			agent_run = replace(
+				mas_run,
+				stdout_capture=mas_run.stdout_parser.captures[agent_name],
+				stderr_capture=mas_run.stderr_parser.captures[agent_name],
+				output_artifacts_streamed=False,
+				stdout_parser=stdout_parser,
+				stderr_parser=stderr_parser,
+			)
+			if stdout_parser.terminal_marker or stderr_parser.terminal_marker:
+				# This agent finished; a slower pack member does not fail it.
+				agent_run = replace(
+					agent_run,
+					exit_code=mas_run.exit_code if mas_run.exit_code is not None else 0,
+					timed_out=False,
+					stalled=False,
+				)
+			result: Optional[JasonValidationResult] = None
+			error: Optional[JasonValidationError] = None
+			try:
+				result = self._finish_validation(
+					toolchain,
+					output_path=Path(output_dirs[index]),
+					mas_run=agent_run,
+					source_artifacts={
+						**job_source_artifacts[index],
+						"jason_runner_mas2j": str(mas2j_path),
+						"runtime_environment_data": str(env_data_path),
+						"toolchain_source": toolchain_source,
+						**class_artifacts,
+					},
+					method_library=job.method_library,
+					action_schemas=job.action_schemas,
+					seed_facts=job.seed_facts,
+					problem_file=job.problem_file,
+					timing_profile=dict(shared_timing),
+					total_start=total_start,
+					extra_artifacts={
+						"packed_agent": agent_name,
+						"packed_agent_count": len(agent_names),
+						"packed_output_dir": str(pack_path),
+					},
+				)
+			except JasonValidationError as exc:
+				error = exc
+			outcomes.append(
+				JasonBatchValidationOutcome(
+					job_id=job.job_id or str(index),
+					output_dir=output_dirs[index],
+					result=result,
+					error=error,
+					queue_seconds=0.0,
+					wall_seconds=time.perf_counter() - agent_start,
+				),
+			)
+		return outcomes
+
+	@staticmethod
+	def _distinct_job_output_dirs(jobs: Sequence[JasonValidationJob]) -> List[str]:
+		output_dirs = [str(Path(job.output_dir).resolve()) for job in jobs]
+		duplicate_output_dirs = sorted(
+			{output_dir for output_dir in output_dirs if output_dirs.count(output_dir) > 1},
+		)
+		if duplicate_output_dirs:
+			raise JasonValidationError(
+				"Jason batch validation jobs must use distinct output directories.",
+				metadata={"duplicate_output_dirs": duplicate_output_dirs},
+			)
+		return output_dirs
+
+	@staticmethod
+	def _packed_agent_asl(runner_asl: str) -> str:
+		"""Keep a finished pack member idle instead of stopping every other agent."""
+
+		return re.sub(r"\.stopMAS\b", ".drop_all_intentions", runner_asl)
+
+	def prepare_shared_runtime(self) -> "JasonRunner":
+		"""Return a runner bound to one resolved toolchain and compiled environment.
+
+		The returned runner shares this runner's class cache, worker pool and
+		adapter, so concurrent validations on it only read cached classes. Its
+		schema lookups and simulators are cached per thread.
+		"""
+
+		toolchain = self.resolve_toolchain()
+		shared_runner = copy.copy(self)
+		shared_runner.toolchain = toolchain
+		shared_runner._thread_caches = _RunnerThreadCaches()
+		shared_runner._resolve_environment_class_dir(
+			java_bin=toolchain.java_bin,
+			java_major=toolchain.java_major,
+			javac_bin=toolchain.javac_bin,
+			jason_jar=toolchain.jason_jar,
+			env_source=shared_runner._build_environment_java_source(),
+			timing_profile={},
+		)
+		return shared_runner
+
+	def _new_output_parser(self, *, record_action_events: bool = False) -> JasonOutputParser:
+		return JasonOutputParser(
+			success_marker=self.success_marker,
+			failure_marker=self.failure_marker,
+			method_trace_record_limit=max(1, int(self.method_trace_record_limit)),
+			record_action_events=record_action_events,
+		)
+
 	def _action_schema_lookup(
 		self,
 		action_schemas: Sequence[Dict[str, Any]],
 	) -> Dict[str, Dict[str, Any]]:
 		cache_key = id(action_schemas)
-		cached = self._action_schema_lookup_cache.get(cache_key)
+		lookup_cache = self._thread_caches.action_schema_lookups
+		cached = lookup_cache.get(cache_key)
 		if cached is not None:
 			return cached
 		schema_lookup: Dict[str, Dict[str, Any]] = {}
@@ -489,46 +1229,47 @@ class JasonRunner:
 				schema_lookup.setdefault(functor, schema)
 			if source_name:
 				schema_lookup.setdefault(source_name, schema)
-		if len(self._action_schema_lookup_cache) >= 16:
-			self._action_schema_lookup_cache.clear()
-		self._action_schema_lookup_cache[cache_key] = schema_lookup
+		if len(lookup_cache) >= 16:
+			lookup_cache.clear()
+		lookup_cache[cache_key] = schema_lookup
 		return schema_lookup
 
-	def _replay_plan_steps_into_world(
+	def _ground_simulator(
 		self,
-		*,
-		world: Set[str],
-		steps: Sequence[Any],
-		schema_lookup: Dict[str, Dict[str, Any]],
-	) -> Set[str]:
-		next_world = set(world)
-		for step in steps:
-			step_name = str(getattr(step, "action_name", None) or getattr(step, "task_name", "")).strip()
-			schema = schema_lookup.get(step_name)
-			if schema is None:
-				continue
-			parameters = [str(item) for item in (schema.get("parameters") or [])]
-			bindings: Dict[str, str] = {}
-			for parameter, value in zip(parameters, getattr(step, "args", ()) or ()):
-				token = self._canonical_runtime_token(parameter)
-				bindings[token] = str(value)
-				if token.startswith("?"):
-					bindings[token[1:]] = str(value)
-
-			for effect in self._ordered_runtime_effects(schema.get("effects") or []):
-				predicate = str(effect.get("predicate", "")).strip()
-				if not predicate or predicate == "=":
-					continue
-				grounded = self._ground_runtime_pattern(
-					predicate,
-					effect.get("args") or [],
-					bindings,
-				)
-				if effect.get("is_positive", True):
-					next_world.add(grounded)
-				else:
-					next_world.discard(grounded)
-		return next_world
+		action_schemas: Sequence[Dict[str, Any]],
+	) -> GroundActionSimulator:
+		"""Return the bitset simulator for one action-schema sequence.
+
+		Entries hold the schema sequence itself, so an id is never reused while its
+		simulator is cached.
+		"""
+
+		cache_key = id(action_schemas)
+		simulator_cache = self._thread_caches.ground_simulators
+		cached = simulator_cache.get(cache_key)
+		if cached is not None and cached[0] is action_schemas:
+			return cached[1]
+		simulator = GroundActionSimulator(
+			action_schemas,
+			token=self._canonical_runtime_token,
+		)
+		if len(simulator_cache) >= 16:
+			simulator_cache.clear()
+		simulator_cache[cache_key] = (action_schemas, simulator)
+		return simulator
+
+	def _symbol_table(self) -> SymbolTable:
+		"""Return this thread's table for parsing and rendering runtime atoms.
+
+		Callers only take strings and name tuples out of it, so clearing a full
+		table never invalidates anything they hold.
+		"""
+
+		thread_caches = self._thread_caches
+		symbols = thread_caches.symbols
+		if symbols.entry_count > thread_caches.symbol_table_limit:
+			symbols.clear()
+		return symbols
 
 	def _runtime_world_to_hddl_facts(
 		self,
@@ -602,7 +1343,14 @@ class JasonRunner:
 				for literal in schema.get(collection_name) or ():
 					if isinstance(literal, dict):
 						register(literal.get("predicate"))
-			for clause in schema.get("precondition_clauses") or ():
+			for clause in (
+				*(schema.get("precondition_clauses") or ()),
+				*(
+					clause
+					for factor in schema.get("precondition_factors") or ()
+					for clause in factor or ()
+				),
+			):
 				for literal in clause or ():
 					if isinstance(literal, dict):
 						register(literal.get("predicate"))
@@ -633,6 +1381,7 @@ class JasonRunner:
 		type_parent_map: Optional[Dict[str, Optional[str]]] = None,
 		query_goals: Sequence[Any] = (),
 		goal_facts: Sequence[str] = (),
+		grounding_stats: Optional[Dict[str, int]] = None,
 	) -> str:
 		runtime_ready_code = self._inject_runtime_object_beliefs(
 			agentspeak_code,
@@ -641,19 +1390,28 @@ class JasonRunner:
 			object_types=object_types or {},
 			type_parent_map=type_parent_map or {},
 		)
-		environment_ready_code = self._rewrite_primitive_wrappers_for_environment(runtime_ready_code)
-		method_goal_ready_code = self._rewrite_method_primitive_actions_to_goals(
-			environment_ready_code,
-			action_schemas=action_schemas,
-		)
-		deferred_type_ready_code = self._defer_type_only_local_context_guards(
-			method_goal_ready_code,
-		)
-		trace_ready_code = self._instrument_method_plans(
-			deferred_type_ready_code,
-			method_library,
-			plan_library=plan_library,
-		)
+		library_segment: Optional[RunnerLibrarySegment] = None
+		library_start = runtime_ready_code.find("/* Primitive Action Plans */")
+		if (
+			self.library_segment_memo is not None
+			and library_start != -1
+			and "runtime trace method" not in runtime_ready_code[:library_start]
+		):
+			# Everything after the initial beliefs is query independent.
+			library_segment = self._runner_library_segment(
+				runtime_ready_code[library_start:],
+				method_library=method_library,
+				plan_library=plan_library,
+				action_schemas=action_schemas,
+			)
+			trace_ready_code = runtime_ready_code[:library_start] + library_segment.library_code
+		else:
+			trace_ready_code = self._render_library_code(
+				runtime_ready_code,
+				method_library=method_library,
+				plan_library=plan_library,
+				action_schemas=action_schemas,
+			)
 		goal_context = self._render_goal_fact_context(goal_facts)
 		failure_repair_enabled = bool(query_goals) and self._failure_repair_enabled()
 		goal_retry_enabled = bool(goal_context) or failure_repair_enabled
@@ -664,17 +1422,31 @@ class JasonRunner:
 			object_types=object_types or {},
 			type_parent_map=type_parent_map or {},
 			enable_blocked_goal_guards=failure_repair_enabled,
+			library_segment=library_segment,
+			grounding_stats=grounding_stats,
+		)
+		failure_handler_key = (failure_repair_enabled, len(query_goals))
+		failure_handler_lines = (
+			library_segment.failure_handlers.get(failure_handler_key)
+			if library_segment is not None
+			else None
 		)
+		if failure_handler_lines is None:
+			failure_handler_lines = tuple(
+				self._render_failure_handlers(
+					method_library,
+					plan_library=plan_library,
+					action_schemas=action_schemas,
+					allow_repair=failure_repair_enabled,
+					query_goal_count=len(query_goals),
+				),
+			)
+			if library_segment is not None:
+				library_segment.failure_handlers[failure_handler_key] = failure_handler_lines
 		lines = [
 			lowered_code.rstrip(),
 			"",
-			*self._render_failure_handlers(
-				method_library,
-				plan_library=plan_library,
-				action_schemas=action_schemas,
-				allow_repair=failure_repair_enabled,
-				query_goal_count=len(query_goals),
-			),
+			*failure_handler_lines,
 			"",
 			"/* Execution Entry */",
 			"!execute.",
@@ -707,10 +1479,71 @@ class JasonRunner:
 					track_runtime_failures=failure_repair_enabled,
 				),
 			)
-		lines.append("-!execute : true <-")
-		lines.extend(self._indent_body(['.print("execute failed")', ".stopMAS"]))
-		lines.append("")
-		return "\n".join(lines)
+		lines.append("-!execute : true <-")
+		lines.extend(self._indent_body(['.print("execute failed")', ".stopMAS"]))
+		lines.append("")
+		return "\n".join(lines)
+
+	def _render_library_code(
+		self,
+		agentspeak_code: str,
+		*,
+		method_library: HTNMethodLibrary | None,
+		plan_library: PlanLibrary | None,
+		action_schemas: Sequence[Dict[str, Any]],
+	) -> str:
+		environment_ready_code = self._rewrite_primitive_wrappers_for_environment(agentspeak_code)
+		method_goal_ready_code = self._rewrite_method_primitive_actions_to_goals(
+			environment_ready_code,
+			action_schemas=action_schemas,
+		)
+		deferred_type_ready_code = self._defer_type_only_local_context_guards(
+			method_goal_ready_code,
+		)
+		return self._instrument_method_plans(
+			deferred_type_ready_code,
+			method_library,
+			plan_library=plan_library,
+		)
+
+	def _runner_library_segment(
+		self,
+		library_code: str,
+		*,
+		method_library: HTNMethodLibrary | None,
+		plan_library: PlanLibrary | None,
+		action_schemas: Sequence[Dict[str, Any]],
+	) -> RunnerLibrarySegment:
+		"""Return the memoised library-level rendering for `library_code`."""
+
+		memo = self.library_segment_memo or shared_library_segment_memo()
+		fingerprint = runner_library_fingerprint(
+			library_code,
+			method_library=method_library,
+			plan_library=plan_library,
+			action_schemas=action_schemas,
+		)
+		segment = memo.get(fingerprint)
+		if segment is not None:
+			return segment
+
+		rendered_code = self._render_library_code(
+			library_code,
+			method_library=method_library,
+			plan_library=plan_library,
+			action_schemas=action_schemas,
+		)
+		segment = RunnerLibrarySegment(fingerprint=fingerprint, library_code=rendered_code)
+		_, _, chunks, _ = self._split_method_plan_chunks(rendered_code)
+		for chunk in chunks:
+			chunk_text = "\n".join(chunk)
+			segment.witness_specs[chunk_text] = self._local_witness_chunk_spec(chunk)
+			guarded_chunk = self._guard_runtime_method_chunk(chunk_text)
+			segment.guarded_chunks[chunk_text] = guarded_chunk
+			segment.chunk_order_features[guarded_chunk] = (
+				self._runtime_method_chunk_order_features(guarded_chunk)
+			)
+		return memo.put(segment)
 
 	def _render_execute_body(
 		self,
@@ -1512,17 +2345,11 @@ class JasonRunner:
 		return canonical.startswith("?") and canonical not in task_formals
 
 	def _parse_runtime_atom(self, atom: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
-		text = str(atom or "").strip()
-		if not text:
-			return None
-		if "(" not in text:
-			return self._sanitize_name(text), ()
-		if not text.endswith(")"):
+		symbols = self._symbol_table()
+		encoded = symbols.encode_agentspeak(str(atom or ""))
+		if encoded is None:
 			return None
-		predicate, args_text = text.split("(", 1)
-		predicate = self._sanitize_name(predicate)
-		args = self._split_asl_arguments(args_text[:-1])
-		return predicate, tuple(self._canonical_runtime_token(arg) for arg in args)
+		return symbols.functor(encoded), symbols.decode_args(encoded)
 
 	def _render_retry_query_goal_calls(self, query_goals: Sequence[Any]) -> Tuple[str, ...]:
 		return tuple(
@@ -1654,90 +2481,14 @@ class JasonRunner:
 		return tuple(goal_calls)
 
 	def _extract_action_path(self, stdout: str) -> List[str]:
-		action_pattern = re.compile(r"^runtime env action success (.+?)\s*$")
-		snapshot_pattern = re.compile(r"^runtime env snapshot (.+?)\s*$")
-		restore_pattern = re.compile(r"^runtime env restore (.+?)\s*$")
-		commit_pattern = re.compile(r"^runtime env commit (.+?)\s*$")
-		actions: List[str] = []
-		snapshots: List[Tuple[str, int]] = []
-		for raw_line in stdout.splitlines():
-			line = raw_line.strip()
-			if match := snapshot_pattern.match(line):
-				snapshots.append((match.group(1).strip(), len(actions)))
-				continue
-			if match := restore_pattern.match(line):
-				key = match.group(1).strip()
-				for index in range(len(snapshots) - 1, -1, -1):
-					snapshot_key, action_count = snapshots[index]
-					if snapshot_key != key:
-						continue
-					del actions[action_count:]
-					del snapshots[index:]
-					break
-				continue
-			if match := commit_pattern.match(line):
-				key = match.group(1).strip()
-				for index in range(len(snapshots) - 1, -1, -1):
-					if snapshots[index][0] == key:
-						del snapshots[index]
-						break
-				continue
-			if match := action_pattern.match(line):
-				actions.append(match.group(1).strip())
-		return actions
+		return JasonOutputParser().feed_text(stdout).action_path
 
 	@staticmethod
 	def _extract_goal_repair_pass_count(stdout: str) -> int:
-		passes = [
-			int(match.group(1))
-			for match in re.finditer(r"runtime query pass\s+([0-9]+)", str(stdout or ""))
-		]
-		return max(passes) if passes else 0
+		return JasonOutputParser().feed_text(stdout).goal_repair_pass_count
 
 	def _extract_method_trace(self, stdout: str) -> List[Dict[str, Any]]:
-		flat_pattern = re.compile(r"runtime trace method flat\s+(.+?)\s*$")
-		legacy_pattern = re.compile(r"runtime trace method\s+trace_method\((.*)\)\s*$")
-		trace: List[Dict[str, Any]] = []
-		for raw_line in stdout.splitlines():
-			line = raw_line.strip()
-			flat_match = flat_pattern.search(line)
-			if flat_match is not None:
-				payload = flat_match.group(1).strip()
-				parts = [part.strip() for part in payload.split("|")]
-				if not parts or not parts[0]:
-					continue
-				trace.append(
-					{
-						"method_name": parts[0],
-						"task_args": [
-							part
-							for part in parts[1:]
-							if part
-						],
-					},
-				)
-				continue
-
-			legacy_match = legacy_pattern.search(line)
-			if legacy_match is None:
-				continue
-			payload = legacy_match.group(1).strip()
-			if not payload:
-				continue
-			parts = [part.strip() for part in payload.split(",")]
-			if not parts or not parts[0]:
-				continue
-			trace.append(
-				{
-					"method_name": self._strip_quoted_atom(parts[0]),
-					"task_args": [
-						self._strip_quoted_atom(part)
-						for part in parts[1:]
-						if part
-					],
-				},
-			)
-		return trace
+		return JasonOutputParser().feed_text(stdout).method_trace
 
 	def _cap_method_trace_records(
 		self,
@@ -1750,18 +2501,6 @@ class JasonRunner:
 			return records, original_count, False
 		return records[:limit], original_count, True
 
-	def _bounded_runtime_output_artifact(self, text: str) -> Tuple[str, bool]:
-		value = str(text or "")
-		limit = max(1, int(self.runtime_output_artifact_limit_chars))
-		if len(value) <= limit:
-			return value, False
-		prefix = (
-			f"[truncated runtime output: original_chars={len(value)}, "
-			f"kept_tail_chars={limit}, "
-			f"sha256={hashlib.sha256(value.encode('utf-8')).hexdigest()}]\n"
-		)
-		return f"{prefix}{value[-limit:]}", True
-
 	def _extract_panda_method_trace(self, plan_text: str) -> List[Dict[str, Any]]:
 		lines = [
 			line.strip()
@@ -2013,26 +2752,10 @@ class JasonRunner:
 		return bridge_specs
 
 	def _extract_failed_goals(self, stdout: str) -> List[str]:
-		pattern = re.compile(r"runtime goal failed\s+fail_goal\((.*)\)\s*$")
-		failed: List[str] = []
-		seen: Set[str] = set()
-		truncated_count = 0
-		for raw_line in stdout.splitlines():
-			line = raw_line.strip()
-			match = pattern.search(line)
-			if match is None:
-				continue
-			payload = match.group(1).strip()
-			if not payload or payload in seen:
-				continue
-			seen.add(payload)
-			if len(failed) < self.failed_goal_record_limit:
-				failed.append(payload)
-			else:
-				truncated_count += 1
-		if truncated_count:
-			failed.append(f"... truncated {truncated_count} additional failed goals")
-		return failed
+		return bound_failed_goals(
+			JasonOutputParser().feed_text(stdout).failed_goals,
+			limit=self.failed_goal_record_limit,
+		)
 
 	def _render_action_path(self, action_path: Sequence[str]) -> str:
 		if not action_path:
@@ -2060,7 +2783,7 @@ class JasonRunner:
 
 	@staticmethod
 	def _sanitize_name(name: str) -> str:
-		return re.sub(r"[^A-Za-z0-9_]+", "_", str(name).strip()).strip("_") or "term"
+		return agentspeak_functor(name)
 
 	@staticmethod
 	def _asl_string(text: str) -> str:
@@ -2073,12 +2796,9 @@ class JasonRunner:
 			return token
 		return cls._asl_string(token)
 
-	@classmethod
-	def _runtime_atom_term(cls, text: str) -> str:
-		token = str(text).strip()
-		if len(token) >= 2 and token[0] == token[-1] and token[0] in {'"', "'"}:
-			return token
-		return cls._asl_atom_or_string(token)
+	@staticmethod
+	def _runtime_atom_term(text: str) -> str:
+		return agentspeak_term(text)
 
 	@classmethod
 	def _type_closure(
@@ -2143,13 +2863,6 @@ class JasonRunner:
 				parts.append(cleaned)
 		return " & ".join(parts) if parts else "true"
 
-	@staticmethod
-	def _strip_quoted_atom(text: str) -> str:
-		token = str(text).strip()
-		if len(token) >= 2 and token[0] == token[-1] and token[0] in {'"', "'"}:
-			return token[1:-1]
-		return token
-
 	@staticmethod
 	def _failure_handler_args(
 		parameters: Sequence[str],
@@ -2685,24 +3398,21 @@ class JasonRunner:
 			return line
 		return f"{indent}!{statement}{suffix or ''}"
 
-	def _ground_local_witness_method_plans(
+	def _split_method_plan_chunks(
 		self,
 		agentspeak_code: str,
-		*,
-		seed_facts: Sequence[str],
-		runtime_objects: Sequence[str],
-		object_types: Dict[str, str],
-		type_parent_map: Dict[str, Optional[str]],
-		enable_blocked_goal_guards: bool = False,
-		max_candidates_per_clause: int = 64,
-		max_total_specialised_chunks: int = 1024,
-	) -> str:
+	) -> Tuple[str, str, List[List[str]], str]:
+		"""Return `(prefix, header, chunks, suffix)` around the HTN method plan section.
+
+		`header` is empty when the program has no method plan section.
+		"""
+
 		start_marker = "/* HTN Method Plans */"
 		end_marker = "/* Failure Handlers */"
 		start_index = agentspeak_code.find(start_marker)
 		end_index = agentspeak_code.find(end_marker)
 		if start_index == -1:
-			return agentspeak_code
+			return agentspeak_code, "", [], ""
 		if end_index == -1 or end_index <= start_index:
 			end_index = len(agentspeak_code)
 
@@ -2711,13 +3421,11 @@ class JasonRunner:
 		suffix = agentspeak_code[end_index:]
 		section_lines = section.splitlines()
 		if not section_lines:
-			return agentspeak_code
+			return agentspeak_code, "", [], ""
 
-		header = section_lines[0]
-		content_lines = section_lines[1:]
 		chunks: List[List[str]] = []
 		current: List[str] = []
-		for line in content_lines:
+		for line in section_lines[1:]:
 			if not line.strip():
 				if current:
 					chunks.append(current)
@@ -2726,6 +3434,33 @@ class JasonRunner:
 			current.append(line)
 		if current:
 			chunks.append(current)
+		return prefix, section_lines[0], chunks, suffix
+
+	def _ground_local_witness_method_plans(
+		self,
+		agentspeak_code: str,
+		*,
+		seed_facts: Sequence[str],
+		runtime_objects: Sequence[str],
+		object_types: Dict[str, str],
+		type_parent_map: Dict[str, Optional[str]],
+		enable_blocked_goal_guards: bool = False,
+		max_candidates_per_clause: int = 64,
+		max_total_specialised_chunks: int = 1024,
+		library_segment: Optional[RunnerLibrarySegment] = None,
+		grounding_stats: Optional[Dict[str, int]] = None,
+	) -> str:
+		"""
+		Specialise method plans over the query's facts for their local witnesses.
+
+		`max_candidates_per_clause` bounds the specialised copies of one clause;
+		a clause with more candidate bindings keeps only its generic plan and is
+		counted under `clauses_over_limit` in `grounding_stats`.
+		"""
+
+		prefix, header, chunks, suffix = self._split_method_plan_chunks(agentspeak_code)
+		if not header:
+			return agentspeak_code
 
 		fact_index, type_domains = self._runtime_fact_index_for_local_witness_grounding(
 			seed_facts=seed_facts,
@@ -2733,42 +3468,60 @@ class JasonRunner:
 			object_types=object_types,
 			type_parent_map=type_parent_map,
 		)
+		grounding_index = GroundingFactIndex(fact_index, canonical=self._canonical_runtime_token)
+		stats = grounding_stats if grounding_stats is not None else {}
+		for key in ("clauses_grounded", "clauses_over_limit", "specialised_chunks", "join_probes"):
+			stats.setdefault(key, 0)
 		specialised_chunks: List[str] = []
 		changed = False
 		total_specialised_chunks = 0
 		for chunk in chunks:
+			chunk_text = "\n".join(chunk)
+			if library_segment is not None and chunk_text in library_segment.witness_specs:
+				witness_spec = library_segment.witness_specs[chunk_text]
+			else:
+				witness_spec = self._local_witness_chunk_spec(chunk)
+			if witness_spec is None:
+				specialised_chunks.append(chunk_text)
+				continue
 			specialised = self._specialise_method_chunk_local_witnesses(
 				chunk,
 				fact_index=fact_index,
 				type_domains=type_domains,
 				max_candidates_per_clause=max_candidates_per_clause,
+				witness_spec=witness_spec,
+				grounding_index=grounding_index,
+				grounding_stats=stats,
 			)
+			stats["clauses_grounded"] += 1
 			next_specialised_count = total_specialised_chunks + max(0, len(specialised) - 1)
 			if next_specialised_count > max_total_specialised_chunks:
-				specialised = ["\n".join(chunk)]
+				specialised = [chunk_text]
 			else:
 				total_specialised_chunks = next_specialised_count
-			if len(specialised) != 1 or specialised[0] != "\n".join(chunk):
+			if len(specialised) != 1 or specialised[0] != chunk_text:
 				changed = True
+				stats["specialised_chunks"] += len(specialised) - 1
 			specialised_chunks.extend(specialised)
 
-		pre_recursive_guard_chunks = list(specialised_chunks)
-		specialised_chunks = self._insert_self_recursive_no_ancestor_guards(
-			specialised_chunks,
-		)
-		if specialised_chunks != pre_recursive_guard_chunks:
-			changed = True
-		pre_guard_promotion_chunks = list(specialised_chunks)
-		specialised_chunks = self._promote_body_no_ancestor_guards_to_context(
-			specialised_chunks,
-		)
-		if specialised_chunks != pre_guard_promotion_chunks:
+		guarded_chunks = library_segment.guarded_chunks if library_segment is not None else {}
+		pre_guard_chunks = list(specialised_chunks)
+		specialised_chunks = [
+			guarded_chunks.get(chunk) or self._guard_runtime_method_chunk(chunk)
+			for chunk in specialised_chunks
+		]
+		if specialised_chunks != pre_guard_chunks:
 			changed = True
 		_ = enable_blocked_goal_guards
 		pre_ordered_chunks = list(specialised_chunks)
 		specialised_chunks = self._order_runtime_method_plan_chunks(
 			specialised_chunks,
 			fact_index=fact_index,
+			chunk_features=(
+				library_segment.chunk_order_features
+				if library_segment is not None
+				else None
+			),
 		)
 		if specialised_chunks != pre_ordered_chunks:
 			changed = True
@@ -2779,6 +3532,13 @@ class JasonRunner:
 		rewritten_section = "\n\n".join([header, *specialised_chunks]).rstrip() + "\n\n"
 		return f"{prefix}{rewritten_section}{suffix}"
 
+	def _guard_runtime_method_chunk(self, chunk: str) -> str:
+		"""Apply the self-recursive no-ancestor rewrites to one method plan chunk."""
+
+		return self._promote_body_no_ancestor_guards_to_context(
+			self._insert_self_recursive_no_ancestor_guards([chunk]),
+		)[0]
+
 	def _defer_type_only_local_context_guards(self, agentspeak_code: str) -> str:
 		"""
 		Remove runtime-only local type guards that would bind variables too early.
@@ -3057,129 +3817,123 @@ class JasonRunner:
 		chunks: Sequence[str],
 		*,
 		fact_index: Dict[Tuple[str, int], Tuple[Tuple[str, ...], ...]],
+		chunk_features: Optional[Dict[str, Any]] = None,
 	) -> List[str]:
 		if not chunks:
 			return []
 
 		current_fact_arg_pairs = self._runtime_fact_arg_pair_index(fact_index)
-		parsed_chunks: List[Dict[str, Any]] = []
+		grouped_items: Dict[str, List[Tuple[Tuple[int, ...], str]]] = {}
+		group_order: List[str] = []
 		for index, chunk in enumerate(chunks):
-			lines = chunk.splitlines()
-			if not lines:
-				parsed_chunks.append({"index": index, "chunk": chunk, "task_name": "", "sort_key": (0,)})
-				continue
-			parsed_head = self._parse_asl_method_head(lines[0])
-			if parsed_head is None:
-				parsed_chunks.append({"index": index, "chunk": chunk, "task_name": "", "sort_key": (0,)})
-				continue
-			task_name, head_args, context_parts = parsed_head
-			body_lines = list(lines[1:])
-			parsed_chunks.append(
-				{
-					"index": index,
-					"chunk": chunk,
-					"task_name": task_name,
-					"head_args": head_args,
-					"context_parts": context_parts,
-					"body_lines": body_lines,
-				},
+			features = chunk_features.get(chunk) if chunk_features is not None else None
+			if features is None:
+				features = self._runtime_method_chunk_order_features(chunk)
+			task_name, static_sort_key, body_goals = features
+			group_name = task_name or f"__raw_{index}"
+			if group_name not in grouped_items:
+				grouped_items[group_name] = []
+				group_order.append(group_name)
+			body_current_fact_pair_score = self._body_current_fact_pair_score(
+				body_goals,
+				current_fact_arg_pairs,
+			)
+			grouped_items[group_name].append(
+				((*static_sort_key, -body_current_fact_pair_score, index), chunk),
 			)
-
-		grouped_indexes: Dict[str, List[int]] = {}
-		group_order: List[str] = []
-		for index, item in enumerate(parsed_chunks):
-			task_name = str(item.get("task_name") or f"__raw_{index}")
-			if task_name not in grouped_indexes:
-				grouped_indexes[task_name] = []
-				group_order.append(task_name)
-			grouped_indexes[task_name].append(index)
 
 		ordered_chunks: List[str] = []
-		for task_name in group_order:
-			group_items = [parsed_chunks[index] for index in grouped_indexes[task_name]]
-			for item in group_items:
-				lines = str(item.get("chunk") or "").splitlines()
-				body_lines = list(item.get("body_lines") or ())
-				body_goals = [
-					goal
-					for goal in (
-						self._parse_asl_goal_call(line)
-						for line in body_lines
+		for group_name in group_order:
+			group_items = grouped_items[group_name]
+			group_items.sort(key=lambda item: item[0])
+			ordered_chunks.extend(chunk for _, chunk in group_items)
+		return ordered_chunks
+
+	def _runtime_method_chunk_order_features(
+		self,
+		chunk: str,
+	) -> Tuple[str, Tuple[int, ...], Tuple[Tuple[str, Tuple[str, ...]], ...]]:
+		"""Return `(task_name, static_sort_key, body_goals)` for one method plan chunk.
+
+		The static key holds every ordering criterion that does not depend on the
+		current facts; only the body fact-pair score is computed per query.
+		"""
+
+		lines = chunk.splitlines()
+		parsed_head = self._parse_asl_method_head(lines[0]) if lines else None
+		if parsed_head is None:
+			return "", (0,), ()
+		task_name, head_args, context_parts = parsed_head
+		body_goals = tuple(
+			goal
+			for goal in (
+				self._parse_asl_goal_call(line)
+				for line in lines[1:]
+			)
+			if goal is not None
+		)
+		body_goal_count = len(body_goals)
+		has_self_recursive_goal = any(
+			str(goal[0]).strip() == str(task_name or "").strip()
+			for goal in body_goals
+		)
+		variable_safe = self._chunk_runtime_variables_are_safe(lines)
+		empty_body_rank = 0 if body_goal_count == 0 else 1
+		body_goal_rank = 0 if body_goal_count == 0 else -body_goal_count
+		grounded_head_arg_count = sum(
+			1
+			for arg in tuple(head_args or ())
+			if not self._looks_like_asl_variable(str(arg))
+		)
+		head_variable_set = {
+			str(arg)
+			for arg in tuple(head_args or ())
+			if self._looks_like_asl_variable(str(arg))
+		}
+		local_context_variables: Set[str] = set()
+		non_type_context_count = sum(
+			1
+			for part in tuple(context_parts or ())
+			if not str(part).strip().startswith("object_type(")
+		)
+		grounded_context_arg_count = 0
+		for part in tuple(context_parts or ()):
+			parsed = self._parse_asl_context_conjunct(str(part))
+			if parsed is None:
+				continue
+			if parsed.get("kind") == "atom":
+				if str(parsed.get("predicate") or "").strip() == "object_type":
+					continue
+				local_context_variables.update(
+					str(arg)
+					for arg in tuple(parsed.get("args") or ())
+					if (
+						self._looks_like_asl_variable(str(arg))
+						and str(arg) not in head_variable_set
 					)
-					if goal is not None
-				]
-				body_goal_count = len(body_goals)
-				has_self_recursive_goal = any(
-					str(goal[0]).strip() == str(item.get("task_name") or "").strip()
-					for goal in body_goals
 				)
-				variable_safe = self._chunk_runtime_variables_are_safe(lines)
-				body_current_fact_pair_score = self._body_current_fact_pair_score(
-					body_goals,
-					current_fact_arg_pairs,
-				)
-				empty_body_rank = 0 if body_goal_count == 0 else 1
-				body_goal_rank = 0 if body_goal_count == 0 else -body_goal_count
-				grounded_head_arg_count = sum(
+				grounded_context_arg_count += sum(
 					1
-					for arg in tuple(item.get("head_args") or ())
+					for arg in tuple(parsed.get("args") or ())
 					if not self._looks_like_asl_variable(str(arg))
 				)
-				head_variable_set = {
-					str(arg)
-					for arg in tuple(item.get("head_args") or ())
-					if self._looks_like_asl_variable(str(arg))
-				}
-				local_context_variables: Set[str] = set()
-				non_type_context_count = sum(
+			elif parsed.get("kind") == "inequality":
+				grounded_context_arg_count += sum(
 					1
-					for part in tuple(item.get("context_parts") or ())
-					if not str(part).strip().startswith("object_type(")
-				)
-				grounded_context_arg_count = 0
-				for part in tuple(item.get("context_parts") or ()):
-					parsed = self._parse_asl_context_conjunct(str(part))
-					if parsed is None:
-						continue
-					if parsed.get("kind") == "atom":
-						if str(parsed.get("predicate") or "").strip() == "object_type":
-							continue
-						local_context_variables.update(
-							str(arg)
-							for arg in tuple(parsed.get("args") or ())
-							if (
-								self._looks_like_asl_variable(str(arg))
-								and str(arg) not in head_variable_set
-							)
-						)
-						grounded_context_arg_count += sum(
-							1
-							for arg in tuple(parsed.get("args") or ())
-							if not self._looks_like_asl_variable(str(arg))
-						)
-					elif parsed.get("kind") == "inequality":
-						grounded_context_arg_count += sum(
-							1
-							for arg in (str(parsed["lhs"]), str(parsed["rhs"]))
-							if not self._looks_like_asl_variable(arg)
-						)
-				item["sort_key"] = (
-					0 if variable_safe else 1,
-					empty_body_rank,
-					0 if not has_self_recursive_goal else 1,
-					grounded_context_arg_count,
-					len(local_context_variables),
-					-non_type_context_count,
-					body_goal_rank,
-					-grounded_head_arg_count,
-					-body_current_fact_pair_score,
-					int(item.get("index", 0)),
+					for arg in (str(parsed["lhs"]), str(parsed["rhs"]))
+					if not self._looks_like_asl_variable(arg)
 				)
-				item["variable_safe"] = variable_safe
-			group_items.sort(key=lambda item: tuple(item.get("sort_key") or ()))
-			ordered_chunks.extend(str(item["chunk"]) for item in group_items)
-
-		return ordered_chunks
+		static_sort_key = (
+			0 if variable_safe else 1,
+			empty_body_rank,
+			0 if not has_self_recursive_goal else 1,
+			grounded_context_arg_count,
+			len(local_context_variables),
+			-non_type_context_count,
+			body_goal_rank,
+			-grounded_head_arg_count,
+		)
+		return task_name, static_sort_key, body_goals
 
 	def _runtime_fact_arg_pair_index(
 		self,
@@ -3226,22 +3980,15 @@ class JasonRunner:
 			score += len(matched_pairs)
 		return score
 
-	def _specialise_method_chunk_local_witnesses(
-		self,
-		chunk: Sequence[str],
-		*,
-		fact_index: Dict[Tuple[str, int], Tuple[Tuple[str, ...], ...]],
-		type_domains: Dict[str, Tuple[str, ...]],
-		max_candidates_per_clause: int,
-	) -> List[str]:
-		original = "\n".join(chunk)
-		if not chunk:
-			return [original]
+	def _local_witness_chunk_spec(self, chunk: Sequence[str]) -> Optional[Dict[str, Any]]:
+		"""Return the fact-independent grounding spec of one chunk, or None without local witnesses."""
 
+		if not chunk:
+			return None
 		parsed_head = self._parse_asl_method_head(chunk[0])
 		if parsed_head is None:
-			return [original]
-		task_name, head_args, context_parts = parsed_head
+			return None
+		_task_name, head_args, context_parts = parsed_head
 		chunk_text = "\n".join(chunk)
 		trigger_vars = {
 			term
@@ -3251,7 +3998,7 @@ class JasonRunner:
 		all_vars = self._extract_asl_variables(chunk_text)
 		local_vars = sorted(all_vars - trigger_vars)
 		if not local_vars:
-			return [original]
+			return None
 
 		type_constraints: List[Tuple[str, str]] = []
 		inequalities: List[Tuple[str, str]] = []
@@ -3279,8 +4026,32 @@ class JasonRunner:
 			}
 			if atom_vars & local_var_set:
 				binding_atoms.append({"predicate": predicate, "args": args})
+		return {
+			"local_vars": tuple(local_vars),
+			"type_constraints": tuple(type_constraints),
+			"inequalities": tuple(inequalities),
+			"binding_atoms": tuple(binding_atoms),
+		}
+
+	def _specialise_method_chunk_local_witnesses(
+		self,
+		chunk: Sequence[str],
+		*,
+		fact_index: Dict[Tuple[str, int], Tuple[Tuple[str, ...], ...]],
+		type_domains: Dict[str, Tuple[str, ...]],
+		max_candidates_per_clause: int,
+		witness_spec: Optional[Dict[str, Any]] = None,
+		grounding_index: Optional[GroundingFactIndex] = None,
+		grounding_stats: Optional[Dict[str, int]] = None,
+	) -> List[str]:
+		original = "\n".join(chunk)
+		if witness_spec is None:
+			witness_spec = self._local_witness_chunk_spec(chunk)
+		if witness_spec is None:
+			return [original]
 
-		binding_atoms.sort(
+		binding_atoms = sorted(
+			witness_spec["binding_atoms"],
 			key=lambda atom: (
 				len(fact_index.get((str(atom["predicate"]), len(tuple(atom["args"]))), ())),
 				-len(
@@ -3295,12 +4066,14 @@ class JasonRunner:
 
 		candidate_bindings = self._candidate_bindings_for_local_witnesses(
 			binding_atoms=binding_atoms,
-			type_constraints=type_constraints,
-			inequalities=inequalities,
-			local_vars=local_vars,
+			type_constraints=witness_spec["type_constraints"],
+			inequalities=witness_spec["inequalities"],
+			local_vars=list(witness_spec["local_vars"]),
 			fact_index=fact_index,
 			type_domains=type_domains,
 			max_candidates_per_clause=max_candidates_per_clause,
+			grounding_index=grounding_index,
+			grounding_stats=grounding_stats,
 		)
 		if not candidate_bindings:
 			return [original]
@@ -3384,183 +4157,30 @@ class JasonRunner:
 		fact_index: Dict[Tuple[str, int], Tuple[Tuple[str, ...], ...]],
 		type_domains: Dict[str, Tuple[str, ...]],
 		max_candidates_per_clause: int,
+		grounding_index: Optional[GroundingFactIndex] = None,
+		grounding_stats: Optional[Dict[str, int]] = None,
 	) -> List[Dict[str, str]]:
-		bindings: List[Dict[str, str]] = [{}]
-		for atom in binding_atoms:
-			next_bindings: List[Dict[str, str]] = []
-			facts = fact_index.get((str(atom["predicate"]), len(tuple(atom["args"]))), ())
-			if not facts:
-				return []
-			for binding in bindings:
-				for fact_args in facts:
-					matched = self._match_grounding_atom(
-						tuple(atom["args"]),
-						fact_args,
-						binding,
-					)
-					if matched is None:
-						continue
-					if not self._binding_satisfies_local_witness_filters(
-						matched,
-						type_constraints=type_constraints,
-						type_domains=type_domains,
-						inequalities=inequalities,
-						local_vars=local_vars,
-						require_all_local_bindings=False,
-					):
-						continue
-					next_bindings.append(matched)
-					if len(next_bindings) > max_candidates_per_clause:
-						return []
-			if not next_bindings:
-				return []
-			bindings = next_bindings
-
-		completed_bindings: List[Dict[str, str]] = []
-		def expand_binding(index: int, binding: Dict[str, str]) -> bool:
-			if len(completed_bindings) > max_candidates_per_clause:
-				return False
-			if index >= len(local_vars):
-				if not self._binding_satisfies_local_witness_filters(
-					binding,
-					type_constraints=type_constraints,
-					type_domains=type_domains,
-					inequalities=inequalities,
-					local_vars=local_vars,
-					require_all_local_bindings=True,
-				):
-					return True
-				completed_bindings.append(dict(binding))
-				return True
-
-			variable = str(local_vars[index])
-			if variable in binding:
-				return expand_binding(index + 1, binding)
-
-			domain = self._local_witness_type_domain(
-				variable,
-				type_constraints=type_constraints,
-				type_domains=type_domains,
-			)
-			if domain is None:
-				return True
-			if not domain:
-				return True
-			if len(domain) > max_candidates_per_clause:
-				return False
-
-			for value in domain:
-				binding[variable] = value
-				if not self._binding_satisfies_local_witness_filters(
-					binding,
-					type_constraints=type_constraints,
-					type_domains=type_domains,
-					inequalities=inequalities,
-					local_vars=local_vars,
-					require_all_local_bindings=False,
-				):
-					binding.pop(variable, None)
-					continue
-				if expand_binding(index + 1, binding) is False:
-					binding.pop(variable, None)
-					return False
-				binding.pop(variable, None)
-			return True
-
-		for binding in bindings:
-			if expand_binding(0, dict(binding)) is False:
-				return []
-
-		unique: Dict[Tuple[Tuple[str, str], ...], Dict[str, str]] = {}
-		for binding in completed_bindings:
-			signature = tuple(sorted(
-				(item, value)
-				for item, value in binding.items()
-				if item in set(local_vars) or value
-			))
-			unique.setdefault(signature, binding)
-		return list(unique.values())
-
-	def _binding_satisfies_local_witness_filters(
-		self,
-		binding: Dict[str, str],
-		*,
-		type_constraints: Sequence[Tuple[str, str]],
-		type_domains: Dict[str, Tuple[str, ...]],
-		inequalities: Sequence[Tuple[str, str]],
-		local_vars: Sequence[str],
-		require_all_local_bindings: bool,
-	) -> bool:
-		if require_all_local_bindings and any(var not in binding for var in local_vars):
-			return False
-
-		for term, type_name in type_constraints:
-			resolved = self._resolve_local_witness_term(term, binding)
-			if resolved is None:
-				continue
-			domain = type_domains.get(str(type_name))
-			if domain is None or resolved not in domain:
-				return False
-
-		for lhs, rhs in inequalities:
-			left_value = self._resolve_local_witness_term(lhs, binding)
-			right_value = self._resolve_local_witness_term(rhs, binding)
-			if left_value is None or right_value is None:
-				continue
-			if self._canonical_runtime_token(left_value) == self._canonical_runtime_token(right_value):
-				return False
-		return True
-
-	def _local_witness_type_domain(
-		self,
-		variable: str,
-		*,
-		type_constraints: Sequence[Tuple[str, str]],
-		type_domains: Dict[str, Tuple[str, ...]],
-	) -> Optional[Tuple[str, ...]]:
-		required_types = [
-			str(type_name)
-			for term, type_name in type_constraints
-			if term == variable
-		]
-		if not required_types:
-			return None
-
-		domain_sets = [
-			set(type_domains.get(type_name, ()))
-			for type_name in required_types
-		]
-		if not domain_sets:
-			return ()
-		domain = set.intersection(*domain_sets)
-		return tuple(sorted(domain))
-
-	@staticmethod
-	def _match_grounding_atom(
-		pattern_args: Sequence[str],
-		fact_args: Sequence[str],
-		binding: Dict[str, str],
-	) -> Optional[Dict[str, str]]:
-		if len(pattern_args) != len(fact_args):
-			return None
-
-		candidate = dict(binding)
-		for pattern_term, fact_term in zip(pattern_args, fact_args):
-			if JasonRunner._looks_like_asl_variable(pattern_term):
-				existing = candidate.get(pattern_term)
-				if existing is not None:
-					if JasonRunner._canonical_runtime_token(existing) != (
-						JasonRunner._canonical_runtime_token(fact_term)
-					):
-						return None
-					continue
-				candidate[pattern_term] = fact_term
-				continue
-			if JasonRunner._canonical_runtime_token(pattern_term) != (
-				JasonRunner._canonical_runtime_token(fact_term)
-			):
-				return None
-		return candidate
+		result = join_local_witness_bindings(
+			binding_atoms=binding_atoms,
+			type_constraints=type_constraints,
+			inequalities=inequalities,
+			local_vars=local_vars,
+			index=grounding_index or GroundingFactIndex(
+				fact_index,
+				canonical=self._canonical_runtime_token,
+			),
+			type_domains=type_domains,
+			max_bindings=max_candidates_per_clause,
+			is_variable=self._looks_like_asl_variable,
+			canonical=self._canonical_runtime_token,
+		)
+		if grounding_stats is not None:
+			grounding_stats["join_probes"] = grounding_stats.get("join_probes", 0) + result.probes
+			if result.over_limit:
+				grounding_stats["clauses_over_limit"] = (
+					grounding_stats.get("clauses_over_limit", 0) + 1
+				)
+		return result.bindings
 
 	def _runtime_fact_index_for_local_witness_grounding(
 		self,
@@ -3678,57 +4298,12 @@ class JasonRunner:
 		}
 
 	@staticmethod
-	def _looks_like_asl_variable(token: str) -> bool:
-		return re.fullmatch(r"[A-Z][A-Z0-9_]*", str(token or "").strip()) is not None
-
-	@staticmethod
-	def _split_asl_arguments(args_text: str) -> Tuple[str, ...]:
-		text = str(args_text or "").strip()
-		if not text:
-			return ()
-		parts: List[str] = []
-		current: List[str] = []
-		depth = 0
-		quote: Optional[str] = None
-		for character in text:
-			if quote is not None:
-				current.append(character)
-				if character == quote:
-					quote = None
-				continue
-			if character in {'"', "'"}:
-				quote = character
-				current.append(character)
-				continue
-			if character == "(":
-				depth += 1
-				current.append(character)
-				continue
-			if character == ")":
-				depth = max(0, depth - 1)
-				current.append(character)
-				continue
-			if character == "," and depth == 0:
-				part = "".join(current).strip()
-				if part:
-					parts.append(part)
-				current = []
-				continue
-			current.append(character)
-		part = "".join(current).strip()
-		if part:
-			parts.append(part)
-		return tuple(parts)
+	def _looks_like_asl_variable(token: str) -> bool:
+		return re.fullmatch(r"[A-Z][A-Z0-9_]*", str(token or "").strip()) is not None
 
-	def _resolve_local_witness_term(
-		self,
-		term: str,
-		binding: Dict[str, str],
-	) -> Optional[str]:
-		token = str(term or "").strip()
-		if self._looks_like_asl_variable(token):
-			return binding.get(token)
-		return token
+	@staticmethod
+	def _split_asl_arguments(args_text: str) -> Tuple[str, ...]:
+		return split_agentspeak_arguments(args_text)
 
 	def _substitute_asl_bindings(
 		self,
@@ -4105,18 +4680,78 @@ class JasonRunner:
 			return ()
 		return tuple(part.strip() for part in args_text.split(",") if part.strip())
 
-	def _build_runner_mas2j(self, domain_name: str) -> str:
+	def _build_runner_mas2j(
+		self,
+		domain_name: str,
+		*,
+		asl_source_path: str = ".",
+		environment_data_path: str | Path | None = None,
+		agent_names: Sequence[str] = ("agentspeak_generated",),
+	) -> str:
 		sanitized_domain = re.sub(r"[^a-zA-Z0-9_]+", "_", domain_name).strip("_").lower()
 		if not sanitized_domain:
 			sanitized_domain = "runtime"
+		environment = self.environment_class_name
+		if environment_data_path is not None:
+			environment += f"({json.dumps(Path(environment_data_path).as_posix())})"
 		return (
 			f"MAS execute_{sanitized_domain} {{\n"
-			f"    environment: {self.environment_class_name}\n"
-			"    agents: agentspeak_generated;\n"
-			"    aslSourcePath: \".\";\n"
+			f"    environment: {environment}\n"
+			f"    agents: {' '.join(f'{agent_name};' for agent_name in agent_names)}\n"
+			f"    aslSourcePath: {json.dumps(asl_source_path)};\n"
 			"}\n"
 		)
 
+	def _resolve_internal_action_dir(
+		self,
+		*,
+		java_bin: str,
+		java_major: int,
+		javac_bin: str,
+		jason_jar: Path,
+		timing_profile: Dict[str, float],
+	) -> Tuple[Path, bool]:
+		"""Return the cached directory holding the prebuilt pipeline internal-action jar."""
+
+		sources = {
+			"pipeline/no_ancestor_goal.java": self._build_no_ancestor_goal_internal_action_source(),
+			"pipeline/choose_runtime_choice.java": (
+				self._build_choose_runtime_choice_internal_action_source()
+			),
+		}
+		cache_key = content_cache_key(
+			*(f"{name}\n{source}" for name, source in sorted(sources.items())),
+			f"javac={Path(javac_bin).resolve()}:{java_major}",
+			jason_jar_version(jason_jar),
+		)
+
+		def build(staging_dir: Path) -> None:
+			for relative_path, source in sources.items():
+				source_path = staging_dir / relative_path
+				source_path.parent.mkdir(parents=True, exist_ok=True)
+				source_path.write_text(source)
+			compile_start = time.perf_counter()
+			self._compile_java_sources(
+				java_bin=java_bin,
+				javac_bin=javac_bin,
+				jason_jar=jason_jar,
+				source_root=staging_dir,
+				failure_message="Jason internal action Java compilation failed.",
+			)
+			write_class_jar(staging_dir, staging_dir / self.internal_action_jar_name)
+			timing_profile["internal_action_compile_seconds"] = time.perf_counter() - compile_start
+
+		return self.class_cache.ensure(
+			"internal_actions",
+			cache_key,
+			required=(
+				self.internal_action_jar_name,
+				"pipeline/no_ancestor_goal.class",
+				"pipeline/choose_runtime_choice.class",
+			),
+			build=build,
+		)
+
 	def _build_no_ancestor_goal_internal_action_source(self) -> str:
 		return """
 package pipeline;
@@ -4341,19 +4976,21 @@ public class choose_runtime_choice extends DefaultInternalAction {
 }
 """.strip() + "\n"
 
-	def _build_environment_java_source(
+	def _build_environment_data(
 		self,
 		*,
 		action_schemas: Sequence[Dict[str, Any]],
 		seed_facts: Sequence[str],
-	) -> str:
+	) -> Dict[str, Any]:
+		"""Return the per-query side file read by the compiled environment at `init()`."""
+
 		seed_atoms = [
 			atom
 			for atom in (self._hddl_fact_to_atom(fact) for fact in seed_facts)
 			if atom is not None
 		]
 
-		action_blocks: List[str] = []
+		actions: List[Dict[str, Any]] = []
 		for schema in action_schemas:
 			functor = schema.get("functor")
 			if not functor:
@@ -4364,46 +5001,67 @@ public class choose_runtime_choice extends DefaultInternalAction {
 			precondition_clauses = list(schema.get("precondition_clauses") or [])
 			if not precondition_clauses:
 				precondition_clauses = [preconditions] if preconditions else [[]]
+			# Past the DNF clause ceiling the exact precondition is the factors.
+			precondition_factors = list(schema.get("precondition_factors") or [])
 			effects = list(self._ordered_runtime_effects(schema.get("effects") or []))
-			action_blocks.append(
-				"""
-		register(new ActionSchema(
-			{functor},
-			{source_name},
-			new String[]{{{parameters}}},
-			{precondition_clauses},
-			new Pattern[]{{{effects}}}
-		));
-		""".strip().format(
-					functor=self._java_quote(functor),
-					source_name=self._java_quote(source_name),
-					parameters=", ".join(self._java_quote(item) for item in parameters),
-					precondition_clauses=self._render_precondition_clauses_java(
-						precondition_clauses,
-					),
-					effects=", ".join(self._render_pattern_java(item) for item in effects),
-				),
+			actions.append(
+				{
+					"functor": str(functor),
+					"source_name": source_name,
+					"parameters": parameters,
+					"precondition_clauses": [
+						[self._environment_pattern_payload(item) for item in clause]
+						for clause in precondition_clauses
+					],
+					"precondition_factors": [
+						[
+							[self._environment_pattern_payload(item) for item in clause]
+							for clause in factor
+						]
+						for factor in precondition_factors
+					],
+					"effects": [self._environment_pattern_payload(item) for item in effects],
+				},
 			)
 
-		seed_lines = "\n".join(
-			f"\t\tworld.add({self._java_quote(atom)});"
-			for atom in seed_atoms
-		)
-		action_lines = "\n\t\t".join(action_blocks)
-		if not action_lines:
-			action_lines = "// no action schemas"
+		return {
+			"environment": self.environment_class_name,
+			"seed_facts": seed_atoms,
+			"actions": actions,
+		}
+
+	def _build_environment_java_source(self) -> str:
+		"""Render the query-independent environment; its data comes from the side file.
+
+		When the side file lists packed `agents`, every agent gets an isolated world
+		(facts, snapshots, choice state) keyed by its name, receives only its own
+		percepts, and environment trace lines are tagged with `[agent]`.
+		"""
 
 		return f"""
 import jason.asSyntax.Literal;
 import jason.asSyntax.Structure;
 import jason.environment.Environment;
 
+import java.io.FileInputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.Collection;
 import java.util.HashMap;
+import java.util.LinkedHashMap;
 import java.util.LinkedHashSet;
+import java.util.List;
 import java.util.Map;
 import java.util.Set;
 
+import javax.json.Json;
+import javax.json.JsonArray;
+import javax.json.JsonObject;
+import javax.json.JsonReader;
+
 public class {self.environment_class_name} extends Environment {{
 
 	private static final class Pattern {{
@@ -4423,6 +5081,8 @@ public class {self.environment_class_name} extends Environment {{
 		final String sourceName;
 		final String[] parameters;
 		final Pattern[][] preconditionClauses;
+		// Conjoined DNFs that make the precondition exact when its full DNF was too large.
+		final Pattern[][][] preconditionFactors;
 		final Pattern[] effects;
 
 		ActionSchema(
@@ -4430,33 +5090,223 @@ public class {self.environment_class_name} extends Environment {{
 			String sourceName,
 			String[] parameters,
 			Pattern[][] preconditionClauses,
+			Pattern[][][] preconditionFactors,
 			Pattern[] effects
 		) {{
 			this.name = name;
 			this.sourceName = sourceName;
 			this.parameters = parameters;
 			this.preconditionClauses = preconditionClauses;
+			this.preconditionFactors = preconditionFactors;
 			this.effects = effects;
 		}}
 	}}
 
-	private final Set<String> world = new LinkedHashSet<>();
+	private static final class TrailEntry {{
+		final boolean added;
+		final String fact;
+		final long sequence;
+
+		TrailEntry(boolean added, String fact, long sequence) {{
+			this.added = added;
+			this.fact = fact;
+			this.sequence = sequence;
+		}}
+	}}
+
+	/**
+	 * One agent's world, indexed by predicate functor.
+	 *
+	 * Every fact keeps the sequence number of its insertion, so "latest" lookups
+	 * match insertion order without scanning other predicates. While snapshots
+	 * are live, changes are appended to an undo trail and a snapshot is only a
+	 * trail mark; restoring undoes the entries recorded after that mark.
+	 */
+	private static final class AgentWorld {{
+		final String agent;
+		final Map<String, LinkedHashMap<String, Long>> factsByPredicate = new LinkedHashMap<>();
+		final Map<String, Long> snapshots = new HashMap<>();
+		final List<TrailEntry> trail = new ArrayList<>();
+		long trailBase = 0L;
+		long nextSequence = 0L;
+		// Atoms changed since the last percept sync, relative to the published percepts.
+		final Set<String> addedSinceSync = new LinkedHashSet<>();
+		final Set<String> removedSinceSync = new LinkedHashSet<>();
+		String activeQueryGoalIndex = null;
+		long runtimeChoiceSequence = 0L;
+
+		AgentWorld(String agent, List<String> seedFacts) {{
+			this.agent = agent;
+			for (String fact : seedFacts) {{
+				add(fact);
+			}}
+		}}
+
+		static String predicateOf(String fact) {{
+			int open = fact.indexOf('(');
+			return open < 0 ? fact : fact.substring(0, open);
+		}}
+
+		boolean contains(String fact) {{
+			Map<String, Long> facts = factsByPredicate.get(predicateOf(fact));
+			return facts != null && facts.containsKey(fact);
+		}}
+
+		void add(String fact) {{
+			if (contains(fact)) {{
+				return;
+			}}
+			long sequence = nextSequence++;
+			insert(fact, sequence);
+			log(true, fact, sequence);
+		}}
+
+		void remove(String fact) {{
+			Map<String, Long> facts = factsByPredicate.get(predicateOf(fact));
+			Long sequence = facts == null ? null : facts.get(fact);
+			if (sequence == null) {{
+				return;
+			}}
+			erase(fact);
+			log(false, fact, sequence);
+		}}
+
+		void removeWithPrefix(String prefix) {{
+			Map<String, Long> facts = factsByPredicate.get(predicateOf(prefix));
+			if (facts == null) {{
+				return;
+			}}
+			List<String> matches = new ArrayList<>();
+			for (String fact : facts.keySet()) {{
+				if (fact.startsWith(prefix)) {{
+					matches.add(fact);
+				}}
+			}}
+			for (String fact : matches) {{
+				remove(fact);
+			}}
+		}}
+
+		String latestWithPrefix(String prefix) {{
+			Map<String, Long> facts = factsByPredicate.get(predicateOf(prefix));
+			if (facts == null) {{
+				return null;
+			}}
+			String latest = null;
+			long latestSequence = Long.MIN_VALUE;
+			for (Map.Entry<String, Long> entry : facts.entrySet()) {{
+				if (entry.getKey().startsWith(prefix) && entry.getValue() > latestSequence) {{
+					latest = entry.getKey();
+					latestSequence = entry.getValue();
+				}}
+			}}
+			return latest;
+		}}
+
+		void snapshot(String key) {{
+			snapshots.put(key, trailBase + trail.size());
+		}}
+
+		boolean restore(String key) {{
+			Long mark = snapshots.get(key);
+			if (mark == null) {{
+				return false;
+			}}
+			int start = (int) (mark - trailBase);
+			List<TrailEntry> undone = new ArrayList<>(trail.subList(start, trail.size()));
+			boolean laterSnapshotLive = false;
+			for (long otherMark : snapshots.values()) {{
+				if (otherMark > mark) {{
+					laterSnapshotLive = true;
+					break;
+				}}
+			}}
+			if (!laterSnapshotLive) {{
+				trail.subList(start, trail.size()).clear();
+			}}
+			for (int i = undone.size() - 1; i >= 0; i--) {{
+				TrailEntry entry = undone.get(i);
+				if (entry.added) {{
+					erase(entry.fact);
+				}} else {{
+					insert(entry.fact, entry.sequence);
+				}}
+				if (laterSnapshotLive) {{
+					// Keep later marks restorable by logging the undo as compensating entries.
+					trail.add(new TrailEntry(!entry.added, entry.fact, entry.sequence));
+				}}
+			}}
+			return true;
+		}}
+
+		void commit(String key) {{
+			snapshots.remove(key);
+			long keepFrom = trailBase + trail.size();
+			for (long mark : snapshots.values()) {{
+				keepFrom = Math.min(keepFrom, mark);
+			}}
+			int drop = (int) (keepFrom - trailBase);
+			if (drop > 0) {{
+				trail.subList(0, drop).clear();
+				trailBase = keepFrom;
+			}}
+		}}
+
+		private void log(boolean added, String fact, long sequence) {{
+			if (!snapshots.isEmpty()) {{
+				trail.add(new TrailEntry(added, fact, sequence));
+			}}
+		}}
+
+		private void insert(String fact, long sequence) {{
+			factsByPredicate.computeIfAbsent(predicateOf(fact), name -> new LinkedHashMap<>()).put(fact, sequence);
+			if (!removedSinceSync.remove(fact)) {{
+				addedSinceSync.add(fact);
+			}}
+		}}
+
+		private void erase(String fact) {{
+			Map<String, Long> facts = factsByPredicate.get(predicateOf(fact));
+			if (facts == null || facts.remove(fact) == null) {{
+				return;
+			}}
+			if (!addedSinceSync.remove(fact)) {{
+				removedSinceSync.add(fact);
+			}}
+		}}
+	}}
+
+	private final List<String> seedFacts = new ArrayList<>();
+	private final Map<String, List<String>> agentSeedFacts = new LinkedHashMap<>();
 	private final Map<String, ActionSchema> actions = new HashMap<>();
-	private final Map<String, Set<String>> snapshots = new HashMap<>();
-	private String activeQueryGoalIndex = null;
-	private long runtimeChoiceSequence = 0L;
+	private final Map<String, AgentWorld> agentWorlds = new LinkedHashMap<>();
+	private AgentWorld sharedWorld = null;
+	private AgentWorld active = null;
 
 	@Override
 	public synchronized void init(String[] args) {{
 		super.init(args);
+		loadEnvironmentData(args.length > 0 ? args[0] : "jason_environment.json");
 		seedInitialFacts();
-		loadActions();
-		syncPercepts();
+		for (AgentWorld agentWorld : worlds()) {{
+			active = agentWorld;
+			syncPercepts();
+		}}
 		System.out.println("runtime env ready");
 	}}
 
+	// Agents without seeded worlds get theirs on first perception, not first action.
+	@Override
+	public synchronized Collection<Literal> getPercepts(String agName) {{
+		if (agName != null) {{
+			worldFor(agName);
+		}}
+		return super.getPercepts(agName);
+	}}
+
 	@Override
 	public synchronized boolean executeAction(String agName, Structure action) {{
+		active = worldFor(agName);
 		if ("true".equals(action.getFunctor()) && action.getArity() == 0) {{
 			return true;
 		}}
@@ -4465,12 +5315,12 @@ public class {self.environment_class_name} extends Environment {{
 		}}
 		ActionSchema schema = actions.get(action.getFunctor());
 		if (schema == null) {{
-			System.out.println("runtime env unknown action " + action);
+			emit("runtime env unknown action " + action);
 			return false;
 		}}
 		String tracedAction = renderTraceAction(schema.sourceName, action);
 		if (action.getArity() != schema.parameters.length) {{
-			System.out.println("runtime env action failed " + tracedAction + " reason=arity");
+			emit("runtime env action failed " + tracedAction + " reason=arity");
 			return false;
 		}}
 
@@ -4484,14 +5334,17 @@ public class {self.environment_class_name} extends Environment {{
 			}}
 		}}
 
-		if (!checkPreconditions(schema.preconditionClauses, bindings)) {{
-			System.out.println("runtime env action failed " + tracedAction + " reason=precondition");
+		if (
+			!checkPreconditions(schema.preconditionClauses, bindings)
+			|| !checkPreconditionFactors(schema.preconditionFactors, bindings)
+		) {{
+			emit("runtime env action failed " + tracedAction + " reason=precondition");
 			return false;
 		}}
 
 		applyEffects(schema.effects, bindings);
 		syncPercepts();
-		System.out.println("runtime env action success " + tracedAction);
+		emit("runtime env action success " + tracedAction);
 		return true;
 	}}
 
@@ -4512,18 +5365,18 @@ public class {self.environment_class_name} extends Environment {{
 		if ("runtime_set_active_query_goal".equals(functor)) {{
 			clearActiveQueryGoalFacts();
 			String index = action.getArity() == 0 ? "0" : canonical(action.getTerm(0).toString());
-			activeQueryGoalIndex = index;
-			world.add("runtime_active_query_goal(" + index + ")");
+			active.activeQueryGoalIndex = index;
+			active.add("runtime_active_query_goal(" + index + ")");
 			syncPercepts();
-			System.out.println("runtime env active query goal " + index);
+			emit("runtime env active query goal " + index);
 			return true;
 		}}
 		if ("runtime_clear_active_query_goal".equals(functor)) {{
 			clearActiveQueryGoalFacts();
-			activeQueryGoalIndex = null;
+			active.activeQueryGoalIndex = null;
 			syncPercepts();
 			String index = action.getArity() == 0 ? "all" : canonical(action.getTerm(0).toString());
-			System.out.println("runtime env clear active query goal " + index);
+			emit("runtime env clear active query goal " + index);
 			return true;
 		}}
 		if ("runtime_record_query_choice".equals(functor)) {{
@@ -4540,48 +5393,45 @@ public class {self.environment_class_name} extends Environment {{
 		}}
 		String key = snapshotKey(action);
 		if ("runtime_snapshot".equals(functor)) {{
-			snapshots.put(key, new LinkedHashSet<>(world));
-			System.out.println("runtime env snapshot " + key);
+			active.snapshot(key);
+			emit("runtime env snapshot " + key);
 			return true;
 		}}
 		if ("runtime_restore".equals(functor)) {{
-			Set<String> snapshot = snapshots.get(key);
-			if (snapshot == null) {{
+			if (!active.restore(key)) {{
 				return false;
 			}}
-			world.clear();
-			world.addAll(snapshot);
 			syncPercepts();
-			System.out.println("runtime env restore " + key);
+			emit("runtime env restore " + key);
 			return true;
 		}}
-		snapshots.remove(key);
-		System.out.println("runtime env commit " + key);
+		active.commit(key);
+		emit("runtime env commit " + key);
 		return true;
 	}}
 
 	private void clearActiveQueryGoalFacts() {{
-		world.removeIf(fact -> fact.startsWith("runtime_active_query_goal("));
+		active.removeWithPrefix("runtime_active_query_goal(");
 	}}
 
 	private void recordRuntimeQueryChoice(Structure action) {{
-		if (activeQueryGoalIndex == null || action.getArity() == 0) {{
+		if (active.activeQueryGoalIndex == null || action.getArity() == 0) {{
 			return;
 		}}
 		String choice = action.getTerm(0).toString();
-		runtimeChoiceSequence += 1L;
-		String lastPrefix = "runtime_last_query_choice(" + activeQueryGoalIndex + ",";
-		String lastFramePrefix = "runtime_last_query_choice_frame(" + activeQueryGoalIndex + ",";
-		world.removeIf(fact -> fact.startsWith(lastPrefix));
-		world.removeIf(fact -> fact.startsWith(lastFramePrefix));
-		world.add(lastPrefix + choice + ")");
-		world.add("runtime_query_choice(" + activeQueryGoalIndex + "," + choice + ")");
-		world.add(lastFramePrefix + runtimeChoiceSequence + "," + choice + ")");
-		world.add(
+		active.runtimeChoiceSequence += 1L;
+		String lastPrefix = "runtime_last_query_choice(" + active.activeQueryGoalIndex + ",";
+		String lastFramePrefix = "runtime_last_query_choice_frame(" + active.activeQueryGoalIndex + ",";
+		active.removeWithPrefix(lastPrefix);
+		active.removeWithPrefix(lastFramePrefix);
+		active.add(lastPrefix + choice + ")");
+		active.add("runtime_query_choice(" + active.activeQueryGoalIndex + "," + choice + ")");
+		active.add(lastFramePrefix + active.runtimeChoiceSequence + "," + choice + ")");
+		active.add(
 			"runtime_query_choice_frame("
-			+ activeQueryGoalIndex
+			+ active.activeQueryGoalIndex
 			+ ","
-			+ runtimeChoiceSequence
+			+ active.runtimeChoiceSequence
 			+ ","
 			+ choice
 			+ ")"
@@ -4598,10 +5448,10 @@ public class {self.environment_class_name} extends Environment {{
 			+ "," + action.getTerm(2)
 			+ "," + action.getTerm(3);
 		String fact = "runtime_method_choice_point(" + payload + ")";
-		world.remove(fact);
+		active.remove(fact);
 		clearLatestRuntimeMethodChoicePoint();
-		world.add(fact);
-		world.add("runtime_latest_method_choice_point(" + payload + ")");
+		active.add(fact);
+		active.add("runtime_latest_method_choice_point(" + payload + ")");
 		syncPercepts();
 	}}
 
@@ -4611,17 +5461,12 @@ public class {self.environment_class_name} extends Environment {{
 		}}
 		String choice = action.getTerm(0).toString();
 		String latestPrefix = "runtime_latest_method_choice_point(" + choice + ",";
-		String latest = null;
-		for (String fact : world) {{
-			if (fact.startsWith(latestPrefix)) {{
-				latest = fact;
-			}}
-		}}
+		String latest = active.latestWithPrefix(latestPrefix);
 		if (latest != null) {{
 			String payload = latest.substring("runtime_latest_method_choice_point(".length(), latest.length() - 1);
-			world.remove("runtime_method_choice_point(" + payload + ")");
+			active.remove("runtime_method_choice_point(" + payload + ")");
 		}} else {{
-			world.removeIf(fact -> fact.startsWith("runtime_method_choice_point(" + choice + ","));
+			active.removeWithPrefix("runtime_method_choice_point(" + choice + ",");
 		}}
 		clearLatestRuntimeMethodChoicePoint();
 		recomputeLatestRuntimeMethodChoicePoint();
@@ -4629,18 +5474,14 @@ public class {self.environment_class_name} extends Environment {{
 	}}
 
 	private void clearLatestRuntimeMethodChoicePoint() {{
-		world.removeIf(fact -> fact.startsWith("runtime_latest_method_choice_point("));
+		active.removeWithPrefix("runtime_latest_method_choice_point(");
 	}}
 
 	private void recomputeLatestRuntimeMethodChoicePoint() {{
-		String latestPayload = null;
-		for (String fact : world) {{
-			if (fact.startsWith("runtime_method_choice_point(")) {{
-				latestPayload = fact.substring("runtime_method_choice_point(".length(), fact.length() - 1);
-			}}
-		}}
-		if (latestPayload != null) {{
-			world.add("runtime_latest_method_choice_point(" + latestPayload + ")");
+		String latest = active.latestWithPrefix("runtime_method_choice_point(");
+		if (latest != null) {{
+			String latestPayload = latest.substring("runtime_method_choice_point(".length(), latest.length() - 1);
+			active.add("runtime_latest_method_choice_point(" + latestPayload + ")");
 		}}
 	}}
 
@@ -4656,15 +5497,124 @@ public class {self.environment_class_name} extends Environment {{
 	}}
 
 	private void seedInitialFacts() {{
-		world.clear();
-		snapshots.clear();
-		runtimeChoiceSequence = 0L;
-{seed_lines if seed_lines else ""}
+		agentWorlds.clear();
+		sharedWorld = null;
+		if (agentSeedFacts.isEmpty()) {{
+			sharedWorld = new AgentWorld(null, seedFacts);
+			return;
+		}}
+		for (Map.Entry<String, List<String>> entry : agentSeedFacts.entrySet()) {{
+			agentWorlds.put(entry.getKey(), new AgentWorld(entry.getKey(), entry.getValue()));
+		}}
+	}}
+
+	private List<AgentWorld> worlds() {{
+		if (sharedWorld != null) {{
+			return Arrays.asList(sharedWorld);
+		}}
+		return new ArrayList<>(agentWorlds.values());
+	}}
+
+	private AgentWorld worldFor(String agName) {{
+		if (sharedWorld != null) {{
+			return sharedWorld;
+		}}
+		AgentWorld world = agentWorlds.get(agName);
+		if (world == null) {{
+			// A new world's seed facts are all pending in addedSinceSync, so one
+			// sync publishes the full initial state to the agent.
+			world = new AgentWorld(agName, seedFacts);
+			agentWorlds.put(agName, world);
+			AgentWorld previous = active;
+			active = world;
+			syncPercepts();
+			active = previous;
+		}}
+		return world;
+	}}
+
+	private void emit(String message) {{
+		if (active == null || active.agent == null) {{
+			System.out.println(message);
+			return;
+		}}
+		System.out.println("[" + active.agent + "] " + message);
 	}}
 
-	private void loadActions() {{
+	private void loadEnvironmentData(String dataFile) {{
+		seedFacts.clear();
+		agentSeedFacts.clear();
 		actions.clear();
-		{action_lines}
+		JsonObject data;
+		try (
+			JsonReader reader = Json.createReader(
+				new InputStreamReader(new FileInputStream(canonical(dataFile)), StandardCharsets.UTF_8)
+			)
+		) {{
+			data = reader.readObject();
+		}} catch (IOException e) {{
+			throw new IllegalStateException("runtime env data unreadable: " + dataFile, e);
+		}}
+		seedFacts.addAll(Arrays.asList(readStrings(data.getJsonArray("seed_facts"))));
+		if (data.containsKey("agents")) {{
+			JsonArray agentPayloads = data.getJsonArray("agents");
+			for (int i = 0; i < agentPayloads.size(); i++) {{
+				JsonObject agent = agentPayloads.getJsonObject(i);
+				agentSeedFacts.put(
+					agent.getString("name"),
+					Arrays.asList(readStrings(agent.getJsonArray("seed_facts")))
+				);
+			}}
+		}}
+		JsonArray actionPayloads = data.getJsonArray("actions");
+		for (int i = 0; i < actionPayloads.size(); i++) {{
+			JsonObject action = actionPayloads.getJsonObject(i);
+			Pattern[][] preconditionClauses = readClauses(action.getJsonArray("precondition_clauses"));
+			JsonArray factorPayloads = action.containsKey("precondition_factors")
+				? action.getJsonArray("precondition_factors")
+				: Json.createArrayBuilder().build();
+			Pattern[][][] preconditionFactors = new Pattern[factorPayloads.size()][][];
+			for (int j = 0; j < factorPayloads.size(); j++) {{
+				preconditionFactors[j] = readClauses(factorPayloads.getJsonArray(j));
+			}}
+			register(new ActionSchema(
+				action.getString("functor"),
+				action.getString("source_name"),
+				readStrings(action.getJsonArray("parameters")),
+				preconditionClauses,
+				preconditionFactors,
+				readPatterns(action.getJsonArray("effects"))
+			));
+		}}
+	}}
+
+	private static String[] readStrings(JsonArray payload) {{
+		String[] values = new String[payload.size()];
+		for (int i = 0; i < payload.size(); i++) {{
+			values[i] = payload.getString(i);
+		}}
+		return values;
+	}}
+
+	private static Pattern[][] readClauses(JsonArray payload) {{
+		Pattern[][] clauses = new Pattern[payload.size()][];
+		for (int i = 0; i < payload.size(); i++) {{
+			clauses[i] = readPatterns(payload.getJsonArray(i));
+		}}
+		return clauses;
+	}}
+
+	private static Pattern[] readPatterns(JsonArray payload) {{
+		Pattern[] patterns = new Pattern[payload.size()];
+		for (int i = 0; i < payload.size(); i++) {{
+			JsonObject pattern = payload.getJsonObject(i);
+			patterns[i] = new Pattern(
+				pattern.getString("predicate"),
+				pattern.getBoolean("positive"),
+				readStrings(pattern.getJsonArray("args"))
+			);
+		}}
+		return patterns;
 	}}
 
 	private void register(ActionSchema schema) {{
@@ -4683,6 +5633,15 @@ public class {self.environment_class_name} extends Environment {{
 		return false;
 	}}
 
+	private boolean checkPreconditionFactors(Pattern[][][] preconditionFactors, Map<String, String> bindings) {{
+		for (Pattern[][] factor : preconditionFactors) {{
+			if (factor.length == 0 || !checkPreconditions(factor, bindings)) {{
+				return false;
+			}}
+		}}
+		return true;
+	}}
+
 	private boolean checkPreconditionClause(Pattern[] preconditions, Map<String, String> bindings) {{
 		for (Pattern pattern : preconditions) {{
 			if ("=".equals(pattern.predicate) && pattern.args.length == 2) {{
@@ -4698,9 +5657,9 @@ public class {self.environment_class_name} extends Environment {{
 			String grounded = ground(pattern.predicate, pattern.args, bindings);
 			boolean holds;
 			if (pattern.positive) {{
-				holds = world.contains(grounded);
+				holds = active.contains(grounded);
 			}} else {{
-				holds = !world.contains(grounded);
+				holds = !active.contains(grounded);
 			}}
 			if (!holds) {{
 				return false;
@@ -4718,7 +5677,7 @@ public class {self.environment_class_name} extends Environment {{
 				continue;
 			}}
 			String grounded = ground(pattern.predicate, pattern.args, bindings);
-			world.remove(grounded);
+			active.remove(grounded);
 		}}
 		for (Pattern pattern : effects) {{
 			if ("=".equals(pattern.predicate)) {{
@@ -4728,7 +5687,7 @@ public class {self.environment_class_name} extends Environment {{
 				continue;
 			}}
 			String grounded = ground(pattern.predicate, pattern.args, bindings);
-			world.add(grounded);
+			active.add(grounded);
 		}}
 	}}
 
@@ -4788,12 +5747,33 @@ public class {self.environment_class_name} extends Environment {{
 		return sourceName + "(" + String.join(",", args) + ")";
 	}}
 
+	// Pushes only the atoms changed since the last sync. Jason keeps percepts in a
+	// synchronized list, so each addPercept/removePercept still scans it: a step
+	// costs O(|delta| * |percepts|) list comparisons, not a full re-parse.
 	private void syncPercepts() {{
-		clearPercepts();
-		for (String atom : world) {{
-			addPercept(Literal.parseLiteral(atom));
+		for (String atom : active.removedSinceSync) {{
+			Literal percept = Literal.parseLiteral(atom);
+			if (active.agent == null) {{
+				removePercept(percept);
+			}} else {{
+				removePercept(active.agent, percept);
+			}}
+		}}
+		for (String atom : active.addedSinceSync) {{
+			Literal percept = Literal.parseLiteral(atom);
+			if (active.agent == null) {{
+				addPercept(percept);
+			}} else {{
+				addPercept(active.agent, percept);
+			}}
+		}}
+		active.removedSinceSync.clear();
+		active.addedSinceSync.clear();
+		if (active.agent == null) {{
+			informAgsEnvironmentChanged();
+			return;
 		}}
-		informAgsEnvironmentChanged();
+		informAgsEnvironmentChanged(active.agent);
 	}}
 }}
 """.strip() + "\n"
@@ -4806,14 +5786,33 @@ public class {self.environment_class_name} extends Environment {{
 		jason_jar: Path,
 		env_java_path: Path,
 		output_path: Path,
+	) -> None:
+		self._compile_java_sources(
+			java_bin=java_bin,
+			javac_bin=javac_bin,
+			jason_jar=jason_jar,
+			source_root=output_path,
+			failure_message="Jason environment Java compilation failed.",
+			failure_metadata={"environment_java": str(env_java_path)},
+		)
+
+	def _compile_java_sources(
+		self,
+		*,
+		java_bin: str,
+		javac_bin: str,
+		jason_jar: Path,
+		source_root: Path,
+		failure_message: str,
+		failure_metadata: Optional[Dict[str, Any]] = None,
 	) -> None:
 		java_home = str(Path(java_bin).resolve().parent.parent)
 		env = dict(os.environ)
 		env["JAVA_HOME"] = java_home
 		env["PATH"] = f"{java_home}/bin:{env.get('PATH', '')}"
 		java_sources = sorted(
-			str(path.relative_to(output_path))
-			for path in output_path.rglob("*.java")
+			str(path.relative_to(source_root))
+			for path in source_root.rglob("*.java")
 		)
 		compile_cmd = [
 			javac_bin,
@@ -4823,7 +5822,7 @@ public class {self.environment_class_name} extends Environment {{
 		]
 		result = subprocess.run(
 			compile_cmd,
-			cwd=output_path,
+			cwd=source_root,
 			text=True,
 			capture_output=True,
 			check=False,
@@ -4833,11 +5832,11 @@ public class {self.environment_class_name} extends Environment {{
 			return
 
 		raise JasonValidationError(
-			"Jason environment Java compilation failed.",
+			failure_message,
 			metadata={
 				"java_bin": java_bin,
 				"javac_bin": javac_bin,
-				"environment_java": str(env_java_path),
+				**(failure_metadata or {}),
 				"java_sources": java_sources,
 				"stdout": result.stdout,
 				"stderr": result.stderr,
@@ -4845,32 +5844,81 @@ public class {self.environment_class_name} extends Environment {{
 			},
 		)
 
-	@staticmethod
-	def _java_quote(value: str) -> str:
-		escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-		return f'"{escaped}"'
-
-	def _render_pattern_java(self, payload: Dict[str, Any]) -> str:
-		predicate = self._sanitize_name(str(payload.get("predicate", "")))
-		args = [str(item) for item in (payload.get("args") or [])]
-		is_positive = bool(payload.get("is_positive", True))
-		args_expr = ", ".join(self._java_quote(item) for item in args)
-		return (
-			f"new Pattern({self._java_quote(predicate)}, "
-			f"{str(is_positive).lower()}, new String[]{{{args_expr}}})"
+	def _resolve_environment_class_dir(
+		self,
+		*,
+		java_bin: str,
+		java_major: int,
+		javac_bin: str,
+		jason_jar: Path,
+		env_source: str,
+		timing_profile: Dict[str, float],
+	) -> Tuple[Path, bool]:
+		"""Return the cached class directory for the data-driven environment."""
+
+		class_file = f"{self.environment_class_name}.class"
+		cache_key = content_cache_key(
+			env_source,
+			f"javac={Path(javac_bin).resolve()}:{java_major}",
+			jason_jar_version(jason_jar),
 		)
 
-	def _render_precondition_clauses_java(
-		self,
-		clauses: Sequence[Sequence[Dict[str, Any]]],
-	) -> str:
-		if not clauses:
-			return "new Pattern[][]{}"
-		rendered_clauses = []
-		for clause in clauses:
-			rendered_patterns = ", ".join(self._render_pattern_java(item) for item in clause)
-			rendered_clauses.append(f"new Pattern[]{{{rendered_patterns}}}")
-		return f"new Pattern[][]{{{', '.join(rendered_clauses)}}}"
+		def build(staging_dir: Path) -> None:
+			env_java_path = staging_dir / f"{self.environment_class_name}.java"
+			env_java_path.write_text(env_source)
+			compile_start = time.perf_counter()
+			self._compile_environment_java(
+				java_bin=java_bin,
+				javac_bin=javac_bin,
+				jason_jar=jason_jar,
+				env_java_path=env_java_path,
+				output_path=staging_dir,
+			)
+			timing_profile["environment_compile_seconds"] = time.perf_counter() - compile_start
+
+		return self.class_cache.ensure(
+			"environment",
+			cache_key,
+			required=(class_file,),
+			build=build,
+		)
+
+	def _environment_pattern_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+		return {
+			"predicate": self._sanitize_name(str(payload.get("predicate", ""))),
+			"positive": bool(payload.get("is_positive", True)),
+			"args": [str(item) for item in (payload.get("args") or [])],
+		}
+
+	def resolve_toolchain(self) -> JasonToolchain:
+		"""Return the Java/Jason toolchain, reusing the persisted manifest when fresh."""
+
+		return self._resolve_toolchain()[0]
+
+	def _resolve_toolchain(self) -> Tuple[JasonToolchain, str]:
+		if self.toolchain is not None:
+			return self.toolchain, "shared"
+		manifest_override = os.getenv("JASON_RUNTIME_TOOLCHAIN_MANIFEST", "").strip()
+		manifest_path = (
+			Path(manifest_override).expanduser()
+			if manifest_override
+			else self.class_cache.root / "toolchain.json"
+		)
+		return resolve_jason_toolchain(
+			manifest_path=manifest_path,
+			fingerprint=lambda: toolchain_fingerprint(
+				jason_src_dir=self.jason_src_dir,
+				jar_dirs=(self._jason_jar_dir(),),
+			),
+			probe=self._probe_toolchain,
+		)
+
+	def _probe_toolchain(self) -> Tuple[str, int, str, Path, Path]:
+		java_bin, java_major = self._select_java_binary()
+		javac_bin = self._select_javac_binary(java_bin)
+		jason_jar = self._ensure_jason_jar(java_bin)
+		log_conf = self._resolve_log_config()
+		return java_bin, java_major, javac_bin, jason_jar, log_conf
 
 	def _resolve_log_config(self) -> Path:
 		log_conf = (
@@ -4906,8 +5954,11 @@ public class {self.environment_class_name} extends Environment {{
 			},
 		)
 
+	def _jason_jar_dir(self) -> Path:
+		return self.jason_src_dir / "jason-cli" / "build" / "bin"
+
 	def _find_jason_jar(self) -> Optional[Path]:
-		bin_dir = self.jason_src_dir / "jason-cli" / "build" / "bin"
+		bin_dir = self._jason_jar_dir()
 		if not bin_dir.exists():
 			return None
 
@@ -5099,7 +6150,11 @@ public class {self.environment_class_name} extends Environment {{
 		exit_code: Optional[int],
 		timed_out: bool,
 		environment_result: EnvironmentAdapterResult,
+		*,
+		stalled: bool = False,
 	) -> str:
+		if stalled:
+			return f"no runtime progress for {self.stall_timeout_seconds}s"
 		if timed_out:
 			return f"timeout ({self.timeout_seconds}s)"
 		if exit_code is None:
@@ -5124,7 +6179,11 @@ public class {self.environment_class_name} extends Environment {{
 		exit_code: Optional[int],
 		timed_out: bool,
 		environment_result: EnvironmentAdapterResult,
+		*,
+		stalled: bool = False,
 	) -> str:
+		if stalled:
+			return "runtime_stalled"
 		if timed_out:
 			return "timeout"
 		if exit_code is None:
@@ -5182,91 +6241,56 @@ public class {self.environment_class_name} extends Environment {{
 		action_schemas: Sequence[Dict[str, Any]],
 		seed_facts: Sequence[str],
 	) -> Dict[str, Any]:
-		world = {
+		simulator = self._ground_simulator(action_schemas)
+		state = simulator.initial_state(
 			atom
-			for atom in (self._hddl_fact_to_atom(fact) for fact in seed_facts)
+			for atom in (simulator.table.encode_hddl(str(fact).strip()) for fact in seed_facts)
 			if atom is not None
-		}
-		schema_lookup = self._action_schema_lookup(action_schemas)
-
+		)
+		parsed_steps: List[Tuple[str, Tuple[str, ...]]] = []
+		malformed_index: Optional[int] = None
 		for index, step in enumerate(action_path):
 			parsed_step = self._parse_runtime_action_step(step)
 			if parsed_step is None:
-				return {
-					"passed": False,
-					"failure_class": "action_path_malformed_step",
-					"message": f"runtime action step #{index + 1} is malformed: {step}",
-					"checked_steps": index,
-					"world_facts": sorted(world),
-				}
-			action_name, action_args = parsed_step
-			schema = schema_lookup.get(action_name)
-			if schema is None:
-				return {
-					"passed": False,
-					"failure_class": "action_path_unknown_action",
-					"message": f"runtime action step #{index + 1} references unknown action '{action_name}'",
-					"checked_steps": index,
-					"world_facts": sorted(world),
-				}
-			parameters = [str(item) for item in (schema.get("parameters") or [])]
-			if len(parameters) != len(action_args):
-				return {
-					"passed": False,
-					"failure_class": "action_path_arity_mismatch",
-					"message": (
-						f"runtime action step #{index + 1} has arity {len(action_args)} for "
-						f"'{action_name}', expected {len(parameters)}"
-					),
-					"checked_steps": index,
-					"world_facts": sorted(world),
-				}
-
-			bindings: Dict[str, str] = {}
-			for parameter, value in zip(parameters, action_args):
-				token = self._canonical_runtime_token(parameter)
-				bindings[token] = value
-				if token.startswith("?"):
-					bindings[token[1:]] = value
-
-			precondition_clauses = list(schema.get("precondition_clauses") or [])
-			if not precondition_clauses:
-				precondition_clauses = [list(schema.get("preconditions") or [])]
-			if not any(
-				self._replay_precondition_clause_holds(clause, bindings, world)
-				for clause in precondition_clauses
-			):
-				return {
-					"passed": False,
-					"failure_class": "action_path_precondition_violation",
-					"message": (
-						f"runtime action step #{index + 1} violates schema preconditions for "
-						f"'{action_name}{self._render_runtime_args(action_args)}'"
-					),
-					"checked_steps": index,
-					"world_facts": sorted(world),
-				}
-
-			for effect in self._ordered_runtime_effects(schema.get("effects") or []):
-				predicate = str(effect.get("predicate", "")).strip()
-				if not predicate or predicate == "=":
-					continue
-				grounded = self._ground_runtime_pattern(
-					predicate,
-					effect.get("args") or [],
-					bindings,
+				malformed_index = index
+				break
+			parsed_steps.append(parsed_step)
+
+		replay = simulator.replay(parsed_steps, state)
+		world_facts = sorted(simulator.state_atoms(replay.state))
+		index = replay.checked_steps
+		if replay.failure is None and malformed_index is None:
+			return {
+				"passed": True,
+				"failure_class": None,
+				"message": None,
+				"checked_steps": len(action_path),
+				"world_facts": world_facts,
+			}
+		if replay.failure is None:
+			failure_class = "action_path_malformed_step"
+			message = f"runtime action step #{index + 1} is malformed: {action_path[index]}"
+		else:
+			action_name, action_args = parsed_steps[index]
+			failure_class = f"action_path_{replay.failure}"
+			if replay.failure == "unknown_action":
+				message = f"runtime action step #{index + 1} references unknown action '{action_name}'"
+			elif replay.failure == "arity_mismatch":
+				message = (
+					f"runtime action step #{index + 1} has arity {len(action_args)} for "
+					f"'{action_name}', expected {simulator.arity(action_name)}"
+				)
+			else:
+				message = (
+					f"runtime action step #{index + 1} violates schema preconditions for "
+					f"'{action_name}{self._render_runtime_args(action_args)}'"
 				)
-				if effect.get("is_positive", True):
-					world.add(grounded)
-				else:
-					world.discard(grounded)
-
 		return {
-			"passed": True,
-			"failure_class": None,
-			"message": None,
-			"checked_steps": len(action_path),
-			"world_facts": sorted(world),
+			"passed": False,
+			"failure_class": failure_class,
+			"message": message,
+			"checked_steps": index,
+			"world_facts": world_facts,
 		}
 
 	def _check_method_trace_reconstruction(
@@ -5327,28 +6351,6 @@ public class {self.environment_class_name} extends Environment {{
 			"message": None,
 		}
 
-	def _replay_precondition_clause_holds(
-		self,
-		clause: Sequence[Dict[str, Any]],
-		bindings: Dict[str, str],
-		world: Set[str],
-	) -> bool:
-		for pattern in clause:
-			predicate = str(pattern.get("predicate", "")).strip()
-			args = [str(item) for item in (pattern.get("args") or [])]
-			is_positive = bool(pattern.get("is_positive", True))
-			if predicate == "=" and len(args) == 2:
-				left = self._resolve_runtime_token(args[0], bindings)
-				right = self._resolve_runtime_token(args[1], bindings)
-				if (left == right) != is_positive:
-					return False
-				continue
-			grounded = self._ground_runtime_pattern(predicate, args, bindings)
-			holds = grounded in world if is_positive else grounded not in world
-			if not holds:
-				return False
-		return True
-
 	@staticmethod
 	def _ordered_runtime_effects(effects: Sequence[Dict[str, Any]]) -> Tuple[Dict[str, Any], ...]:
 		"""
@@ -5393,59 +6395,16 @@ public class {self.environment_class_name} extends Environment {{
 			return value[1:-1]
 		return value
 
-	def _resolve_runtime_token(
-		self,
-		token: str,
-		bindings: Dict[str, str],
-	) -> str:
-		canonical = self._canonical_runtime_token(token)
-		if canonical in bindings:
-			return bindings[canonical]
-		if canonical.startswith("?") and canonical[1:] in bindings:
-			return bindings[canonical[1:]]
-		return canonical
-
-	def _ground_runtime_pattern(
-		self,
-		predicate: str,
-		args: Sequence[str],
-		bindings: Dict[str, str],
-	) -> str:
-		functor = self._sanitize_name(predicate)
-		if not args:
-			return functor
-		grounded_args = [
-			self._runtime_atom_term(self._resolve_runtime_token(arg, bindings))
-			for arg in args
-		]
-		return f"{functor}({','.join(grounded_args)})"
-
 	@staticmethod
 	def _render_runtime_args(args: Sequence[str]) -> str:
 		if not args:
 			return "()"
 		return f"({', '.join(args)})"
 
-	@staticmethod
-	@lru_cache(maxsize=131072)
-	def _hddl_fact_to_atom(fact: str) -> Optional[str]:
-		text = (fact or "").strip()
-		if not text.startswith("(") or not text.endswith(")"):
-			return None
-		inner = text[1:-1].strip()
-		if not inner or inner.startswith("not "):
-			return None
-		tokens = inner.split()
-		if not tokens:
-			return None
-		predicate, args = tokens[0], tokens[1:]
-		if predicate == "=":
-			return None
-		functor = JasonRunner._sanitize_name(predicate)
-		if not args:
-			return functor
-		rendered_args = [JasonRunner._runtime_atom_term(arg) for arg in args]
-		return f"{functor}({','.join(rendered_args)})"
+	def _hddl_fact_to_atom(self, fact: str) -> Optional[str]:
+		symbols = self._symbol_table()
+		encoded = symbols.encode_hddl(str(fact or "").strip())
+		return None if encoded is None else symbols.decode_agentspeak(encoded)
 
 	@staticmethod
 	def _normalise_process_output(output: str | bytes | None) -> str:
@@ -0,0 +1,192 @@
+"""
+Persisted Jason toolchain resolution.
+
+Selecting a Java runtime probes every candidate with `java -version`, and the
+Jason jar / javac / logging configuration lookups walk the filesystem. The
+result only changes when the process environment or the Jason build changes, so
+it is resolved once, kept in memory, and persisted to a small JSON manifest that
+other runners and worker processes reuse until its fingerprint goes stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+TOOLCHAIN_MANIFEST_VERSION = 1
+
+_TOOLCHAIN_ENVIRONMENT_KEYS = (
+	"PATH",
+	"JAVA_HOME",
+	"JASON_RUNTIME_JAVA_BIN",
+	"JASON_RUNTIME_JAVA_HOME",
+	"STAGE6_JAVA_BIN",
+	"STAGE6_JAVA_HOME",
+)
+
+_toolchain_memo: Dict[Tuple[str, str], "JasonToolchain"] = {}
+_toolchain_memo_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class JasonToolchain:
+	"""Resolved Java/Jason binaries shared by every runner of one environment."""
+
+	java_bin: str
+	java_major: int
+	javac_bin: str
+	jason_jar: Path
+	log_conf: Path
+	fingerprint: str
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			"manifest_version": TOOLCHAIN_MANIFEST_VERSION,
+			"java_bin": self.java_bin,
+			"java_major": self.java_major,
+			"javac_bin": self.javac_bin,
+			"jason_jar": str(self.jason_jar),
+			"log_conf": str(self.log_conf),
+			"fingerprint": self.fingerprint,
+		}
+
+	@classmethod
+	def from_dict(cls, payload: Dict[str, Any]) -> Optional["JasonToolchain"]:
+		if payload.get("manifest_version") != TOOLCHAIN_MANIFEST_VERSION:
+			return None
+		try:
+			return cls(
+				java_bin=str(payload["java_bin"]),
+				java_major=int(payload["java_major"]),
+				javac_bin=str(payload["javac_bin"]),
+				jason_jar=Path(str(payload["jason_jar"])),
+				log_conf=Path(str(payload["log_conf"])),
+				fingerprint=str(payload["fingerprint"]),
+			)
+		except (KeyError, TypeError, ValueError):
+			return None
+
+	def is_usable(self) -> bool:
+		"""Return whether every resolved file still exists on disk."""
+
+		return all(
+			Path(path).exists()
+			for path in (self.java_bin, self.javac_bin, self.jason_jar, self.log_conf)
+		)
+
+
+def toolchain_fingerprint(*, jason_src_dir: Path, jar_dirs: Iterable[Path] = ()) -> str:
+	"""Hash the inputs that can change toolchain resolution.
+
+	Covers the Java-related environment variables (including `PATH`) and the
+	name, size and mtime of every Jason CLI jar, so rebuilding Jason or switching
+	JDKs invalidates the manifest automatically.
+	"""
+
+	payload: Dict[str, Any] = {
+		"environment": {key: os.getenv(key, "") for key in _TOOLCHAIN_ENVIRONMENT_KEYS},
+		"jason_src_dir": str(Path(jason_src_dir).resolve()),
+		"jars": [],
+	}
+	for jar_dir in jar_dirs:
+		jar_dir = Path(jar_dir)
+		if not jar_dir.exists():
+			continue
+		for jar_path in sorted(jar_dir.glob("*.jar")):
+			try:
+				stat = jar_path.stat()
+			except OSError:
+				continue
+			payload["jars"].append([str(jar_path), stat.st_size, stat.st_mtime_ns])
+	encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+	return hashlib.sha256(encoded).hexdigest()
+
+
+def load_toolchain_manifest(manifest_path: Path, fingerprint: str) -> Optional[JasonToolchain]:
+	"""Return the persisted toolchain when it matches `fingerprint` and still exists."""
+
+	try:
+		payload = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return None
+	if not isinstance(payload, dict):
+		return None
+	toolchain = JasonToolchain.from_dict(payload)
+	if toolchain is None or toolchain.fingerprint != fingerprint or not toolchain.is_usable():
+		return None
+	return toolchain
+
+
+def write_toolchain_manifest(manifest_path: Path, toolchain: JasonToolchain) -> None:
+	"""Persist `toolchain` atomically; failures only cost a re-probe next time."""
+
+	manifest_path = Path(manifest_path)
+	try:
+		manifest_path.parent.mkdir(parents=True, exist_ok=True)
+		handle, temp_name = tempfile.mkstemp(
+			prefix=f".{manifest_path.name}-",
+			dir=manifest_path.parent,
+		)
+		with os.fdopen(handle, "w", encoding="utf-8") as stream:
+			json.dump(toolchain.to_dict(), stream, indent=2, sort_keys=True)
+		os.replace(temp_name, manifest_path)
+	except OSError:
+		return
+
+
+def resolve_jason_toolchain(
+	*,
+	manifest_path: Path,
+	fingerprint: Callable[[], str],
+	probe: Callable[[], Tuple[str, int, str, Path, Path]],
+) -> Tuple[JasonToolchain, str]:
+	"""Return `(toolchain, source)` where source is `memory`, `manifest` or `probe`.
+
+	`probe` performs the full resolution and returns
+	`(java_bin, java_major, javac_bin, jason_jar, log_conf)`; it only runs when
+	neither the in-process memo nor the persisted manifest matches the current
+	fingerprint.
+	"""
+
+	manifest_key = str(Path(manifest_path).resolve())
+	current_fingerprint = fingerprint()
+	with _toolchain_memo_lock:
+		memoized = _toolchain_memo.get((manifest_key, current_fingerprint))
+	if memoized is not None and memoized.is_usable():
+		return memoized, "memory"
+
+	persisted = load_toolchain_manifest(Path(manifest_path), current_fingerprint)
+	if persisted is not None:
+		with _toolchain_memo_lock:
+			_toolchain_memo[(manifest_key, current_fingerprint)] = persisted
+		return persisted, "manifest"
+
+	java_bin, java_major, javac_bin, jason_jar, log_conf = probe()
+	# Building the Jason jar during the probe changes the jar fingerprint.
+	resolved_fingerprint = fingerprint()
+	toolchain = JasonToolchain(
+		java_bin=str(java_bin),
+		java_major=int(java_major),
+		javac_bin=str(javac_bin),
+		jason_jar=Path(jason_jar),
+		log_conf=Path(log_conf),
+		fingerprint=resolved_fingerprint,
+	)
+	with _toolchain_memo_lock:
+		_toolchain_memo[(manifest_key, resolved_fingerprint)] = toolchain
+	write_toolchain_manifest(Path(manifest_path), toolchain)
+	return toolchain, "probe"
+
+
+def clear_toolchain_memo() -> None:
+	"""Forget in-process resolutions; persisted manifests are left untouched."""
+
+	with _toolchain_memo_lock:
+		_toolchain_memo.clear()
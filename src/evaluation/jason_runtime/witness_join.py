@@ -0,0 +1,313 @@
+"""
+Indexed join engine for local-witness grounding.
+
+A method plan context binds its method-local variables through a conjunction of
+runtime facts. `join_local_witness_bindings` evaluates that conjunction as a
+small relational join:
+- facts are hash-indexed by (predicate, bound argument positions) on first use;
+- atoms are joined in estimated selectivity order;
+- type and inequality filters run as soon as their variables are bound.
+
+Results come back in the order a left-to-right nested-loop evaluation of the
+atoms would produce them, so the generated plan order does not depend on the
+join order chosen here.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+
+GroundingFacts = Dict[Tuple[str, int], Tuple[Tuple[str, ...], ...]]
+
+
+class GroundingFactIndex:
+	"""Runtime facts of one query with lazily built per-position hash indexes."""
+
+	def __init__(self, facts: GroundingFacts, *, canonical: Callable[[str], str]) -> None:
+		self.facts = facts
+		self._canonical = canonical
+		self._positions: Dict[Tuple[str, int], Dict[Tuple[str, ...], int]] = {}
+		self._indexes: Dict[
+			Tuple[str, int, Tuple[int, ...]],
+			Dict[Tuple[str, ...], Tuple[Tuple[str, ...], ...]],
+		] = {}
+		self._distinct_counts: Dict[Tuple[str, int, int], int] = {}
+
+	def facts_for(self, predicate: str, arity: int) -> Tuple[Tuple[str, ...], ...]:
+		return self.facts.get((predicate, arity), ())
+
+	def position(self, predicate: str, arity: int, fact_args: Tuple[str, ...]) -> int:
+		"""Return the rank of `fact_args` within its predicate's sorted facts."""
+
+		key = (predicate, arity)
+		positions = self._positions.get(key)
+		if positions is None:
+			positions = {}
+			for index, args in enumerate(self.facts_for(predicate, arity)):
+				positions.setdefault(args, index)
+			self._positions[key] = positions
+		return positions.get(fact_args, len(positions))
+
+	def distinct_count(self, predicate: str, arity: int, position: int) -> int:
+		key = (predicate, arity, position)
+		count = self._distinct_counts.get(key)
+		if count is None:
+			count = len(
+				{
+					self._canonical(args[position])
+					for args in self.facts_for(predicate, arity)
+				},
+			)
+			self._distinct_counts[key] = count
+		return count
+
+	def lookup(
+		self,
+		predicate: str,
+		arity: int,
+		bound: Sequence[Tuple[int, str]],
+	) -> Tuple[Tuple[str, ...], ...]:
+		"""Return the facts whose `bound` positions hold the given values, in fact order."""
+
+		if not bound:
+			return self.facts_for(predicate, arity)
+		positions = tuple(position for position, _ in bound)
+		index_key = (predicate, arity, positions)
+		index = self._indexes.get(index_key)
+		if index is None:
+			buckets: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+			for args in self.facts_for(predicate, arity):
+				bucket_key = tuple(self._canonical(args[position]) for position in positions)
+				buckets.setdefault(bucket_key, []).append(args)
+			index = {key: tuple(values) for key, values in buckets.items()}
+			self._indexes[index_key] = index
+		return index.get(tuple(self._canonical(value) for _, value in bound), ())
+
+
+@dataclass
+class LocalWitnessJoinResult:
+	"""Candidate bindings of one clause plus join bookkeeping."""
+
+	bindings: List[Dict[str, str]]
+	over_limit: bool = False
+	probes: int = 0
+
+
+def join_local_witness_bindings(
+	*,
+	binding_atoms: Sequence[Dict[str, object]],
+	type_constraints: Sequence[Tuple[str, str]],
+	inequalities: Sequence[Tuple[str, str]],
+	local_vars: Sequence[str],
+	index: GroundingFactIndex,
+	type_domains: Dict[str, Tuple[str, ...]],
+	max_bindings: int,
+	is_variable: Callable[[str], bool],
+	canonical: Callable[[str], str],
+) -> LocalWitnessJoinResult:
+	"""Return every binding of `local_vars` that satisfies the clause.
+
+	A binding must satisfy the binding atoms, the type constraints and the
+	inequalities. Local variables not bound by any atom are enumerated from
+	their type domains; a variable with no type constraint leaves the clause
+	unspecialised. Collection stops with `over_limit=True` once more than
+	`max_bindings` distinct bindings exist.
+	"""
+
+	atoms = [
+		(str(atom["predicate"]), tuple(str(arg) for arg in tuple(atom["args"])))
+		for atom in binding_atoms
+	]
+	for predicate, args in atoms:
+		if not index.facts_for(predicate, len(args)):
+			return LocalWitnessJoinResult(bindings=[])
+
+	type_checks: Dict[str, List[str]] = {}
+	for term, type_name in type_constraints:
+		if is_variable(term):
+			type_checks.setdefault(term, []).append(str(type_name))
+			continue
+		domain = type_domains.get(str(type_name))
+		if domain is None or term not in domain:
+			return LocalWitnessJoinResult(bindings=[])
+	inequality_checks: Dict[str, List[Tuple[str, str]]] = {}
+	for lhs, rhs in inequalities:
+		lhs_variable = is_variable(lhs)
+		rhs_variable = is_variable(rhs)
+		if not lhs_variable and not rhs_variable:
+			if canonical(lhs) == canonical(rhs):
+				return LocalWitnessJoinResult(bindings=[])
+			continue
+		for term in (lhs, rhs):
+			if is_variable(term):
+				inequality_checks.setdefault(term, []).append((lhs, rhs))
+
+	def resolve(term: str, binding: Dict[str, str]) -> Optional[str]:
+		return binding.get(term) if is_variable(term) else term
+
+	def accepts(binding: Dict[str, str], new_vars: Sequence[str]) -> bool:
+		for variable in new_vars:
+			value = binding[variable]
+			for type_name in type_checks.get(variable, ()):
+				domain = type_domains.get(type_name)
+				if domain is None or value not in domain:
+					return False
+			for lhs, rhs in inequality_checks.get(variable, ()):
+				left_value = resolve(lhs, binding)
+				right_value = resolve(rhs, binding)
+				if left_value is None or right_value is None:
+					continue
+				if canonical(left_value) == canonical(right_value):
+					return False
+		return True
+
+	join_order = _plan_join_order(atoms, index=index, is_variable=is_variable)
+	bound_after_atoms: Set[str] = {
+		arg
+		for _, args in atoms
+		for arg in args
+		if is_variable(arg)
+	}
+	expansion_domains: List[Tuple[str, Tuple[str, ...]]] = []
+	for variable in local_vars:
+		variable = str(variable)
+		if variable in bound_after_atoms:
+			continue
+		required_types = type_checks.get(variable, ())
+		if not required_types:
+			return LocalWitnessJoinResult(bindings=[])
+		domain = set(type_domains.get(required_types[0], ()))
+		for type_name in required_types[1:]:
+			domain &= set(type_domains.get(type_name, ()))
+		if not domain:
+			return LocalWitnessJoinResult(bindings=[])
+		expansion_domains.append((variable, tuple(sorted(domain))))
+
+	local_var_set = {str(variable) for variable in local_vars}
+	best: Dict[Tuple[Tuple[str, str], ...], Tuple[Tuple[int, ...], Dict[str, str]]] = {}
+	probes = 0
+	over_limit = False
+
+	def record(binding: Dict[str, str], order_key: Tuple[int, ...]) -> bool:
+		signature = tuple(sorted(
+			(item, value)
+			for item, value in binding.items()
+			if item in local_var_set or value
+		))
+		existing = best.get(signature)
+		if existing is None:
+			if len(best) >= max_bindings:
+				return False
+			best[signature] = (order_key, dict(binding))
+		elif order_key < existing[0]:
+			best[signature] = (order_key, dict(binding))
+		return True
+
+	def expand(
+		position: int,
+		binding: Dict[str, str],
+		fact_ranks: Tuple[int, ...],
+		domain_ranks: Tuple[int, ...],
+	) -> bool:
+		if position >= len(expansion_domains):
+			return record(binding, fact_ranks + domain_ranks)
+		variable, domain = expansion_domains[position]
+		for rank, value in enumerate(domain):
+			binding[variable] = value
+			if accepts(binding, (variable,)):
+				if not expand(position + 1, binding, fact_ranks, domain_ranks + (rank,)):
+					binding.pop(variable, None)
+					return False
+			binding.pop(variable, None)
+		return True
+
+	def join(step: int, binding: Dict[str, str], ranks: Dict[int, int]) -> bool:
+		nonlocal probes
+		if step >= len(join_order):
+			fact_ranks = tuple(ranks[atom_index] for atom_index in range(len(atoms)))
+			return expand(0, dict(binding), fact_ranks, ())
+		atom_index = join_order[step]
+		predicate, args = atoms[atom_index]
+		bound = [
+			(position, resolve(arg, binding))
+			for position, arg in enumerate(args)
+			if resolve(arg, binding) is not None
+		]
+		for fact_args in index.lookup(predicate, len(args), bound):
+			probes += 1
+			matched = _match_atom(args, fact_args, binding, is_variable=is_variable, canonical=canonical)
+			if matched is None:
+				continue
+			new_vars = [variable for variable in matched if variable not in binding]
+			if not accepts(matched, new_vars):
+				continue
+			ranks[atom_index] = index.position(predicate, len(args), fact_args)
+			if not join(step + 1, matched, ranks):
+				return False
+		ranks.pop(atom_index, None)
+		return True
+
+	if not join(0, {}, {}):
+		over_limit = True
+	if over_limit:
+		return LocalWitnessJoinResult(bindings=[], over_limit=True, probes=probes)
+	ordered = sorted(best.values(), key=lambda item: item[0])
+	return LocalWitnessJoinResult(
+		bindings=[binding for _, binding in ordered],
+		probes=probes,
+	)
+
+
+def _plan_join_order(
+	atoms: Sequence[Tuple[str, Tuple[str, ...]]],
+	*,
+	index: GroundingFactIndex,
+	is_variable: Callable[[str], bool],
+) -> List[int]:
+	"""Greedily order atoms by estimated result size given the variables bound so far."""
+
+	remaining = list(range(len(atoms)))
+	bound_vars: Set[str] = set()
+	order: List[int] = []
+	while remaining:
+		def estimate(atom_index: int) -> Tuple[float, int]:
+			predicate, args = atoms[atom_index]
+			size = float(len(index.facts_for(predicate, len(args))))
+			for position, arg in enumerate(args):
+				if is_variable(arg) and arg not in bound_vars:
+					continue
+				size /= max(1, index.distinct_count(predicate, len(args), position))
+			return size, atom_index
+
+		chosen = min(remaining, key=estimate)
+		remaining.remove(chosen)
+		order.append(chosen)
+		bound_vars.update(arg for arg in atoms[chosen][1] if is_variable(arg))
+	return order
+
+
+def _match_atom(
+	pattern_args: Sequence[str],
+	fact_args: Sequence[str],
+	binding: Dict[str, str],
+	*,
+	is_variable: Callable[[str], bool],
+	canonical: Callable[[str], str],
+) -> Optional[Dict[str, str]]:
+	if len(pattern_args) != len(fact_args):
+		return None
+	candidate = dict(binding)
+	for pattern_term, fact_term in zip(pattern_args, fact_args):
+		if is_variable(pattern_term):
+			existing = candidate.get(pattern_term)
+			if existing is not None:
+				if canonical(existing) != canonical(fact_term):
+					return None
+				continue
+			candidate[pattern_term] = fact_term
+			continue
+		if canonical(pattern_term) != canonical(fact_term):
+			return None
+	return candidate
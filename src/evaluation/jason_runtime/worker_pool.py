@@ -0,0 +1,721 @@
+"""
+Warm Jason JVM worker pool.
+
+Keeps long-lived JVM processes that execute RunLocalMAS jobs on request, so batch
+evaluation pays JVM startup once per worker instead of once per query. Each job
+runs inside its own class loader (Jason jar plus the job directory) because
+RunLocalMAS keeps process-wide static state; the worker intercepts the
+`System.exit` issued by `.stopMAS` and reports the exit code over a line
+protocol instead of terminating. The interception relies on a
+`SecurityManager`, which JDK 24 removed (JEP 486), so pooling is limited to
+Java releases up to `SECURITY_MANAGER_MAX_JAVA_MAJOR`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from evaluation.jason_runtime.output_stream import (
+	JasonOutputFileTail,
+	JasonOutputParser,
+	JasonProgressTracker,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# From JDK 24 `System.setSecurityManager` throws UnsupportedOperationException.
+SECURITY_MANAGER_MAX_JAVA_MAJOR = 23
+
+
+def worker_pool_supported(java_major: Optional[int]) -> bool:
+	"""Return whether the worker's `System.exit` interception runs on this Java release."""
+
+	return java_major is None or int(java_major) <= SECURITY_MANAGER_MAX_JAVA_MAJOR
+
+
+class JasonWorkerPoolError(RuntimeError):
+	"""Raised when a warm Jason worker cannot be started or driven."""
+
+	def __init__(self, message: str, *, metadata: Optional[Dict[str, Any]] = None) -> None:
+		super().__init__(message)
+		self.metadata = dict(metadata or {})
+
+
+@dataclass(frozen=True)
+class JasonWorkerJob:
+	"""One RunLocalMAS invocation for a warm worker."""
+
+	work_dir: Path
+	mas2j_file: Path
+	log_conf: Path
+	timeout_seconds: float
+	stdout_file: Path
+	stderr_file: Path
+	classpath: Tuple[str, ...] = ()
+	stdout_parser: Optional[JasonOutputParser] = field(default=None, compare=False)
+	stderr_parser: Optional[JasonOutputParser] = field(default=None, compare=False)
+	stall_timeout_seconds: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class JasonWorkerJobResult:
+	"""Outcome of one job executed by a warm worker."""
+
+	exit_code: Optional[int]
+	timed_out: bool
+	stdout: str
+	stderr: str
+	worker_id: int
+	worker_job_index: int
+	worker_spawned: bool
+	worker_recycled: bool
+	wall_seconds: float
+	stalled: bool = False
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			"exit_code": self.exit_code,
+			"timed_out": self.timed_out,
+			"stalled": self.stalled,
+			"worker_id": self.worker_id,
+			"worker_job_index": self.worker_job_index,
+			"worker_spawned": self.worker_spawned,
+			"worker_recycled": self.worker_recycled,
+			"wall_seconds": self.wall_seconds,
+		}
+
+
+class _JasonWorkerProcess:
+	"""One live JVM worker and its protocol reader."""
+
+	def __init__(self, *, worker_id: int, process: subprocess.Popen, log_handle: Any) -> None:
+		self.worker_id = worker_id
+		self.process = process
+		self.log_handle = log_handle
+		self.job_count = 0
+		self.messages: "queue.Queue[Optional[str]]" = queue.Queue()
+		self.reader = threading.Thread(
+			target=self._read_protocol,
+			name=f"jason-worker-{worker_id}-reader",
+			daemon=True,
+		)
+		self.reader.start()
+
+	def _read_protocol(self) -> None:
+		stream = self.process.stdout
+		try:
+			for raw_line in iter(stream.readline, ""):
+				self.messages.put(raw_line.rstrip("\n"))
+		except (OSError, ValueError):
+			pass
+		finally:
+			self.messages.put(None)
+
+	def is_alive(self) -> bool:
+		return self.process.poll() is None
+
+	def send(self, line: str) -> None:
+		stdin = self.process.stdin
+		if stdin is None:
+			raise JasonWorkerPoolError("Jason worker stdin is closed.")
+		stdin.write(line + "\n")
+		stdin.flush()
+
+	def next_message(self, timeout: Optional[float]) -> Optional[str]:
+		return self.messages.get(timeout=timeout)
+
+	def stop(self, *, graceful: bool = True) -> None:
+		if self.is_alive() and graceful:
+			try:
+				self.send("QUIT")
+				self.process.wait(timeout=5)
+			except Exception:
+				pass
+		if self.is_alive():
+			self.process.kill()
+			try:
+				self.process.wait(timeout=5)
+			except Exception:
+				pass
+		for stream in (self.process.stdin, self.process.stdout):
+			try:
+				if stream is not None:
+					stream.close()
+			except Exception:
+				pass
+		try:
+			self.log_handle.close()
+		except Exception:
+			pass
+
+
+class JasonWorkerPool:
+	"""Bounded pool of pre-started JVMs that run Jason MAS jobs."""
+
+	worker_class_name = "JasonMASWorker"
+	startup_timeout_seconds = 60.0
+	progress_poll_seconds = 0.5
+
+	def __init__(
+		self,
+		*,
+		java_bin: str,
+		javac_bin: str,
+		jason_jar: str | Path,
+		max_workers: int = 1,
+		max_jobs_per_worker: int = 200,
+		worker_dir: str | Path | None = None,
+		jvm_options: Sequence[str] = (),
+		java_major: Optional[int] = None,
+	) -> None:
+		self.java_bin = str(java_bin)
+		self.java_major = java_major
+		self.javac_bin = str(javac_bin)
+		self.jason_jar = Path(jason_jar).resolve()
+		self.max_workers = max(1, int(max_workers))
+		self.max_jobs_per_worker = max(1, int(max_jobs_per_worker))
+		self.jvm_options = tuple(str(item) for item in jvm_options)
+		self._owns_worker_dir = worker_dir is None
+		self.worker_dir = (
+			Path(worker_dir).resolve()
+			if worker_dir is not None
+			else Path(tempfile.mkdtemp(prefix="jason-worker-pool-"))
+		)
+		self.worker_dir.mkdir(parents=True, exist_ok=True)
+		self._lock = threading.Condition()
+		self._idle: List[_JasonWorkerProcess] = []
+		self._live_count = 0
+		self._worker_ids = itertools.count(1)
+		self._job_ids = itertools.count(1)
+		self._compiled = False
+		self._closed = False
+		self.stats: Dict[str, int] = {
+			"workers_spawned": 0,
+			"workers_recycled": 0,
+			"workers_killed": 0,
+			"jobs_completed": 0,
+			"jobs_timed_out": 0,
+			"jobs_stalled": 0,
+		}
+
+	def __enter__(self) -> "JasonWorkerPool":
+		return self
+
+	def __exit__(self, *exc_info: Any) -> None:
+		self.close()
+
+	def run(self, job: JasonWorkerJob) -> JasonWorkerJobResult:
+		"""Execute one job on an idle worker, spawning or recycling workers as needed."""
+
+		worker, spawned = self._acquire_worker()
+		job_id = next(self._job_ids)
+		start = time.perf_counter()
+		classpath = [str(self.jason_jar), *job.classpath]
+		if not job.classpath:
+			classpath.append(str(Path(job.work_dir).resolve()))
+		request = "\t".join(
+			[
+				"RUN",
+				str(job_id),
+				os.pathsep.join(classpath),
+				str(Path(job.mas2j_file).resolve()),
+				str(Path(job.log_conf).resolve()),
+				str(Path(job.stdout_file).resolve()),
+				str(Path(job.stderr_file).resolve()),
+			],
+		)
+		exit_code: Optional[int] = None
+		timed_out = False
+		stalled = False
+		healthy = True
+		parsers = [parser for parser in (job.stdout_parser, job.stderr_parser) if parser is not None]
+		tails = [
+			JasonOutputFileTail(path, parser)
+			for path, parser in (
+				(job.stdout_file, job.stdout_parser),
+				(job.stderr_file, job.stderr_parser),
+			)
+			if parser is not None
+		]
+		progress = JasonProgressTracker(parsers) if parsers else None
+		try:
+			worker.send(request)
+			deadline = start + max(float(job.timeout_seconds), 0.0)
+			while True:
+				now = time.perf_counter()
+				remaining = deadline - now
+				if remaining <= 0:
+					raise queue.Empty
+				wait_seconds = remaining
+				if progress is not None:
+					for tail in tails:
+						tail.poll()
+					progress.observe()
+					terminal = any(parser.terminal_marker for parser in parsers)
+					if not terminal and progress.stalled(job.stall_timeout_seconds, now=now):
+						stalled = True
+						healthy = False
+						break
+					wait_seconds = min(remaining, self.progress_poll_seconds)
+				try:
+					message = worker.next_message(wait_seconds)
+				except queue.Empty:
+					if progress is not None and wait_seconds < remaining:
+						continue
+					raise
+				if message is None:
+					healthy = False
+					exit_code = worker.process.poll()
+					break
+				fields = message.split("\t")
+				if fields[0] == "DONE" and len(fields) >= 3 and fields[1] == str(job_id):
+					exit_code = int(fields[2])
+					break
+		except queue.Empty:
+			timed_out = True
+			healthy = False
+		except (OSError, ValueError):
+			healthy = False
+			exit_code = worker.process.poll()
+		worker.job_count += 1
+		recycled = self._release_worker(worker, healthy=healthy)
+		for tail in tails:
+			tail.poll(final=True)
+		with self._lock:
+			self.stats["jobs_completed"] += 1
+			if timed_out:
+				self.stats["jobs_timed_out"] += 1
+			if stalled:
+				self.stats["jobs_stalled"] += 1
+		return JasonWorkerJobResult(
+			exit_code=exit_code,
+			timed_out=timed_out,
+			stdout=self._read_job_output(job.stdout_file),
+			stderr=self._read_job_output(job.stderr_file),
+			worker_id=worker.worker_id,
+			worker_job_index=worker.job_count,
+			worker_spawned=spawned,
+			worker_recycled=recycled,
+			wall_seconds=time.perf_counter() - start,
+			stalled=stalled,
+		)
+
+	def close(self) -> None:
+		"""Stop all idle workers and release the pool directory."""
+
+		with self._lock:
+			self._closed = True
+			idle = list(self._idle)
+			self._idle.clear()
+			self._live_count -= len(idle)
+			self._lock.notify_all()
+		for worker in idle:
+			worker.stop()
+		if self._owns_worker_dir:
+			shutil.rmtree(self.worker_dir, ignore_errors=True)
+
+	def _acquire_worker(self) -> Tuple[_JasonWorkerProcess, bool]:
+		with self._lock:
+			while True:
+				if self._closed:
+					raise JasonWorkerPoolError("Jason worker pool is closed.")
+				while self._idle:
+					worker = self._idle.pop()
+					if worker.is_alive():
+						return worker, False
+					self._live_count -= 1
+					worker.stop(graceful=False)
+				if self._live_count < self.max_workers:
+					self._live_count += 1
+					break
+				self._lock.wait()
+		try:
+			return self._spawn_worker(), True
+		except Exception:
+			with self._lock:
+				self._live_count -= 1
+				self._lock.notify()
+			raise
+
+	def _release_worker(self, worker: _JasonWorkerProcess, *, healthy: bool) -> bool:
+		recycle = (
+			not healthy
+			or not worker.is_alive()
+			or worker.job_count >= self.max_jobs_per_worker
+		)
+		with self._lock:
+			retire = recycle or self._closed
+			if retire:
+				self._live_count -= 1
+				if not healthy:
+					self.stats["workers_killed"] += 1
+				elif recycle:
+					self.stats["workers_recycled"] += 1
+			else:
+				self._idle.append(worker)
+			self._lock.notify()
+		if retire:
+			worker.stop(graceful=healthy)
+		return recycle
+
+	def _spawn_worker(self) -> _JasonWorkerProcess:
+		if not worker_pool_supported(self.java_major):
+			raise JasonWorkerPoolError(
+				"Jason worker needs a SecurityManager, which this Java release no longer supports.",
+				metadata={
+					"java_bin": self.java_bin,
+					"java_major": self.java_major,
+					"max_supported_java_major": SECURITY_MANAGER_MAX_JAVA_MAJOR,
+				},
+			)
+		self._ensure_worker_class()
+		worker_id = next(self._worker_ids)
+		worker_home = self.worker_dir / f"worker_{worker_id}"
+		worker_home.mkdir(parents=True, exist_ok=True)
+		log_handle = (worker_home / "worker.log").open("w")
+		process = subprocess.Popen(
+			self._worker_command(),
+			cwd=worker_home,
+			stdin=subprocess.PIPE,
+			stdout=subprocess.PIPE,
+			stderr=log_handle,
+			text=True,
+			bufsize=1,
+			env=self._java_env(),
+		)
+		worker = _JasonWorkerProcess(worker_id=worker_id, process=process, log_handle=log_handle)
+		try:
+			message = worker.next_message(self.startup_timeout_seconds)
+		except queue.Empty:
+			message = None
+		if message != "READY":
+			worker.stop(graceful=False)
+			raise JasonWorkerPoolError(
+				"Jason worker failed to start.",
+				metadata={
+					"worker_id": worker_id,
+					"first_message": message,
+					"worker_log": str(worker_home / "worker.log"),
+				},
+			)
+		with self._lock:
+			self.stats["workers_spawned"] += 1
+		return worker
+
+	def _worker_command(self) -> List[str]:
+		return [
+			self.java_bin,
+			"-Djava.security.manager=allow",
+			"-Djava.awt.headless=true",
+			*self.jvm_options,
+			"-cp",
+			str(self.worker_dir),
+			self.worker_class_name,
+		]
+
+	def _java_env(self) -> Dict[str, str]:
+		java_home = str(Path(self.java_bin).resolve().parent.parent)
+		env = dict(os.environ)
+		env["JAVA_HOME"] = java_home
+		env["PATH"] = f"{java_home}/bin:{env.get('PATH', '')}"
+		return env
+
+	def _ensure_worker_class(self) -> None:
+		with self._lock:
+			if self._compiled:
+				return
+			class_path = self.worker_dir / f"{self.worker_class_name}.class"
+			if not class_path.exists():
+				source_path = self.worker_dir / f"{self.worker_class_name}.java"
+				source_path.write_text(build_worker_java_source(self.worker_class_name))
+				result = subprocess.run(
+					[self.javac_bin, "-nowarn", source_path.name],
+					cwd=self.worker_dir,
+					text=True,
+					capture_output=True,
+					check=False,
+					env=self._java_env(),
+				)
+				if result.returncode != 0 or not class_path.exists():
+					raise JasonWorkerPoolError(
+						"Jason worker Java compilation failed.",
+						metadata={
+							"javac_bin": self.javac_bin,
+							"stdout": result.stdout,
+							"stderr": result.stderr,
+							"return_code": result.returncode,
+						},
+					)
+			self._compiled = True
+
+	@staticmethod
+	def _read_job_output(path: Path) -> str:
+		try:
+			return Path(path).read_text(encoding="utf-8", errors="replace")
+		except OSError:
+			return ""
+
+
+_shared_pools: Dict[Tuple[str, str, str], JasonWorkerPool] = {}
+_shared_pools_lock = threading.Lock()
+_unsupported_pool_keys: set[Tuple[str, str, str]] = set()
+
+
+def configured_worker_count() -> int:
+	"""Return the warm-worker count requested through `JASON_RUNTIME_WORKERS`."""
+
+	raw_value = os.getenv("JASON_RUNTIME_WORKERS", "").strip()
+	if not raw_value:
+		return 0
+	try:
+		return max(0, int(raw_value))
+	except ValueError:
+		return 0
+
+
+def configured_max_jobs_per_worker() -> int:
+	raw_value = os.getenv("JASON_RUNTIME_WORKER_MAX_JOBS", "").strip()
+	if not raw_value:
+		return 200
+	try:
+		return max(1, int(raw_value))
+	except ValueError:
+		return 200
+
+
+def shared_worker_pool(
+	*,
+	java_bin: str,
+	javac_bin: str,
+	jason_jar: str | Path,
+	java_major: Optional[int] = None,
+) -> Optional[JasonWorkerPool]:
+	"""Return the process-wide pool for one toolchain, or None when pooling is disabled.
+
+	Pooling is also skipped, with one warning per toolchain, when `java_major`
+	is too new for the worker's `System.exit` interception.
+	"""
+
+	worker_count = configured_worker_count()
+	if worker_count <= 0:
+		return None
+	key = (str(java_bin), str(javac_bin), str(Path(jason_jar).resolve()))
+	with _shared_pools_lock:
+		if not worker_pool_supported(java_major):
+			if key not in _unsupported_pool_keys:
+				_unsupported_pool_keys.add(key)
+				logger.warning(
+					"Jason worker pool disabled for %s: Java %s removed the SecurityManager "
+					"the worker uses to intercept System.exit (supported up to Java %s); "
+					"running each MAS in its own JVM instead.",
+					java_bin,
+					java_major,
+					SECURITY_MANAGER_MAX_JAVA_MAJOR,
+				)
+			return None
+		pool = _shared_pools.get(key)
+		if pool is None:
+			pool = JasonWorkerPool(
+				java_bin=java_bin,
+				javac_bin=javac_bin,
+				jason_jar=jason_jar,
+				max_workers=worker_count,
+				max_jobs_per_worker=configured_max_jobs_per_worker(),
+				java_major=java_major,
+			)
+			_shared_pools[key] = pool
+		return pool
+
+
+def close_shared_worker_pools() -> None:
+	"""Stop every process-wide worker pool."""
+
+	with _shared_pools_lock:
+		pools = list(_shared_pools.values())
+		_shared_pools.clear()
+	for pool in pools:
+		pool.close()
+
+
+atexit.register(close_shared_worker_pools)
+
+
+def build_worker_java_source(class_name: str = JasonWorkerPool.worker_class_name) -> str:
+	"""Render the JVM-side worker loop.
+
+	Protocol (one tab-separated line per message):
+	  in:  RUN <job> <classpath> <mas2j> <log-conf> <stdout-file> <stderr-file> | QUIT
+	  out: READY | DONE <job> <exit-code>
+	"""
+
+	return f"""
+import java.io.BufferedReader;
+import java.io.File;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.security.Permission;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.CountDownLatch;
+
+public class {class_name} {{
+
+	private static volatile ThreadGroup activeJobGroup = null;
+	private static volatile CountDownLatch activeJobExit = null;
+	private static volatile int activeJobExitCode = 0;
+	private static volatile boolean shuttingDown = false;
+
+	public static void main(String[] args) throws Exception {{
+		PrintStream protocol = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+		installExitInterceptor();
+		BufferedReader reader = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+		protocol.println("READY");
+		String line;
+		while ((line = reader.readLine()) != null) {{
+			String[] parts = line.split("\\t", -1);
+			if (parts.length == 0 || "QUIT".equals(parts[0])) {{
+				break;
+			}}
+			if (!"RUN".equals(parts[0]) || parts.length < 7) {{
+				protocol.println("ERROR\\tmalformed request");
+				continue;
+			}}
+			int exitCode = runJob(parts[2], parts[3], parts[4], parts[5], parts[6]);
+			protocol.println("DONE\\t" + parts[1] + "\\t" + exitCode);
+		}}
+		shuttingDown = true;
+		System.exit(0);
+	}}
+
+	private static void installExitInterceptor() {{
+		System.setSecurityManager(new SecurityManager() {{
+			@Override
+			public void checkPermission(Permission perm) {{
+			}}
+
+			@Override
+			public void checkPermission(Permission perm, Object context) {{
+			}}
+
+			@Override
+			public void checkExit(int status) {{
+				if (shuttingDown) {{
+					return;
+				}}
+				ThreadGroup group = Thread.currentThread().getThreadGroup();
+				CountDownLatch latch = activeJobExit;
+				if (latch != null && belongsTo(group, activeJobGroup)) {{
+					activeJobExitCode = status;
+					latch.countDown();
+				}}
+				throw new SecurityException("Jason job exit intercepted");
+			}}
+		}});
+	}}
+
+	private static boolean belongsTo(ThreadGroup group, ThreadGroup jobGroup) {{
+		if (jobGroup == null) {{
+			return false;
+		}}
+		for (ThreadGroup cursor = group; cursor != null; cursor = cursor.getParent()) {{
+			if (cursor == jobGroup) {{
+				return true;
+			}}
+		}}
+		return false;
+	}}
+
+	private static int runJob(
+		String classpath,
+		String masFile,
+		String logConf,
+		String stdoutFile,
+		String stderrFile
+	) {{
+		PrintStream originalOut = System.out;
+		PrintStream originalErr = System.err;
+		CountDownLatch latch = new CountDownLatch(1);
+		ThreadGroup jobGroup = new ThreadGroup("jason-job");
+		int exitCode = 1;
+		activeJobExitCode = 0;
+		activeJobGroup = jobGroup;
+		activeJobExit = latch;
+		URLClassLoader loader = null;
+		try (
+			PrintStream jobOut = new PrintStream(new FileOutputStream(stdoutFile), true, "UTF-8");
+			PrintStream jobErr = new PrintStream(new FileOutputStream(stderrFile), true, "UTF-8")
+		) {{
+			System.setOut(jobOut);
+			System.setErr(jobErr);
+			List<URL> urls = new ArrayList<>();
+			for (String entry : classpath.split(File.pathSeparator)) {{
+				if (!entry.isEmpty()) {{
+					urls.add(new File(entry).toURI().toURL());
+				}}
+			}}
+			loader = new URLClassLoader(urls.toArray(new URL[0]), ClassLoader.getPlatformClassLoader());
+			final URLClassLoader jobLoader = loader;
+			Thread jobThread = new Thread(jobGroup, () -> {{
+				try {{
+					Class<?> runner = Class.forName("jason.infra.local.RunLocalMAS", true, jobLoader);
+					Method main = runner.getMethod("main", String[].class);
+					main.invoke(null, (Object) new String[]{{masFile, "--log-conf", logConf, "--no-net"}});
+				}} catch (Throwable error) {{
+					Throwable cause = error instanceof InvocationTargetException ? error.getCause() : error;
+					if (!(cause instanceof SecurityException)) {{
+						cause.printStackTrace();
+						activeJobExitCode = 1;
+					}}
+				}} finally {{
+					latch.countDown();
+				}}
+			}}, "jason-job-main");
+			jobThread.setContextClassLoader(jobLoader);
+			jobThread.setDaemon(true);
+			jobThread.start();
+			latch.await();
+			exitCode = activeJobExitCode;
+			activeJobExit = null;
+			activeJobGroup = null;
+			jobGroup.interrupt();
+			jobOut.flush();
+			jobErr.flush();
+		}} catch (Throwable error) {{
+			error.printStackTrace(originalErr);
+			exitCode = 1;
+		}} finally {{
+			activeJobExit = null;
+			activeJobGroup = null;
+			System.setOut(originalOut);
+			System.setErr(originalErr);
+			if (loader != null) {{
+				try {{
+					loader.close();
+				}} catch (Exception ignored) {{
+				}}
+			}}
+		}}
+		return exitCode;
+	}}
+}}
+""".strip() + "\n"
@@ -8,6 +8,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+from domain_model.compiled_domain import compile_domain
 from method_library.synthesis.naming import sanitize_identifier
 from method_library.synthesis.schema import HTNMethodLibrary
 from evaluation.agentspeak import AgentSpeakRenderer
@@ -21,6 +22,7 @@ from evaluation.goal_grounding.grounder import (
 	NLToLTLfGenerator,
 )
 from evaluation.jason_runtime import JasonRunner
+from evaluation.jason_runtime.output_stream import configured_stall_timeout_seconds
 from evaluation.jason_runtime.runner import JasonValidationError
 from evaluation.runtime_context import (
 	action_type_map_for_domain,
@@ -45,7 +47,7 @@ from execution_logging.execution_logger import ExecutionLogger
 from plan_library.artifacts import PlanLibraryArtifactBundle, load_plan_library_artifact_bundle
 from plan_library.models import PlanLibrary
 from utils.config import get_config
-from utils.hddl_parser import HDDLParser
+from utils.hddl_parse_cache import load_parsed_domain, load_parsed_problem
 
 
 class PlanLibraryEvaluationOrchestrator:
@@ -58,6 +60,7 @@ class PlanLibraryEvaluationOrchestrator:
 		problem_file: str | None = None,
 		evaluation_domain_source: str | None = None,
 		runtime_backend: str | None = None,
+		jason_runner: JasonRunner | None = None,
 	) -> None:
 		self.config = get_config()
 		self.project_root = Path(__file__).resolve().parents[2]
@@ -79,9 +82,11 @@ class PlanLibraryEvaluationOrchestrator:
 		self.runtime_backend = str(runtime_backend or "jason").strip().lower()
 		if self.runtime_backend != "jason":
 			raise ValueError(f"Unsupported runtime backend '{self.runtime_backend}'.")
+		# Batch callers share one runner (toolchain, compiled environment) across queries.
+		self.jason_runner = jason_runner
 
-		self.domain = HDDLParser.parse_domain(self.domain_file)
-		self.problem = HDDLParser.parse_problem(self.problem_file) if self.problem_file else None
+		self.domain = load_parsed_domain(self.domain_file)
+		self.problem = load_parsed_problem(self.problem_file) if self.problem_file else None
 		self.type_parent_map = build_type_parent_map_for_domain(self.domain)
 		self.domain_type_names = set(self.type_parent_map.keys())
 		self.predicate_type_map = predicate_type_map_for_domain(
@@ -93,7 +98,7 @@ class PlanLibraryEvaluationOrchestrator:
 		validate_problem_domain_compatibility(
 			problem=self.problem,
 			domain_type_names=self.domain_type_names,
-			type_parent_map=self.type_parent_map,
+			compiled_domain=compile_domain(self.domain),
 			predicate_type_map=self.predicate_type_map,
 			task_type_map=self.task_type_map,
 		)
@@ -569,10 +574,8 @@ class PlanLibraryEvaluationOrchestrator:
 
 		try:
 			output_dir = self._require_output_dir()
-			runner = JasonRunner(
-				timeout_seconds=self._jason_runtime_timeout_seconds(
-					subgoal_count=len(grounding_result.subgoals),
-				),
+			runner = self.jason_runner or self.build_jason_runner(
+				subgoal_count=len(grounding_result.subgoals),
 			)
 			action_schemas = planner_action_schemas_for_domain(evaluation_domain.domain)
 			seed_facts = (
@@ -915,6 +918,21 @@ class PlanLibraryEvaluationOrchestrator:
 			if key != "total_seconds" and value is not None
 		}
 
+	@classmethod
+	def build_jason_runner(cls, *, subgoal_count: int = 0) -> JasonRunner:
+		"""Return a Jason runner configured with the evaluation runtime budgets."""
+
+		return JasonRunner(
+			timeout_seconds=cls._jason_runtime_timeout_seconds(subgoal_count=subgoal_count),
+			stall_timeout_seconds=cls._jason_runtime_stall_timeout_seconds(),
+		)
+
 	@staticmethod
 	def _jason_runtime_timeout_seconds(*, subgoal_count: int) -> int:
+		# Hard ceiling only; runs that stop making progress are cut by the stall watchdog.
 		return 1800
+
+	@staticmethod
+	def _jason_runtime_stall_timeout_seconds() -> float:
+		stall_timeout_seconds = configured_stall_timeout_seconds()
+		return 0.0 if stall_timeout_seconds is None else stall_timeout_seconds
@@ -18,7 +18,7 @@ from temporal_specification import (
 	parse_task_event_predicate_name,
 	validate_temporal_specification_record,
 )
-from utils.hddl_parser import HDDLParser
+from utils.hddl_parse_cache import load_parsed_domain
 from utils.symbol_normalizer import SymbolNormalizer
 
 
@@ -28,7 +28,7 @@ class PlanLibraryEvaluationPipeline:
 	def __init__(self, *, domain_file: str) -> None:
 		self.project_root = Path(__file__).resolve().parents[2]
 		self.domain_file = str(Path(domain_file).expanduser().resolve())
-		self.domain = HDDLParser.parse_domain(self.domain_file)
+		self.domain = load_parsed_domain(self.domain_file)
 
 	def evaluate_benchmark_case(
 		self,
@@ -5,8 +5,9 @@ Runtime domain context helpers for plan-library evaluation.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
 
+from domain_model.compiled_domain import CompiledDomain, compile_domain
 from domain_model.materialization import (
 	write_generated_domain_file,
 	write_masked_domain_file,
@@ -21,7 +22,6 @@ from evaluation.domain_selection import (
 from evaluation.artifacts import TemporalGroundingResult
 from evaluation.goal_grounding.grounding_map import GroundingMap
 from plan_library.artifacts import PlanLibraryArtifactBundle
-from utils.hddl_condition_parser import HDDLConditionParser
 from utils.hddl_parser import HDDLParser
 
 
@@ -32,67 +32,7 @@ class EvaluationTypeResolutionError(RuntimeError):
 def build_type_parent_map_for_domain(domain: Any) -> Dict[str, Optional[str]]:
 	"""Build a child-to-parent type map from a parsed HDDL domain."""
 
-	tokens = [
-		token.strip()
-		for token in (getattr(domain, "types", []) or [])
-		if token and token.strip()
-	]
-	if not tokens:
-		return {"object": None}
-
-	parent_map: Dict[str, Optional[str]] = {}
-	pending_children: List[str] = []
-	index = 0
-	while index < len(tokens):
-		token = tokens[index]
-		if token == "-":
-			if not pending_children or index + 1 >= len(tokens):
-				raise ValueError("Malformed HDDL :types declaration (dangling '-').")
-			parent_type = tokens[index + 1]
-			for child_type in pending_children:
-				previous = parent_map.get(child_type)
-				if previous is not None and previous != parent_type:
-					raise ValueError(
-						f"Type '{child_type}' has conflicting parents "
-						f"('{previous}' vs '{parent_type}').",
-					)
-				parent_map[child_type] = parent_type
-			pending_children = []
-			index += 2
-			continue
-
-		pending_children.append(token)
-		index += 1
-
-	for child_type in pending_children:
-		parent_map.setdefault(child_type, "object")
-
-	parent_map["object"] = None
-	changed = True
-	while changed:
-		changed = False
-		for parent_type in list(parent_map.values()):
-			if parent_type is None or parent_type in parent_map:
-				continue
-			parent_map[parent_type] = "object" if parent_type != "object" else None
-			changed = True
-
-	for type_name in list(parent_map.keys()):
-		if type_name == "object":
-			parent_map[type_name] = None
-			continue
-		if parent_map[type_name] == type_name:
-			raise ValueError(f"Type '{type_name}' cannot inherit from itself.")
-
-		seen = {type_name}
-		cursor = parent_map[type_name]
-		while cursor is not None:
-			if cursor in seen:
-				raise ValueError(f"Cyclic type hierarchy detected at '{type_name}'.")
-			seen.add(cursor)
-			cursor = parent_map.get(cursor)
-
-	return parent_map
+	return dict(compile_domain(domain).type_parent_map)
 
 
 def sanitize_name(name: str) -> str:
@@ -128,14 +68,10 @@ def predicate_type_map_for_domain(
 	"""Build predicate argument type signatures for a parsed domain."""
 
 	mapping: Dict[str, Tuple[str, ...]] = {}
-	for predicate in getattr(domain, "predicates", []):
-		mapping[predicate.name] = tuple(
-			require_known_type(
-				parameter_type(parameter),
-				f"Predicate '{predicate.name}'",
-				domain_type_names,
-			)
-			for parameter in predicate.parameters
+	for predicate_name, signature in compile_domain(domain).predicate_types.items():
+		mapping[predicate_name] = tuple(
+			require_known_type(type_name, f"Predicate '{predicate_name}'", domain_type_names)
+			for type_name in signature
 		)
 	return mapping
 
@@ -147,17 +83,13 @@ def action_type_map_for_domain(
 	"""Build action argument type signatures for a parsed domain."""
 
 	mapping: Dict[str, Tuple[str, ...]] = {}
-	for action in getattr(domain, "actions", []):
+	for action_name, signature in compile_domain(domain).action_types.items():
 		type_signature = tuple(
-			require_known_type(
-				parameter_type(parameter),
-				f"Action '{action.name}'",
-				domain_type_names,
-			)
-			for parameter in action.parameters
+			require_known_type(type_name, f"Action '{action_name}'", domain_type_names)
+			for type_name in signature
 		)
-		mapping[action.name] = type_signature
-		mapping[sanitize_name(action.name)] = type_signature
+		mapping[action_name] = type_signature
+		mapping[sanitize_name(action_name)] = type_signature
 	return mapping
 
 
@@ -168,48 +100,23 @@ def task_type_map_for_domain(
 	"""Build compound-task argument type signatures for a parsed domain."""
 
 	mapping: Dict[str, Tuple[str, ...]] = {}
-	for task in getattr(domain, "tasks", []):
+	for task_name, signature in compile_domain(domain).task_types.items():
 		type_signature = tuple(
-			require_known_type(
-				parameter_type(parameter),
-				f"Task '{task.name}'",
-				domain_type_names,
-			)
-			for parameter in task.parameters
+			require_known_type(type_name, f"Task '{task_name}'", domain_type_names)
+			for type_name in signature
 		)
-		mapping[task.name] = type_signature
-		mapping[sanitize_name(task.name)] = type_signature
+		mapping[task_name] = type_signature
+		mapping[sanitize_name(task_name)] = type_signature
 	return mapping
 
 
-def is_subtype(
-	candidate_type: str,
-	expected_type: str,
-	type_parent_map: Dict[str, Optional[str]],
-) -> bool:
-	"""Return whether candidate_type equals or inherits from expected_type."""
-
-	if candidate_type == expected_type:
-		return True
-	if candidate_type not in type_parent_map or expected_type not in type_parent_map:
-		return False
-	cursor = type_parent_map.get(candidate_type)
-	visited = {candidate_type}
-	while cursor is not None and cursor not in visited:
-		if cursor == expected_type:
-			return True
-		visited.add(cursor)
-		cursor = type_parent_map.get(cursor)
-	return False
-
-
 def validate_problem_arguments_against_signature(
 	*,
 	args: Sequence[str],
 	signature: Sequence[str],
 	object_types: Dict[str, str],
 	domain_type_names: Set[str],
-	type_parent_map: Dict[str, Optional[str]],
+	compiled_domain: CompiledDomain,
 	scope: str,
 ) -> None:
 	"""Validate one grounded problem tuple against its declared type signature."""
@@ -224,7 +131,7 @@ def validate_problem_arguments_against_signature(
 			continue
 		if actual_type not in domain_type_names:
 			raise ValueError(f"{scope}: object '{arg}' uses unknown type '{actual_type}'.")
-		if not is_subtype(actual_type, expected_type, type_parent_map):
+		if not compiled_domain.is_subtype(actual_type, expected_type):
 			raise ValueError(
 				f"{scope}: object '{arg}' has type '{actual_type}', expected "
 				f"'{expected_type}'.",
@@ -235,7 +142,7 @@ def validate_problem_domain_compatibility(
 	*,
 	problem: Any,
 	domain_type_names: Set[str],
-	type_parent_map: Dict[str, Optional[str]],
+	compiled_domain: CompiledDomain,
 	predicate_type_map: Dict[str, Tuple[str, ...]],
 	task_type_map: Dict[str, Tuple[str, ...]],
 ) -> None:
@@ -268,7 +175,7 @@ def validate_problem_domain_compatibility(
 			signature=task_type_map[task.task_name],
 			object_types=problem.object_types,
 			domain_type_names=domain_type_names,
-			type_parent_map=type_parent_map,
+			compiled_domain=compiled_domain,
 			scope=f"problem HTN task '{task.to_signature()}'",
 		)
 
@@ -283,7 +190,7 @@ def validate_problem_domain_compatibility(
 			signature=predicate_type_map[fact.predicate],
 			object_types=problem.object_types,
 			domain_type_names=domain_type_names,
-			type_parent_map=type_parent_map,
+			compiled_domain=compiled_domain,
 			scope=f"problem fact '{fact.to_signature()}'",
 		)
 
@@ -353,10 +260,10 @@ def render_problem_fact(fact: Any) -> str:
 def planner_action_schemas_for_domain(domain: Any) -> Tuple[Dict[str, Any], ...]:
 	"""Parse HDDL action schemas into the Jason environment adapter format."""
 
-	parser = HDDLConditionParser()
+	compiled = compile_domain(domain)
 	schemas = []
-	for action in getattr(domain, "actions", []):
-		parsed = parser.parse_action(action)
+	for index, action in enumerate(getattr(domain, "actions", [])):
+		parsed = compiled.parsed_action_at(index)
 		schemas.append(
 			{
 				"functor": sanitize_name(action.name),
@@ -381,6 +288,20 @@ def planner_action_schemas_for_domain(domain: Any) -> Tuple[Dict[str, Any], ...]
 					]
 					for clause in parsed.precondition_clauses
 				],
+				"precondition_factors": [
+					[
+						[
+							{
+								"predicate": literal.predicate,
+								"args": list(literal.args),
+								"is_positive": literal.is_positive,
+							}
+							for literal in clause
+						]
+						for clause in factor
+					]
+					for factor in parsed.precondition_factors
+				],
 				"effects": [
 					{
 						"predicate": literal.predicate,
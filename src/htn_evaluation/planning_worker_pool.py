@@ -0,0 +1,361 @@
+"""
+Warm worker pool for official problem-root planning tasks.
+
+A fresh `spawn` process per planning task re-imports the planning and
+verification stack and re-parses the domain before any planner runs. The pool
+keeps a few warm "zygote" processes instead. Each zygote is spawned once,
+imports those modules, and keeps parsed domains and problems in the
+process-wide HDDL parse cache. It then forks one child per task, so every task
+still runs in its own process and process group with its own resource limits.
+The parent can hard-kill a task's process group on timeout exactly as it kills
+a spawned worker.
+
+`PlanningWorkerPool` mirrors the `Queue()` / `Process()` surface of a
+multiprocessing context. `HTNProblemRootEvaluator` can therefore launch,
+poll and terminate pooled tasks with the same code it uses for spawned
+processes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import itertools
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+PLANNING_WORKER_PRELOAD_MODULES: Tuple[str, ...] = (
+	"htn_evaluation.problem_root_runtime",
+	"utils.hddl_parse_cache",
+	"planning.linearization",
+	"planning.panda_sat",
+	"verification.official_plan_verifier",
+)
+PLANNING_WORKER_START_TIMEOUT_SECONDS = 120.0
+
+
+def planning_worker_pool_enabled() -> bool:
+	"""Return whether warm pooled workers are used (`HTN_EVAL_PLANNER_WORKER_POOL`).
+
+	The pool needs `os.fork`; `off`, `0`, `false` or `no` fall back to one
+	spawned process per planning task.
+	"""
+
+	raw_value = os.environ.get("HTN_EVAL_PLANNER_WORKER_POOL", "").strip().lower()
+	if raw_value in {"off", "0", "false", "no"}:
+		return False
+	return hasattr(os, "fork")
+
+
+class _TaggedResultQueue:
+	"""Result queue handed to a forked task; tags every message with the task token."""
+
+	def __init__(self, result_queue: Any, token: int) -> None:
+		self._result_queue = result_queue
+		self._token = token
+
+	def put(self, item: Any) -> None:
+		self._result_queue.put((self._token, item))
+
+
+def _run_forked_task(conn: Any, result_queue: Any, request: Dict[str, Any]) -> None:
+	"""Body of a forked task child; never returns."""
+
+	exit_code = 0
+	try:
+		conn.close()
+		try:
+			os.setsid()
+		except OSError:
+			pass
+		request["target"](
+			_TaggedResultQueue(result_queue, request["token"]),
+			**request["kwargs"],
+		)
+		result_queue.close()
+		result_queue.join_thread()
+	except BaseException:
+		exit_code = 1
+	finally:
+		os._exit(exit_code)
+
+
+def _planning_worker_main(conn: Any, result_queue: Any, preload_modules: Tuple[str, ...]) -> None:
+	"""Zygote loop: warm imports once, then fork one child per received task."""
+
+	for module_name in preload_modules:
+		try:
+			importlib.import_module(module_name)
+		except Exception:
+			pass
+	from utils.hddl_parse_cache import load_parsed_domain, load_parsed_problem
+
+	while True:
+		try:
+			request = conn.recv()
+		except (EOFError, OSError):
+			return
+		if request is None:
+			return
+		kwargs = dict(request["kwargs"])
+		try:
+			if "domain_file" in kwargs and "problem_file" in kwargs:
+				kwargs["domain"] = load_parsed_domain(kwargs["domain_file"])
+				kwargs["problem"] = load_parsed_problem(kwargs["problem_file"])
+		except Exception:
+			# The task parses the inputs itself and reports the failure.
+			kwargs.pop("domain", None)
+			kwargs.pop("problem", None)
+		request = {**request, "kwargs": kwargs}
+		pid = os.fork()
+		if pid == 0:
+			_run_forked_task(conn, result_queue, request)
+		try:
+			os.setpgid(pid, pid)
+		except OSError:
+			# The child already called setsid.
+			pass
+		conn.send(("started", request["token"], pid))
+		_, status = os.waitpid(pid, 0)
+		conn.send(("exited", request["token"], status))
+
+
+class _PlanningWorker:
+	"""Parent-side handle of one zygote process."""
+
+	def __init__(self, context: Any, preload_modules: Tuple[str, ...]) -> None:
+		self.conn, child_conn = context.Pipe()
+		self.result_queue = context.Queue()
+		self.process = context.Process(
+			target=_planning_worker_main,
+			args=(child_conn, self.result_queue, preload_modules),
+			daemon=True,
+		)
+		self.process.start()
+		child_conn.close()
+		self.tasks_run = 0
+
+	def alive(self) -> bool:
+		return self.process.is_alive()
+
+	def retire(self) -> None:
+		try:
+			self.conn.send(None)
+		except (OSError, ValueError):
+			pass
+		self.process.join(timeout=1.0)
+		if self.process.is_alive():
+			self.process.kill()
+			self.process.join(timeout=1.0)
+		self.conn.close()
+		self.result_queue.close()
+		self.result_queue.join_thread()
+
+
+class PooledResultQueue:
+	"""Result queue of one pooled task, bound to its worker when the task starts."""
+
+	def __init__(self, pool: "PlanningWorkerPool") -> None:
+		self._pool = pool
+		self.task: Optional["PooledPlanningProcess"] = None
+
+	def get(self, timeout: Optional[float] = None) -> Any:
+		task = self.task
+		if task is None or task.worker is None:
+			raise queue.Empty
+		while True:
+			token, item = task.worker.result_queue.get(timeout=timeout)
+			if token == task.token:
+				task.result_delivered = True
+				return item
+
+	def close(self) -> None:
+		if self.task is not None:
+			self._pool.release(self.task)
+
+	def join_thread(self) -> None:
+		return None
+
+
+class PooledPlanningProcess:
+	"""`multiprocessing.Process`-like handle of one task forked by a pooled worker.
+
+	`pid` is the forked task process, which leads its own process group, so
+	`os.killpg(os.getpgid(pid), ...)` stops the task without touching its worker.
+	"""
+
+	def __init__(
+		self,
+		pool: "PlanningWorkerPool",
+		*,
+		target: Callable[..., None],
+		kwargs: Dict[str, Any],
+	) -> None:
+		self._pool = pool
+		self.target = target
+		self.kwargs = dict(kwargs)
+		self.result_queue: PooledResultQueue = self.kwargs.pop("result_queue")
+		self.result_queue.task = self
+		self.token = next(pool._tokens)
+		self.worker: Optional[_PlanningWorker] = None
+		self.pid: Optional[int] = None
+		self.exitcode: Optional[int] = None
+		self.result_delivered = False
+		self.released = False
+
+	def start(self) -> None:
+		self.worker = self._pool.acquire()
+		self.worker.conn.send(
+			{"token": self.token, "target": self.target, "kwargs": self.kwargs},
+		)
+		remaining = PLANNING_WORKER_START_TIMEOUT_SECONDS
+		try:
+			while remaining > 0:
+				if self.worker.conn.poll(0.5):
+					self._receive()
+					if self.pid is not None:
+						return
+				elif not self.worker.alive():
+					break
+				remaining -= 0.5
+		except (EOFError, OSError):
+			pass
+		raise RuntimeError("Pooled planning worker did not start the task.")
+
+	def _receive(self) -> None:
+		event, token, value = self.worker.conn.recv()
+		if token != self.token:
+			return
+		if event == "started":
+			self.pid = int(value)
+		elif event == "exited":
+			self.exitcode = os.waitstatus_to_exitcode(int(value))
+
+	def is_alive(self) -> bool:
+		if self.pid is None or self.exitcode is not None:
+			return False
+		try:
+			while self.worker.conn.poll(0):
+				self._receive()
+		except (EOFError, OSError):
+			self.exitcode = -1
+		if self.exitcode is None and not self.worker.alive():
+			self.exitcode = -1
+		return self.exitcode is None
+
+	def join(self, timeout: Optional[float] = None) -> None:
+		if not self.is_alive():
+			return
+		try:
+			if self.worker.conn.poll(timeout):
+				self._receive()
+		except (EOFError, OSError):
+			self.exitcode = -1
+
+	def _signal(self, signum: int) -> None:
+		if self.pid is None or not self.is_alive():
+			return
+		try:
+			os.killpg(self.pid, signum)
+		except OSError:
+			try:
+				os.kill(self.pid, signum)
+			except OSError:
+				pass
+
+	def terminate(self) -> None:
+		self._signal(signal.SIGTERM)
+
+	def kill(self) -> None:
+		self._signal(signal.SIGKILL)
+
+
+class PlanningWorkerPool:
+	"""Warm zygote processes that fork one child process per planning task.
+
+	Workers are created on demand and reused once their task has exited and
+	delivered its result. A worker whose task was killed or died without a result
+	is retired, since the task may have left its result queue half-written.
+	"""
+
+	def __init__(
+		self,
+		*,
+		preload_modules: Tuple[str, ...] = PLANNING_WORKER_PRELOAD_MODULES,
+		max_idle_workers: Optional[int] = None,
+	) -> None:
+		self._context = multiprocessing.get_context("spawn")
+		self._preload_modules = tuple(preload_modules)
+		self._max_idle_workers = max(int(max_idle_workers or os.cpu_count() or 1), 1)
+		self._idle: List[_PlanningWorker] = []
+		self._lock = threading.Lock()
+		self._tokens = itertools.count(1)
+		self.stats: Dict[str, int] = {"workers_started": 0, "workers_reused": 0, "workers_retired": 0}
+
+	def Queue(self) -> PooledResultQueue:
+		return PooledResultQueue(self)
+
+	def Process(self, target: Callable[..., None], kwargs: Dict[str, Any]) -> PooledPlanningProcess:
+		return PooledPlanningProcess(self, target=target, kwargs=kwargs)
+
+	def acquire(self) -> _PlanningWorker:
+		with self._lock:
+			while self._idle:
+				worker = self._idle.pop()
+				if worker.alive():
+					self.stats["workers_reused"] += 1
+					return worker
+				self.stats["workers_retired"] += 1
+			self.stats["workers_started"] += 1
+		return _PlanningWorker(self._context, self._preload_modules)
+
+	def release(self, task: PooledPlanningProcess) -> None:
+		worker = task.worker
+		if worker is None or task.released:
+			return
+		task.released = True
+		reusable = task.result_delivered and not task.is_alive() and worker.alive()
+		with self._lock:
+			if reusable and len(self._idle) < self._max_idle_workers:
+				worker.tasks_run += 1
+				self._idle.append(worker)
+				return
+			self.stats["workers_retired"] += 1
+		if task.is_alive():
+			task.kill()
+			task.join(timeout=1.0)
+		worker.retire()
+
+	def close(self) -> None:
+		with self._lock:
+			idle, self._idle = self._idle, []
+		for worker in idle:
+			worker.retire()
+
+
+_SHARED_POOL: Optional[PlanningWorkerPool] = None
+_SHARED_POOL_LOCK = threading.Lock()
+
+
+def shared_planning_worker_pool() -> PlanningWorkerPool:
+	"""Return the process-wide pool, creating it on first use."""
+
+	global _SHARED_POOL
+	with _SHARED_POOL_LOCK:
+		if _SHARED_POOL is None:
+			_SHARED_POOL = PlanningWorkerPool()
+			atexit.register(_SHARED_POOL.close)
+		return _SHARED_POOL
+
+
+def planner_process_context() -> Any:
+	"""Return the warm pool, or a `spawn` context when the pool is disabled."""
+
+	if planning_worker_pool_enabled():
+		return shared_planning_worker_pool()
+	return multiprocessing.get_context("spawn")
@@ -26,6 +26,7 @@ from planning.primary_planner import (
 	expand_primary_planner_tasks_for_representations,
 )
 from planning.representations import PlanningRepresentation, RepresentationBuildResult
+from .planning_worker_pool import planner_process_context
 from .problem_root_runtime import official_problem_root_planning_task_worker
 from .result_tables import (
 	PRIMARY_HTN_PLANNER_ID,
@@ -38,6 +39,25 @@ from .result_tables import (
 
 PRIMARY_PLANNER_RESULT_MESSAGE = "primary_planner_attempt"
 HTN_ATTEMPT_TEXT_PREVIEW_CHARS = 4096
+PLANNER_PORTFOLIO_POLL_SECONDS = 0.05
+
+
+def planner_portfolio_width() -> int:
+	"""Return how many planning tasks race concurrently (`HTN_EVAL_PLANNER_PORTFOLIO_WIDTH`).
+
+	The default of 1 keeps the memory-bounded sequential order. `auto` races one
+	task per available CPU.
+	"""
+
+	raw_value = os.environ.get("HTN_EVAL_PLANNER_PORTFOLIO_WIDTH", "").strip().lower()
+	if not raw_value:
+		return 1
+	if raw_value == "auto":
+		return max(os.cpu_count() or 1, 1)
+	try:
+		return max(int(raw_value), 1)
+	except ValueError:
+		return 1
 
 
 def _attempt_text_preview(value: Any) -> str:
@@ -218,7 +238,7 @@ class HTNProblemRootEvaluator:
 				"planner_wallclock_seconds": 0.0,
 			}
 		representation_build_seconds = time.perf_counter() - representation_build_start
-		context = multiprocessing.get_context("spawn")
+		context = planner_process_context()
 		attempts: List[Dict[str, Any]] = []
 		planner_start = time.perf_counter()
 		selected_attempt: Optional[Dict[str, Any]] = None
@@ -276,14 +296,17 @@ class HTNProblemRootEvaluator:
 				"stderr": "",
 			}
 
-		def run_single_task(planning_task: PrimaryPlannerTask) -> Dict[str, Any]:
-			raw_remaining_timeout = planning_timeout_seconds - (time.perf_counter() - planner_start)
+		def launch_task(planning_task: PrimaryPlannerTask) -> Dict[str, Any]:
+			launch_offset = time.perf_counter() - planner_start
+			raw_remaining_timeout = planning_timeout_seconds - launch_offset
 			if raw_remaining_timeout <= 0.0:
-				return incomplete_attempt(
-					planning_task,
-					failure_reason="planner_timeout_budget_exhausted_before_primary_planner_launch",
-					total_seconds=planning_timeout_seconds,
-				)
+				return {
+					"attempt": incomplete_attempt(
+						planning_task,
+						failure_reason="planner_timeout_budget_exhausted_before_primary_planner_launch",
+						total_seconds=planning_timeout_seconds,
+					),
+				}
 			remaining_timeout = max(raw_remaining_timeout, 1.0)
 			attempt_output_dir = planner_root / planning_task.task_id
 			attempt_output_dir.mkdir(parents=True, exist_ok=True)
@@ -299,47 +322,170 @@ class HTNProblemRootEvaluator:
 					"planning_timeout_seconds": remaining_timeout,
 				},
 			)
-			attempt: Optional[Dict[str, Any]] = None
 			try:
 				process.start()
-				deadline = time.perf_counter() + remaining_timeout + 5.0
-				try:
-					while True:
-						try:
-							wait_seconds = max(min(deadline - time.perf_counter(), 5.0), 0.1)
-							message = result_queue.get(timeout=wait_seconds)
-							attempt = dict(message)
-							break
-						except queue.Empty:
-							if time.perf_counter() >= deadline:
-								break
-							if not process.is_alive():
-								break
-				finally:
+			except Exception:
+				self.close_planner_queue(result_queue)
+				raise
+			return {
+				"process": process,
+				"result_queue": result_queue,
+				"launch_offset": launch_offset,
+				"deadline": time.perf_counter() + remaining_timeout + 5.0,
+			}
+
+		def release_task(launched: Dict[str, Any]) -> None:
+			process = launched["process"]
+			try:
+				process.join(timeout=1.0)
+				if process.is_alive():
+					self.terminate_planner_process(process)
 					process.join(timeout=1.0)
-					if process.is_alive():
-						self.terminate_planner_process(process)
-						process.join(timeout=1.0)
 			finally:
-				self.close_planner_queue(result_queue)
-			if attempt is not None:
-				return attempt
+				self.close_planner_queue(launched["result_queue"])
+
+		def deadline_attempt(planning_task: PrimaryPlannerTask) -> Dict[str, Any]:
 			return incomplete_attempt(
 				planning_task,
 				failure_reason="planner_attempt_incomplete_before_deadline",
 				total_seconds=planning_timeout_seconds,
 			)
 
-		for planning_task in planning_tasks:
-			attempt = run_single_task(planning_task)
-			attempts.append(attempt)
-			if bool(attempt.get("success")):
-				selected_attempt = dict(attempt)
-				break
+		def record_timing(
+			planning_task: PrimaryPlannerTask,
+			*,
+			launch_offset: Optional[float],
+			attempt: Optional[Dict[str, Any]],
+			cancelled: bool = False,
+		) -> None:
+			finished_offset = time.perf_counter() - planner_start
+			solved = attempt is not None and bool(attempt.get("success"))
+			if launch_offset is None:
+				status = "not_launched"
+			elif cancelled:
+				status = "cancelled"
+			else:
+				status = "solved" if solved else "failed"
+			task_timings[planning_task.task_id] = {
+				"task_id": planning_task.task_id,
+				"planner_id": planning_task.planner_id,
+				"representation_id": planning_task.representation.representation_id,
+				"status": status,
+				"launch_offset_seconds": launch_offset,
+				"finished_offset_seconds": None if launch_offset is None else finished_offset,
+				"time_to_solution_seconds": (
+					finished_offset - launch_offset
+					if solved and launch_offset is not None
+					else None
+				),
+			}
+
+		def run_single_task(planning_task: PrimaryPlannerTask) -> Dict[str, Any]:
+			launched = launch_task(planning_task)
+			if "attempt" in launched:
+				record_timing(planning_task, launch_offset=None, attempt=None)
+				return launched["attempt"]
+			attempt: Optional[Dict[str, Any]] = None
+			process = launched["process"]
+			deadline = launched["deadline"]
+			try:
+				while True:
+					try:
+						wait_seconds = max(min(deadline - time.perf_counter(), 5.0), 0.1)
+						message = launched["result_queue"].get(timeout=wait_seconds)
+						attempt = dict(message)
+						break
+					except queue.Empty:
+						if time.perf_counter() >= deadline:
+							break
+						if not process.is_alive():
+							break
+			finally:
+				release_task(launched)
+			if attempt is None:
+				attempt = deadline_attempt(planning_task)
+			record_timing(planning_task, launch_offset=launched["launch_offset"], attempt=attempt)
+			return attempt
+
+		def run_portfolio(tasks: Sequence[PrimaryPlannerTask]) -> Optional[Dict[str, Any]]:
+			"""Race up to `portfolio_width` tasks; cancel the rest once one plan verifies."""
+
+			results: Dict[int, Dict[str, Any]] = {}
+			running: Dict[int, Dict[str, Any]] = {}
+			waiting = list(range(len(tasks)))
+			winner: Optional[Dict[str, Any]] = None
+			try:
+				while winner is None and (waiting or running):
+					while waiting and len(running) < portfolio_width:
+						index = waiting.pop(0)
+						launched = launch_task(tasks[index])
+						if "attempt" in launched:
+							record_timing(tasks[index], launch_offset=None, attempt=None)
+							results[index] = launched["attempt"]
+						else:
+							running[index] = launched
+					finished_any = False
+					for index, launched in list(running.items()):
+						attempt: Optional[Dict[str, Any]] = None
+						try:
+							attempt = dict(launched["result_queue"].get(timeout=0.0))
+						except queue.Empty:
+							if launched["process"].is_alive() and time.perf_counter() < launched["deadline"]:
+								continue
+							try:
+								# A worker that just exited may still be flushing its result.
+								attempt = dict(launched["result_queue"].get(timeout=0.5))
+							except queue.Empty:
+								attempt = None
+						del running[index]
+						release_task(launched)
+						finished_any = True
+						if attempt is None:
+							attempt = deadline_attempt(tasks[index])
+						record_timing(tasks[index], launch_offset=launched["launch_offset"], attempt=attempt)
+						results[index] = attempt
+						if bool(attempt.get("success")):
+							winner = attempt
+							break
+					if not finished_any and winner is None:
+						time.sleep(PLANNER_PORTFOLIO_POLL_SECONDS)
+			finally:
+				for index, launched in running.items():
+					self.terminate_planner_process(launched["process"])
+					release_task(launched)
+					record_timing(
+						tasks[index],
+						launch_offset=launched["launch_offset"],
+						attempt=None,
+						cancelled=True,
+					)
+					results[index] = incomplete_attempt(
+						tasks[index],
+						failure_reason="planner_attempt_cancelled_after_portfolio_winner",
+						total_seconds=time.perf_counter() - planner_start - launched["launch_offset"],
+					)
+			attempts.extend(results[index] for index in sorted(results))
+			return None if winner is None else dict(winner)
+
+		task_timings: Dict[str, Dict[str, Any]] = {}
+		portfolio_width = min(planner_portfolio_width(), max(len(planning_tasks), 1))
+		if portfolio_width > 1:
+			selected_attempt = run_portfolio(planning_tasks)
+		else:
+			for planning_task in planning_tasks:
+				attempt = run_single_task(planning_task)
+				attempts.append(attempt)
+				if bool(attempt.get("success")):
+					selected_attempt = dict(attempt)
+					break
 
 		if selected_attempt is None:
 			selected_attempt = self.select_planner_attempt(attempts)
 
+		for planning_task in planning_tasks:
+			if planning_task.task_id not in task_timings:
+				record_timing(planning_task, launch_offset=None, attempt=None)
+
 		return {
 			"evaluation_mode": mode,
 			"requested_planner_id": normalized_planner_id,
@@ -348,6 +494,15 @@ class HTNProblemRootEvaluator:
 			"selected_attempt": selected_attempt,
 			"representation_build_seconds": representation_build_seconds,
 			"planner_wallclock_seconds": time.perf_counter() - planner_start,
+			"planner_portfolio": {
+				"width": portfolio_width,
+				"winner_task_id": (
+					selected_attempt.get("task_id")
+					if bool(selected_attempt.get("success"))
+					else None
+				),
+				"tasks": [task_timings[task.task_id] for task in planning_tasks],
+			},
 		}
 
 	def representation_build_failure_attempt(
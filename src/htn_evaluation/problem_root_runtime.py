@@ -34,6 +34,7 @@ from planning.official_benchmark import (
 from verification.official_plan_verifier import IPCPlanVerifier
 
 from .context import HTNEvaluationContext
+from .problem_scheduler import assigned_cpu_affinity
 from .result_tables import PRIMARY_PLANNER_SELECTION_RULE
 
 
@@ -94,7 +95,12 @@ def _apply_official_resource_profile(
 		if callable(sched_setaffinity):
 			try:
 				existing_affinity = os.sched_getaffinity(0)
-				target_cpu = min(existing_affinity) if existing_affinity else 0
+				# A sweep scheduler hands concurrent problems distinct cores.
+				assigned_cpus = [cpu for cpu in assigned_cpu_affinity() if cpu in existing_affinity]
+				if assigned_cpus:
+					target_cpu = assigned_cpus[0]
+				else:
+					target_cpu = min(existing_affinity) if existing_affinity else 0
 				sched_setaffinity(0, {target_cpu})
 				profile["cpu_affinity_enforced"] = True
 				profile["cpu_affinity_strategy"] = "sched_setaffinity"
@@ -916,8 +922,14 @@ def official_problem_root_planning_task_worker(
 	output_dir: str,
 	task_payload: Dict[str, Any],
 	planning_timeout_seconds: float,
+	domain: Any = None,
+	problem: Any = None,
 ) -> None:
-	"""Spawn-safe worker for one primary planner attempt."""
+	"""Spawn-safe worker for one primary planner attempt.
+
+	`domain` and `problem` are the parsed inputs when a warm worker pool already
+	holds them; otherwise the worker parses the files itself.
+	"""
 	plan_solve_seconds = 0.0
 	plan_verification_seconds = 0.0
 	total_start = time.perf_counter()
@@ -925,7 +937,8 @@ def official_problem_root_planning_task_worker(
 	captured_stderr = io.StringIO()
 	planning_task = PrimaryPlannerTask.from_dict(dict(task_payload))
 	try:
-		if hasattr(os, "setsid"):
+		# Pooled workers are forked already leading their own process group.
+		if hasattr(os, "setsid") and os.getpgrp() != os.getpid():
 			os.setsid()
 		resource_profile = _apply_official_resource_profile(
 			memory_limit_mib=OFFICIAL_BENCHMARK_MEMORY_LIMIT_MIB,
@@ -934,6 +947,8 @@ def official_problem_root_planning_task_worker(
 		context = HTNEvaluationContext(
 			domain_file=domain_file,
 			problem_file=problem_file,
+			domain=domain,
+			problem=problem,
 		)
 		context.logger = _NullExecutionLogger()
 		context.output_dir = Path(output_dir).resolve()
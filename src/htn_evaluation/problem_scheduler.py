@@ -0,0 +1,200 @@
+"""
+Cross-problem scheduler for official problem-root baseline sweeps.
+
+A sweep is a set of independent (domain, problem) jobs. The scheduler runs
+them concurrently. It admits a job only while the host has room for the job's
+official resource profile (`OFFICIAL_BENCHMARK_MEMORY_LIMIT_MIB` and
+`OFFICIAL_BENCHMARK_CPU_COUNT`, the bounds `_apply_official_resource_profile`
+enforces inside each worker). Jobs are started longest-expected-first, using
+the wall-clock times recorded by earlier sweeps, so the slowest problems do not
+start last and stretch the tail.
+
+Each admitted job receives dedicated CPU ids. The launcher passes them on via
+`HTN_EVAL_CPU_AFFINITY`, so concurrently pinned workers do not all land on the
+same core.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from planning.official_benchmark import (
+	OFFICIAL_BENCHMARK_CPU_COUNT,
+	OFFICIAL_BENCHMARK_MEMORY_LIMIT_MIB,
+)
+
+
+CPU_AFFINITY_ENV = "HTN_EVAL_CPU_AFFINITY"
+SCHEDULER_POLL_SECONDS = 0.2
+
+
+@dataclass(frozen=True)
+class ScheduledProblemJob:
+	"""One (domain, problem) job of a sweep and the resources it is admitted with."""
+
+	domain_key: str
+	query_id: str
+	expected_seconds: Optional[float] = None
+	memory_limit_mib: int = OFFICIAL_BENCHMARK_MEMORY_LIMIT_MIB
+	cpu_count: int = OFFICIAL_BENCHMARK_CPU_COUNT
+
+	@property
+	def job_id(self) -> str:
+		return f"{self.domain_key}/{self.query_id}"
+
+
+@dataclass(frozen=True)
+class HostCapacity:
+	"""Memory and CPU ids the scheduler may hand out to concurrent jobs."""
+
+	memory_mib: int
+	cpu_ids: Tuple[int, ...]
+
+	@classmethod
+	def detect(cls, *, max_jobs: Optional[int] = None) -> "HostCapacity":
+		sched_getaffinity = getattr(os, "sched_getaffinity", None)
+		if callable(sched_getaffinity):
+			cpu_ids = tuple(sorted(sched_getaffinity(0)))
+		else:
+			cpu_ids = tuple(range(os.cpu_count() or 1))
+		if max_jobs is not None:
+			cpu_ids = cpu_ids[: max(int(max_jobs), 1) * max(OFFICIAL_BENCHMARK_CPU_COUNT, 1)]
+		try:
+			memory_mib = int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024))
+		except (AttributeError, OSError, ValueError):
+			memory_mib = OFFICIAL_BENCHMARK_MEMORY_LIMIT_MIB * len(cpu_ids)
+		return cls(memory_mib=memory_mib, cpu_ids=cpu_ids or (0,))
+
+
+def assigned_cpu_affinity() -> Tuple[int, ...]:
+	"""Return the CPU ids a scheduler assigned to this process, if any."""
+
+	cpu_ids: List[int] = []
+	for part in os.environ.get(CPU_AFFINITY_ENV, "").split(","):
+		try:
+			cpu_ids.append(int(part))
+		except ValueError:
+			continue
+	return tuple(cpu_ids)
+
+
+def previous_problem_seconds(result_paths: Iterable[Path]) -> Dict[Tuple[str, str], float]:
+	"""Read per-problem wall-clock times from earlier `problem_results.json` files.
+
+	Later files (by modification time) win, so the newest recorded timing of a
+	problem is used.
+	"""
+
+	timed_paths: List[Tuple[float, Path]] = []
+	for path in result_paths:
+		try:
+			timed_paths.append((path.stat().st_mtime, path))
+		except OSError:
+			continue
+	seconds: Dict[Tuple[str, str], float] = {}
+	for _, path in sorted(timed_paths):
+		try:
+			rows = json.loads(path.read_text())
+		except (OSError, ValueError):
+			continue
+		for row in rows if isinstance(rows, list) else ():
+			if not isinstance(row, dict):
+				continue
+			value = row.get("execution_time_seconds")
+			if value is None:
+				value = row.get("planner_wallclock_seconds")
+			try:
+				seconds[(str(row["domain_key"]), str(row["query_id"]))] = float(value)
+			except (KeyError, TypeError, ValueError):
+				continue
+	return seconds
+
+
+def order_longest_expected_first(jobs: Sequence[ScheduledProblemJob]) -> List[ScheduledProblemJob]:
+	"""Sort jobs by expected duration, longest first.
+
+	Jobs without a recorded timing are treated as the longest known job, since an
+	unknown problem is as likely to be slow as fast; on a tie the known job goes
+	first. Remaining ties keep submission order.
+	"""
+
+	known = [job.expected_seconds for job in jobs if job.expected_seconds is not None]
+	unknown_seconds = max(known) if known else 0.0
+	return sorted(
+		jobs,
+		key=lambda job: (
+			-(job.expected_seconds if job.expected_seconds is not None else unknown_seconds),
+			job.expected_seconds is None,
+		),
+	)
+
+
+class ProblemRootScheduler:
+	"""Run sweep jobs concurrently under a host memory and CPU budget.
+
+	`launch(job, cpu_ids)` starts one job and returns a handle with
+	`subprocess.Popen`-style `poll()`. Jobs are admitted in
+	longest-expected-first order whenever enough memory and CPU ids are free; a
+	job larger than the whole host still runs, alone.
+	"""
+
+	def __init__(
+		self,
+		capacity: HostCapacity,
+		*,
+		poll_seconds: float = SCHEDULER_POLL_SECONDS,
+	) -> None:
+		self.capacity = capacity
+		self.poll_seconds = max(float(poll_seconds), 0.0)
+
+	def run(
+		self,
+		jobs: Sequence[ScheduledProblemJob],
+		*,
+		launch: Callable[[ScheduledProblemJob, Tuple[int, ...]], Any],
+		on_finish: Optional[Callable[[Dict[str, Any]], None]] = None,
+	) -> List[Dict[str, Any]]:
+		pending = order_longest_expected_first(jobs)
+		free_cpu_ids = list(self.capacity.cpu_ids)
+		free_memory_mib = int(self.capacity.memory_mib)
+		running: List[Tuple[ScheduledProblemJob, Any, Tuple[int, ...], float]] = []
+		results: List[Dict[str, Any]] = []
+		while pending or running:
+			for job in list(pending):
+				cpu_need = max(int(job.cpu_count), 1)
+				fits = cpu_need <= len(free_cpu_ids) and job.memory_limit_mib <= free_memory_mib
+				if not fits and running:
+					continue
+				cpu_ids = tuple(free_cpu_ids[:cpu_need])
+				del free_cpu_ids[:cpu_need]
+				free_memory_mib -= job.memory_limit_mib
+				pending.remove(job)
+				running.append((job, launch(job, cpu_ids), cpu_ids, time.perf_counter()))
+			for entry in list(running):
+				job, handle, cpu_ids, started = entry
+				returncode = handle.poll()
+				if returncode is None:
+					continue
+				running.remove(entry)
+				free_cpu_ids.extend(cpu_ids)
+				free_cpu_ids.sort()
+				free_memory_mib += job.memory_limit_mib
+				result = {
+					"domain_key": job.domain_key,
+					"query_id": job.query_id,
+					"returncode": int(returncode),
+					"seconds": time.perf_counter() - started,
+					"expected_seconds": job.expected_seconds,
+					"cpu_ids": list(cpu_ids),
+				}
+				results.append(result)
+				if on_finish is not None:
+					on_finish(result)
+			if running:
+				time.sleep(self.poll_seconds)
+		return results
@@ -14,6 +14,7 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Optional, Sequence, Set, Tuple
 
+from domain_model.compiled_domain import compile_domain
 from method_library.synthesis.naming import sanitize_identifier
 from method_library.synthesis.schema import HTNLiteral
 from execution_logging.execution_logger import ExecutionLogger
@@ -38,12 +39,12 @@ class MethodLibrarySynthesisContext:
 		self.domain_file = str(domain_file)
 		self.domain = HDDLParser.parse_domain(self.domain_file)
 		self.output_dir: Optional[Path] = None
+		self.compiled_domain = compile_domain(self.domain)
 		self.type_parent_map = self._build_type_parent_map()
 		self.domain_type_names = set(self.type_parent_map.keys())
 		self.predicate_type_map = self._predicate_type_map()
 		self.action_type_map = self._action_type_map()
 		self.task_type_map = self._task_type_map()
-		self._subtype_check_cache: Dict[Tuple[str, str], bool] = {}
 		self._resolved_symbol_type_cache: Dict[frozenset[str], str] = {}
 		self._dynamic_task_signature_cache: Dict[Tuple[int, str], Tuple[str, ...]] = {}
 		self._method_variable_type_hint_cache: Dict[Tuple[int, int], Dict[str, str]] = {}
@@ -118,64 +119,7 @@ class MethodLibrarySynthesisContext:
 		)
 
 	def _build_type_parent_map(self) -> Dict[str, Optional[str]]:
-		tokens = [
-			token.strip()
-			for token in (getattr(self.domain, "types", []) or [])
-			if token and token.strip()
-		]
-		if not tokens:
-			return {"object": None}
-
-		parent_map: Dict[str, Optional[str]] = {}
-		pending_children: list[str] = []
-		index = 0
-		while index < len(tokens):
-			token = tokens[index]
-			if token == "-":
-				if not pending_children or index + 1 >= len(tokens):
-					raise ValueError("Malformed HDDL :types declaration.")
-				parent_type = tokens[index + 1]
-				for child_type in pending_children:
-					previous = parent_map.get(child_type)
-					if previous is not None and previous != parent_type:
-						raise ValueError(
-							f"Type '{child_type}' has conflicting parents "
-							f"('{previous}' vs '{parent_type}').",
-						)
-					parent_map[child_type] = parent_type
-				pending_children = []
-				index += 2
-				continue
-			pending_children.append(token)
-			index += 1
-
-		for child_type in pending_children:
-			parent_map.setdefault(child_type, "object")
-		parent_map["object"] = None
-
-		changed = True
-		while changed:
-			changed = False
-			for parent_type in list(parent_map.values()):
-				if parent_type is None or parent_type in parent_map:
-					continue
-				parent_map[parent_type] = "object" if parent_type != "object" else None
-				changed = True
-
-		for type_name in list(parent_map.keys()):
-			if type_name == "object":
-				parent_map[type_name] = None
-				continue
-			if parent_map[type_name] == type_name:
-				raise ValueError(f"Type '{type_name}' cannot inherit from itself.")
-			seen = {type_name}
-			cursor = parent_map[type_name]
-			while cursor is not None:
-				if cursor in seen:
-					raise ValueError(f"Cyclic type hierarchy detected at '{type_name}'.")
-				seen.add(cursor)
-				cursor = parent_map.get(cursor)
-		return parent_map
+		return dict(self.compiled_domain.type_parent_map)
 
 	def _predicate_type_map(self) -> Dict[str, Tuple[str, ...]]:
 		return {
@@ -218,27 +162,7 @@ class MethodLibrarySynthesisContext:
 		return mapping
 
 	def _is_subtype(self, candidate_type: str, expected_type: str) -> bool:
-		cache_key = (candidate_type, expected_type)
-		if cache_key in self._subtype_check_cache:
-			return self._subtype_check_cache[cache_key]
-
-		if candidate_type == expected_type:
-			self._subtype_check_cache[cache_key] = True
-			return True
-		if candidate_type not in self.type_parent_map or expected_type not in self.type_parent_map:
-			self._subtype_check_cache[cache_key] = False
-			return False
-
-		cursor = self.type_parent_map.get(candidate_type)
-		visited = {candidate_type}
-		while cursor is not None and cursor not in visited:
-			if cursor == expected_type:
-				self._subtype_check_cache[cache_key] = True
-				return True
-			visited.add(cursor)
-			cursor = self.type_parent_map.get(cursor)
-		self._subtype_check_cache[cache_key] = False
-		return False
+		return self.compiled_domain.is_subtype(candidate_type, expected_type)
 
 	def _resolve_symbol_type(
 		self,
@@ -5,11 +5,11 @@ HTN method-library to AgentSpeak(L) plan-library translation.
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Sequence, Tuple
 
+from domain_model.compiled_domain import compile_domain, parameter_name_type_pairs
 from method_library.synthesis.naming import sanitize_identifier
 from method_library.synthesis.schema import HTNLiteral, HTNMethod, HTNMethodLibrary
-from utils.hddl_condition_parser import HDDLConditionParser
 
 from .models import (
 	AgentSpeakBodyStep,
@@ -39,7 +39,7 @@ def build_plan_library(
 	methods_by_task: Dict[str, List[HTNMethod]] = defaultdict(list)
 	for candidate_method in method_library.methods:
 		methods_by_task[str(candidate_method.task_name).strip()].append(candidate_method)
-	mutable_predicates = _mutable_predicates(action_semantics_map)
+	mutable_predicates = compile_domain(domain).mutable_predicates
 	plans: List[AgentSpeakPlan] = []
 	accepted_methods = 0
 	unsupported_buckets: Dict[str, int] = defaultdict(int)
@@ -133,79 +133,39 @@ def build_plan_library(
 	), coverage
 
 
-def _task_type_map_for_domain(domain: Any) -> Dict[str, Tuple[str, ...]]:
+def _aliased_signature_map(
+	signatures: Mapping[str, Tuple[str, ...]],
+) -> Dict[str, Tuple[str, ...]]:
 	mapping: Dict[str, Tuple[str, ...]] = {}
-	for task in getattr(domain, "tasks", ()) or ():
-		task_name = str(getattr(task, "name", "") or "").strip()
-		if not task_name:
-			continue
-		task_types = tuple(
-			_parameter_type(parameter)
-			for parameter in (getattr(task, "parameters", ()) or ())
-		)
-		mapping[task_name] = task_types
-		mapping.setdefault(sanitize_identifier(task_name), task_types)
+	for name, type_signature in signatures.items():
+		mapping[name] = type_signature
+		mapping.setdefault(sanitize_identifier(name), type_signature)
 	return mapping
 
 
+def _task_type_map_for_domain(domain: Any) -> Dict[str, Tuple[str, ...]]:
+	return _aliased_signature_map(compile_domain(domain).task_types)
+
+
 def _action_type_map_for_domain(domain: Any) -> Dict[str, Tuple[str, ...]]:
-	mapping: Dict[str, Tuple[str, ...]] = {}
-	for action in getattr(domain, "actions", ()) or ():
-		action_name = str(getattr(action, "name", "") or "").strip()
-		if not action_name:
-			continue
-		action_types = tuple(
-			_parameter_type(parameter)
-			for parameter in (getattr(action, "parameters", ()) or ())
-		)
-		mapping[action_name] = action_types
-		mapping.setdefault(sanitize_identifier(action_name), action_types)
-	return mapping
+	return _aliased_signature_map(compile_domain(domain).action_types)
 
 
 def _predicate_type_map_for_domain(domain: Any) -> Dict[str, Tuple[str, ...]]:
-	mapping: Dict[str, Tuple[str, ...]] = {}
-	for predicate in getattr(domain, "predicates", ()) or ():
-		predicate_name = str(getattr(predicate, "name", "") or "").strip()
-		if not predicate_name:
-			continue
-		predicate_types = tuple(
-			_parameter_type(parameter)
-			for parameter in (getattr(predicate, "parameters", ()) or ())
-		)
-		mapping[predicate_name] = predicate_types
-		mapping.setdefault(sanitize_identifier(predicate_name), predicate_types)
-	return mapping
+	return _aliased_signature_map(compile_domain(domain).predicate_types)
 
 
-def _domain_method_parameter_type_map(domain: Any) -> Dict[str, Dict[str, str]]:
-	mapping: Dict[str, Dict[str, str]] = {}
-	for method in getattr(domain, "methods", ()) or ():
-		method_name = str(getattr(method, "name", "") or "").strip()
-		if not method_name:
-			continue
-		typed_parameters: Dict[str, str] = {}
-		for parameter in getattr(method, "parameters", ()) or ():
-			for variable_name, type_name in _parameter_name_type_pairs(parameter):
-				typed_parameters[variable_name] = type_name
+def _domain_method_parameter_type_map(domain: Any) -> Dict[str, Mapping[str, str]]:
+	mapping: Dict[str, Mapping[str, str]] = {}
+	for method_name, typed_parameters in compile_domain(domain).method_parameter_types.items():
 		mapping[method_name] = typed_parameters
 		mapping.setdefault(sanitize_identifier(method_name), typed_parameters)
 	return mapping
 
 
 def _action_semantics_map_for_domain(domain: Any) -> Dict[str, Dict[str, Any]]:
-	parser = HDDLConditionParser()
 	mapping: Dict[str, Dict[str, Any]] = {}
-	for action in getattr(domain, "actions", ()) or ():
-		action_name = str(getattr(action, "name", "") or "").strip()
-		if not action_name:
-			continue
-		if not hasattr(action, "preconditions") or not hasattr(action, "effects"):
-			continue
-		try:
-			parsed = parser.parse_action(action)
-		except Exception:
-			continue
+	for action_name, parsed in compile_domain(domain).parsed_actions.items():
 		entry = {
 			"preconditions": parsed.preconditions,
 			"effects": parsed.effects,
@@ -216,45 +176,6 @@ def _action_semantics_map_for_domain(domain: Any) -> Dict[str, Dict[str, Any]]:
 	return mapping
 
 
-def _mutable_predicates(action_semantics_map: Dict[str, Dict[str, Any]]) -> set[str]:
-	predicates: set[str] = set()
-	for action_entry in action_semantics_map.values():
-		for effect in tuple(action_entry.get("effects") or ()):
-			predicate = str(getattr(effect, "predicate", "") or "").strip()
-			if predicate and predicate != "=":
-				predicates.add(predicate)
-	return predicates
-
-
-def _parameter_type(parameter: str) -> str:
-	text = str(parameter or "").strip()
-	if ":" in text:
-		return text.split(":", 1)[1].strip() or "object"
-	if "-" in text:
-		return text.split("-", 1)[1].strip() or "object"
-	return "object"
-
-
-def _parameter_name_type_pairs(parameter: Any) -> Tuple[Tuple[str, str], ...]:
-	text = str(parameter or "").strip()
-	if not text:
-		return ()
-	if " - " in text:
-		raw_names, raw_type = text.split(" - ", 1)
-		type_name = raw_type.strip() or "object"
-		return tuple(
-			(_symbol_token(name), type_name)
-			for name in raw_names.split()
-			if _symbol_token(name)
-		)
-	if ":" in text:
-		raw_name, raw_type = text.split(":", 1)
-		name = _symbol_token(raw_name)
-		return ((name, raw_type.strip() or "object"),) if name else ()
-	name = _symbol_token(text)
-	return ((name, "object"),) if name else ()
-
-
 def _typed_trigger_arguments(
 	*,
 	method: HTNMethod,
@@ -318,7 +239,7 @@ def _method_variable_type_map(
 	method: HTNMethod,
 	task_schema: Any | None,
 	task_parameter_types: Sequence[str],
-	domain_method_type_map: Dict[str, Dict[str, str]],
+	domain_method_type_map: Dict[str, Mapping[str, str]],
 	task_type_map: Dict[str, Tuple[str, ...]],
 	action_type_map: Dict[str, Tuple[str, ...]],
 	predicate_type_map: Dict[str, Tuple[str, ...]],
@@ -338,7 +259,7 @@ def _method_variable_type_map(
 			variable_types[token] = normalised_type
 
 	for raw_parameter in tuple(getattr(method, "parameters", ()) or ()):
-		for variable_name, type_name in _parameter_name_type_pairs(raw_parameter):
+		for variable_name, type_name in parameter_name_type_pairs(raw_parameter):
 			remember(variable_name, type_name)
 
 	for method_key in (
@@ -448,7 +369,7 @@ def _translated_context_literals(
 	variable_map: Dict[str, str],
 	method_variable_types: Dict[str, str],
 	methods_by_task: Dict[str, List[HTNMethod]],
-	mutable_predicates: set[str],
+	mutable_predicates: FrozenSet[str],
 	action_semantics_map: Dict[str, Dict[str, Any]],
 ) -> Tuple[Tuple[str, ...], Tuple[Dict[str, Any], ...]]:
 	trigger_variables = {
@@ -846,7 +767,7 @@ def _local_witness_binding_literals(
 	initial_bound_variables: set[str],
 	variable_types: Dict[str, str],
 	methods_by_task: Dict[str, List[HTNMethod]],
-	mutable_predicates: set[str],
+	mutable_predicates: FrozenSet[str],
 	action_semantics_map: Dict[str, Dict[str, Any]],
 ) -> Tuple[Any, ...]:
 	binding_literals: List[Any] = []
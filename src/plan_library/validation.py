@@ -8,9 +8,9 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Sequence, Tuple
 
+from domain_model.compiled_domain import compile_domain
 from method_library.synthesis.naming import sanitize_identifier
 from method_library.synthesis.schema import HTNMethodLibrary
-from utils.hddl_condition_parser import HDDLConditionParser
 
 from .models import LibraryValidationRecord, PlanLibrary, TranslationCoverage
 
@@ -453,18 +453,8 @@ def _symbol_signature_map(
 
 
 def _action_semantics_map_for_validation(domain: Any) -> Dict[str, Dict[str, Any]]:
-	parser = HDDLConditionParser()
 	mapping: Dict[str, Dict[str, Any]] = {}
-	for action in getattr(domain, "actions", ()) or ():
-		action_name = str(getattr(action, "name", "") or "").strip()
-		if not action_name:
-			continue
-		if not hasattr(action, "preconditions") or not hasattr(action, "effects"):
-			continue
-		try:
-			parsed = parser.parse_action(action)
-		except Exception:
-			continue
+	for action_name, parsed in compile_domain(domain).parsed_actions.items():
 		entry = {
 			"parameters": parsed.parameters,
 			"preconditions": parsed.preconditions,
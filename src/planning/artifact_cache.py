@@ -0,0 +1,254 @@
+"""
+Content-addressed cache of PANDA toolchain intermediates.
+
+The parsed `.psas` model, the grounded model and the Lifted Linear
+linearization depend only on their input HDDL text and on the tool binaries
+that produced them. Each stage's output files and logs are stored under the
+SHA-256 of those inputs, so later solver configurations and repeated runs start
+from the cached model instead of rerunning pandaPIparser, pandaPIgrounder or the
+linearizer.
+
+The cache is opt-in (`PANDA_ARTIFACT_CACHE_DIR`) and capped by total size. The
+least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from planning.process_capture import read_process_output_preview, sanitize_process_output_label
+
+
+PANDA_ARTIFACT_CACHE_VERSION = 1
+DEFAULT_PANDA_ARTIFACT_CACHE_ROOT = Path(__file__).resolve().parent / ".panda_artifact_cache"
+DEFAULT_PANDA_ARTIFACT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def tool_fingerprint(binary: Optional[str | Path]) -> str:
+	"""Fingerprint a tool executable by name, size and modification time."""
+
+	if not binary:
+		return "missing"
+	path = Path(binary)
+	try:
+		stat = path.stat()
+	except OSError:
+		return f"{path.name}:missing"
+	return f"{path.name}:{stat.st_size}:{int(stat.st_mtime_ns)}"
+
+
+def artifact_cache_key(
+	stage: str,
+	*,
+	inputs: Sequence[str | bytes],
+	tools: Sequence[str],
+) -> str:
+	"""Return the SHA-256 key of one toolchain stage run."""
+
+	digest = hashlib.sha256()
+	parts = [
+		str(PANDA_ARTIFACT_CACHE_VERSION).encode("ascii"),
+		str(stage).encode("utf-8"),
+		*(part if isinstance(part, bytes) else str(part).encode("utf-8") for part in inputs),
+		*(str(tool).encode("utf-8") for tool in tools),
+	]
+	for part in parts:
+		digest.update(str(len(part)).encode("ascii"))
+		digest.update(b":")
+		digest.update(part)
+	return digest.hexdigest()
+
+
+class PANDAArtifactCache:
+	"""Directory of cached stage outputs, one sub-directory per content key.
+
+	Entries are assembled in a staging directory and published with an atomic
+	rename, so concurrent planners sharing one root never restore a partial entry.
+	A hit refreshes the entry's manifest time. After each store the least recently
+	used entries are removed until the directory fits in `max_bytes`.
+	"""
+
+	def __init__(self, root: str | Path, *, max_bytes: Optional[int] = None) -> None:
+		self.root = Path(root).resolve()
+		self.max_bytes = max(
+			1,
+			int(max_bytes if max_bytes is not None else configured_panda_artifact_cache_max_bytes()),
+		)
+		self._lock = threading.Lock()
+		self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+	def entry_dir(self, key: str) -> Path:
+		return self.root / key[:2] / key
+
+	def restore(self, key: str, targets: Dict[str, Path]) -> bool:
+		"""Copy the cached files named by `targets` to their paths; False on a miss."""
+
+		entry = self.entry_dir(key)
+		try:
+			manifest = json.loads((entry / "manifest.json").read_text())
+		except (OSError, ValueError):
+			manifest = None
+		restored = (
+			isinstance(manifest, dict)
+			and manifest.get("cache_version") == PANDA_ARTIFACT_CACHE_VERSION
+			and set(targets) <= set(manifest.get("files") or ())
+		)
+		if restored:
+			try:
+				for name, target in targets.items():
+					target.parent.mkdir(parents=True, exist_ok=True)
+					shutil.copyfile(entry / name, target)
+				os.utime(entry / "manifest.json")
+			except OSError:
+				restored = False
+		with self._lock:
+			self.stats["hits" if restored else "misses"] += 1
+		return restored
+
+	def store(self, key: str, sources: Dict[str, Path]) -> None:
+		if not all(path.is_file() for path in sources.values()):
+			return
+		entry = self.entry_dir(key)
+		if entry.exists():
+			return
+		staging: Optional[str] = None
+		try:
+			entry.parent.mkdir(parents=True, exist_ok=True)
+			staging = tempfile.mkdtemp(prefix=f".{key[:16]}-", dir=entry.parent)
+			for name, source in sources.items():
+				shutil.copyfile(source, Path(staging) / name)
+			(Path(staging) / "manifest.json").write_text(
+				json.dumps(
+					{
+						"cache_version": PANDA_ARTIFACT_CACHE_VERSION,
+						"files": sorted(sources),
+					},
+				),
+			)
+			os.rename(staging, entry)
+			staging = None
+		except OSError:
+			# A read-only or full cache directory, or a concurrent writer that
+			# published the same entry first, only costs the reuse.
+			pass
+		finally:
+			if staging is not None:
+				shutil.rmtree(staging, ignore_errors=True)
+		self._evict()
+
+	def _evict(self) -> None:
+		entries = []
+		total_bytes = 0
+		for manifest in self.root.glob("*/*/manifest.json"):
+			entry = manifest.parent
+			try:
+				last_used = manifest.stat().st_mtime_ns
+				size = sum(path.stat().st_size for path in entry.iterdir())
+			except OSError:
+				continue
+			entries.append((last_used, size, entry))
+			total_bytes += size
+		if total_bytes <= self.max_bytes:
+			return
+		evicted = 0
+		for _, size, entry in sorted(entries):
+			if total_bytes <= self.max_bytes:
+				break
+			shutil.rmtree(entry, ignore_errors=True)
+			if entry.exists():
+				continue
+			total_bytes -= size
+			evicted += 1
+		with self._lock:
+			self.stats["evictions"] += evicted
+
+
+def configured_panda_artifact_cache_max_bytes() -> int:
+	"""Return the cache size cap from `PANDA_ARTIFACT_CACHE_MAX_BYTES`."""
+
+	raw_value = os.getenv("PANDA_ARTIFACT_CACHE_MAX_BYTES", "").strip()
+	if not raw_value:
+		return DEFAULT_PANDA_ARTIFACT_CACHE_MAX_BYTES
+	try:
+		return max(1, int(raw_value))
+	except ValueError:
+		return DEFAULT_PANDA_ARTIFACT_CACHE_MAX_BYTES
+
+
+def configured_panda_artifact_cache() -> Optional[PANDAArtifactCache]:
+	"""Return the cache selected by `PANDA_ARTIFACT_CACHE_DIR`, or None when disabled.
+
+	The cache is off unless the variable is set. `on` selects the default
+	directory next to this module; `off`, `0`, `false` or `no` keep it disabled.
+	"""
+
+	raw_value = os.getenv("PANDA_ARTIFACT_CACHE_DIR", "").strip()
+	if not raw_value or raw_value.lower() in {"off", "0", "false", "no"}:
+		return None
+	if raw_value.lower() in {"on", "1", "true", "yes"}:
+		return PANDAArtifactCache(DEFAULT_PANDA_ARTIFACT_CACHE_ROOT)
+	return PANDAArtifactCache(Path(raw_value).expanduser())
+
+
+def run_cached_stage(
+	cache: Optional[PANDAArtifactCache],
+	*,
+	key: Optional[str],
+	work_dir: Path,
+	output_label: str,
+	outputs: Sequence[Path],
+	run: Callable[[], Dict[str, Any]],
+) -> Tuple[Dict[str, Any], str]:
+	"""Restore a stage's outputs and logs from `cache`, or run it and store them.
+
+	Returns the subprocess result (as produced by `run_subprocess_to_files`) and
+	the cache status `"hit"`, `"miss"` or `"disabled"`. Only runs that exit with
+	status 0 and leave every output file behind are stored.
+	"""
+
+	label = sanitize_process_output_label(output_label)
+	stdout_path = work_dir / f"{label}.stdout.log"
+	stderr_path = work_dir / f"{label}.stderr.log"
+	files = {
+		**{path.name: path for path in outputs},
+		stdout_path.name: stdout_path,
+		stderr_path.name: stderr_path,
+	}
+	if cache is None or key is None:
+		return run(), "disabled"
+	if cache.restore(key, files):
+		stdout_preview = read_process_output_preview(stdout_path)
+		stderr_preview = read_process_output_preview(stderr_path)
+		return {
+			"returncode": 0,
+			"timed_out": False,
+			"stdout": stdout_preview["text"],
+			"stderr": stderr_preview["text"],
+			"stdout_path": stdout_preview["path"],
+			"stderr_path": stderr_preview["path"],
+			"stdout_truncated": bool(stdout_preview["truncated"]),
+			"stderr_truncated": bool(stderr_preview["truncated"]),
+			"stdout_byte_size": int(stdout_preview["byte_size"]),
+			"stderr_byte_size": int(stderr_preview["byte_size"]),
+		}, "hit"
+	result = run()
+	if int(result.get("returncode") or 0) == 0 and not result.get("timed_out"):
+		cache.store(key, files)
+	return result, "miss"
+
+
+def record_artifact_cache_status(timing_profile: Dict[str, Any], stage: str, status: str) -> None:
+	"""Add one stage's cache status to a planner `timing_profile`."""
+
+	stages = dict(timing_profile.get("artifact_cache_stages") or {})
+	stages[stage] = status
+	timing_profile["artifact_cache_stages"] = stages
+	timing_profile["artifact_cache_hits"] = sum(1 for value in stages.values() if value == "hit")
+	timing_profile["artifact_cache_misses"] = sum(1 for value in stages.values() if value == "miss")
@@ -23,6 +23,12 @@ from planning.official_benchmark import (
 	OFFICIAL_LIFTED_LINEAR_INNER_SOLVER_ID,
 	OFFICIAL_LIFTED_LINEAR_SOLVER_ID,
 )
+from planning.artifact_cache import (
+	artifact_cache_key,
+	record_artifact_cache_status,
+	run_cached_stage,
+	tool_fingerprint,
+)
 from planning.panda_sat import PANDAPlanner, PANDAPlanningError
 from planning.plan_models import PANDAPlanResult
 from planning.process_capture import run_subprocess_to_files
@@ -151,17 +157,35 @@ class LiftedLinearPlanner:
 		linearized_problem_path = work_dir / "problem.linearized.hddl"
 
 		linearizer_start = time.perf_counter()
-		linearizer_result = self._run_subprocess(
-			[
-				str(linearizer),
-				str(Path(domain_file).resolve()),
-				str(Path(problem_file).resolve()),
-				str(linearized_domain_path),
-				str(linearized_problem_path),
-			],
-			work_dir,
-			timeout_seconds=timeout_seconds,
+		artifact_cache = self.panda_planner.artifact_cache
+		linearizer_key: Optional[str] = None
+		if artifact_cache is not None:
+			linearizer_key = artifact_cache_key(
+				"linearizer",
+				inputs=(
+					Path(domain_file).read_bytes(),
+					Path(problem_file).read_bytes(),
+				),
+				tools=(tool_fingerprint(linearizer),),
+			)
+		linearizer_result, linearizer_cache_status = run_cached_stage(
+			artifact_cache,
+			key=linearizer_key,
+			work_dir=work_dir,
 			output_label="linearizer",
+			outputs=(linearized_domain_path, linearized_problem_path),
+			run=lambda: self._run_subprocess(
+				[
+					str(linearizer),
+					str(Path(domain_file).resolve()),
+					str(Path(problem_file).resolve()),
+					str(linearized_domain_path),
+					str(linearized_problem_path),
+				],
+				work_dir,
+				timeout_seconds=timeout_seconds,
+				output_label="linearizer",
+			),
 		)
 		if linearizer_result["returncode"] != 0:
 			raise PANDAPlanningError(
@@ -191,6 +215,7 @@ class LiftedLinearPlanner:
 			"linearized_domain_file": str(linearized_domain_path),
 			"linearized_problem_file": str(linearized_problem_path),
 			"linearizer_seconds": time.perf_counter() - linearizer_start,
+			"linearizer_artifact_cache": linearizer_cache_status,
 			"linearizer_stdout": linearizer_result["stdout"],
 			"linearizer_stderr": linearizer_result["stderr"],
 			"linearizer_stdout_path": linearizer_result["stdout_path"],
@@ -221,6 +246,7 @@ class LiftedLinearPlanner:
 			grounder_cmd=self._preferred_grounder_command(self.panda_planner.grounder_cmd),
 			engine_cmd=self._preferred_engine_command(self.panda_planner.engine_cmd),
 			problem_builder=self.panda_planner.problem_builder,
+			artifact_cache=self.panda_planner.artifact_cache,
 		)
 		inner_result = inner_planner.plan_hddl_files(
 			domain=domain,
@@ -280,8 +306,12 @@ class LiftedLinearPlanner:
 			for candidate in decoded_candidates
 		]
 		inner_result.work_dir = str(work_dir)
+		timing_profile = dict(inner_result.timing_profile or {})
+		linearizer_cache_status = (linearization_metadata or {}).get("linearizer_artifact_cache")
+		if linearizer_cache_status:
+			record_artifact_cache_status(timing_profile, "linearizer", str(linearizer_cache_status))
 		inner_result.timing_profile = {
-			**dict(inner_result.timing_profile or {}),
+			**timing_profile,
 			"linearizer_seconds": float((linearization_metadata or {}).get("linearizer_seconds") or 0.0),
 			"linearizer_stdout": (linearization_metadata or {}).get("linearizer_stdout", ""),
 			"linearizer_stderr": (linearization_metadata or {}).get("linearizer_stderr", ""),
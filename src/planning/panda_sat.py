@@ -17,11 +17,20 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from domain_model.compiled_domain import compile_domain
 from method_library.synthesis.schema import (
 	HTNLiteral,
 	HTNMethod,
 	HTNMethodLibrary,
 )
+from planning.artifact_cache import (
+	PANDAArtifactCache,
+	artifact_cache_key,
+	configured_panda_artifact_cache,
+	record_artifact_cache_status,
+	run_cached_stage,
+	tool_fingerprint,
+)
 from planning.process_capture import read_full_process_output, run_subprocess_to_files
 from planning.problem_encoding import PANDAProblemBuilder
 from planning.plan_models import PANDAPlanResult, PANDAPlanStep
@@ -60,12 +69,18 @@ class PANDAPlanner:
 		grounder_cmd: str = "pandaPIgrounder",
 		engine_cmd: str = "pandaPIengine",
 		problem_builder: Optional[PANDAProblemBuilder] = None,
+		artifact_cache: Optional[PANDAArtifactCache] = None,
 	) -> None:
 		self.workspace = Path(workspace).resolve() if workspace else None
 		self.parser_cmd = parser_cmd
 		self.grounder_cmd = grounder_cmd
 		self.engine_cmd = engine_cmd
 		self.problem_builder = problem_builder or PANDAProblemBuilder()
+		self.artifact_cache = (
+			artifact_cache
+			if artifact_cache is not None
+			else configured_panda_artifact_cache()
+		)
 
 	def toolchain_available(self) -> bool:
 		return all(
@@ -222,24 +237,61 @@ class PANDAPlanner:
 		problem_path.write_text(problem_hddl)
 		timing_profile["write_input_files_seconds"] = time.perf_counter() - write_files_start
 
+		parser_key: Optional[str] = None
+		grounder_key: Optional[str] = None
+		if self.artifact_cache is not None:
+			parser_tools = (
+				self.parser_cmd,
+				tool_fingerprint(self._resolve_command_head(self.parser_cmd)),
+			)
+			parser_key = artifact_cache_key(
+				"parser",
+				inputs=(domain_hddl, problem_hddl),
+				tools=parser_tools,
+			)
+			grounder_key = artifact_cache_key(
+				"grounder",
+				inputs=(domain_hddl, problem_hddl),
+				tools=(
+					*parser_tools,
+					self.grounder_cmd,
+					tool_fingerprint(self._resolve_command_head(self.grounder_cmd)),
+				),
+			)
 		parser_start = time.perf_counter()
-		parser_run = self._run_command(
-			self._build_command(self.parser_cmd, str(domain_path), str(problem_path), str(parsed_path)),
-			"parser",
-			work_dir,
-			timeout_seconds=timeout_seconds,
+		parser_run, parser_cache_status = run_cached_stage(
+			self.artifact_cache,
+			key=parser_key,
+			work_dir=work_dir,
 			output_label="parser",
+			outputs=(parsed_path,),
+			run=lambda: self._run_command(
+				self._build_command(self.parser_cmd, str(domain_path), str(problem_path), str(parsed_path)),
+				"parser",
+				work_dir,
+				timeout_seconds=timeout_seconds,
+				output_label="parser",
+			),
 		)
 		timing_profile["parser_seconds"] = time.perf_counter() - parser_start
 		grounder_start = time.perf_counter()
-		grounder_run = self._run_command(
-			self._build_command(self.grounder_cmd, str(parsed_path), str(grounded_path)),
-			"grounder",
-			work_dir,
-			timeout_seconds=timeout_seconds,
+		grounder_run, grounder_cache_status = run_cached_stage(
+			self.artifact_cache,
+			key=grounder_key,
+			work_dir=work_dir,
 			output_label="grounder",
+			outputs=(grounded_path,),
+			run=lambda: self._run_command(
+				self._build_command(self.grounder_cmd, str(parsed_path), str(grounded_path)),
+				"grounder",
+				work_dir,
+				timeout_seconds=timeout_seconds,
+				output_label="grounder",
+			),
 		)
 		timing_profile["grounder_seconds"] = time.perf_counter() - grounder_start
+		record_artifact_cache_status(timing_profile, "parser", parser_cache_status)
+		record_artifact_cache_status(timing_profile, "grounder", grounder_cache_status)
 		engine_start = time.perf_counter()
 		engine_attempts: List[Dict[str, Any]] = []
 		conversion_total_seconds = 0.0
@@ -1336,33 +1388,17 @@ class PANDAPlanner:
 		return candidates
 
 	def _predicate_type_map(self, domain: Any) -> Dict[str, Tuple[str, ...]]:
-		mapping: Dict[str, Tuple[str, ...]] = {}
-		for predicate in getattr(domain, "predicates", []) or ():
-			mapping[predicate.name] = tuple(
-				self._parameter_type(parameter)
-				for parameter in getattr(predicate, "parameters", ()) or ()
-			)
-		return mapping
+		return dict(compile_domain(domain).predicate_types)
 
 	def _action_type_map(self, domain: Any) -> Dict[str, Tuple[str, ...]]:
 		mapping: Dict[str, Tuple[str, ...]] = {}
-		for action in getattr(domain, "actions", []) or ():
-			type_signature = tuple(
-				self._parameter_type(parameter)
-				for parameter in getattr(action, "parameters", ()) or ()
-			)
-			mapping[action.name] = type_signature
-			mapping[self._sanitize_name(action.name)] = type_signature
+		for action_name, type_signature in compile_domain(domain).action_types.items():
+			mapping[action_name] = type_signature
+			mapping[self._sanitize_name(action_name)] = type_signature
 		return mapping
 
 	def _declared_task_type_map(self, domain: Any) -> Dict[str, Tuple[str, ...]]:
-		mapping: Dict[str, Tuple[str, ...]] = {}
-		for task in getattr(domain, "tasks", []) or ():
-			mapping[str(task.name)] = tuple(
-				self._parameter_type(parameter)
-				for parameter in getattr(task, "parameters", ()) or ()
-			)
-		return mapping
+		return dict(compile_domain(domain).task_types)
 
 	@staticmethod
 	def _task_binding_parameters(
@@ -1377,15 +1413,6 @@ class PANDAPlanner:
 			return leading_parameters
 		return task_binding_parameters
 
-	@staticmethod
-	def _parameter_type(parameter: Any) -> str:
-		text = str(parameter or "").strip()
-		if "-" not in text:
-			return "object"
-		_, type_name = text.split("-", 1)
-		resolved = type_name.strip()
-		return resolved or "object"
-
 	@staticmethod
 	def _canonical_symbol(token: str) -> str:
 		return str(token or "").strip().lstrip("?")
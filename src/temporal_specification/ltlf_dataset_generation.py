@@ -19,7 +19,7 @@ from temporal_specification.models import TemporalSpecificationRecord
 from temporal_specification.validation import validate_temporal_specification_record
 from utils.benchmark_query_dataset import DEFAULT_BENCHMARK_QUERY_DATASET_PATH
 from utils.config import Config, get_config
-from utils.hddl_parser import HDDLParser
+from utils.hddl_parse_cache import load_parsed_domain, load_parsed_problem
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -228,7 +228,7 @@ def _generate_domain_cases(
 	config: Config,
 	generator_factory: GeneratorFactory,
 ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
-	domain = HDDLParser.parse_domain(str(domain_file))
+	domain = load_parsed_domain(domain_file)
 	type_parent_map = build_type_parent_map_for_domain(domain)
 	domain_type_names = set(type_parent_map.keys())
 	task_type_map = task_type_map_for_domain(domain, domain_type_names)
@@ -267,7 +267,7 @@ def _generate_domain_cases(
 			status = "reused"
 		else:
 			problem_path = _resolve_problem_file(domain_file=domain_file, problem_file=problem_file)
-			problem = HDDLParser.parse_problem(str(problem_path))
+			problem = load_parsed_problem(problem_path)
 			grounding_result, _llm_prompt, _llm_response = generator.generate(
 				instruction,
 				method_library=None,
@@ -0,0 +1,392 @@
+"""
+Compiled ground-action simulator over interned atoms.
+
+Ground atoms are interned to integer ids by a `utils.symbol_table.SymbolTable`,
+the same table the textual atom parsers use. A world state is a Python int used
+as a bitset over those ids. Each ground action instance is compiled once into
+masks:
+- one (positive, negative) precondition mask pair per precondition clause;
+- one add mask and one delete mask.
+
+A replay step is then a few integer operations instead of re-rendering and
+hashing atom strings. Goal checks are mask tests, so a whole trajectory can be
+checked against a goal in one pass.
+
+Grounding never renders text: schema literals become `GroundAtom`s directly.
+The `syntax` a simulator is built with only decides how atom strings are read
+and rendered at its edges: runtime atoms such as `on(a,b)` for the Jason
+runtime, or `(on a b)` facts for the plan verifier.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .symbol_table import GroundAtom, SymbolTable
+
+
+GROUND_SIMULATOR_ATOM_LIMIT = 1 << 16
+GROUND_SIMULATOR_SYNTAXES = ("agentspeak", "hddl")
+
+GroundStep = Tuple[str, Tuple[str, ...]]
+# One argument of a schema literal: (parameter index, None) or (None, constant).
+_TermTemplate = Tuple[Optional[int], Optional[str]]
+# A schema literal: (predicate, terms, is_positive); predicate None marks `(= a b)`.
+_LiteralTemplate = Tuple[Optional[str], Tuple[_TermTemplate, ...], bool]
+
+
+def render_hddl_atom(functor: str, args: Sequence[str]) -> str:
+	"""Render `(functor arg1 arg2)`."""
+
+	return f"({' '.join((functor, *args))})"
+
+
+def _any_clause_holds(masks: Sequence[Tuple[int, int]], state: int) -> bool:
+	for positive, negative in masks:
+		if state & positive == positive and not state & negative:
+			return True
+	return False
+
+
+@dataclass(frozen=True)
+class GroundAction:
+	"""One action instance compiled to bit masks over a `SymbolTable`."""
+
+	name: str
+	args: Tuple[str, ...]
+	precondition_masks: Tuple[Tuple[int, int], ...]
+	add_mask: int
+	delete_mask: int
+	# Factored preconditions: every factor needs one satisfied (positive, negative) pair.
+	precondition_factor_masks: Tuple[Tuple[Tuple[int, int], ...], ...] = ()
+
+	def applicable(self, state: int) -> bool:
+		if not _any_clause_holds(self.precondition_masks, state):
+			return False
+		return all(
+			_any_clause_holds(masks, state)
+			for masks in self.precondition_factor_masks
+		)
+
+	def apply(self, state: int) -> int:
+		# Deletes first, then adds: a fact both deleted and added stays true.
+		return (state & ~self.delete_mask) | self.add_mask
+
+
+@dataclass(frozen=True)
+class GroundReplay:
+	"""Outcome of replaying one action path.
+
+	`checked_steps` counts the steps applied before `failure` stopped the replay.
+	`failure` is None, `"unknown_action"`, `"arity_mismatch"` or
+	`"precondition_violation"`. `trace` holds the state after every applied step
+	when the replay was asked to record it.
+	"""
+
+	state: int
+	checked_steps: int
+	failure: Optional[str] = None
+	trace: Tuple[int, ...] = ()
+
+	@property
+	def passed(self) -> bool:
+		return self.failure is None
+
+
+class _ActionTemplate:
+	__slots__ = ("name", "arity", "precondition_clauses", "precondition_factors", "effects")
+
+	def __init__(
+		self,
+		name: str,
+		arity: int,
+		precondition_clauses: Tuple[Tuple[_LiteralTemplate, ...], ...],
+		effects: Tuple[_LiteralTemplate, ...],
+		precondition_factors: Tuple[Tuple[Tuple[_LiteralTemplate, ...], ...], ...] = (),
+	) -> None:
+		self.name = name
+		self.arity = arity
+		self.precondition_clauses = precondition_clauses
+		self.precondition_factors = precondition_factors
+		self.effects = effects
+
+
+class GroundActionSimulator:
+	"""Replay ground action paths against action schemas with bitset states.
+
+	`action_schemas` use the runtime schema dictionaries (`functor`,
+	`source_name`, `parameters`, `preconditions` or `precondition_clauses`,
+	optional `precondition_factors`, `effects`). Actions are looked up by
+	functor and by source name. Ground actions are compiled on first use and
+	kept for the simulator's lifetime.
+
+	`syntax` ("agentspeak" or "hddl") is the form atom strings are read and
+	rendered in; `token` canonicalises action arguments and schema constants.
+	When the table numbers more than `atom_limit` atoms, the next
+	`initial_state` call starts a fresh table, so states from earlier replays
+	must not be mixed with later ones.
+	"""
+
+	def __init__(
+		self,
+		action_schemas: Sequence[Dict[str, Any]],
+		*,
+		syntax: str = "agentspeak",
+		token: Callable[[str], str] = str.strip,
+		atom_limit: int = GROUND_SIMULATOR_ATOM_LIMIT,
+	) -> None:
+		if syntax not in GROUND_SIMULATOR_SYNTAXES:
+			raise ValueError(
+				f"Unsupported ground simulator syntax '{syntax}'. "
+				f"Expected one of: {', '.join(GROUND_SIMULATOR_SYNTAXES)}.",
+			)
+		self.table = SymbolTable()
+		self.syntax = syntax
+		self.atom_limit = max(1, int(atom_limit))
+		self._token = token
+		self._predicates: Dict[str, None] = {}
+		self._templates: Dict[str, _ActionTemplate] = {}
+		self._ground_actions: Dict[GroundStep, GroundAction] = {}
+		for schema in action_schemas:
+			template = self._compile_template(schema)
+			for key in (
+				str(schema.get("functor", "")).strip(),
+				str(schema.get("source_name", "")).strip(),
+			):
+				if key:
+					self._templates.setdefault(key, template)
+		self._intern_predicates()
+
+	def arity(self, action_name: str) -> Optional[int]:
+		template = self._templates.get(action_name)
+		return None if template is None else template.arity
+
+	def encode(self, atom: Union[str, GroundAtom]) -> Optional[GroundAtom]:
+		"""Encode an atom string in the simulator's syntax; atoms pass through."""
+
+		if isinstance(atom, GroundAtom):
+			return atom
+		if self.syntax == "hddl":
+			return self.table.encode_hddl(atom)
+		return self.table.encode_agentspeak(atom)
+
+	def render(self, atom: GroundAtom) -> str:
+		if self.syntax == "hddl":
+			return self.table.decode_hddl(atom)
+		return self.table.decode_agentspeak(atom)
+
+	def state_atoms(self, state: int) -> Tuple[str, ...]:
+		"""Render the atoms set in `state`, in interning order."""
+
+		return tuple(self.render(atom) for atom in self.table.atoms(state))
+
+	def initial_state(self, atoms: Iterable[Union[str, GroundAtom]]) -> int:
+		"""Return the state holding `atoms`; strings that are not atoms are skipped."""
+
+		if self.table.atom_count > self.atom_limit:
+			self.clear()
+		return self._mask(atoms)
+
+	def clear(self) -> None:
+		self.table.clear()
+		self._ground_actions.clear()
+		self._intern_predicates()
+
+	def _intern_predicates(self) -> None:
+		# Interned up front so runtime spellings such as `at_robby` map back to `at-robby`.
+		for predicate in self._predicates:
+			self.table.intern_predicate(predicate)
+
+	def _mask(self, atoms: Iterable[Union[str, GroundAtom]]) -> int:
+		encode = self.encode
+		return self.table.mask(
+			encoded
+			for encoded in (encode(atom) for atom in atoms)
+			if encoded is not None
+		)
+
+	def ground(self, action_name: str, args: Sequence[str]) -> GroundAction:
+		"""Return the compiled instance of `action_name(args)`.
+
+		Raises KeyError for an unknown action and ValueError on an arity mismatch.
+		"""
+
+		key = (action_name, tuple(args))
+		action = self._ground_actions.get(key)
+		if action is not None:
+			return action
+		template = self._templates.get(action_name)
+		if template is None:
+			raise KeyError(action_name)
+		if template.arity != len(key[1]):
+			raise ValueError(
+				f"action '{action_name}' expects {template.arity} arguments, got {len(key[1])}",
+			)
+		action = self._compile_ground_action(template, key[1])
+		self._ground_actions[key] = action
+		return action
+
+	def replay(
+		self,
+		steps: Iterable[GroundStep],
+		state: int,
+		*,
+		check_preconditions: bool = True,
+		skip_unknown: bool = False,
+		record_trace: bool = False,
+	) -> GroundReplay:
+		"""Apply `steps` to `state`, stopping at the first failing step.
+
+		With `skip_unknown`, unknown actions are passed over instead of failing;
+		arity mismatches still fail.
+		"""
+
+		trace: List[int] = []
+		checked_steps = 0
+		for action_name, args in steps:
+			try:
+				action = self.ground(action_name, args)
+			except KeyError:
+				if skip_unknown:
+					checked_steps += 1
+					if record_trace:
+						trace.append(state)
+					continue
+				return GroundReplay(state, checked_steps, "unknown_action", tuple(trace))
+			except ValueError:
+				return GroundReplay(state, checked_steps, "arity_mismatch", tuple(trace))
+			if check_preconditions and not action.applicable(state):
+				return GroundReplay(state, checked_steps, "precondition_violation", tuple(trace))
+			state = action.apply(state)
+			checked_steps += 1
+			if record_trace:
+				trace.append(state)
+		return GroundReplay(state, checked_steps, None, tuple(trace))
+
+	def goal_mask(self, atoms: Iterable[Union[str, GroundAtom]]) -> int:
+		return self._mask(atoms)
+
+	def missing_goal_atoms(self, state: int, goal_mask: int) -> Tuple[str, ...]:
+		return self.state_atoms(goal_mask & ~state)
+
+	@staticmethod
+	def goals_satisfied(states: Sequence[int], goal_mask: int) -> Tuple[bool, ...]:
+		"""Check one goal mask against many states, e.g. a recorded replay trace."""
+
+		return tuple(state & goal_mask == goal_mask for state in states)
+
+	def _compile_template(self, schema: Dict[str, Any]) -> _ActionTemplate:
+		parameters = [str(item) for item in (schema.get("parameters") or [])]
+		parameter_index: Dict[str, int] = {}
+		for index, parameter in enumerate(parameters):
+			canonical = self._token(parameter)
+			parameter_index[canonical] = index
+			if canonical.startswith("?"):
+				parameter_index[canonical[1:]] = index
+
+		def term_template(arg: Any) -> _TermTemplate:
+			canonical = self._token(str(arg))
+			index = parameter_index.get(canonical)
+			if index is None and canonical.startswith("?"):
+				index = parameter_index.get(canonical[1:])
+			if index is not None:
+				return (index, None)
+			return (None, canonical)
+
+		def literal_template(pattern: Dict[str, Any]) -> _LiteralTemplate:
+			predicate = str(pattern.get("predicate", "")).strip()
+			args = tuple(term_template(arg) for arg in (pattern.get("args") or []))
+			is_equality = predicate == "=" and len(args) == 2
+			if not is_equality:
+				self._predicates.setdefault(predicate)
+			return (
+				None if is_equality else predicate,
+				args,
+				bool(pattern.get("is_positive", True)),
+			)
+
+		clauses = list(schema.get("precondition_clauses") or [])
+		if not clauses:
+			clauses = [list(schema.get("preconditions") or [])]
+		effects = tuple(
+			literal_template(effect)
+			for effect in (schema.get("effects") or [])
+			if str(effect.get("predicate", "")).strip() not in {"", "="}
+		)
+		return _ActionTemplate(
+			name=str(schema.get("functor") or schema.get("source_name") or "").strip(),
+			arity=len(parameters),
+			precondition_clauses=tuple(
+				tuple(literal_template(pattern) for pattern in clause)
+				for clause in clauses
+			),
+			effects=effects,
+			precondition_factors=tuple(
+				tuple(
+					tuple(literal_template(pattern) for pattern in clause)
+					for clause in factor
+				)
+				for factor in (schema.get("precondition_factors") or [])
+			),
+		)
+
+	def _compile_ground_action(
+		self,
+		template: _ActionTemplate,
+		args: Tuple[str, ...],
+	) -> GroundAction:
+		table = self.table
+		canonical_args = tuple(self._token(arg) for arg in args)
+
+		def resolve(term: _TermTemplate) -> str:
+			index, constant = term
+			return canonical_args[index] if index is not None else str(constant)
+
+		def atom_bit(literal: _LiteralTemplate) -> int:
+			predicate, terms, _ = literal
+			return table.bit(table.atom(str(predicate), [resolve(term) for term in terms]))
+
+		def clause_masks(
+			clauses: Sequence[Tuple[_LiteralTemplate, ...]],
+		) -> Tuple[Tuple[int, int], ...]:
+			masks: List[Tuple[int, int]] = []
+			for clause in clauses:
+				positive = 0
+				negative = 0
+				satisfiable = True
+				for literal in clause:
+					functor, terms, is_positive = literal
+					if functor is None:
+						if (resolve(terms[0]) == resolve(terms[1])) != is_positive:
+							satisfiable = False
+							break
+						continue
+					if is_positive:
+						positive |= atom_bit(literal)
+					else:
+						negative |= atom_bit(literal)
+				if satisfiable:
+					masks.append((positive, negative))
+			return tuple(masks)
+
+		precondition_masks = clause_masks(template.precondition_clauses)
+		precondition_factor_masks = tuple(
+			clause_masks(factor)
+			for factor in template.precondition_factors
+		)
+		add_mask = 0
+		delete_mask = 0
+		for literal in template.effects:
+			if literal[2]:
+				add_mask |= atom_bit(literal)
+			else:
+				delete_mask |= atom_bit(literal)
+		return GroundAction(
+			name=template.name,
+			args=args,
+			precondition_masks=precondition_masks,
+			add_mask=add_mask,
+			delete_mask=delete_mask,
+			precondition_factor_masks=precondition_factor_masks,
+		)
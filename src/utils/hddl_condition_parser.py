@@ -2,12 +2,43 @@
 Minimal HDDL condition parser shared by method synthesis and plan rendering.
 
 The parser keeps symbolic literals, including equality and disequality constraints.
+
+Conditions are expanded to DNF. Expansions are memoized per action name and
+formula text, and every parser instance shares them. Each expansion is capped
+at `HDDL_DNF_MAX_CLAUSES` clauses. An action precondition whose expansion would
+go past the cap is kept in factored form: a conjunction of small DNF factors,
+which `ParsedActionSchema.precondition_factors` carries.
 """
 
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+HDDL_DNF_CACHE_SIZE = 4096
+DEFAULT_HDDL_DNF_MAX_CLAUSES = 256
+
+
+def configured_dnf_max_clauses() -> Optional[int]:
+    """Return the DNF clause ceiling from `HDDL_DNF_MAX_CLAUSES`, or None when disabled.
+
+    An empty or invalid value selects `DEFAULT_HDDL_DNF_MAX_CLAUSES`; `off`, `0`,
+    `false` or `no` expand every condition fully.
+    """
+
+    raw_value = os.getenv("HDDL_DNF_MAX_CLAUSES", "").strip().lower()
+    if not raw_value:
+        return DEFAULT_HDDL_DNF_MAX_CLAUSES
+    if raw_value in {"off", "0", "false", "no"}:
+        return None
+    try:
+        return max(int(raw_value), 1)
+    except ValueError:
+        return DEFAULT_HDDL_DNF_MAX_CLAUSES
 
 
 class UnsupportedHDDLConstructError(ValueError):
@@ -34,6 +65,28 @@ class UnsupportedHDDLConstructError(ValueError):
         super().__init__(message)
 
 
+class DNFClauseLimitExceeded(ValueError):
+    """Raised when expanding a condition to DNF would exceed the clause ceiling."""
+
+    def __init__(
+        self,
+        clause_count: int,
+        max_clauses: int,
+        *,
+        action_name: str | None = None,
+    ) -> None:
+        self.clause_count = clause_count
+        self.max_clauses = max_clauses
+        self.action_name = action_name
+        message = (
+            f"DNF expansion needs at least {clause_count} clauses, "
+            f"more than the ceiling of {max_clauses}."
+        )
+        if action_name:
+            message += f" Action: {action_name}."
+        super().__init__(message)
+
+
 @dataclass(frozen=True)
 class HDDLLiteralPattern:
     """A symbolic literal pattern extracted from an HDDL expression."""
@@ -52,15 +105,40 @@ class HDDLLiteralPattern:
         )
 
 
+DNFClauses = Tuple[Tuple[HDDLLiteralPattern, ...], ...]
+
+
 @dataclass(frozen=True)
 class ParsedActionSchema:
-    """The symbolic semantics of an HDDL action schema."""
+    """The symbolic semantics of an HDDL action schema.
+
+    `precondition_factors` is empty when `precondition_clauses` is the exact
+    DNF of the precondition. When the DNF would exceed the clause ceiling, the
+    exact precondition is the conjunction of the factors instead (every factor
+    needs one satisfied clause). `precondition_clauses` then holds the single
+    clause of literals every expansion requires, which is weaker than the
+    precondition: check `precondition_is_exact` before reading it as the DNF,
+    or use `precondition_dnf_factors`, which is exact either way.
+    """
 
     name: str
     parameters: Tuple[str, ...]
     preconditions: Tuple[HDDLLiteralPattern, ...]
-    precondition_clauses: Tuple[Tuple[HDDLLiteralPattern, ...], ...]
+    precondition_clauses: DNFClauses
     effects: Tuple[HDDLLiteralPattern, ...]
+    precondition_factors: Tuple[DNFClauses, ...] = ()
+
+    @property
+    def precondition_is_exact(self) -> bool:
+        """Whether `precondition_clauses` alone is the exact precondition DNF."""
+        return not self.precondition_factors
+
+    @property
+    def precondition_dnf_factors(self) -> Tuple[DNFClauses, ...]:
+        """The exact precondition as a conjunction of DNFs."""
+        if self.precondition_factors:
+            return (self.precondition_clauses, *self.precondition_factors)
+        return (self.precondition_clauses,)
 
     @property
     def positive_preconditions(self) -> Tuple[HDDLLiteralPattern, ...]:
@@ -119,8 +197,53 @@ class HDDLSExpressionParser:
         return tree
 
 
+class _BoundedCache:
+    """Thread-safe LRU shared by every parser instance."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(int(max_entries), 1)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_DNF_CACHE = _BoundedCache(HDDL_DNF_CACHE_SIZE)
+_ACTION_CACHE = _BoundedCache(HDDL_DNF_CACHE_SIZE)
+
+
+def clear_condition_parser_caches() -> None:
+    """Drop every memoized DNF expansion and parsed action schema."""
+
+    _DNF_CACHE.clear()
+    _ACTION_CACHE.clear()
+
+
 class HDDLConditionParser:
-    """Extract literal patterns from HDDL preconditions or effects."""
+    """Extract literal patterns from HDDL preconditions or effects.
+
+    `max_clauses` caps each DNF expansion and defaults to
+    `configured_dnf_max_clauses()`.
+    """
+
+    def __init__(self, *, max_clauses: Optional[int] = None) -> None:
+        self.max_clauses = max_clauses if max_clauses is not None else configured_dnf_max_clauses()
 
     def parse_literals(
         self,
@@ -129,11 +252,20 @@ class HDDLConditionParser:
         action_name: str | None = None,
         scope: str = "condition",
     ) -> Tuple[HDDLLiteralPattern, ...]:
-        clauses = self.parse_dnf(
-            expression,
-            action_name=action_name,
-            scope=scope,
-        )
+        try:
+            clauses = self.parse_dnf(
+                expression,
+                action_name=action_name,
+                scope=scope,
+            )
+        except DNFClauseLimitExceeded:
+            return self._required_literals_from_factors(
+                self.parse_factored_dnf(
+                    expression,
+                    action_name=action_name,
+                    scope=scope,
+                ),
+            )
         return self._required_literals_from_clauses(clauses)
 
     def parse_dnf(
@@ -142,24 +274,108 @@ class HDDLConditionParser:
         *,
         action_name: str | None = None,
         scope: str = "condition",
-    ) -> Tuple[Tuple[HDDLLiteralPattern, ...], ...]:
+    ) -> DNFClauses:
         normalised_expression = str(expression or "").strip()
         if not normalised_expression or normalised_expression in {"none", "()"}:
             return ((),)
-        tree = HDDLSExpressionParser.parse_expression(expression)
-        return self._walk_dnf(
-            tree,
-            action_name=action_name,
-            source_scope=scope,
-        )
+        cache_key = ("dnf", action_name or "", scope, normalised_expression, self.max_clauses)
+        cached = _DNF_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        tree = HDDLSExpressionParser.parse_expression(normalised_expression)
+        try:
+            clauses = self._walk_dnf(
+                tree,
+                action_name=action_name,
+                source_scope=scope,
+            )
+        except DNFClauseLimitExceeded as error:
+            raise DNFClauseLimitExceeded(
+                error.clause_count,
+                error.max_clauses,
+                action_name=action_name,
+            ) from None
+        _DNF_CACHE.put(cache_key, clauses)
+        return clauses
+
+    def parse_factored_dnf(
+        self,
+        expression: str,
+        *,
+        action_name: str | None = None,
+        scope: str = "condition",
+    ) -> Tuple[DNFClauses, ...]:
+        """Expand a condition to a conjunction of DNF factors under the clause ceiling.
+
+        Top-level conjuncts are expanded one by one. Neighbouring conjuncts are
+        multiplied out while the product stays under the ceiling. A condition
+        whose full DNF fits therefore comes back as one factor equal to
+        `parse_dnf`. Only a single conjunct that exceeds the ceiling by itself
+        raises `DNFClauseLimitExceeded`.
+        """
+
+        normalised_expression = str(expression or "").strip()
+        if not normalised_expression or normalised_expression in {"none", "()"}:
+            return (((),),)
+        cache_key = ("factors", action_name or "", scope, normalised_expression, self.max_clauses)
+        cached = _DNF_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        tree = HDDLSExpressionParser.parse_expression(normalised_expression)
+        factors: List[DNFClauses] = []
+        for node, negated in self._conjunctive_factors(tree, False):
+            try:
+                dnf = self._walk_dnf(
+                    node,
+                    negated,
+                    action_name=action_name,
+                    source_scope=scope,
+                )
+            except DNFClauseLimitExceeded as error:
+                raise DNFClauseLimitExceeded(
+                    error.clause_count,
+                    error.max_clauses,
+                    action_name=action_name,
+                ) from None
+            if factors and (
+                self.max_clauses is None
+                or len(factors[-1]) * len(dnf) <= self.max_clauses
+            ):
+                factors[-1] = self._conjoin_dnfs([factors[-1], dnf])
+            else:
+                factors.append(dnf)
+        result = tuple(factors) or (((),),)
+        _DNF_CACHE.put(cache_key, result)
+        return result
 
     def parse_action(self, action: Any) -> ParsedActionSchema:
-        parameters = tuple(self._extract_parameter_names(action.parameters))
-        precondition_clauses = self.parse_dnf(
-            action.preconditions,
-            action_name=action.name,
-            scope="precondition",
+        cache_key = (
+            str(action.name),
+            tuple(action.parameters),
+            str(action.preconditions),
+            str(action.effects),
+            self.max_clauses,
         )
+        cached = _ACTION_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        parameters = tuple(self._extract_parameter_names(action.parameters))
+        precondition_factors: Tuple[DNFClauses, ...] = ()
+        try:
+            precondition_clauses = self.parse_dnf(
+                action.preconditions,
+                action_name=action.name,
+                scope="precondition",
+            )
+            preconditions = self._required_literals_from_clauses(precondition_clauses)
+        except DNFClauseLimitExceeded:
+            precondition_factors = self.parse_factored_dnf(
+                action.preconditions,
+                action_name=action.name,
+                scope="precondition",
+            )
+            preconditions = self._required_literals_from_factors(precondition_factors)
+            precondition_clauses = (preconditions,)
         effect_clauses = self.parse_dnf(
             action.effects,
             action_name=action.name,
@@ -171,13 +387,37 @@ class HDDLConditionParser:
                 action_name=action.name,
                 expression=f"effect: {action.effects}",
             )
-        return ParsedActionSchema(
+        parsed = ParsedActionSchema(
             name=action.name,
             parameters=parameters,
-            preconditions=self._required_literals_from_clauses(precondition_clauses),
+            preconditions=preconditions,
             precondition_clauses=precondition_clauses,
             effects=effect_clauses[0] if effect_clauses else (),
+            precondition_factors=precondition_factors,
         )
+        _ACTION_CACHE.put(cache_key, parsed)
+        return parsed
+
+    def _conjunctive_factors(self, node: Any, negated: bool) -> List[Tuple[Any, bool]]:
+        """Split a formula into the (node, negated) conjuncts of its top-level conjunction."""
+
+        if not isinstance(node, list) or not node:
+            return [(node, negated)]
+        head = str(node[0])
+        if (head == "and" and not negated) or (head == "or" and negated):
+            return [
+                factor
+                for child in node[1:]
+                for factor in self._conjunctive_factors(child, negated)
+            ]
+        if head == "not" and len(node) == 2:
+            return self._conjunctive_factors(node[1], not negated)
+        if head == "imply" and negated and len(node) == 3:
+            return [
+                *self._conjunctive_factors(node[1], False),
+                *self._conjunctive_factors(node[2], True),
+            ]
+        return [(node, negated)]
 
     def _walk_dnf(
         self,
@@ -186,7 +426,7 @@ class HDDLConditionParser:
         *,
         action_name: str | None = None,
         source_scope: str = "condition",
-    ) -> Tuple[Tuple[HDDLLiteralPattern, ...], ...]:
+    ) -> DNFClauses:
         if not isinstance(node, list) or not node:
             return ()
 
@@ -342,6 +582,8 @@ class HDDLConditionParser:
         for dnf in dnf_items[1:]:
             if not result or not dnf:
                 return ()
+            # Checked before the cross product, which is what blows up.
+            self._check_clause_count(len(result) * len(dnf))
             combined: List[Tuple[HDDLLiteralPattern, ...]] = []
             for left in result:
                 for right in dnf:
@@ -351,6 +593,10 @@ class HDDLConditionParser:
             result = self._normalise_dnf(tuple(combined))
         return result
 
+    def _check_clause_count(self, clause_count: int) -> None:
+        if self.max_clauses is not None and clause_count > self.max_clauses:
+            raise DNFClauseLimitExceeded(clause_count, self.max_clauses)
+
     def _normalise_dnf(
         self,
         clauses: Tuple[Tuple[HDDLLiteralPattern, ...], ...],
@@ -408,6 +654,20 @@ class HDDLConditionParser:
                 ordered_shared.append(item)
         return tuple(ordered_shared)
 
+    def _required_literals_from_factors(
+        self,
+        factors: Tuple[DNFClauses, ...],
+    ) -> Tuple[HDDLLiteralPattern, ...]:
+        required: List[HDDLLiteralPattern] = []
+        seen: set[str] = set()
+        for factor in factors:
+            for item in self._required_literals_from_clauses(factor):
+                signature = self._literal_signature(item)
+                if signature not in seen:
+                    seen.add(signature)
+                    required.append(item)
+        return tuple(required)
+
     @staticmethod
     def _literal_key(item: HDDLLiteralPattern) -> Tuple[str, Tuple[str, ...]]:
         return (item.predicate, item.args)
@@ -0,0 +1,199 @@
+"""
+Process-wide cache of parsed HDDL domains and problems.
+
+The same `domain.hddl` is parsed by pipelines, orchestrators, query-dataset
+helpers and planner workers, and every evaluation parses its problem again.
+Parses are cached in memory under the resolved path plus the file's
+modification time and size, and are shared by every caller in the process. The
+parsed dataclasses are frozen, so callers must not mutate their lists either.
+
+An optional on-disk pickle layer (`HDDL_PARSE_CACHE_DIR`) lets freshly spawned
+worker processes load a parse instead of running the parser again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .hddl_parser import HDDLDomain, HDDLParser, HDDLProblem
+
+
+HDDL_PARSE_CACHE_VERSION = 1
+HDDL_PARSE_CACHE_SIZE = 256
+DEFAULT_HDDL_PARSE_CACHE_ROOT = Path(__file__).resolve().parent / ".hddl_parse_cache"
+# Files modified this recently may change again without a visible mtime/size
+# change, so such entries are re-checked by content before they are reused.
+RACY_MTIME_WINDOW_SECONDS = 2.0
+
+_StatKey = Tuple[str, str, int, int]
+
+
+def _parser_fingerprint() -> str:
+    parser_file = Path(sys.modules[HDDLParser.__module__].__file__ or "")
+    try:
+        stat = parser_file.stat()
+    except OSError:
+        return "unknown"
+    return f"{stat.st_size}:{int(stat.st_mtime_ns)}"
+
+
+def configured_hddl_pickle_cache_root() -> Optional[Path]:
+    """Return the pickle directory from `HDDL_PARSE_CACHE_DIR`, or None when disabled.
+
+    The pickle layer is optional: it is off unless the variable is set. `on`
+    selects the default directory next to this module; `off`, `0`, `false` or
+    `no` keep it disabled.
+    """
+
+    raw_value = os.getenv("HDDL_PARSE_CACHE_DIR", "").strip()
+    if not raw_value or raw_value.lower() in {"off", "0", "false", "no"}:
+        return None
+    if raw_value.lower() in {"on", "1", "true", "yes"}:
+        return DEFAULT_HDDL_PARSE_CACHE_ROOT
+    return Path(raw_value).expanduser().resolve()
+
+
+class HDDLParseCache:
+    """LRU of parsed HDDL files with an optional directory of pickled parses."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = HDDL_PARSE_CACHE_SIZE,
+        pickle_root: Optional[str | Path] = None,
+    ) -> None:
+        self.max_entries = max(int(max_entries), 1)
+        self.pickle_root = Path(pickle_root).resolve() if pickle_root is not None else None
+        self._entries: "OrderedDict[_StatKey, Tuple[Any, Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "pickle_hits": 0}
+
+    def domain(self, file_path: str | Path) -> HDDLDomain:
+        return self._load("domain", file_path, HDDLParser.parse_domain)
+
+    def problem(self, file_path: str | Path) -> HDDLProblem:
+        return self._load("problem", file_path, HDDLParser.parse_problem)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, kind: str, file_path: str | Path, parse: Callable[[str], Any]) -> Any:
+        resolved = Path(file_path).expanduser().resolve()
+        stat = resolved.stat()
+        key: _StatKey = (kind, str(resolved), int(stat.st_mtime_ns), int(stat.st_size))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            value, racy_digest = entry
+            if racy_digest is None or racy_digest == self._content_digest(resolved):
+                with self._lock:
+                    self.stats["hits"] += 1
+                return value
+
+        racy = time.time() - stat.st_mtime_ns / 1e9 < RACY_MTIME_WINDOW_SECONDS
+        racy_digest = self._content_digest(resolved) if racy else None
+        value = None if racy else self._read_pickle(key)
+        if value is not None:
+            with self._lock:
+                self.stats["pickle_hits"] += 1
+        else:
+            value = parse(str(resolved))
+            with self._lock:
+                self.stats["misses"] += 1
+            if not racy:
+                self._write_pickle(key, value)
+        with self._lock:
+            self._entries[key] = (value, racy_digest)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _content_digest(path: Path) -> Optional[str]:
+        try:
+            return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        except OSError:
+            return None
+
+    def _pickle_path(self, key: _StatKey) -> Optional[Path]:
+        if self.pickle_root is None:
+            return None
+        digest = hashlib.sha256(
+            "\0".join(
+                (
+                    str(HDDL_PARSE_CACHE_VERSION),
+                    _parser_fingerprint(),
+                    f"{sys.version_info.major}.{sys.version_info.minor}",
+                    *(str(part) for part in key),
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+        return self.pickle_root / digest[:2] / f"{digest}.pickle"
+
+    def _read_pickle(self, key: _StatKey) -> Any:
+        path = self._pickle_path(key)
+        if path is None:
+            return None
+        try:
+            with path.open("rb") as stream:
+                return pickle.load(stream)
+        except Exception:
+            return None
+
+    def _write_pickle(self, key: _StatKey, value: Any) -> None:
+        path = self._pickle_path(key)
+        if path is None:
+            return
+        staging: Optional[str] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, staging = tempfile.mkstemp(prefix=f".{path.stem[:16]}-", dir=path.parent)
+            with os.fdopen(handle, "wb") as stream:
+                pickle.dump(value, stream, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(staging, path)
+            staging = None
+        except OSError:
+            # A read-only or full cache directory only costs the reuse.
+            pass
+        finally:
+            if staging is not None and os.path.exists(staging):
+                os.unlink(staging)
+
+
+_SHARED_CACHE: Optional[HDDLParseCache] = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def shared_hddl_parse_cache() -> HDDLParseCache:
+    """Return the process-wide cache, creating it on first use."""
+
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = HDDLParseCache(pickle_root=configured_hddl_pickle_cache_root())
+        return _SHARED_CACHE
+
+
+def load_parsed_domain(file_path: str | Path) -> HDDLDomain:
+    """Return the cached parse of an HDDL domain file."""
+
+    return shared_hddl_parse_cache().domain(file_path)
+
+
+def load_parsed_problem(file_path: str | Path) -> HDDLProblem:
+    """Return the cached parse of an HDDL problem file."""
+
+    return shared_hddl_parse_cache().problem(file_path)
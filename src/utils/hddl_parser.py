@@ -16,10 +16,10 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLPredicate:
     """Represents an HDDL predicate."""
 
@@ -45,7 +45,7 @@ class HDDLPredicate:
         return f"{self.name}({', '.join(var_names)})"
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLAction:
     """Represents an HDDL primitive action schema."""
 
@@ -64,7 +64,7 @@ class HDDLAction:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLTask:
     """Represents an HDDL compound task schema."""
 
@@ -90,7 +90,7 @@ class HDDLTask:
         return f"{self.name}({', '.join(var_names)})"
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLSubtask:
     """Represents one labelled subtask inside an HDDL method body."""
 
@@ -99,7 +99,7 @@ class HDDLSubtask:
     args: List[str]
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLFact:
     """Represents one grounded fact in a problem file."""
 
@@ -115,7 +115,7 @@ class HDDLFact:
         return atom if self.is_positive else f"not {atom}"
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLTaskInvocation:
     """Represents one task call in a problem HTN network."""
 
@@ -129,7 +129,7 @@ class HDDLTaskInvocation:
         return f"{self.task_name}({', '.join(self.args)})"
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLMethod:
     """Represents an HDDL method."""
 
@@ -142,7 +142,7 @@ class HDDLMethod:
     ordering: List[Tuple[str, str]]
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLDomain:
     """Parsed HDDL domain information."""
 
@@ -167,7 +167,7 @@ class HDDLDomain:
         return [task.to_signature() for task in self.tasks]
 
 
-@dataclass
+@dataclass(frozen=True)
 class HDDLProblem:
     """Parsed HDDL problem information."""
 
@@ -183,6 +183,58 @@ class HDDLProblem:
     goal_facts: List[HDDLFact]
 
 
+SExpression = Union[str, List["SExpression"]]
+
+# One alternation over the whole file: comments, parentheses and atoms.
+_TOKEN_PATTERN = re.compile(r";[^\n]*|[()]|[^\s();]+")
+_COMMENT_PATTERN = re.compile(r";.*$", flags=re.MULTILINE)
+
+
+class _SExpressionList(list):
+    """List node that remembers the source span it was read from."""
+
+    __slots__ = ("source", "start", "end")
+
+    def source_text(self) -> str:
+        return self.source[self.start:self.end]
+
+
+def read_sexpressions(content: str) -> List[SExpression]:
+    """
+    Tokenize HDDL text in a single pass and return its top-level S-expressions.
+
+    Comments (`;` to end of line) are dropped while tokenizing, so no separate
+    stripping pass over the text is needed. List nodes keep their source span,
+    which lets formulas be reported with their original spelling.
+    """
+    root: List[SExpression] = []
+    stack: List[List[SExpression]] = [root]
+    for match in _TOKEN_PATTERN.finditer(content):
+        token = match.group()
+        if token == "(":
+            node = _SExpressionList()
+            node.source = content
+            node.start = match.start()
+            stack[-1].append(node)
+            stack.append(node)
+        elif token == ")":
+            if len(stack) == 1:
+                raise ValueError(f"Unexpected ')' in HDDL text at index {match.start()}")
+            stack.pop().end = match.end()
+        elif token[0] != ";":
+            stack[-1].append(token)
+    if len(stack) != 1:
+        raise ValueError(f"Unclosed HDDL block starting at index {stack[1].start}")
+    return root
+
+
+def render_sexpression(expression: SExpression) -> str:
+    """Render an S-expression tree as compact single-line HDDL text."""
+    if isinstance(expression, str):
+        return expression
+    return "(" + " ".join(render_sexpression(item) for item in expression) + ")"
+
+
 class HDDLParser:
     """Parser for the subset of HDDL used by this project."""
 
@@ -197,27 +249,40 @@ class HDDLParser:
         Returns:
             HDDLDomain with parsed information.
         """
-        content = Path(file_path).read_text()
-        content = re.sub(r";.*$", "", content, flags=re.MULTILINE)
-
-        domain_name_match = re.search(r"\(define\s+\(domain\s+([^\s)]+)\)", content)
-        domain_name = domain_name_match.group(1) if domain_name_match else "unknown"
-
-        requirements = HDDLParser._extract_simple_list_block(content, "requirements")
-        types = HDDLParser._extract_simple_list_block(content, "types")
-        predicates = HDDLParser._extract_predicates(content)
-        tasks = HDDLParser._extract_tasks(content)
-        methods = HDDLParser._extract_methods(content)
-        actions = HDDLParser._extract_actions(content)
+        header, sections = HDDLParser._read_define(
+            Path(file_path).read_text(),
+            "domain",
+        )
 
         return HDDLDomain(
-            name=domain_name,
-            requirements=requirements,
-            types=types,
-            predicates=predicates,
-            tasks=tasks,
-            methods=methods,
-            actions=actions,
+            name=header or "unknown",
+            requirements=HDDLParser._section_tokens(sections, ":requirements"),
+            types=HDDLParser._section_tokens(sections, ":types"),
+            predicates=HDDLParser._extract_predicates(sections),
+            tasks=[
+                task
+                for task in (
+                    HDDLParser._build_task(block)
+                    for block in sections.get(":task", ())
+                )
+                if task is not None
+            ],
+            methods=[
+                method
+                for method in (
+                    HDDLParser._build_method(block)
+                    for block in sections.get(":method", ())
+                )
+                if method is not None
+            ],
+            actions=[
+                action
+                for action in (
+                    HDDLParser._build_action(block)
+                    for block in sections.get(":action", ())
+                )
+                if action is not None
+            ],
         )
 
     @staticmethod
@@ -231,119 +296,146 @@ class HDDLParser:
         Returns:
             HDDLProblem with parsed objects, init, HTN tasks, and optional goal facts.
         """
-        content = Path(file_path).read_text()
-        content = re.sub(r";.*$", "", content, flags=re.MULTILINE)
-
-        problem_name_match = re.search(r"\(define\s+\(problem\s+([^\s)]+)\)", content)
-        problem_name = problem_name_match.group(1) if problem_name_match else "unknown_problem"
-        domain_name_match = re.search(r"\(:domain\s+([^\s)]+)\)", content)
-        domain_name = domain_name_match.group(1) if domain_name_match else "unknown_domain"
-
-        objects, object_types = HDDLParser._extract_problem_objects(content)
-        htn_parameter_types = HDDLParser._extract_problem_htn_parameters(content)
-        init_facts = HDDLParser._extract_problem_init_facts(content)
-        htn_tasks = HDDLParser._extract_problem_htn_tasks(content)
-        htn_ordered = HDDLParser._problem_htn_tasks_are_ordered(content)
-        htn_ordering = HDDLParser._extract_problem_htn_ordering(content)
-        goal_facts = HDDLParser._extract_problem_goal_facts(content)
+        header, sections = HDDLParser._read_define(
+            Path(file_path).read_text(),
+            "problem",
+        )
+        domain_block = HDDLParser._first_section(sections, ":domain")
+        domain_name = (
+            domain_block[1]
+            if domain_block is not None and len(domain_block) > 1 and isinstance(domain_block[1], str)
+            else "unknown_domain"
+        )
+        objects, object_types = HDDLParser._typed_names(
+            HDDLParser._section_tokens(sections, ":objects"),
+        )
+        htn_block = HDDLParser._first_section(sections, ":htn")
 
         return HDDLProblem(
-            name=problem_name,
+            name=header or "unknown_problem",
             domain_name=domain_name,
             objects=objects,
             object_types=object_types,
-            htn_parameter_types=htn_parameter_types,
-            init_facts=init_facts,
-            htn_tasks=htn_tasks,
-            htn_ordered=htn_ordered,
-            htn_ordering=htn_ordering,
-            goal_facts=goal_facts,
+            htn_parameter_types=HDDLParser._extract_problem_htn_parameters(htn_block),
+            init_facts=HDDLParser._extract_problem_init_facts(sections),
+            htn_tasks=HDDLParser._extract_problem_htn_tasks(htn_block),
+            htn_ordered=HDDLParser._problem_htn_tasks_are_ordered(htn_block),
+            htn_ordering=HDDLParser._parse_ordering(
+                HDDLParser._keyword_value(htn_block, ":ordering"),
+            ),
+            goal_facts=HDDLParser._extract_problem_goal_facts(sections),
         )
 
     @staticmethod
-    def _extract_simple_list_block(content: str, keyword: str) -> List[str]:
-        block = HDDLParser._extract_single_block(content, keyword)
-        if block is None:
-            return []
+    def _read_define(
+        content: str,
+        kind: str,
+    ) -> Tuple[Optional[str], Dict[str, List[List[SExpression]]]]:
+        """Return the `(define (<kind> name) ...)` name and its sections by keyword."""
+        header: Optional[str] = None
+        sections: Dict[str, List[List[SExpression]]] = {}
+        for expression in read_sexpressions(content):
+            if not isinstance(expression, list) or not expression or expression[0] != "define":
+                continue
+            for item in expression[1:]:
+                if not isinstance(item, list) or not item or not isinstance(item[0], str):
+                    continue
+                if item[0] == kind and header is None and len(item) > 1 and isinstance(item[1], str):
+                    header = item[1]
+                elif item[0].startswith(":"):
+                    sections.setdefault(item[0], []).append(item)
+            break
+        return header, sections
 
-        match = re.search(rf"\(:{keyword}\s+(.*?)\)$", block, flags=re.DOTALL)
-        if not match:
-            return []
+    @staticmethod
+    def _first_section(
+        sections: Dict[str, List[List[SExpression]]],
+        keyword: str,
+    ) -> Optional[List[SExpression]]:
+        blocks = sections.get(keyword)
+        return blocks[0] if blocks else None
 
-        return [token.strip() for token in match.group(1).split() if token.strip()]
+    @staticmethod
+    def _section_tokens(
+        sections: Dict[str, List[List[SExpression]]],
+        keyword: str,
+    ) -> List[str]:
+        block = HDDLParser._first_section(sections, keyword)
+        if block is None:
+            return []
+        return [render_sexpression(item) for item in block[1:]]
 
     @staticmethod
-    def _extract_problem_objects(content: str) -> Tuple[List[str], Dict[str, str]]:
-        block = HDDLParser._extract_single_block(content, "objects")
+    def _keyword_value(
+        block: Optional[List[SExpression]],
+        keyword: str,
+    ) -> Optional[SExpression]:
+        """Return the expression following `keyword` among the direct items of `block`."""
         if block is None:
-            return [], {}
+            return None
+        for index in range(1, len(block) - 1):
+            if block[index] == keyword:
+                return block[index + 1]
+        return None
 
-        inner = block[len("(:objects"): -1].strip()
-        raw_params = HDDLParser._parse_parameters(inner)
-        objects: List[str] = []
-        object_types: Dict[str, str] = {}
-        for item in raw_params:
+    @staticmethod
+    def _parameter_tokens(expression: Optional[SExpression]) -> str:
+        if expression is None:
+            return ""
+        if isinstance(expression, str):
+            return expression
+        return " ".join(render_sexpression(item) for item in expression)
+
+    @staticmethod
+    def _typed_names(tokens: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        names: List[str] = []
+        name_types: Dict[str, str] = {}
+        for item in HDDLParser._parse_parameters(" ".join(tokens)):
             if " - " in item:
-                object_name, type_name = item.split(" - ", 1)
-                object_name = object_name.strip()
+                name, type_name = item.split(" - ", 1)
+                name = name.strip()
                 type_name = type_name.strip() or "object"
             else:
-                object_name = item.strip()
+                name = item.strip()
                 type_name = "object"
-            if not object_name:
+            if not name:
                 continue
-            objects.append(object_name)
-            object_types[object_name] = type_name
-        return objects, object_types
+            names.append(name)
+            name_types[name] = type_name
+        return names, name_types
 
     @staticmethod
-    def _extract_problem_htn_parameters(content: str) -> Dict[str, str]:
-        block = HDDLParser._extract_single_block(content, "htn")
-        if block is None:
-            return {}
-        params_expr = HDDLParser._extract_expression_after_keyword(block, ":parameters")
+    def _extract_problem_htn_parameters(htn_block: Optional[List[SExpression]]) -> Dict[str, str]:
+        params_expr = HDDLParser._keyword_value(htn_block, ":parameters")
         if params_expr is None:
             return {}
-        params_str = params_expr[1:-1].strip() if params_expr.startswith("(") and params_expr.endswith(")") else params_expr
-        raw_params = HDDLParser._parse_parameters(params_str)
-        htn_parameter_types: Dict[str, str] = {}
-        for item in raw_params:
-            if " - " in item:
-                parameter_name, type_name = item.split(" - ", 1)
-                parameter_name = parameter_name.strip()
-                type_name = type_name.strip() or "object"
-            else:
-                parameter_name = item.strip()
-                type_name = "object"
-            if not parameter_name:
-                continue
-            htn_parameter_types[parameter_name] = type_name
+        _, htn_parameter_types = HDDLParser._typed_names(
+            [HDDLParser._parameter_tokens(params_expr)],
+        )
         return htn_parameter_types
 
     @staticmethod
-    def _extract_problem_init_facts(content: str) -> List[HDDLFact]:
-        block = HDDLParser._extract_single_block(content, "init")
+    def _extract_problem_init_facts(
+        sections: Dict[str, List[List[SExpression]]],
+    ) -> List[HDDLFact]:
+        block = HDDLParser._first_section(sections, ":init")
         if block is None:
             return []
-        tree = _SimpleSExpressionParser.parse_expression(block)
-        if not isinstance(tree, list) or not tree or tree[0] != ":init":
-            return []
         facts: List[HDDLFact] = []
-        for item in tree[1:]:
+        for item in block[1:]:
             fact = HDDLParser._sexpr_to_fact(item)
             if fact is not None:
                 facts.append(fact)
         return facts
 
     @staticmethod
-    def _extract_problem_goal_facts(content: str) -> List[HDDLFact]:
-        block = HDDLParser._extract_single_block(content, "goal")
-        if block is None:
-            return []
-        goal_expr = HDDLParser._extract_expression_after_keyword(block, ":goal")
-        if goal_expr is None:
+    def _extract_problem_goal_facts(
+        sections: Dict[str, List[List[SExpression]]],
+    ) -> List[HDDLFact]:
+        block = HDDLParser._first_section(sections, ":goal")
+        if block is None or len(block) < 2:
             return []
-        tree = _SimpleSExpressionParser.parse_expression(goal_expr)
+        tree = block[1]
         if isinstance(tree, list) and tree and tree[0] == "and":
             items = tree[1:]
         else:
@@ -356,19 +448,17 @@ class HDDLParser:
         return facts
 
     @staticmethod
-    def _extract_problem_htn_tasks(content: str) -> List[HDDLTaskInvocation]:
-        block = HDDLParser._extract_single_block(content, "htn")
-        if block is None:
-            return []
-        tasks_expr = HDDLParser._extract_expression_after_keyword(block, ":tasks")
-        if tasks_expr is None:
-            tasks_expr = HDDLParser._extract_expression_after_keyword(block, ":ordered-subtasks")
-        if tasks_expr is None:
-            tasks_expr = HDDLParser._extract_expression_after_keyword(block, ":subtasks")
-        if tasks_expr is None:
+    def _extract_problem_htn_tasks(
+        htn_block: Optional[List[SExpression]],
+    ) -> List[HDDLTaskInvocation]:
+        tree = HDDLParser._keyword_value(htn_block, ":tasks")
+        if tree is None:
+            tree = HDDLParser._keyword_value(htn_block, ":ordered-subtasks")
+        if tree is None:
+            tree = HDDLParser._keyword_value(htn_block, ":subtasks")
+        if tree is None:
             return []
 
-        tree = _SimpleSExpressionParser.parse_expression(tasks_expr)
         items = tree[1:] if isinstance(tree, list) and tree and tree[0] == "and" else [tree]
         task_invocations: List[HDDLTaskInvocation] = []
         for item in items:
@@ -397,19 +487,8 @@ class HDDLParser:
         return task_invocations
 
     @staticmethod
-    def _problem_htn_tasks_are_ordered(content: str) -> bool:
-        block = HDDLParser._extract_single_block(content, "htn")
-        if block is None:
-            return False
-        return ":ordered-subtasks" in block
-
-    @staticmethod
-    def _extract_problem_htn_ordering(content: str) -> List[Tuple[str, str]]:
-        block = HDDLParser._extract_single_block(content, "htn")
-        if block is None:
-            return []
-        ordering_expr = HDDLParser._extract_expression_after_keyword(block, ":ordering")
-        return HDDLParser._parse_ordering(ordering_expr)
+    def _problem_htn_tasks_are_ordered(htn_block: Optional[List[SExpression]]) -> bool:
+        return htn_block is not None and ":ordered-subtasks" in htn_block
 
     @staticmethod
     def _sexpr_to_fact(item: object) -> Optional[HDDLFact]:
@@ -431,139 +510,98 @@ class HDDLParser:
         )
 
     @staticmethod
-    def _extract_predicates(content: str) -> List[HDDLPredicate]:
-        block = HDDLParser._extract_single_block(content, "predicates")
+    def _extract_predicates(
+        sections: Dict[str, List[List[SExpression]]],
+    ) -> List[HDDLPredicate]:
+        block = HDDLParser._first_section(sections, ":predicates")
         if block is None:
             return []
 
-        inner = block[len("(:predicates"): -1].strip()
-        pattern = r"\(([a-zA-Z][a-zA-Z0-9_-]*)\s*([^)]*)\)"
-        matches = re.findall(pattern, inner)
-
         predicates: List[HDDLPredicate] = []
-        for name, params_str in matches:
+        for item in block[1:]:
+            if not isinstance(item, list) or not item or not isinstance(item[0], str):
+                continue
             predicates.append(
                 HDDLPredicate(
-                    name=name,
-                    parameters=HDDLParser._parse_parameters(params_str),
+                    name=item[0],
+                    parameters=HDDLParser._parse_parameters(
+                        HDDLParser._parameter_tokens(item[1:]),
+                    ),
                 )
             )
         return predicates
 
     @staticmethod
-    def _extract_tasks(content: str) -> List[HDDLTask]:
-        tasks: List[HDDLTask] = []
-        for block in HDDLParser._extract_blocks(content, "task"):
-            name_match = re.match(r"\(:task\s+([^\s()]+)", block)
-            if not name_match:
-                continue
-
-            params_expr = HDDLParser._extract_expression_after_keyword(block, ":parameters")
-            params_str = params_expr[1:-1].strip() if params_expr else ""
-            tasks.append(
-                HDDLTask(
-                    name=name_match.group(1),
-                    parameters=HDDLParser._parse_parameters(params_str),
-                )
-            )
-        return tasks
+    def _block_name(block: List[SExpression]) -> Optional[str]:
+        if len(block) > 1 and isinstance(block[1], str) and not block[1].startswith(":"):
+            return block[1]
+        return None
 
     @staticmethod
-    def _extract_methods(content: str) -> List[HDDLMethod]:
-        methods: List[HDDLMethod] = []
-        for block in HDDLParser._extract_blocks(content, "method"):
-            name_match = re.match(r"\(:method\s+([^\s()]+)", block)
-            if not name_match:
-                continue
-
-            params_expr = HDDLParser._extract_expression_after_keyword(block, ":parameters")
-            params_str = params_expr[1:-1].strip() if params_expr else ""
+    def _build_task(block: List[SExpression]) -> Optional[HDDLTask]:
+        name = HDDLParser._block_name(block)
+        if name is None:
+            return None
+        return HDDLTask(
+            name=name,
+            parameters=HDDLParser._parse_parameters(
+                HDDLParser._parameter_tokens(HDDLParser._keyword_value(block, ":parameters")),
+            ),
+        )
 
-            task_expr = HDDLParser._extract_expression_after_keyword(block, ":task")
-            task_name, task_args = HDDLParser._parse_task_invocation(task_expr)
+    @staticmethod
+    def _build_method(block: List[SExpression]) -> Optional[HDDLMethod]:
+        name = HDDLParser._block_name(block)
+        if name is None:
+            return None
 
-            precondition_expr = HDDLParser._extract_expression_after_keyword(
-                block,
-                ":precondition",
-            )
-            subtasks_expr = HDDLParser._extract_expression_after_keyword(
-                block,
-                ":ordered-subtasks",
-            )
-            ordering: List[Tuple[str, str]] = []
-            if subtasks_expr is None:
-                subtasks_expr = HDDLParser._extract_expression_after_keyword(block, ":subtasks")
-                ordering_expr = HDDLParser._extract_expression_after_keyword(block, ":ordering")
-                ordering = HDDLParser._parse_ordering(ordering_expr)
-
-            subtasks = HDDLParser._parse_subtasks(subtasks_expr)
-            if not ordering and subtasks:
-                ordering = [
-                    (subtasks[index].label, subtasks[index + 1].label)
-                    for index in range(len(subtasks) - 1)
-                ]
-
-            methods.append(
-                HDDLMethod(
-                    name=name_match.group(1),
-                    task_name=task_name,
-                    task_args=task_args,
-                    parameters=HDDLParser._parse_parameters(params_str),
-                    precondition=HDDLParser._clean_formula(precondition_expr),
-                    subtasks=subtasks,
-                    ordering=ordering,
-                )
+        task_name, task_args = HDDLParser._parse_task_invocation(
+            HDDLParser._keyword_value(block, ":task"),
+        )
+        subtasks_expr = HDDLParser._keyword_value(block, ":ordered-subtasks")
+        ordering: List[Tuple[str, str]] = []
+        if subtasks_expr is None:
+            subtasks_expr = HDDLParser._keyword_value(block, ":subtasks")
+            ordering = HDDLParser._parse_ordering(
+                HDDLParser._keyword_value(block, ":ordering"),
             )
-        return methods
 
-    @staticmethod
-    def _extract_actions(content: str) -> List[HDDLAction]:
-        actions: List[HDDLAction] = []
-        for block in HDDLParser._extract_blocks(content, "action"):
-            name_match = re.match(r"\(:action\s+([^\s()]+)", block)
-            if not name_match:
-                continue
+        subtasks = HDDLParser._parse_subtasks(subtasks_expr)
+        if not ordering and subtasks:
+            ordering = [
+                (subtasks[index].label, subtasks[index + 1].label)
+                for index in range(len(subtasks) - 1)
+            ]
 
-            params_expr = HDDLParser._extract_expression_after_keyword(block, ":parameters")
-            params_str = params_expr[1:-1].strip() if params_expr else ""
-            precondition_expr = HDDLParser._extract_expression_after_keyword(
-                block,
-                ":precondition",
-            )
-            effect_expr = HDDLParser._extract_expression_after_keyword(block, ":effect")
-
-            actions.append(
-                HDDLAction(
-                    name=name_match.group(1),
-                    parameters=HDDLParser._parse_parameters(params_str),
-                    preconditions=HDDLParser._clean_formula(precondition_expr),
-                    effects=HDDLParser._clean_formula(effect_expr),
-                )
-            )
-        return actions
+        return HDDLMethod(
+            name=name,
+            task_name=task_name,
+            task_args=task_args,
+            parameters=HDDLParser._parse_parameters(
+                HDDLParser._parameter_tokens(HDDLParser._keyword_value(block, ":parameters")),
+            ),
+            precondition=HDDLParser._clean_formula(
+                HDDLParser._keyword_value(block, ":precondition"),
+            ),
+            subtasks=subtasks,
+            ordering=ordering,
+        )
 
     @staticmethod
-    def _extract_single_block(content: str, keyword: str) -> Optional[str]:
-        blocks = HDDLParser._extract_blocks(content, keyword)
-        if not blocks:
+    def _build_action(block: List[SExpression]) -> Optional[HDDLAction]:
+        name = HDDLParser._block_name(block)
+        if name is None:
             return None
-        return blocks[0]
-
-    @staticmethod
-    def _extract_blocks(content: str, keyword: str) -> List[str]:
-        token = f"(:{keyword}"
-        blocks: List[str] = []
-        cursor = 0
-
-        while True:
-            start = content.find(token, cursor)
-            if start == -1:
-                break
-            end = HDDLParser._find_matching_paren(content, start)
-            blocks.append(content[start:end + 1])
-            cursor = end + 1
-
-        return blocks
+        return HDDLAction(
+            name=name,
+            parameters=HDDLParser._parse_parameters(
+                HDDLParser._parameter_tokens(HDDLParser._keyword_value(block, ":parameters")),
+            ),
+            preconditions=HDDLParser._clean_formula(
+                HDDLParser._keyword_value(block, ":precondition"),
+            ),
+            effects=HDDLParser._clean_formula(HDDLParser._keyword_value(block, ":effect")),
+        )
 
     @staticmethod
     def _find_matching_paren(content: str, start_index: int) -> int:
@@ -578,28 +616,6 @@ class HDDLParser:
                     return index
         raise ValueError(f"Unclosed HDDL block starting at index {start_index}")
 
-    @staticmethod
-    def _extract_expression_after_keyword(block: str, keyword: str) -> Optional[str]:
-        start = block.find(keyword)
-        if start == -1:
-            return None
-
-        cursor = start + len(keyword)
-        while cursor < len(block) and block[cursor].isspace():
-            cursor += 1
-
-        if cursor >= len(block):
-            return None
-
-        if block[cursor] == "(":
-            end = HDDLParser._find_matching_paren(block, cursor)
-            return block[cursor:end + 1]
-
-        end = cursor
-        while end < len(block) and not block[end].isspace() and block[end] != ")":
-            end += 1
-        return block[cursor:end]
-
     @staticmethod
     def _parse_parameters(params_str: str) -> List[str]:
         names: List[str] = []
@@ -629,38 +645,37 @@ class HDDLParser:
         return names
 
     @staticmethod
-    def _clean_formula(formula: Optional[str]) -> str:
-        if not formula:
+    def _clean_formula(formula: Optional[SExpression]) -> str:
+        if formula is None:
             return "none"
 
-        compact = " ".join(formula.split()).strip()
-        if compact == "(and)":
+        if isinstance(formula, _SExpressionList):
+            text = formula.source_text()
+            if ";" in text:
+                text = _COMMENT_PATTERN.sub("", text)
+        else:
+            text = render_sexpression(formula)
+        compact = " ".join(text.split()).strip()
+        if not compact or compact == "(and)":
             return "none"
         return compact
 
     @staticmethod
-    def _parse_task_invocation(expression: Optional[str]) -> Tuple[str, List[str]]:
-        if not expression:
+    def _parse_task_invocation(expression: Optional[SExpression]) -> Tuple[str, List[str]]:
+        if expression is None:
             return "unknown_task", []
-
-        text = expression.strip()
-        if text.startswith("(") and text.endswith(")"):
-            text = text[1:-1].strip()
-        tokens = [token for token in text.split() if token]
+        if isinstance(expression, str):
+            return expression, []
+        tokens = [render_sexpression(item) for item in expression]
         if not tokens:
             return "unknown_task", []
         return tokens[0], tokens[1:]
 
     @staticmethod
-    def _parse_subtasks(expression: Optional[str]) -> List[HDDLSubtask]:
-        if not expression:
-            return []
-
-        text = expression.strip()
-        if text == "(and)":
+    def _parse_subtasks(tree: Optional[SExpression]) -> List[HDDLSubtask]:
+        if tree is None:
             return []
 
-        tree = _SimpleSExpressionParser.parse_expression(text)
         items = tree[1:] if isinstance(tree, list) and tree and tree[0] == "and" else [tree]
 
         subtasks: List[HDDLSubtask] = []
@@ -685,11 +700,10 @@ class HDDLParser:
         return subtasks
 
     @staticmethod
-    def _parse_ordering(expression: Optional[str]) -> List[Tuple[str, str]]:
-        if not expression:
+    def _parse_ordering(tree: Optional[SExpression]) -> List[Tuple[str, str]]:
+        if tree is None:
             return []
 
-        tree = _SimpleSExpressionParser.parse_expression(expression)
         items = tree[1:] if isinstance(tree, list) and tree and tree[0] == "and" else [tree]
 
         ordering: List[Tuple[str, str]] = []
@@ -703,44 +717,6 @@ class HDDLParser:
         return ordering
 
 
-class _SimpleSExpressionParser:
-    """Tiny S-expression parser for the HDDL subset used here."""
-
-    @staticmethod
-    def tokenize(expression: str) -> List[str]:
-        spaced = expression.replace("(", " ( ").replace(")", " ) ")
-        return [token for token in spaced.split() if token]
-
-    @classmethod
-    def parse(cls, tokens: List[str], index: int = 0) -> Tuple[object, int]:
-        if index >= len(tokens):
-            raise ValueError("Unexpected end of HDDL expression")
-
-        token = tokens[index]
-        if token == "(":
-            result: List[object] = []
-            cursor = index + 1
-            while cursor < len(tokens) and tokens[cursor] != ")":
-                item, cursor = cls.parse(tokens, cursor)
-                result.append(item)
-            if cursor >= len(tokens):
-                raise ValueError("Unclosed HDDL expression")
-            return result, cursor + 1
-
-        if token == ")":
-            raise ValueError("Unexpected ')' in HDDL expression")
-
-        return token, index + 1
-
-    @classmethod
-    def parse_expression(cls, expression: str) -> object:
-        tokens = cls.tokenize(expression)
-        if not tokens:
-            return []
-        tree, _ = cls.parse(tokens, 0)
-        return tree
-
-
 def test_hddl_parser() -> None:
     """Ad hoc parser smoke test."""
     domain_file = Path(__file__).parent.parent / "domains" / "blocksworld" / "domain.hddl"
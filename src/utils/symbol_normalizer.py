@@ -18,6 +18,8 @@ Design rationale:
 import re
 from typing import List, Tuple, Dict
 
+from .symbol_table import HYPHEN_CHAR, HYPHEN_REPLACEMENT, SymbolTable
+
 
 class SymbolNormalizer:
     """
@@ -30,8 +32,8 @@ class SymbolNormalizer:
     """
 
     # Constants for hyphen encoding
-    HYPHEN_REPLACEMENT = "hh"
-    HYPHEN_CHAR = "-"
+    HYPHEN_REPLACEMENT = HYPHEN_REPLACEMENT
+    HYPHEN_CHAR = HYPHEN_CHAR
 
     # Regex patterns
     PREDICATE_PATTERN = re.compile(r'([a-z_][a-z0-9_]*)\(([^()]+)\)')
@@ -40,6 +42,8 @@ class SymbolNormalizer:
         """Initialize normalizer with empty mapping tables"""
         self.normalized_to_original: Dict[str, str] = {}
         self.original_to_normalized: Dict[str, str] = {}
+        # Parsed predicate strings, interned once per normalizer
+        self.symbols = SymbolTable()
 
     # ========== HYPHEN HANDLING ==========
 
@@ -271,17 +275,13 @@ class SymbolNormalizer:
             "clear(block-1)" → ("clear", ["block-1"])
             "handempty" → ("handempty", [])
         """
-        match = self.PREDICATE_PATTERN.match(predicate_str.strip())
+        atom = self.symbols.encode_agentspeak(predicate_str)
 
-        if not match:
-            # No arguments (nullary predicate or propositional constant)
+        if atom is None:
+            # Not an atom; keep the text as a propositional constant
             return predicate_str.strip(), []
 
-        pred_name = match.group(1)
-        args_str = match.group(2)
-        args = [arg.strip() for arg in args_str.split(',')]
-
-        return pred_name, args
+        return self.symbols.symbol(atom.predicate_id), list(self.symbols.decode_args(atom))
 
     # ========== ANTI-GROUNDING (PROPOSITIONAL → PARAMETERIZED) ==========
 
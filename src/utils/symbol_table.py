@@ -0,0 +1,439 @@
+"""
+Per-problem symbol table and integer-encoded ground atoms.
+
+Ground atoms travel through the pipeline in three textual forms:
+- HDDL facts such as `(on a b)`;
+- AgentSpeak runtime atoms such as `on(a,b)`;
+- propositional task-event symbols such as `on_a_b`.
+
+Comparing atoms through these strings means parsing and re-rendering them
+over and over. A `SymbolTable` interns the predicate, object and type names of
+one problem to small integers. A `GroundAtom` is a tuple of those integers, so
+atoms hash and compare without any string work. Each textual form is parsed at
+most once per table, and atoms are rendered back to any form on demand.
+
+The table also numbers the atoms themselves. Those dense atom indices are the
+bit positions of the bitset world states in `utils.ground_simulator`, so the
+simulator and the textual parsers share one interning scheme.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Hyphen encoding of propositional task-event symbols; `SymbolNormalizer` uses it too.
+HYPHEN_CHAR = "-"
+HYPHEN_REPLACEMENT = "hh"
+
+_AGENTSPEAK_BARE_TERM_PATTERN = re.compile(r"[a-z][a-z0-9_]*")
+_FUNCTOR_PATTERN = re.compile(r"[^A-Za-z0-9_]+")
+
+
+def agentspeak_functor(predicate: str) -> str:
+	"""Return the AgentSpeak functor the Jason runtime uses for an HDDL predicate."""
+
+	return _FUNCTOR_PATTERN.sub("_", str(predicate).strip()).strip("_") or "term"
+
+
+def agentspeak_term(symbol: str) -> str:
+	"""Return `symbol` as an AgentSpeak atom, quoting it when it is not a bare atom.
+
+	Text that is already quoted is returned unchanged.
+	"""
+
+	token = str(symbol).strip()
+	if _AGENTSPEAK_BARE_TERM_PATTERN.fullmatch(token):
+		return token
+	if len(token) >= 2 and token[0] == token[-1] and token[0] in {'"', "'"}:
+		return token
+	return json.dumps(token)
+
+
+def split_agentspeak_arguments(args_text: str) -> Tuple[str, ...]:
+	"""Split `a, "b,c", f(d,e)` at top-level commas, keeping quotes and nesting."""
+
+	text = str(args_text or "").strip()
+	if not text:
+		return ()
+	parts: List[str] = []
+	current: List[str] = []
+	depth = 0
+	quote: Optional[str] = None
+	for character in text:
+		if quote is not None:
+			current.append(character)
+			if character == quote:
+				quote = None
+			continue
+		if character in {'"', "'"}:
+			quote = character
+			current.append(character)
+			continue
+		if character == "(":
+			depth += 1
+			current.append(character)
+			continue
+		if character == ")":
+			depth = max(0, depth - 1)
+			current.append(character)
+			continue
+		if character == "," and depth == 0:
+			part = "".join(current).strip()
+			if part:
+				parts.append(part)
+			current = []
+			continue
+		current.append(character)
+	part = "".join(current).strip()
+	if part:
+		parts.append(part)
+	return tuple(parts)
+
+
+def agentspeak_atom_parts(text: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+	"""Split `on(a,"b-1")` or `handempty` into its written functor and raw arguments.
+
+	The functor is returned as written (`put-down` stays `put-down`). Text with
+	unbalanced parentheses or whitespace inside the functor returns None.
+	"""
+
+	text = str(text or "").strip()
+	if not text:
+		return None
+	if "(" not in text:
+		if ")" in text:
+			return None
+		return text, ()
+	if not text.endswith(")"):
+		return None
+	functor, args_text = text.split("(", 1)
+	functor = functor.strip()
+	if not functor or any(character.isspace() for character in functor):
+		return None
+	return functor, split_agentspeak_arguments(args_text[:-1])
+
+
+def _unquote_agentspeak_term(term: str) -> str:
+	token = term.strip()
+	if len(token) >= 2 and token[0] == token[-1] and token[0] in {'"', "'"}:
+		if token[0] == '"':
+			try:
+				return str(json.loads(token))
+			except ValueError:
+				pass
+		return token[1:-1]
+	return token
+
+
+def hddl_fact_parts(text: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+	"""Split a positive HDDL fact `(p a b)` into `("p", ("a", "b"))`.
+
+	Negated facts, equality literals and malformed text return None.
+	"""
+
+	text = str(text or "").strip()
+	if not text.startswith("(") or not text.endswith(")"):
+		return None
+	tokens = text[1:-1].split()
+	if not tokens or tokens[0] in {"not", "="}:
+		return None
+	return tokens[0], tuple(tokens[1:])
+
+
+class GroundAtom(tuple):
+	"""`(predicate_id, arg_id, ...)`: one ground atom encoded over a `SymbolTable`."""
+
+	__slots__ = ()
+
+	def __new__(cls, predicate_id: int, argument_ids: Iterable[int] = ()) -> "GroundAtom":
+		return tuple.__new__(cls, (predicate_id, *argument_ids))
+
+	def __getnewargs__(self) -> Tuple[int, Tuple[int, ...]]:
+		return self[0], tuple(self[1:])
+
+	@property
+	def predicate_id(self) -> int:
+		return self[0]
+
+	@property
+	def argument_ids(self) -> Tuple[int, ...]:
+		return tuple(self[1:])
+
+	@property
+	def arity(self) -> int:
+		return len(self) - 1
+
+	def __repr__(self) -> str:
+		return f"GroundAtom{tuple(self)!r}"
+
+
+class SymbolTable:
+	"""Small-integer codes for the predicates, objects and types of one problem.
+
+	Predicates, objects and types share one code space. An atom's position
+	already says whether a code names a predicate or an object. Codes are dense
+	and stable until `clear`, so `GroundAtom`s from one table can be stored in
+	sets, used as dict keys or compared freely. Atoms from different tables, or
+	from before a `clear`, must not be mixed.
+
+	Atoms are numbered separately by `index`; `bit` and `mask` turn them into
+	the int bitsets the ground simulator uses as world states.
+	"""
+
+	def __init__(self, symbols: Iterable[str] = ()) -> None:
+		self._codes: Dict[str, int] = {}
+		self._symbols: List[str] = []
+		self._predicate_codes: Dict[str, int] = {}
+		self._functor_codes: Dict[str, int] = {}
+		self._functors: Dict[int, str] = {}
+		self._object_types: Dict[int, int] = {}
+		self._hddl_atoms: Dict[str, Optional[GroundAtom]] = {}
+		self._agentspeak_atoms: Dict[str, Optional[GroundAtom]] = {}
+		self._agentspeak_texts: Dict[GroundAtom, str] = {}
+		self._propositional_atoms: Dict[str, GroundAtom] = {}
+		self._atom_indices: Dict[GroundAtom, int] = {}
+		self._indexed_atoms: List[GroundAtom] = []
+		for symbol in symbols:
+			self.intern(symbol)
+
+	@classmethod
+	def for_problem(cls, problem: Any, domain: Any = None) -> "SymbolTable":
+		"""Build a table with every type, predicate, object and fact of a parsed problem."""
+
+		table = cls()
+		if domain is not None:
+			for type_name in getattr(domain, "types", ()) or ():
+				if type_name and type_name != "-":
+					table.intern(type_name)
+			for predicate in getattr(domain, "predicates", ()) or ():
+				table.intern_predicate(predicate.name)
+		object_types = dict(getattr(problem, "object_types", {}) or {})
+		for object_name in getattr(problem, "objects", ()) or ():
+			object_code = table.intern(object_name)
+			type_name = object_types.get(object_name)
+			if type_name:
+				table._object_types[object_code] = table.intern(type_name)
+		for fact in (
+			*(getattr(problem, "init_facts", ()) or ()),
+			*(getattr(problem, "goal_facts", ()) or ()),
+		):
+			table.encode_fact(fact)
+		return table
+
+	def __len__(self) -> int:
+		return len(self._symbols)
+
+	def __contains__(self, symbol: object) -> bool:
+		return symbol in self._codes
+
+	@property
+	def atom_count(self) -> int:
+		"""Number of atoms numbered by `index`, i.e. the bitset width."""
+
+		return len(self._indexed_atoms)
+
+	@property
+	def entry_count(self) -> int:
+		"""Symbols, indexed atoms and memoized texts held; callers bound tables by it."""
+
+		return (
+			len(self._symbols)
+			+ len(self._indexed_atoms)
+			+ len(self._hddl_atoms)
+			+ len(self._agentspeak_atoms)
+		)
+
+	def clear(self) -> None:
+		"""Forget every symbol, atom and memoized text."""
+
+		for entries in (
+			self._codes,
+			self._predicate_codes,
+			self._functor_codes,
+			self._functors,
+			self._object_types,
+			self._hddl_atoms,
+			self._agentspeak_atoms,
+			self._agentspeak_texts,
+			self._propositional_atoms,
+			self._atom_indices,
+		):
+			entries.clear()
+		self._symbols.clear()
+		self._indexed_atoms.clear()
+
+	def intern(self, symbol: str) -> int:
+		code = self._codes.get(symbol)
+		if code is None:
+			code = len(self._symbols)
+			self._codes[symbol] = code
+			self._symbols.append(symbol)
+		return code
+
+	def intern_predicate(self, predicate: str) -> int:
+		"""Intern a predicate name and remember its AgentSpeak functor spelling."""
+
+		code = self._predicate_codes.get(predicate)
+		if code is None:
+			code = self.intern(predicate)
+			functor = agentspeak_functor(predicate)
+			self._predicate_codes[predicate] = code
+			self._functor_codes.setdefault(functor, code)
+			self._functors[code] = functor
+		return code
+
+	def code(self, symbol: str) -> Optional[int]:
+		return self._codes.get(symbol)
+
+	def symbol(self, code: int) -> str:
+		return self._symbols[code]
+
+	def object_type(self, object_name: str) -> Optional[str]:
+		"""Return the declared type of a problem object, if the table knows it."""
+
+		type_code = self._object_types.get(self._codes.get(object_name, -1))
+		return None if type_code is None else self._symbols[type_code]
+
+	def atom(self, predicate: str, args: Sequence[str] = ()) -> GroundAtom:
+		intern = self.intern
+		return GroundAtom(self.intern_predicate(predicate), [intern(arg) for arg in args])
+
+	def find(self, predicate: str, args: Sequence[str] = ()) -> Optional[GroundAtom]:
+		"""Return the atom only if every name is already interned; never grows the table.
+
+		A table that is no longer written to can be read this way from several
+		threads.
+		"""
+
+		predicate_code = self._predicate_codes.get(predicate)
+		if predicate_code is None:
+			return None
+		codes = self._codes
+		argument_ids: List[int] = []
+		for arg in args:
+			code = codes.get(arg)
+			if code is None:
+				return None
+			argument_ids.append(code)
+		return GroundAtom(predicate_code, argument_ids)
+
+	def encode_fact(self, fact: Any) -> GroundAtom:
+		"""Encode a parsed `HDDLFact`; its polarity is left to the caller."""
+
+		return self.atom(fact.predicate, fact.args)
+
+	def encode_hddl(self, text: str) -> Optional[GroundAtom]:
+		"""Encode a positive HDDL fact such as `(on a b)`; None for other text."""
+
+		if text in self._hddl_atoms:
+			return self._hddl_atoms[text]
+		parts = hddl_fact_parts(text)
+		encoded = self.atom(*parts) if parts is not None else None
+		self._hddl_atoms[text] = encoded
+		return encoded
+
+	def encode_agentspeak(self, text: str) -> Optional[GroundAtom]:
+		"""Encode a runtime atom such as `on(a,b)`, `at("truck-0",l1)` or `handempty`.
+
+		Quoted arguments are unquoted. A functor that is not a known predicate but
+		spells one in AgentSpeak form (`at_robby` for `at-robby`) maps back to that
+		predicate; any other functor is kept as written. Malformed text is None.
+		"""
+
+		if text in self._agentspeak_atoms:
+			return self._agentspeak_atoms[text]
+		encoded: Optional[GroundAtom] = None
+		parts = agentspeak_atom_parts(text)
+		if parts is not None:
+			functor, raw_args = parts
+			predicate_code = self._predicate_codes.get(functor)
+			if predicate_code is None:
+				predicate_code = self._functor_codes.get(functor)
+			if predicate_code is None:
+				predicate_code = self.intern_predicate(functor)
+			encoded = GroundAtom(
+				predicate_code,
+				[self.intern(_unquote_agentspeak_term(arg)) for arg in raw_args],
+			)
+		self._agentspeak_atoms[text] = encoded
+		return encoded
+
+	def encode_propositional(self, symbol: str) -> Optional[GroundAtom]:
+		"""Return the atom this table rendered as `symbol`, if any.
+
+		Propositional symbols join names with `_`, so they cannot be split back
+		into names in general. Only symbols produced by `decode_propositional`
+		are known.
+		"""
+
+		return self._propositional_atoms.get(symbol)
+
+	def decode_hddl(self, atom: GroundAtom) -> str:
+		symbols = self._symbols
+		return f"({' '.join(symbols[code] for code in atom)})"
+
+	def decode_agentspeak(self, atom: GroundAtom) -> str:
+		text = self._agentspeak_texts.get(atom)
+		if text is None:
+			symbols = self._symbols
+			functor = self.functor(atom)
+			if len(atom) == 1:
+				text = functor
+			else:
+				text = f"{functor}({','.join(agentspeak_term(symbols[code]) for code in atom[1:])})"
+			self._agentspeak_texts[atom] = text
+		return text
+
+	def functor(self, atom: GroundAtom) -> str:
+		"""Return the AgentSpeak functor of an atom's predicate."""
+
+		functor = self._functors.get(atom[0])
+		if functor is None:
+			functor = agentspeak_functor(self._symbols[atom[0]])
+		return functor
+
+	def decode_propositional(self, atom: GroundAtom) -> str:
+		"""Render the task-event symbol `SymbolNormalizer.create_propositional_symbol` builds."""
+
+		symbol = "_".join(
+			self._symbols[code].replace(HYPHEN_CHAR, HYPHEN_REPLACEMENT).lower()
+			for code in atom
+		)
+		self._propositional_atoms.setdefault(symbol, atom)
+		return symbol
+
+	def decode_args(self, atom: GroundAtom) -> Tuple[str, ...]:
+		symbols = self._symbols
+		return tuple(symbols[code] for code in atom[1:])
+
+	def index(self, atom: GroundAtom) -> int:
+		"""Return the dense index of `atom`, numbering it on first use."""
+
+		atom_index = self._atom_indices.get(atom)
+		if atom_index is None:
+			atom_index = len(self._indexed_atoms)
+			self._atom_indices[atom] = atom_index
+			self._indexed_atoms.append(atom)
+		return atom_index
+
+	def bit(self, atom: GroundAtom) -> int:
+		return 1 << self.index(atom)
+
+	def mask(self, atoms: Iterable[GroundAtom]) -> int:
+		state = 0
+		for atom in atoms:
+			state |= 1 << self.index(atom)
+		return state
+
+	def atoms(self, state: int) -> Tuple[GroundAtom, ...]:
+		"""Return the atoms set in the bitset `state`, in index order."""
+
+		atoms: List[GroundAtom] = []
+		while state:
+			low_bit = state & -state
+			atoms.append(self._indexed_atoms[low_bit.bit_length() - 1])
+			state ^= low_bit
+		return tuple(atoms)
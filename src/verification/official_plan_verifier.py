@@ -5,17 +5,49 @@ import os
 import re
 import shutil
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from method_library.synthesis.schema import HTNMethod, HTNMethodLibrary
 from method_library.synthesis.naming import query_root_alias_task_name, sanitize_identifier
 from utils.hddl_parser import HDDLParser
+from utils.symbol_table import SymbolTable
+from verification.primitive_plan_checker import PrimitivePlanCheck, check_primitive_plan_text
+from verification.result_cache import (
+	IPCVerificationResultCache,
+	configured_verification_cache_root,
+	verification_cache_key,
+	verifier_binary_version,
+)
 
 
 _ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 _TEXT_PREVIEW_LIMIT = 2000
+PRIMITIVE_PREFILTER_MODES = ("on", "off", "differential")
+DEFAULT_HIERARCHY_STATE_LIMIT = 100_000
+
+
+def _primitive_prefilter_mode(value: Optional[str] = None) -> str:
+	"""Resolve the pre-filter mode from `value` or `IPC_VERIFIER_PRIMITIVE_PREFILTER`."""
+
+	raw_value = value if value is not None else os.getenv("IPC_VERIFIER_PRIMITIVE_PREFILTER", "")
+	mode = str(raw_value or "").strip().lower()
+	if mode in {"0", "false", "no"}:
+		return "off"
+	return mode if mode in PRIMITIVE_PREFILTER_MODES else "on"
+
+
+def _hierarchy_state_limit() -> int:
+	"""Return the reconstruction state budget from `IPC_VERIFIER_HIERARCHY_STATE_LIMIT`."""
+
+	raw_value = os.getenv("IPC_VERIFIER_HIERARCHY_STATE_LIMIT", "").strip()
+	if not raw_value:
+		return DEFAULT_HIERARCHY_STATE_LIMIT
+	try:
+		return max(1, int(raw_value))
+	except ValueError:
+		return DEFAULT_HIERARCHY_STATE_LIMIT
 
 
 def _compact_text_preview(text: str) -> str:
@@ -47,6 +79,7 @@ class IPCPrimitivePlanVerificationResult:
 	plan_kind: str = "primitive_only"
 	build_warning: Optional[str] = None
 	error: Optional[str] = None
+	metadata: Dict[str, object] = field(default_factory=dict)
 
 	def to_dict(self) -> Dict[str, object]:
 		return {
@@ -65,6 +98,7 @@ class IPCPrimitivePlanVerificationResult:
 			"plan_kind": self.plan_kind,
 			"build_warning": self.build_warning,
 			"error": self.error,
+			"metadata": dict(self.metadata),
 		}
 
 
@@ -94,19 +128,43 @@ class _MethodTraceEntry:
 	task_args: Tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class _FailedExpansion:
+	"""Memo entry for a task expansion that raised ValueError."""
+
+	message: str
+
+
 class IPCPlanVerifier:
-	"""Run the PANDA HTN verifier with best-effort hierarchical plan export."""
+	"""Run the PANDA HTN verifier with best-effort hierarchical plan export.
+
+	`primitive_prefilter` controls the in-process primitive plan check that runs
+	before `pandaPIparser -v`: "on" skips the external verifier when the check
+	proves the primitive plan non-executable, "differential" always runs both and
+	records whether they agree, and "off" disables the check.
+
+	External verdicts of `verify_plan_text` are reused from `result_cache`, which
+	defaults to the opt-in directory configured by `IPC_VERIFIER_RESULT_CACHE_DIR`.
+	"""
 
 	def __init__(
 		self,
 		parser_cmd: str = "pandaPIparser",
 		grounder_cmd: str = "pandaPIgrounder",
 		engine_cmd: str = "pandaPIengine",
+		primitive_prefilter: Optional[str] = None,
+		result_cache: IPCVerificationResultCache | None = None,
 	) -> None:
 		self.parser_cmd = parser_cmd
 		self.grounder_cmd = grounder_cmd
 		self.engine_cmd = engine_cmd
+		self.primitive_prefilter = _primitive_prefilter_mode(primitive_prefilter)
+		if result_cache is None:
+			cache_root = configured_verification_cache_root()
+			result_cache = IPCVerificationResultCache(cache_root) if cache_root is not None else None
+		self.result_cache = result_cache
 		self._last_hierarchical_build_warning: Optional[str] = None
+		self.last_hierarchy_reconstruction_stats: Dict[str, int] = {}
 
 	def tool_available(self) -> bool:
 		return self._resolve_command_head(self.parser_cmd) is not None
@@ -155,12 +213,14 @@ class IPCPlanVerifier:
 		plan_filename: str = "ipc_official_plan.txt",
 		output_filename: str = "ipc_official_verifier.txt",
 		json_filename: str = "ipc_official_verification.json",
+		metadata: Optional[Dict[str, object]] = None,
 	) -> IPCPrimitivePlanVerificationResult:
 		output_path = Path(output_dir).resolve()
 		output_path.mkdir(parents=True, exist_ok=True)
 		plan_path = output_path / plan_filename
 		output_text_path = output_path / output_filename
 		output_json_path = output_path / json_filename
+		result_metadata: Dict[str, object] = dict(metadata or {})
 
 		plan_path.write_text(str(plan_text))
 		resolved_parser = self._resolve_command_head(self.parser_cmd) or self.parser_cmd
@@ -187,21 +247,100 @@ class IPCPlanVerifier:
 				plan_kind=plan_kind,
 				build_warning=build_warning,
 				error=f"{self.parser_cmd} is not available on PATH",
+				metadata=result_metadata,
 			)
 			output_json_path.write_text(json.dumps(result.to_dict(), indent=2))
 			return result
 
-		completed = subprocess.run(
-			command,
-			text=True,
-			capture_output=True,
-			check=False,
-		)
-		stdout = self.strip_ansi(completed.stdout)
-		stderr = self.strip_ansi(completed.stderr)
-		combined = self._combine_output(stdout, stderr)
-		output_text_path.write_text(combined)
+		prefilter_check: Optional[PrimitivePlanCheck] = None
+		if self.primitive_prefilter != "off":
+			prefilter_check = check_primitive_plan_text(
+				domain_file=domain_file,
+				problem_file=problem_file,
+				plan_text=str(plan_text),
+			)
+		if self.primitive_prefilter == "on" and prefilter_check is not None and prefilter_check.rejects:
+			output_text_path.write_text(
+				f"Primitive plan pre-filter: {prefilter_check.message}\n"
+				"Primitive plan alone executable: false\n",
+			)
+			result = IPCPrimitivePlanVerificationResult(
+				tool_available=True,
+				command=command,
+				plan_file=str(plan_path),
+				output_file=str(output_text_path),
+				stdout="",
+				stderr="",
+				primitive_plan_only=plan_kind == "primitive_only",
+				primitive_plan_executable=False,
+				verification_result=False,
+				reached_goal_state=False,
+				plan_kind=plan_kind,
+				build_warning=build_warning,
+				error=None,
+				metadata={
+					**result_metadata,
+					"primitive_prefilter": self._primitive_prefilter_metadata(
+						prefilter_check,
+						external_skipped=True,
+					),
+				},
+			)
+			output_json_path.write_text(json.dumps(result.to_dict(), indent=2))
+			return result
 
+		cache_key: Optional[str] = None
+		verdict: Optional[Dict[str, Any]] = None
+		if self.result_cache is not None:
+			cache_key = verification_cache_key(
+				domain_file=domain_file,
+				problem_file=problem_file,
+				plan_text=str(plan_text),
+				verifier_version=verifier_binary_version(resolved_parser),
+			)
+			verdict = self.result_cache.get(cache_key)
+		cache_hit = verdict is not None
+		if verdict is None:
+			completed = subprocess.run(
+				command,
+				text=True,
+				capture_output=True,
+				check=False,
+			)
+			stdout = self.strip_ansi(completed.stdout)
+			stderr = self.strip_ansi(completed.stderr)
+			combined = self._combine_output(stdout, stderr)
+			verdict = {
+				"stdout": stdout,
+				"stderr": stderr,
+				"primitive_plan_only": "Primitive plan only" in combined,
+				"primitive_plan_executable": self._extract_executability(combined),
+				"verification_result": self._extract_bool(
+					combined,
+					"Plan verification result",
+				),
+				"reached_goal_state": self._infer_goal_reached(combined),
+				"error": None if completed.returncode == 0 else f"verifier exited with code {completed.returncode}",
+			}
+			conclusive = (
+				verdict["primitive_plan_executable"] is not None
+				or verdict["verification_result"] is not None
+			)
+			if self.result_cache is not None and cache_key is not None and conclusive:
+				self.result_cache.put(cache_key, verdict)
+		stdout = str(verdict.get("stdout") or "")
+		stderr = str(verdict.get("stderr") or "")
+		output_text_path.write_text(self._combine_output(stdout, stderr))
+
+		if cache_key is not None:
+			result_metadata["verification_cache"] = {"hit": cache_hit, "key": cache_key}
+		if prefilter_check is not None:
+			result_metadata["primitive_prefilter"] = self._primitive_prefilter_metadata(
+				prefilter_check,
+				external_skipped=False,
+				external_executable=verdict.get("primitive_plan_executable"),
+				external_goal_reached=verdict.get("reached_goal_state"),
+			)
 		result = IPCPrimitivePlanVerificationResult(
 			tool_available=True,
 			command=command,
@@ -209,20 +348,40 @@ class IPCPlanVerifier:
 			output_file=str(output_text_path),
 			stdout=stdout,
 			stderr=stderr,
-			primitive_plan_only="Primitive plan only" in combined,
-			primitive_plan_executable=self._extract_executability(combined),
-			verification_result=self._extract_bool(
-				combined,
-				"Plan verification result",
-			),
-			reached_goal_state=self._infer_goal_reached(combined),
+			primitive_plan_only=verdict.get("primitive_plan_only"),
+			primitive_plan_executable=verdict.get("primitive_plan_executable"),
+			verification_result=verdict.get("verification_result"),
+			reached_goal_state=verdict.get("reached_goal_state"),
 			plan_kind=plan_kind,
 			build_warning=build_warning,
-			error=None if completed.returncode == 0 else f"verifier exited with code {completed.returncode}",
+			error=verdict.get("error"),
+			metadata=result_metadata,
 		)
 		output_json_path.write_text(json.dumps(result.to_dict(), indent=2))
 		return result
 
+	def _primitive_prefilter_metadata(
+		self,
+		check: PrimitivePlanCheck,
+		*,
+		external_skipped: bool,
+		external_executable: Optional[bool] = None,
+		external_goal_reached: Optional[bool] = None,
+	) -> Dict[str, object]:
+		agrees: Optional[bool] = None
+		if not external_skipped and check.executable is not None and external_executable is not None:
+			agrees = check.executable == external_executable and (
+				external_goal_reached is None or check.goal_reached == external_goal_reached
+			)
+		return {
+			"mode": self.primitive_prefilter,
+			"external_skipped": external_skipped,
+			"agrees": agrees,
+			"external_executable": external_executable,
+			"external_goal_reached": external_goal_reached,
+			**check.to_dict(),
+		}
+
 	def verify_primitive_plan(
 		self,
 		*,
@@ -419,17 +578,15 @@ class IPCPlanVerifier:
 		json_filename: str,
 		prefer_hierarchical: bool,
 	) -> IPCPrimitivePlanVerificationResult:
-		output_path = Path(output_dir).resolve()
-		output_path.mkdir(parents=True, exist_ok=True)
-		plan_path = output_path / plan_filename
-		output_text_path = output_path / output_filename
-		output_json_path = output_path / json_filename
-
 		build_warning = None
 		plan_kind = "primitive_only"
-		plan_text = self.render_primitive_only_plan(action_path)
+		# Both plan renderings parse the same steps; intern them once per problem.
+		symbols = SymbolTable()
+		plan_text = self.render_primitive_only_plan(action_path, symbols=symbols)
+		metadata: Dict[str, object] = {}
 		if prefer_hierarchical:
 			self._last_hierarchical_build_warning = None
+			self.last_hierarchy_reconstruction_stats = {}
 			try:
 				rendered = self._render_supported_hierarchical_plan(
 					domain_file=domain_file,
@@ -437,6 +594,7 @@ class IPCPlanVerifier:
 					action_path=action_path,
 					method_library=method_library,
 					method_trace=method_trace,
+					symbols=symbols,
 				)
 			except Exception as exc:
 				rendered = None
@@ -446,67 +604,20 @@ class IPCPlanVerifier:
 				plan_kind = "hierarchical"
 				if build_warning is None:
 					build_warning = self._last_hierarchical_build_warning
-		plan_path.write_text(plan_text)
-
-		resolved_parser = self._resolve_command_head(self.parser_cmd) or self.parser_cmd
-		command = [
-			resolved_parser,
-			"-v",
-			str(Path(domain_file).resolve()),
-			str(Path(problem_file).resolve()),
-			str(plan_path),
-		]
-
-		if not self.tool_available():
-			result = IPCPrimitivePlanVerificationResult(
-				tool_available=False,
-				command=command,
-				plan_file=str(plan_path),
-				output_file=str(output_text_path),
-				stdout="",
-				stderr="",
-				primitive_plan_only=None,
-				primitive_plan_executable=None,
-				verification_result=None,
-				reached_goal_state=None,
-				plan_kind=plan_kind,
-				build_warning=build_warning,
-				error=f"{self.parser_cmd} is not available on PATH",
-			)
-			output_json_path.write_text(json.dumps(result.to_dict(), indent=2))
-			return result
-
-		completed = subprocess.run(
-			command,
-			text=True,
-			capture_output=True,
-			check=False,
-		)
-		stdout = self.strip_ansi(completed.stdout)
-		stderr = self.strip_ansi(completed.stderr)
-		combined = self._combine_output(stdout, stderr)
-		output_text_path.write_text(combined)
-
-		result = IPCPrimitivePlanVerificationResult(
-			tool_available=True,
-			command=command,
-			plan_file=str(plan_path),
-			output_file=str(output_text_path),
-			stdout=stdout,
-			stderr=stderr,
-			primitive_plan_only="Primitive plan only" in combined,
-			primitive_plan_executable=self._extract_executability(combined),
-			verification_result=self._extract_bool(
-				combined,
-				"Plan verification result",
-			),
-			reached_goal_state=self._infer_goal_reached(combined),
+			if self.last_hierarchy_reconstruction_stats:
+				metadata["hierarchy_reconstruction"] = dict(self.last_hierarchy_reconstruction_stats)
+		return self.verify_plan_text(
+			domain_file=domain_file,
+			problem_file=problem_file,
+			plan_text=plan_text,
+			output_dir=output_dir,
 			plan_kind=plan_kind,
 			build_warning=build_warning,
-			error=None if completed.returncode == 0 else f"verifier exited with code {completed.returncode}",
+			plan_filename=plan_filename,
+			output_filename=output_filename,
+			json_filename=json_filename,
+			metadata=metadata,
 		)
-		output_json_path.write_text(json.dumps(result.to_dict(), indent=2))
-		return result
 
 	def _resolve_command_head(self, command: str) -> Optional[str]:
 		head = self._command_head(command)
@@ -549,10 +660,15 @@ class IPCPlanVerifier:
 		return parts[0] if parts else str(command)
 
 	@staticmethod
-	def render_primitive_only_plan(action_path: Sequence[str]) -> str:
+	def render_primitive_only_plan(
+		action_path: Sequence[str],
+		*,
+		symbols: SymbolTable | None = None,
+	) -> str:
+		symbols = symbols if symbols is not None else SymbolTable()
 		lines = ["==>"]
 		for index, action_step in enumerate(action_path):
-			name, args = IPCPlanVerifier._parse_action_step(action_step)
+			name, args = IPCPlanVerifier._parse_action_step(action_step, symbols)
 			lines.append(" ".join([str(index), name, *args]).rstrip())
 		lines.append("root")
 		return "\n".join(lines) + "\n"
@@ -565,6 +681,7 @@ class IPCPlanVerifier:
 		action_path: Sequence[str],
 		method_library: HTNMethodLibrary | None,
 		method_trace: Sequence[Dict[str, Any]] | None,
+		symbols: SymbolTable | None = None,
 	) -> Optional[str]:
 		problem = HDDLParser.parse_problem(str(problem_file))
 		if method_library is None or not method_library.methods:
@@ -574,7 +691,8 @@ class IPCPlanVerifier:
 		if not problem.htn_tasks:
 			return None
 
-		actions = [self._parse_action_step(step) for step in action_path]
+		symbols = symbols if symbols is not None else SymbolTable()
+		actions = [self._parse_action_step(step, symbols) for step in action_path]
 		trace_entries = self._normalise_method_trace(method_trace)
 		root_tasks = list(problem.htn_tasks)
 		root_tasks_ordered = bool(problem.htn_ordered)
@@ -666,12 +784,52 @@ class IPCPlanVerifier:
 		if len(method_lookup) != len(method_library.methods):
 			raise ValueError("method library contains duplicate method names")
 
+		# Expanding a task is a pure function of the task and the two cursors, so every
+		# outcome, including ValueError failures, is memoised. Root-task retries and
+		# alternative internal task names then never re-expand the same subproblem.
+		state_limit = _hierarchy_state_limit()
+		stats = {"explored_states": 0, "memo_hits": 0, "failed_states": 0, "state_limit": state_limit}
+		self.last_hierarchy_reconstruction_stats = stats
+		_TaskKey = Tuple[str, Tuple[str, ...], str, int, int]
+		memo: Dict[_TaskKey, Union[Tuple[_AbstractNode, int, int], _FailedExpansion]] = {}
+
 		def reconstruct_task(
 			task_name: str,
 			task_args: Tuple[str, ...],
 			source_task_name: str,
 			action_index: int,
 			trace_index: int,
+		) -> Tuple[_AbstractNode, int, int]:
+			key = (task_name, tuple(task_args), source_task_name, action_index, trace_index)
+			cached = memo.get(key)
+			if cached is not None:
+				stats["memo_hits"] += 1
+				if isinstance(cached, _FailedExpansion):
+					raise ValueError(cached.message)
+				return cached
+			if stats["explored_states"] >= state_limit:
+				raise ValueError(
+					f"hierarchy reconstruction exceeded {state_limit} explored states",
+				)
+			stats["explored_states"] += 1
+			try:
+				outcome = expand_task(*key)
+			except ValueError as exc:
+				stats["failed_states"] += 1
+				memo[key] = _FailedExpansion(str(exc))
+				raise
+			except Exception:
+				stats["failed_states"] += 1
+				raise
+			memo[key] = outcome
+			return outcome
+
+		def expand_task(
+			task_name: str,
+			task_args: Tuple[str, ...],
+			source_task_name: str,
+			action_index: int,
+			trace_index: int,
 		) -> Tuple[_AbstractNode, int, int]:
 			next_action_index = action_index
 			next_trace_index = trace_index
@@ -1168,15 +1326,11 @@ class IPCPlanVerifier:
 		return ordered_steps
 
 	@staticmethod
-	def _parse_action_step(action_step: str) -> _ActionStep:
-		bare = action_step.strip()
-		if bare and "(" not in bare and ")" not in bare:
-			return bare, ()
-		match = re.fullmatch(r"([^\s(]+)\((.*)\)", action_step.strip())
-		if match is None:
+	def _parse_action_step(action_step: str, symbols: SymbolTable) -> _ActionStep:
+		encoded = symbols.encode_agentspeak(action_step)
+		if encoded is None:
 			raise ValueError(f"Invalid action_path step for IPC verifier: {action_step}")
-		args = tuple(arg.strip() for arg in match.group(2).split(",") if arg.strip())
-		return match.group(1), args
+		return symbols.symbol(encoded.predicate_id), symbols.decode_args(encoded)
 
 	@staticmethod
 	def _action_names_match(expected_action_name: str, actual_action_name: str) -> bool:
@@ -0,0 +1,298 @@
+"""
+In-process primitive plan checker used as a pre-filter for `pandaPIparser -v`.
+
+The checker takes the parsed action semantics from the shared `CompiledDomain`,
+compiles them into a bitset `GroundActionSimulator` and replays the primitive
+part of a plan from the problem's initial state. Its verdict mirrors what
+`IPCPlanVerifier._extract_executability` and `_infer_goal_reached` read from the
+external verifier's output.
+
+The check can only ever reject: a precondition violation proves the plan
+non-executable, and that is the one result the verifier may act on without
+running `pandaPIparser -v`. Every other outcome, including an executable replay
+that reaches the goal, defers to the external verifier. The check does not cover
+everything the verifier checks (method structure, for one), so a plan it
+replays cleanly can still be rejected there. Steps whose arguments do not match
+the declared parameter types, and plans that name unknown actions, use the
+wrong arity or cannot be parsed, are left to the external verifier.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from domain_model.compiled_domain import compile_domain
+from utils.ground_simulator import GroundActionSimulator, render_hddl_atom
+from utils.hddl_condition_parser import HDDLLiteralPattern, UnsupportedHDDLConstructError
+from utils.hddl_parse_cache import load_parsed_domain, load_parsed_problem
+
+
+_PrimitiveStep = Tuple[str, Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class PrimitivePlanCheck:
+	"""Verdict of one in-process primitive plan check.
+
+	`executable` and `goal_reached` are None when the check is inconclusive and the
+	external verifier has to decide.
+	"""
+
+	executable: Optional[bool]
+	goal_reached: Optional[bool]
+	checked_steps: int
+	failure: Optional[str] = None
+	message: Optional[str] = None
+	missing_goal_facts: Tuple[str, ...] = ()
+
+	@property
+	def rejects(self) -> bool:
+		return self.executable is False
+
+	def to_dict(self) -> Dict[str, object]:
+		return {
+			"executable": self.executable,
+			"goal_reached": self.goal_reached,
+			"checked_steps": self.checked_steps,
+			"failure": self.failure,
+			"message": self.message,
+			"missing_goal_facts": list(self.missing_goal_facts),
+		}
+
+
+def _literal_dict(pattern: HDDLLiteralPattern) -> Dict[str, Any]:
+	return {
+		"predicate": pattern.predicate.lower(),
+		"args": [arg.lower() for arg in pattern.args],
+		"is_positive": pattern.is_positive,
+	}
+
+
+class PrimitivePlanChecker:
+	"""Replay primitive plan steps of one domain/problem pair."""
+
+	def __init__(self, domain: Any, problem: Any) -> None:
+		compiled = compile_domain(domain)
+		schemas: List[Dict[str, Any]] = []
+		self._compiled = compiled
+		# Declared parameter types per lowered action name; None when they cannot be read.
+		self._action_types: Dict[str, Optional[Tuple[str, ...]]] = {}
+		for index, action in enumerate(getattr(domain, "actions", []) or []):
+			parsed = compiled.parsed_action_at(index)
+			declared_types = compiled.action_types.get(str(action.name).strip())
+			if declared_types is not None and len(declared_types) != len(parsed.parameters):
+				declared_types = None
+			self._action_types.setdefault(parsed.name.lower(), declared_types)
+			schemas.append(
+				{
+					"functor": parsed.name.lower(),
+					"parameters": [parameter.lower() for parameter in parsed.parameters],
+					"precondition_clauses": [
+						[_literal_dict(pattern) for pattern in clause]
+						for clause in parsed.precondition_clauses
+					],
+					"precondition_factors": [
+						[[_literal_dict(pattern) for pattern in clause] for clause in factor]
+						for factor in parsed.precondition_factors
+					],
+					"effects": [_literal_dict(pattern) for pattern in parsed.effects],
+				},
+			)
+		self.simulator = GroundActionSimulator(schemas, syntax="hddl")
+		self._lock = threading.Lock()
+		object_types = dict(getattr(problem, "object_types", {}) or {})
+		self._object_types = {
+			str(name).lower(): object_types.get(name) or "object"
+			for name in getattr(problem, "objects", []) or []
+		}
+		self._initial_facts = tuple(
+			render_hddl_atom(fact.predicate.lower(), [arg.lower() for arg in fact.args])
+			for fact in getattr(problem, "init_facts", []) or []
+			if fact.is_positive and fact.predicate != "="
+		)
+		goal_facts = [
+			fact
+			for fact in getattr(problem, "goal_facts", []) or []
+			if fact.predicate != "="
+		]
+		self._goal_facts = tuple(
+			render_hddl_atom(fact.predicate.lower(), [arg.lower() for arg in fact.args])
+			for fact in goal_facts
+			if fact.is_positive
+		)
+		self._goal_negative_facts = tuple(
+			render_hddl_atom(fact.predicate.lower(), [arg.lower() for arg in fact.args])
+			for fact in goal_facts
+			if not fact.is_positive
+		)
+
+	@classmethod
+	def for_files(cls, domain_file: str | Path, problem_file: str | Path) -> "PrimitivePlanChecker":
+		"""Return a checker for the files, reusing it while neither file changes."""
+
+		domain_path = Path(domain_file).resolve()
+		problem_path = Path(problem_file).resolve()
+		return _cached_checker(
+			str(domain_path),
+			_file_signature(domain_path),
+			str(problem_path),
+			_file_signature(problem_path),
+		)
+
+	def initial_state(self) -> int:
+		return self.simulator.initial_state(self._initial_facts)
+
+	def check_steps(self, steps: Sequence[_PrimitiveStep]) -> PrimitivePlanCheck:
+		lowered = [
+			(str(name).lower(), tuple(str(arg).lower() for arg in args))
+			for name, args in steps
+		]
+		# Checkers are shared through the file cache; the simulator interns lazily.
+		with self._lock:
+			return self._check_lowered_steps(lowered)
+
+	def _first_mistyped_step(self, lowered: Sequence[_PrimitiveStep]) -> Optional[int]:
+		"""Index of the first step whose arguments do not fit the declared parameter types."""
+
+		compiled = self._compiled
+		for index, (name, args) in enumerate(lowered):
+			if name not in self._action_types:
+				continue
+			declared_types = self._action_types[name]
+			if declared_types is None or len(declared_types) != len(args):
+				return index
+			for arg, expected_type in zip(args, declared_types):
+				object_type = self._object_types.get(arg)
+				if object_type is None or not compiled.is_subtype(object_type, expected_type):
+					return index
+		return None
+
+	def _check_lowered_steps(self, lowered: Sequence[_PrimitiveStep]) -> PrimitivePlanCheck:
+		simulator = self.simulator
+		state = self.initial_state()
+		mistyped_index = self._first_mistyped_step(lowered)
+		if mistyped_index is not None:
+			# Only a precondition violation before the mistyped step stays conclusive.
+			replay = simulator.replay(lowered[:mistyped_index], state)
+			if replay.failure != "precondition_violation":
+				name, args = lowered[mistyped_index]
+				return PrimitivePlanCheck(
+					executable=None,
+					goal_reached=None,
+					checked_steps=mistyped_index,
+					failure="parameter_type_mismatch",
+					message=(
+						f"primitive step #{mistyped_index + 1} "
+						f"{render_hddl_atom(name, args)}: parameter_type_mismatch"
+					),
+				)
+		else:
+			replay = simulator.replay(lowered, state)
+		# Steps are numbered from 1 in messages; `checked_steps` is the failing index.
+		step_number = replay.checked_steps + 1
+		if replay.failure == "precondition_violation":
+			name, args = lowered[replay.checked_steps]
+			return PrimitivePlanCheck(
+				executable=False,
+				goal_reached=False,
+				checked_steps=replay.checked_steps,
+				failure=replay.failure,
+				message=(
+					f"primitive step #{step_number} "
+					f"{render_hddl_atom(name, args)} is not applicable"
+				),
+			)
+		if replay.failure is not None:
+			name, args = lowered[replay.checked_steps]
+			return PrimitivePlanCheck(
+				executable=None,
+				goal_reached=None,
+				checked_steps=replay.checked_steps,
+				failure=replay.failure,
+				message=f"primitive step #{step_number} {render_hddl_atom(name, args)}: {replay.failure}",
+			)
+		missing = simulator.missing_goal_atoms(replay.state, simulator.goal_mask(self._goal_facts))
+		violated = simulator.state_atoms(replay.state & simulator.goal_mask(self._goal_negative_facts))
+		return PrimitivePlanCheck(
+			executable=True,
+			goal_reached=not missing and not violated,
+			checked_steps=replay.checked_steps,
+			missing_goal_facts=tuple(missing) + tuple(f"(not {fact})" for fact in violated),
+		)
+
+	def check_plan_text(self, plan_text: str) -> PrimitivePlanCheck:
+		steps = primitive_steps_from_plan_text(plan_text)
+		if steps is None:
+			return PrimitivePlanCheck(
+				executable=None,
+				goal_reached=None,
+				checked_steps=0,
+				failure="unparsed_plan",
+				message="plan text has no readable primitive section",
+			)
+		return self.check_steps(steps)
+
+
+def primitive_steps_from_plan_text(plan_text: str) -> Optional[List[_PrimitiveStep]]:
+	"""Return the primitive steps of a pandaPI plan in listed order, or None if unreadable."""
+
+	lines = [line.strip() for line in str(plan_text or "").splitlines()]
+	if "==>" not in lines:
+		return None
+	steps: List[_PrimitiveStep] = []
+	for line in lines[lines.index("==>") + 1:]:
+		if not line:
+			continue
+		if line.startswith("root") or line == "<==":
+			break
+		tokens = line.split()
+		if not re.fullmatch(r"\d+", tokens[0]) or len(tokens) < 2:
+			return None
+		steps.append((tokens[1], tuple(tokens[2:])))
+	return steps
+
+
+def check_primitive_plan_text(
+	*,
+	domain_file: str | Path,
+	problem_file: str | Path,
+	plan_text: str,
+) -> PrimitivePlanCheck:
+	"""Check `plan_text`, reporting unsupported domains as inconclusive."""
+
+	try:
+		checker = PrimitivePlanChecker.for_files(domain_file, problem_file)
+	except (UnsupportedHDDLConstructError, AttributeError, OSError, ValueError) as exc:
+		return PrimitivePlanCheck(
+			executable=None,
+			goal_reached=None,
+			checked_steps=0,
+			failure="unsupported_domain",
+			message=str(exc),
+		)
+	return checker.check_plan_text(plan_text)
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+	stat = path.stat()
+	return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _cached_checker(
+	domain_path: str,
+	domain_signature: Tuple[int, int],
+	problem_path: str,
+	problem_signature: Tuple[int, int],
+) -> PrimitivePlanChecker:
+	# The shared parse cache hands out the same domain object the verifier and the
+	# rest of the pipeline use, so its `CompiledDomain` is shared as well.
+	return PrimitivePlanChecker(
+		load_parsed_domain(domain_path),
+		load_parsed_problem(problem_path),
+	)
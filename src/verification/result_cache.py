@@ -0,0 +1,197 @@
+"""
+Content-addressed cache of external plan-verifier verdicts.
+
+Sweeps and incremental library runs often verify byte-identical
+(domain, problem, plan text) triples again. A verdict of `pandaPIparser -v`
+depends only on those three inputs and on the verifier binary, so it is stored
+under the SHA-256 of all four and reused across processes and runs.
+
+The cache is opt-in (`IPC_VERIFIER_RESULT_CACHE_DIR`). Entries keep the full
+verifier output, so a hit reproduces the same artefacts as a fresh run. The
+directory is capped by total size, and the least recently used entries are
+evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+VERIFICATION_CACHE_VERSION = 2
+DEFAULT_VERIFICATION_CACHE_ROOT = Path(__file__).resolve().parent / ".verification_cache"
+DEFAULT_VERIFICATION_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Puts between directory rescans that pick up entries written by other processes.
+VERIFICATION_CACHE_RESCAN_PUTS = 256
+
+
+def verification_cache_key(
+	*,
+	domain_file: str | Path,
+	problem_file: str | Path,
+	plan_text: str,
+	verifier_version: str,
+) -> str:
+	"""Return the SHA-256 key of one verification request."""
+
+	digest = hashlib.sha256()
+	for part in (
+		str(VERIFICATION_CACHE_VERSION).encode("ascii"),
+		Path(domain_file).read_bytes(),
+		Path(problem_file).read_bytes(),
+		str(plan_text).encode("utf-8"),
+		str(verifier_version).encode("utf-8"),
+	):
+		digest.update(str(len(part)).encode("ascii"))
+		digest.update(b":")
+		digest.update(part)
+	return digest.hexdigest()
+
+
+def verifier_binary_version(binary: Optional[str]) -> str:
+	"""Fingerprint a verifier executable by name, size and modification time."""
+
+	if not binary:
+		return "missing"
+	path = Path(binary)
+	try:
+		stat = path.stat()
+	except OSError:
+		return f"{path.name}:missing"
+	return f"{path.name}:{stat.st_size}:{int(stat.st_mtime_ns)}"
+
+
+def configured_verification_cache_root() -> Optional[Path]:
+	"""Return the cache directory from `IPC_VERIFIER_RESULT_CACHE_DIR`, or None when disabled.
+
+	The cache is off unless the variable is set. `on` selects the default
+	directory next to this module; `off`, `0`, `false` or `no` keep it disabled.
+	"""
+
+	raw_value = os.getenv("IPC_VERIFIER_RESULT_CACHE_DIR", "").strip()
+	if not raw_value or raw_value.lower() in {"off", "0", "false", "no"}:
+		return None
+	if raw_value.lower() in {"on", "1", "true", "yes"}:
+		return DEFAULT_VERIFICATION_CACHE_ROOT
+	return Path(raw_value).expanduser().resolve()
+
+
+def configured_verification_cache_max_bytes() -> int:
+	"""Return the cache size cap from `IPC_VERIFIER_RESULT_CACHE_MAX_BYTES`."""
+
+	raw_value = os.getenv("IPC_VERIFIER_RESULT_CACHE_MAX_BYTES", "").strip()
+	if not raw_value:
+		return DEFAULT_VERIFICATION_CACHE_MAX_BYTES
+	try:
+		return max(1, int(raw_value))
+	except ValueError:
+		return DEFAULT_VERIFICATION_CACHE_MAX_BYTES
+
+
+class IPCVerificationResultCache:
+	"""Directory of JSON verdict entries, one file per content key.
+
+	Entries are written to a temporary file and published with an atomic rename,
+	so concurrent verifiers sharing one root never read a partial entry. A hit
+	refreshes the entry's modification time.
+
+	Writes keep a running estimate of the directory size instead of scanning it.
+	The directory is only scanned on the first write, when the estimate passes
+	`max_bytes`, and every `VERIFICATION_CACHE_RESCAN_PUTS` writes. A scan that
+	finds the directory too large removes the oldest entries until it fits.
+	"""
+
+	def __init__(self, root: str | Path, *, max_bytes: Optional[int] = None) -> None:
+		self.root = Path(root).resolve()
+		self.max_bytes = max(
+			1,
+			int(max_bytes if max_bytes is not None else configured_verification_cache_max_bytes()),
+		)
+		self._lock = threading.Lock()
+		self._estimated_bytes: Optional[int] = None
+		self._puts_since_scan = 0
+		self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "scans": 0}
+
+	def entry_path(self, key: str) -> Path:
+		return self.root / key[:2] / f"{key}.json"
+
+	def get(self, key: str) -> Optional[Dict[str, Any]]:
+		try:
+			payload = json.loads(self.entry_path(key).read_text())
+		except (OSError, ValueError):
+			payload = None
+		if not isinstance(payload, dict) or payload.get("cache_version") != VERIFICATION_CACHE_VERSION:
+			payload = None
+		else:
+			try:
+				os.utime(self.entry_path(key))
+			except OSError:
+				pass
+		with self._lock:
+			self.stats["misses" if payload is None else "hits"] += 1
+		return payload
+
+	def put(self, key: str, payload: Dict[str, Any]) -> None:
+		entry = self.entry_path(key)
+		staging: Optional[str] = None
+		added_bytes = 0
+		try:
+			entry.parent.mkdir(parents=True, exist_ok=True)
+			handle, staging = tempfile.mkstemp(prefix=f".{key[:16]}-", dir=entry.parent)
+			with os.fdopen(handle, "w") as stream:
+				json.dump({**payload, "cache_version": VERIFICATION_CACHE_VERSION}, stream)
+			added_bytes = os.stat(staging).st_size
+			try:
+				added_bytes -= entry.stat().st_size
+			except OSError:
+				pass
+			os.replace(staging, entry)
+			staging = None
+		except OSError:
+			# A read-only or full cache directory only costs the reuse.
+			pass
+		finally:
+			if staging is not None and os.path.exists(staging):
+				os.unlink(staging)
+		with self._lock:
+			self._puts_since_scan += 1
+			if self._estimated_bytes is not None:
+				self._estimated_bytes += added_bytes
+			needs_scan = (
+				self._estimated_bytes is None
+				or self._estimated_bytes > self.max_bytes
+				or self._puts_since_scan >= VERIFICATION_CACHE_RESCAN_PUTS
+			)
+		if needs_scan:
+			self._evict()
+
+	def _evict(self) -> None:
+		entries = []
+		total_bytes = 0
+		for path in self.root.glob("*/*.json"):
+			try:
+				stat = path.stat()
+			except OSError:
+				continue
+			entries.append((stat.st_mtime_ns, stat.st_size, path))
+			total_bytes += stat.st_size
+		evicted = 0
+		for _, size, path in sorted(entries):
+			if total_bytes <= self.max_bytes:
+				break
+			try:
+				path.unlink()
+			except OSError:
+				continue
+			total_bytes -= size
+			evicted += 1
+		with self._lock:
+			self._estimated_bytes = total_bytes
+			self._puts_since_scan = 0
+			self.stats["scans"] += 1
+			self.stats["evictions"] += evicted
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+	sys.path.insert(0, str(SRC_ROOT))
+
+from domain_model import CompiledDomain, compile_domain
+from utils.hddl_parser import HDDLParser
+
+TRANSPORT_DOMAIN_FILE = PROJECT_ROOT / "src" / "domains" / "transport" / "domain.hddl"
+
+
+def test_compile_domain_shares_one_index_per_parsed_domain() -> None:
+	domain = HDDLParser.parse_domain(str(TRANSPORT_DOMAIN_FILE))
+
+	compiled = compile_domain(domain)
+
+	assert compile_domain(domain) is compiled
+	assert compile_domain(compiled) is compiled
+	assert compile_domain(HDDLParser.parse_domain(str(TRANSPORT_DOMAIN_FILE))) is not compiled
+	assert compiled.type_parent_map["vehicle"] == "locatable"
+	assert compiled.type_parent_map["object"] is None
+	assert compiled.is_subtype("vehicle", "object")
+	assert compiled.is_subtype("package", "locatable")
+	assert not compiled.is_subtype("locatable", "vehicle")
+	assert not compiled.is_subtype("vehicle", "undeclared")
+	assert compiled.predicate_types["road"] == ("location", "location")
+	assert compiled.action_types["drive"] == ("vehicle", "location", "location")
+	assert set(compiled.parsed_actions) == {action.name for action in domain.actions}
+	assert "at" in compiled.mutable_predicates
+	assert "road" not in compiled.mutable_predicates
+
+
+def test_compiled_domain_keeps_action_parse_errors_per_action() -> None:
+	domain = SimpleNamespace(
+		types=["block"],
+		predicates=[SimpleNamespace(name="clear", parameters=["?x - block"])],
+		actions=[
+			SimpleNamespace(
+				name="pick",
+				parameters=["?x - block"],
+				preconditions="(clear ?x)",
+				effects="(not (clear ?x))",
+			),
+			SimpleNamespace(name="noop", parameters=[]),
+		],
+		tasks=[],
+		methods=[
+			SimpleNamespace(name="m-pick", parameters=["?x - block", "?y"]),
+		],
+	)
+
+	compiled = compile_domain(domain)
+
+	assert isinstance(compiled, CompiledDomain)
+	assert compile_domain(domain) is not compiled
+	assert compiled.parsed_action_at(0).name == "pick"
+	with pytest.raises(AttributeError) as first:
+		compiled.parsed_action_at(1)
+	with pytest.raises(AttributeError) as second:
+		compiled.parsed_action_at(1)
+	assert first.value is not second.value
+	assert first.value.__cause__ is compiled.action_parse_results[1]
+	assert second.value.__cause__ is compiled.action_parse_results[1]
+	assert set(compiled.parsed_actions) == {"pick"}
+	assert compiled.mutable_predicates == frozenset({"clear"})
+	assert dict(compiled.method_parameter_types["m-pick"]) == {"?x": "block", "?y": "object"}
+
+
+def test_problem_argument_validation_checks_subtypes_through_compiled_domain() -> None:
+	from evaluation.runtime_context import validate_problem_arguments_against_signature
+
+	compiled = compile_domain(HDDLParser.parse_domain(str(TRANSPORT_DOMAIN_FILE)))
+	object_types = {"truck-0": "vehicle", "package-0": "package", "city-loc-0": "location"}
+
+	validate_problem_arguments_against_signature(
+		args=("truck-0", "city-loc-0"),
+		signature=("locatable", "location"),
+		object_types=object_types,
+		domain_type_names=set(compiled.type_names),
+		compiled_domain=compiled,
+		scope="fact 'at'",
+	)
+	with pytest.raises(ValueError, match="expected 'vehicle'"):
+		validate_problem_arguments_against_signature(
+			args=("package-0",),
+			signature=("vehicle",),
+			object_types=object_types,
+			domain_type_names=set(compiled.type_names),
+			compiled_domain=compiled,
+			scope="task 'deliver'",
+		)
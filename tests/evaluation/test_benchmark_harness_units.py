@@ -467,6 +467,78 @@ def test_domain_benchmark_supports_single_query_runs(
 	).exists()
 
 
+def test_domain_benchmark_runs_queries_concurrently_with_shared_jason_runner(
+	tmp_path: Path,
+	monkeypatch,
+) -> None:
+	query_cases = {
+		f"q{index}": {"problem_file": tmp_path / f"p{index}.hddl", "instruction": f"q{index}"}
+		for index in range(1, 4)
+	}
+	monkeypatch.setattr(
+		benchmark_support,
+		"load_domain_query_cases",
+		lambda domain_key: query_cases,
+	)
+	shared_runner = object()
+
+	class FakeRunnerFactory:
+		def prepare_shared_runtime(self):
+			return shared_runner
+
+	monkeypatch.setattr(
+		benchmark_support.PlanLibraryEvaluationOrchestrator,
+		"build_jason_runner",
+		classmethod(lambda cls, **kwargs: FakeRunnerFactory()),
+	)
+	calls: dict[str, tuple[str, object]] = {}
+
+	def fake_run_plan_library_evaluation_case(
+		domain_key: str,
+		query_id: str,
+		*,
+		library_source: str,
+		runtime_backend: str = "jason",
+		logs_root: str | Path | None = None,
+		jason_runner=None,
+	):
+		calls[query_id] = (str(Path(logs_root or "").resolve()), jason_runner)
+		return {
+			"query_id": query_id,
+			"problem_file": str(query_cases[query_id]["problem_file"]),
+			"library_source": library_source,
+			"runtime_backend": runtime_backend,
+			"success": True,
+			"result": {"success": True, "step": ""},
+			"outcome_bucket": "hierarchical_plan_verified",
+			"log_dir": str(Path(logs_root or tmp_path).resolve()),
+			"execution": {},
+			"failure_signature": {},
+			"evaluation_domain_source": "benchmark",
+		}
+
+	monkeypatch.setattr(
+		benchmark_support,
+		"run_plan_library_evaluation_case",
+		fake_run_plan_library_evaluation_case,
+	)
+	summary = run_plan_library_evaluation_benchmark_for_domain(
+		"blocksworld",
+		output_root=tmp_path / "parallel-run",
+		run_id="parallel-run",
+		max_workers=3,
+	)
+
+	domain_root = tmp_path / "parallel-run" / "blocksworld"
+	assert summary["complete"] is True
+	assert summary["completed_query_ids"] == ["q1", "q2", "q3"]
+	assert calls == {
+		query_id: (str((domain_root / "logs" / query_id).resolve()), shared_runner)
+		for query_id in ("q1", "q2", "q3")
+	}
+	assert all((domain_root / "query_results" / f"{query_id}.json").exists() for query_id in calls)
+
+
 def test_query_report_checkpoint_compacts_long_query_and_formula_text() -> None:
 	long_instruction = " ".join("move_block" for _ in range(600))
 	long_formula = " & ".join(f"do_move(b{i},b{i + 1})" for i in range(500))
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import io
+import json
+import os
+import subprocess
 import sys
 import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -25,7 +32,28 @@ from evaluation.goal_grounding.grounder import (
 	NLToLTLfGenerator,
 )
 from evaluation.jason_runtime.environment_adapter import EnvironmentAdapterResult
-from evaluation.jason_runtime.runner import JasonRunner, JasonValidationResult
+from evaluation.jason_runtime.library_segment import RunnerLibrarySegmentMemo
+from evaluation.jason_runtime.runner import (
+	JasonRunner,
+	JasonValidationError,
+	JasonValidationJob,
+	JasonValidationResult,
+)
+from evaluation.jason_runtime.output_stream import (
+	JasonAgentOutputDemux,
+	JasonOutputCapture,
+	JasonOutputParser,
+	JasonPackedAgents,
+	run_streaming_jason_process,
+	summarize_jason_output,
+)
+from evaluation.jason_runtime.toolchain import JasonToolchain, clear_toolchain_memo
+from evaluation.jason_runtime.worker_pool import (
+	JasonWorkerJob,
+	JasonWorkerPool,
+	JasonWorkerPoolError,
+	shared_worker_pool,
+)
 from evaluation.failure_signature import infer_missing_goal_facts
 from evaluation.official_verification import resolve_verification_domain_file
 from evaluation.orchestrator import PlanLibraryEvaluationOrchestrator
@@ -38,8 +66,17 @@ from plan_library import (
 	PlanLibraryArtifactBundle,
 	TranslationCoverage,
 )
+from domain_model.compiled_domain import compile_domain
+from utils.hddl_condition_parser import HDDLConditionParser
+from utils.hddl_parse_cache import load_parsed_domain
 from utils.hddl_parser import HDDLParser
 from verification.official_plan_verifier import IPCPlanVerifier, IPCPrimitivePlanVerificationResult
+from verification.primitive_plan_checker import PrimitivePlanChecker
+from verification.result_cache import (
+	DEFAULT_VERIFICATION_CACHE_ROOT,
+	IPCVerificationResultCache,
+	configured_verification_cache_root,
+)
 from evaluation import official_verification as evaluation_official_verification_module
 from evaluation import orchestrator as evaluation_orchestrator_module
 
@@ -1026,6 +1063,79 @@ def test_jason_runner_local_witness_specialisation_keeps_canonical_fallback() ->
 	)
 
 
+def test_jason_runner_local_witness_join_starts_from_the_selective_atom() -> None:
+	runner = JasonRunner()
+	chunk = [
+		"+!visit(V) : at(V, SRC) & road(SRC, MID) <-",
+		"\t!drive(V, SRC, MID).",
+	]
+	vehicle_count = 80
+	fact_index, type_domains = runner._runtime_fact_index_for_local_witness_grounding(
+		seed_facts=(
+			*(f"(at truck{index} loc{index})" for index in range(vehicle_count)),
+			"(road loc0 hub)",
+			"(road loc1 hub)",
+			"(road loc2 hub)",
+		),
+		runtime_objects=(),
+		object_types={},
+		type_parent_map={},
+	)
+	grounding_stats: dict[str, int] = {}
+
+	specialised_chunks = runner._specialise_method_chunk_local_witnesses(
+		chunk,
+		fact_index=fact_index,
+		type_domains=type_domains,
+		max_candidates_per_clause=64,
+		grounding_stats=grounding_stats,
+	)
+
+	assert specialised_chunks[:3] == [
+		f"+!visit(truck{index}) : at(truck{index}, loc{index}) & road(loc{index}, hub) <-\n"
+		f"\t!drive(truck{index}, loc{index}, hub)."
+		for index in range(3)
+	]
+	assert specialised_chunks[3] == "\n".join(chunk)
+	assert grounding_stats["join_probes"] < vehicle_count
+	assert grounding_stats.get("clauses_over_limit", 0) == 0
+
+
+def test_jason_runner_local_witness_join_reports_clauses_over_limit() -> None:
+	runner = JasonRunner()
+	chunk = [
+		"+!visit(V) : object_type(DEST, location) & DEST \\== SRC & at(V, SRC) <-",
+		"\t!drive(V, SRC, DEST).",
+	]
+	locations = tuple(f"loc{index}" for index in range(10))
+	fact_index, type_domains = runner._runtime_fact_index_for_local_witness_grounding(
+		seed_facts=("(at truck0 loc0)",),
+		runtime_objects=locations,
+		object_types={location: "location" for location in locations},
+		type_parent_map={"location": None},
+	)
+	grounding_stats: dict[str, int] = {}
+
+	limited = runner._specialise_method_chunk_local_witnesses(
+		chunk,
+		fact_index=fact_index,
+		type_domains=type_domains,
+		max_candidates_per_clause=4,
+		grounding_stats=grounding_stats,
+	)
+	unlimited = runner._specialise_method_chunk_local_witnesses(
+		chunk,
+		fact_index=fact_index,
+		type_domains=type_domains,
+		max_candidates_per_clause=64,
+	)
+
+	assert limited == ["\n".join(chunk)]
+	assert grounding_stats["clauses_over_limit"] == 1
+	assert len(unlimited) == len(locations)
+	assert all("loc0, loc0" not in specialised for specialised in unlimited)
+
+
 def test_jason_runner_inserts_no_ancestor_guard_for_self_recursive_methods() -> None:
 	runner = JasonRunner()
 	chunks = [
@@ -1210,6 +1320,60 @@ def test_jason_runner_rewrites_method_primitive_actions_to_wrapper_goals() -> No
 	assert "\t!unstack(BLOCK1, BLOCK2);" not in primitive_section
 
 
+def test_jason_runner_reuses_library_segment_across_queries() -> None:
+	agentspeak_code = "\n".join(
+		[
+			"/* Initial Beliefs */",
+			"",
+			"/* Primitive Action Plans */",
+			"+!drive(V, SRC, DEST) : true <-",
+			"\tdrive(V, SRC, DEST).",
+			"",
+			"/* HTN Method Plans */",
+			"+!get_to(V, DEST) : at(V, SRC) & road(SRC, DEST) <-",
+			"\tdrive(V, SRC, DEST).",
+			"",
+			"+!get_to(V, DEST) : road(MID, DEST) <-",
+			"\t!get_to(V, MID);",
+			"\tdrive(V, MID, DEST).",
+			"",
+			"/* Failure Handlers */",
+		],
+	)
+	action_schemas = (
+		{"functor": "drive", "source_name": "drive", "parameters": ["?v", "?from", "?to"]},
+	)
+	queries = (
+		{
+			"seed_facts": ("at(truck, loc0)", "road(loc0, loc1)"),
+			"runtime_objects": ("truck", "loc0", "loc1"),
+			"query_goals": (),
+		},
+		{
+			"seed_facts": ("at(truck, loc2)", "road(loc2, loc3)", "road(loc3, loc4)"),
+			"runtime_objects": ("truck", "loc2", "loc3", "loc4"),
+			"query_goals": ({"task_name": "get_to", "args": ["truck", "loc4"]},),
+		},
+	)
+	cached_runner = JasonRunner()
+	cached_runner.library_segment_memo = RunnerLibrarySegmentMemo()
+	uncached_runner = JasonRunner()
+	uncached_runner.library_segment_memo = None
+
+	for query in queries:
+		build_kwargs = {
+			"action_schemas": action_schemas,
+			"object_types": {},
+			"type_parent_map": {},
+			**query,
+		}
+		assert cached_runner._build_runner_asl(agentspeak_code, **build_kwargs) == (
+			uncached_runner._build_runner_asl(agentspeak_code, **build_kwargs)
+		)
+
+	assert cached_runner.library_segment_memo.stats == {"hits": 1, "misses": 1}
+
+
 def test_jason_runner_instruments_before_runtime_specialisation() -> None:
 	runner = JasonRunner()
 	agentspeak_code = "\n".join(
@@ -1378,6 +1542,32 @@ def test_jason_runner_delegates_dynamic_effects_to_environment() -> None:
 	)[-1]["is_positive"] is True
 
 
+def test_agentspeak_renderer_conjoins_factored_precondition_groups() -> None:
+	action = type(
+		"ActionStub",
+		(),
+		{
+			"name": "fire",
+			"parameters": ["?x - object"],
+			"preconditions": "(and (ready ?x) (or (left ?x) (right ?x)) (or (up ?x) (down ?x)))",
+			"effects": "(and (done ?x))",
+		},
+	)()
+	semantics = HDDLConditionParser(max_clauses=2).parse_action(action)
+
+	context = AgentSpeakRenderer()._context_from_precondition_clauses(
+		semantics.precondition_clauses,
+		semantics.parameters,
+		("X",),
+		factors=semantics.precondition_factors,
+	)
+
+	assert not semantics.precondition_is_exact
+	assert context == (
+		"ready(X) & ((ready(X) & left(X)) | (ready(X) & right(X))) & (up(X) | down(X))"
+	)
+
+
 def test_agentspeak_renderer_emits_plan_library_without_temporal_runtime() -> None:
 	domain = HDDLParser.parse_domain(str(PROJECT_ROOT / "src" / "domains" / "blocksworld" / "domain.hddl"))
 	renderer = AgentSpeakRenderer()
@@ -2276,6 +2466,40 @@ def test_jason_runner_records_domain_agnostic_runtime_method_choices() -> None:
 	assert "runtime_last_query_choice(1, CHOICE)" in runtime_program
 
 
+class _FakeJasonProcess:
+	def __init__(self, stdout: str, stderr: str, returncode: int) -> None:
+		self.stdout = io.StringIO(stdout)
+		self.stderr = io.StringIO(stderr)
+		self.returncode = returncode
+
+	def poll(self) -> int:
+		return self.returncode
+
+	def wait(self, timeout: float | None = None) -> int:
+		return self.returncode
+
+	def terminate(self) -> None:
+		return None
+
+	def kill(self) -> None:
+		return None
+
+
+def _fake_jason_popen(
+	stdout: str,
+	stderr: str = "",
+	*,
+	returncode: int = 0,
+	commands: list[list[str]] | None = None,
+):
+	def fake_popen(command, *args, **kwargs):
+		if commands is not None:
+			commands.append(list(command))
+		return _FakeJasonProcess(stdout, stderr, returncode)
+
+	return fake_popen
+
+
 def test_jason_runner_extracts_only_committed_snapshot_actions() -> None:
 	runner = JasonRunner()
 	stdout = "\n".join(
@@ -2298,12 +2522,244 @@ def test_jason_runner_extracts_only_committed_snapshot_actions() -> None:
 	]
 
 
+def test_jason_output_parser_merges_streams_like_combined_output() -> None:
+	stdout_parser = JasonOutputParser(method_trace_record_limit=2)
+	stderr_parser = JasonOutputParser(method_trace_record_limit=2, record_action_events=True)
+	stdout_parser.feed_text(
+		"\n".join(
+			[
+				"runtime env ready",
+				"runtime env action success move(a,b)",
+				"runtime env snapshot 1",
+				"runtime env action success move(b,c)",
+				"[agent] runtime goal failed fail_goal(on(a,b))",
+			],
+		),
+	)
+	stderr_parser.feed_text(
+		"\n".join(
+			[
+				"runtime env restore 1",
+				"[agent] runtime trace method flat m1|a|b",
+				"[agent] runtime trace method flat m2|b",
+				"[agent] runtime trace method flat m3",
+				"[agent] runtime query pass 2",
+				"[agent] runtime goal failed fail_goal(on(a,b))",
+				"[agent] runtime goal failed fail_goal(on(b,c))",
+				"[agent] execute success",
+			],
+		),
+	)
+
+	summary = summarize_jason_output(
+		stdout_parser,
+		stderr_parser,
+		method_trace_record_limit=2,
+		failed_goal_record_limit=1,
+	)
+
+	assert summary.action_path == ["move(a,b)"]
+	assert [item["method_name"] for item in summary.method_trace] == ["m1", "m2"]
+	assert summary.method_trace[0]["task_args"] == ["a", "b"]
+	assert summary.method_trace_original_count == 3
+	assert summary.method_trace_truncated is True
+	assert summary.observed_failed_goals == [
+		"on(a,b)",
+		"... truncated 1 additional failed goals",
+	]
+	assert summary.goal_repair_pass_count == 2
+	assert summary.terminal_marker == "execute success"
+
+
+def test_streaming_jason_process_stops_jvm_after_terminal_marker(tmp_path: Path) -> None:
+	script = (
+		"import sys, time\n"
+		"print('runtime env ready', flush=True)\n"
+		"print('runtime env action success move(a,b)', flush=True)\n"
+		"print('execute success', flush=True)\n"
+		"time.sleep(30)\n"
+	)
+	stdout_parser = JasonOutputParser()
+	stderr_parser = JasonOutputParser(record_action_events=True)
+	start = time.perf_counter()
+
+	run = run_streaming_jason_process(
+		[sys.executable, "-c", script],
+		cwd=tmp_path,
+		timeout_seconds=20,
+		stdout_parser=stdout_parser,
+		stderr_parser=stderr_parser,
+		stdout_sink=tmp_path / "stdout.txt",
+		stderr_sink=tmp_path / "stderr.txt",
+		sink_limit_chars=40,
+		terminal_marker_grace_seconds=0.2,
+	)
+
+	assert time.perf_counter() - start < 10
+	assert run.early_stopped is True
+	assert run.timed_out is False
+	assert run.exit_code == 0
+	assert run.terminal_marker_seconds is not None
+	assert stdout_parser.action_path == ["move(a,b)"]
+	assert "execute success" in run.stdout
+	assert len(run.stdout) == 40
+	assert (tmp_path / "stdout.txt").read_text() == (
+		"runtime env ready\n"
+		"runtime env action success move(a,b)\n"
+		"execute success\n"
+	)
+
+
+def test_streaming_jason_process_keeps_only_bounded_output_tails(tmp_path: Path) -> None:
+	script = (
+		"print('runtime env ready', flush=True)\n"
+		"for index in range(2000):\n"
+		"    print(f'runtime env action success move(b{index},c)', flush=True)\n"
+		"print('execute success', flush=True)\n"
+	)
+	stdout_parser = JasonOutputParser()
+
+	run = run_streaming_jason_process(
+		[sys.executable, "-c", script],
+		cwd=tmp_path,
+		timeout_seconds=20,
+		stdout_parser=stdout_parser,
+		stderr_parser=JasonOutputParser(),
+		stdout_sink=tmp_path / "stdout.txt",
+		sink_limit_chars=200,
+	)
+
+	full_output = "runtime env ready\n" + "".join(
+		f"runtime env action success move(b{index},c)\n" for index in range(2000)
+	) + "execute success\n"
+	artifact = (tmp_path / "stdout.txt").read_text()
+	assert run.stdout == full_output[-200:]
+	assert run.stdout_capture.total_chars == len(full_output)
+	assert run.stdout_capture.truncated is True
+	assert len(stdout_parser.action_path) == 2000
+	assert stdout_parser.status_lines == ["runtime env ready", "execute success"]
+	assert artifact.startswith(full_output[:200])
+	assert f"original_chars={len(full_output)}" in artifact
+	assert artifact.endswith(full_output[-200:])
+
+
+def test_streaming_jason_process_times_out_without_terminal_marker(tmp_path: Path) -> None:
+	script = (
+		"import time\n"
+		"print('runtime env ready', flush=True)\n"
+		"time.sleep(30)\n"
+	)
+
+	run = run_streaming_jason_process(
+		[sys.executable, "-c", script],
+		cwd=tmp_path,
+		timeout_seconds=0.5,
+		stdout_parser=JasonOutputParser(),
+		stderr_parser=JasonOutputParser(),
+	)
+
+	assert run.timed_out is True
+	assert run.exit_code is None
+	assert run.early_stopped is False
+	assert run.stdout == "runtime env ready\n"
+
+
+def test_jason_output_parser_progress_ignores_replayed_repair_loops() -> None:
+	parser = JasonOutputParser()
+	parser.feed_text(
+		"\n".join(
+			[
+				"runtime env snapshot s1",
+				"runtime env action success move(a,b)",
+				"runtime trace method flat m1|a|b",
+			],
+		),
+	)
+	baseline = parser.progress_marker()
+
+	parser.feed_text(
+		"\n".join(
+			[
+				"runtime env restore s1",
+				"runtime env snapshot s1",
+				"runtime env action success move(a,b)",
+				"runtime trace method flat m1|a|b",
+			],
+		),
+	)
+	assert parser.progress_marker() == baseline
+
+	parser.feed("runtime query pass 1")
+	assert parser.progress_marker() != baseline
+
+
+def test_jason_agent_output_demux_waits_for_every_packed_agent() -> None:
+	packed_agents = JasonPackedAgents(("query_1", "query_2"))
+	stdout_demux = JasonAgentOutputDemux(packed_agents, JasonOutputParser)
+	stderr_demux = JasonAgentOutputDemux(packed_agents, JasonOutputParser)
+
+	assert stdout_demux.feed("runtime env ready") is False
+	assert stdout_demux.feed("[query_2] runtime env action success move(a,b)") is False
+	assert stderr_demux.feed("[query_1] execute success") is False
+	assert stdout_demux.terminal_marker is None
+	assert stderr_demux.feed("[query_2] execute failed") is True
+
+	assert stdout_demux.parsers["query_1"].action_path == []
+	assert stdout_demux.parsers["query_2"].action_path == ["move(a,b)"]
+	assert stdout_demux.agent_text("query_1") == "runtime env ready\n"
+	assert stderr_demux.parsers["query_2"].terminal_marker == "execute failed"
+	assert stdout_demux.terminal_marker is not None
+
+
+def test_streaming_jason_process_stops_run_without_progress(tmp_path: Path) -> None:
+	script = (
+		"import time\n"
+		"print('runtime env action success move(a,b)', flush=True)\n"
+		"while True:\n"
+		"    print('runtime env restore s1', flush=True)\n"
+		"    print('runtime env snapshot s1', flush=True)\n"
+		"    time.sleep(0.05)\n"
+	)
+	start = time.perf_counter()
+
+	run = run_streaming_jason_process(
+		[sys.executable, "-c", script],
+		cwd=tmp_path,
+		timeout_seconds=20,
+		stdout_parser=JasonOutputParser(),
+		stderr_parser=JasonOutputParser(),
+		stall_timeout_seconds=0.5,
+	)
+
+	assert time.perf_counter() - start < 10
+	assert run.stalled is True
+	assert run.timed_out is False
+	assert run.exit_code is None
+	assert run.last_progress_seconds is not None and run.last_progress_seconds < 0.5
+
+
+def test_jason_runner_reports_stalled_runs_as_distinct_failure_class() -> None:
+	runner = JasonRunner(stall_timeout_seconds=30)
+	environment_result = EnvironmentAdapterResult(success=True, adapter_name="test", mode="test")
+
+	assert runner._failure_class("", None, False, environment_result, stalled=True) == (
+		"runtime_stalled"
+	)
+	assert runner._failure_reason("", "", None, False, environment_result, stalled=True) == (
+		"no runtime progress for 30.0s"
+	)
+	assert JasonRunner(stall_timeout_seconds=0).stall_timeout_seconds is None
+
+
 def test_jason_runner_bounds_repetitive_runtime_artifacts() -> None:
 	runner = JasonRunner()
 	runner.runtime_output_artifact_limit_chars = 12
 	runner.method_trace_record_limit = 2
 
-	bounded_output, output_truncated = runner._bounded_runtime_output_artifact("0123456789abcdef")
+	capture = JasonOutputCapture(runner.runtime_output_artifact_limit_chars)
+	for chunk in ("0123", "4567", "89ab", "cdef"):
+		capture.append(chunk)
+	bounded_output = capture.bounded_text()
 	bounded_trace, original_trace_count, trace_truncated = runner._cap_method_trace_records(
 		[
 			{"method_name": "m1", "task_args": []},
@@ -2312,7 +2768,8 @@ def test_jason_runner_bounds_repetitive_runtime_artifacts() -> None:
 		],
 	)
 
-	assert output_truncated is True
+	assert capture.truncated is True
+	assert capture.total_chars == 16
 	assert "original_chars=16" in bounded_output
 	assert bounded_output.endswith("456789abcdef")
 	assert original_trace_count == 3
@@ -2350,11 +2807,6 @@ def test_jason_runner_validate_passes_raw_agentspeak_program_to_runtime_builder(
 		env_java_path.write_text("class JasonPipelineEnvironment {}")
 		(output_path / f"{runner.environment_class_name}.class").write_text("")
 
-	class FakeCompletedProcess:
-		returncode = 0
-		stdout = "runtime env ready\nexecute success\n"
-		stderr = ""
-
 	monkeypatch.setattr(runner, "_select_java_binary", lambda: ("java", 17))
 	monkeypatch.setattr(runner, "_select_javac_binary", lambda java_bin: "javac")
 	monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java_bin: jason_jar)
@@ -2370,7 +2822,10 @@ def test_jason_runner_validate_passes_raw_agentspeak_program_to_runtime_builder(
 	monkeypatch.setattr(runner, "_extract_action_path", lambda stdout: [])
 	monkeypatch.setattr(runner, "_extract_method_trace", lambda output: [])
 	monkeypatch.setattr(runner, "_run_consistency_checks", lambda **kwargs: {})
-	monkeypatch.setattr("evaluation.jason_runtime.runner.subprocess.run", lambda *args, **kwargs: FakeCompletedProcess())
+	monkeypatch.setattr(
+		"evaluation.jason_runtime.runner.subprocess.Popen",
+		_fake_jason_popen("runtime env ready\nexecute success\n"),
+	)
 
 	result = runner.validate(
 		agentspeak_code="""
@@ -2428,11 +2883,6 @@ def test_jason_runner_validate_downgrades_consistency_check_failures_to_diagnost
 		env_java_path.write_text("class JasonPipelineEnvironment {}")
 		(output_path / f"{runner.environment_class_name}.class").write_text("")
 
-	class FakeCompletedProcess:
-		returncode = 0
-		stdout = "runtime env ready\nexecute success\n"
-		stderr = ""
-
 	monkeypatch.setattr(runner, "_select_java_binary", lambda: ("java", 17))
 	monkeypatch.setattr(runner, "_select_javac_binary", lambda java_bin: "javac")
 	monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java_bin: jason_jar)
@@ -2460,8 +2910,8 @@ def test_jason_runner_validate_downgrades_consistency_check_failures_to_diagnost
 		lambda **kwargs: (_ for _ in ()).throw(RuntimeError("diagnostic boom")),
 	)
 	monkeypatch.setattr(
-		"evaluation.jason_runtime.runner.subprocess.run",
-		lambda *args, **kwargs: FakeCompletedProcess(),
+		"evaluation.jason_runtime.runner.subprocess.Popen",
+		_fake_jason_popen("runtime env ready\nexecute success\n"),
 	)
 
 	result = runner.validate(
@@ -2491,100 +2941,1078 @@ def test_jason_runner_validate_downgrades_consistency_check_failures_to_diagnost
 	assert result.consistency_checks["message"] == "diagnostic boom"
 
 
-def test_method_trace_reconstruction_accepts_hyphenated_runtime_action_names(
+_FAKE_JASON_WORKER_SCRIPT = """
+import os, sys, time
+print("READY", flush=True)
+for line in sys.stdin:
+	parts = line.rstrip("\\n").split("\\t")
+	if parts[0] != "RUN":
+		break
+	_, job_id, classpath, mas2j, log_conf, stdout_file, stderr_file = parts
+	if "hang" in open(mas2j).read():
+		time.sleep(60)
+	with open(stdout_file, "w") as handle:
+		handle.write(f"worker pid {os.getpid()}\\nexecute success\\n")
+	open(stderr_file, "w").close()
+	print(f"DONE\\t{job_id}\\t0", flush=True)
+"""
+
+
+def _fake_jason_worker_pool(tmp_path: Path, **kwargs) -> JasonWorkerPool:
+	script_path = tmp_path / "fake_worker.py"
+	script_path.write_text(_FAKE_JASON_WORKER_SCRIPT)
+	pool = JasonWorkerPool(
+		java_bin="java",
+		javac_bin="javac",
+		jason_jar=tmp_path / "jason.jar",
+		worker_dir=tmp_path / "workers",
+		**kwargs,
+	)
+	pool._ensure_worker_class = lambda: None
+	pool._worker_command = lambda: [sys.executable, str(script_path)]
+	return pool
+
+
+def _fake_jason_worker_job(tmp_path: Path, name: str, *, mas2j_text: str = "MAS x {}", timeout: float = 10.0):
+	job_dir = tmp_path / name
+	job_dir.mkdir()
+	mas2j_file = job_dir / "jason_runner.mas2j"
+	mas2j_file.write_text(mas2j_text)
+	return JasonWorkerJob(
+		work_dir=job_dir,
+		mas2j_file=mas2j_file,
+		log_conf=tmp_path / "logging.properties",
+		timeout_seconds=timeout,
+		stdout_file=job_dir / "jason_stdout.txt",
+		stderr_file=job_dir / "jason_stderr.txt",
+	)
+
+
+def test_jason_worker_pool_reuses_warm_worker_and_recycles_after_job_budget(tmp_path: Path) -> None:
+	with _fake_jason_worker_pool(tmp_path, max_jobs_per_worker=2) as pool:
+		first = pool.run(_fake_jason_worker_job(tmp_path, "job1"))
+		second = pool.run(_fake_jason_worker_job(tmp_path, "job2"))
+		third = pool.run(_fake_jason_worker_job(tmp_path, "job3"))
+
+	assert first.exit_code == 0 and "execute success" in first.stdout
+	assert first.worker_spawned is True
+	assert second.worker_spawned is False
+	assert second.worker_id == first.worker_id
+	assert second.stdout.splitlines()[0] == first.stdout.splitlines()[0]
+	assert second.worker_recycled is True
+	assert third.worker_spawned is True
+	assert third.worker_id != first.worker_id
+	assert pool.stats["workers_spawned"] == 2
+	assert pool.stats["workers_recycled"] == 1
+
+
+def test_jason_worker_pool_kills_worker_on_job_timeout(tmp_path: Path) -> None:
+	with _fake_jason_worker_pool(tmp_path) as pool:
+		stalled = pool.run(
+			_fake_jason_worker_job(tmp_path, "stalled", mas2j_text="hang", timeout=0.5),
+		)
+		recovered = pool.run(_fake_jason_worker_job(tmp_path, "recovered"))
+
+	assert stalled.timed_out is True
+	assert stalled.exit_code is None
+	assert recovered.timed_out is False
+	assert recovered.worker_spawned is True
+	assert recovered.worker_id != stalled.worker_id
+	assert pool.stats["workers_killed"] == 1
+	assert pool.stats["jobs_timed_out"] == 1
+
+
+def test_jason_worker_pool_stops_job_without_progress(tmp_path: Path) -> None:
+	job = _fake_jason_worker_job(tmp_path, "stalled", mas2j_text="hang", timeout=20)
+	job = replace(
+		job,
+		stdout_parser=JasonOutputParser(),
+		stderr_parser=JasonOutputParser(),
+		stall_timeout_seconds=0.5,
+	)
+	with _fake_jason_worker_pool(tmp_path) as pool:
+		pool.progress_poll_seconds = 0.1
+		start = time.perf_counter()
+		stalled = pool.run(job)
+
+	assert time.perf_counter() - start < 10
+	assert stalled.stalled is True
+	assert stalled.timed_out is False
+	assert stalled.exit_code is None
+	assert pool.stats["jobs_stalled"] == 1
+	assert pool.stats["workers_killed"] == 1
+
+
+def test_jason_worker_pool_is_skipped_on_java_without_security_manager(
+	monkeypatch: pytest.MonkeyPatch,
+	caplog: pytest.LogCaptureFixture,
 	tmp_path: Path,
 ) -> None:
-	problem_file = tmp_path / "blocksworld_simple_put_on.hddl"
-	problem_file.write_text(
-		"""(define (problem BW-simple-put-on)
-(:domain BLOCKS)
-(:objects b2 b4 - block)
-(:htn :parameters () :ordered-subtasks (and
-(task1 (do_put_on b4 b2))
-))
-(:init
-(handempty)
-(ontable b2)
-(ontable b4)
-(clear b2)
-(clear b4)
-)
-\t(:goal (and
-(on b4 b2)
-\t))
-)
-""",
-		encoding="utf-8",
-	)
-	method_library = HTNMethodLibrary(
-		compound_tasks=[
-			HTNTask(name="do_put_on", parameters=("?x", "?y"), is_primitive=False),
-		],
-		primitive_tasks=[
-			HTNTask(name="pick_up", parameters=("?x",), is_primitive=True),
-			HTNTask(name="stack", parameters=("?x", "?y"), is_primitive=True),
-		],
-		methods=[
-			HTNMethod(
-				method_name="m_do_put_on_serial",
-				task_name="do_put_on",
-				parameters=("?x", "?y"),
-				task_args=("?x", "?y"),
-				subtasks=(
-					HTNMethodStep("s1", "pick_up", ("?x",), "primitive", action_name="pick_up"),
-					HTNMethodStep("s2", "stack", ("?x", "?y"), "primitive", action_name="stack"),
-				),
-				ordering=(("s1", "s2"),),
-			),
-		],
-		target_literals=[],
-		target_task_bindings=[],
-	)
-	runner = JasonRunner()
+	monkeypatch.setenv("JASON_RUNTIME_WORKERS", "2")
+	toolchain = {"java_bin": "java24", "javac_bin": "javac24", "jason_jar": tmp_path / "jason.jar"}
 
-	reconstruction = runner._check_method_trace_reconstruction(
-		action_path=("pick-up(b4)", "stack(b4,b2)"),
-		method_trace=({"method_name": "m_do_put_on_serial", "task_args": ("b4", "b2")},),
-		method_library=method_library,
-		problem_file=problem_file,
+	with caplog.at_level("WARNING", logger="evaluation.jason_runtime.worker_pool"):
+		assert shared_worker_pool(**toolchain, java_major=24) is None
+		assert shared_worker_pool(**toolchain, java_major=24) is None
+
+	assert len(caplog.records) == 1
+	assert "Java 24" in caplog.records[0].getMessage()
+	with _fake_jason_worker_pool(tmp_path, java_major=24) as pool:
+		with pytest.raises(JasonWorkerPoolError, match="SecurityManager"):
+			pool.run(_fake_jason_worker_job(tmp_path, "job"))
+	assert pool.stats["workers_spawned"] == 0
+
+
+def test_jason_runner_validate_runs_mas_on_worker_pool(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	pool = _fake_jason_worker_pool(tmp_path)
+	runner = JasonRunner(runtime_dir=tmp_path, worker_pool=pool)
+	jason_jar = tmp_path / "jason.jar"
+	log_conf = tmp_path / "logging.properties"
+	jason_jar.write_text("")
+	log_conf.write_text("")
+	output_dir = tmp_path / "query"
+
+	def fake_compile_environment_java(**kwargs) -> None:
+		output_path = Path(str(kwargs["output_path"]))
+		(output_path / f"{runner.environment_class_name}.class").write_text("")
+
+	def unexpected_streaming_run(*args, **kwargs):
+		raise AssertionError("worker pool mode must not start a cold JVM")
+
+	monkeypatch.setattr(runner, "_select_java_binary", lambda: ("java", 17))
+	monkeypatch.setattr(runner, "_select_javac_binary", lambda java_bin: "javac")
+	monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java_bin: jason_jar)
+	monkeypatch.setattr(runner, "_resolve_log_config", lambda: log_conf)
+	monkeypatch.setattr(runner, "_compile_environment_java", fake_compile_environment_java)
+	monkeypatch.setattr(
+		runner.environment_adapter,
+		"validate",
+		lambda *, stdout, stderr: EnvironmentAdapterResult(
+			success=True,
+			adapter_name="fake",
+			mode="test",
+			details={},
+		),
 	)
-	rendered_plan = IPCPlanVerifier()._render_supported_hierarchical_plan(
-		domain_file=problem_file,
-		problem_file=problem_file,
-		action_path=("pick-up(b4)", "stack(b4,b2)"),
-		method_library=method_library,
-		method_trace=({"method_name": "m_do_put_on_serial", "task_args": ("b4", "b2")},),
+	monkeypatch.setattr(runner, "_extract_action_path", lambda stdout: [])
+	monkeypatch.setattr(runner, "_extract_method_trace", lambda output: [])
+	monkeypatch.setattr(runner, "_run_consistency_checks", lambda **kwargs: {})
+	monkeypatch.setattr(
+		"evaluation.jason_runtime.runner.run_streaming_jason_process",
+		unexpected_streaming_run,
 	)
 
-	assert reconstruction == {
-		"passed": True,
-		"failure_class": None,
-		"message": None,
-	}
-	assert rendered_plan is not None
-	assert "pick-up b4" in rendered_plan
-	assert "stack b4 b2" in rendered_plan
+	with pool:
+		result = runner.validate(
+			agentspeak_code="""
+/* Initial Beliefs */
 
+/* Primitive Action Plans */
 
-def test_hierarchical_plan_exporter_rejects_runtime_repair_suffix(tmp_path: Path) -> None:
-	problem_file = tmp_path / "blocksworld_repeated_runtime_roots.hddl"
-	problem_file.write_text(
-		"""(define (problem BW-repair-root)
-(:domain BLOCKS)
-(:objects b2 b4 - block)
-(:htn :parameters () :ordered-subtasks (and
-(task1 (do_put_on b4 b2))
-))
-(:init
-(handempty)
-(ontable b2)
-(ontable b4)
-(clear b2)
-(clear b4)
-)
-\t(:goal (and
-(on b4 b2)
-\t))
+/* HTN Method Plans */
++!idle_goal : true <-
+	true.
+""".strip(),
+			method_library=_sample_method_library(),
+			action_schemas=[{"name": "idle_action"}],
+			seed_facts=(),
+			runtime_objects=(),
+			object_types={},
+			type_parent_map={},
+			domain_name="blocks",
+			problem_file=None,
+			output_dir=output_dir,
+		)
+
+	assert result.status == "success"
+	assert result.artifacts["mas_execution_mode"] == "worker_pool"
+	assert result.artifacts["jason_worker"]["worker_spawned"] is True
+	mas2j_text = (output_dir / "jason_runner.mas2j").read_text()
+	assert f'aslSourcePath: "{output_dir.resolve()}";' in mas2j_text
+
+
+def test_jason_runner_environment_class_cache_is_keyed_by_jdk(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	runner = JasonRunner(runtime_dir=tmp_path)
+	jason_jar = tmp_path / "jason-cli-all-3.3.1.jar"
+	jason_jar.write_text("")
+	compiled_dirs: list[Path] = []
+
+	def fake_compile_environment_java(**kwargs) -> None:
+		output_path = Path(str(kwargs["output_path"]))
+		compiled_dirs.append(output_path)
+		(output_path / f"{runner.environment_class_name}.class").write_text("")
+
+	monkeypatch.setattr(runner, "_compile_environment_java", fake_compile_environment_java)
+
+	resolved = [
+		runner._resolve_environment_class_dir(
+			java_bin="java",
+			java_major=java_major,
+			javac_bin="javac",
+			jason_jar=jason_jar,
+			env_source="class Env {}",
+			timing_profile={},
+		)
+		for java_major in (17, 21, 17)
+	]
+
+	assert len(compiled_dirs) == 2
+	assert [cache_hit for _, cache_hit in resolved] == [False, False, True]
+	assert resolved[0][0] != resolved[1][0]
+	assert resolved[2][0] == resolved[0][0]
+
+
+def test_jason_runner_compiles_data_driven_environment_once_per_template(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	runner = JasonRunner(runtime_dir=tmp_path)
+	jason_jar = tmp_path / "jason-cli-all-3.3.1.jar"
+	log_conf = tmp_path / "logging.properties"
+	jason_jar.write_text("")
+	log_conf.write_text("")
+	compiled_dirs: list[Path] = []
+
+	def fake_compile_environment_java(**kwargs) -> None:
+		output_path = Path(str(kwargs["output_path"]))
+		compiled_dirs.append(output_path)
+		(output_path / f"{runner.environment_class_name}.class").write_text("")
+
+	monkeypatch.setattr(runner, "_select_java_binary", lambda: ("java", 17))
+	monkeypatch.setattr(runner, "_select_javac_binary", lambda java_bin: "javac")
+	monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java_bin: jason_jar)
+	monkeypatch.setattr(runner, "_resolve_log_config", lambda: log_conf)
+	monkeypatch.setattr(runner, "_compile_environment_java", fake_compile_environment_java)
+	monkeypatch.setattr(
+		runner.environment_adapter,
+		"validate",
+		lambda *, stdout, stderr: EnvironmentAdapterResult(
+			success=True,
+			adapter_name="fake",
+			mode="test",
+			details={},
+		),
+	)
+	monkeypatch.setattr(runner, "_extract_action_path", lambda stdout: [])
+	monkeypatch.setattr(runner, "_extract_method_trace", lambda output: [])
+	monkeypatch.setattr(runner, "_run_consistency_checks", lambda **kwargs: {})
+	monkeypatch.setattr(
+		"evaluation.jason_runtime.runner.subprocess.Popen",
+		_fake_jason_popen("runtime env ready\nexecute success\n"),
+	)
+
+	results = []
+	for query_index, seed_fact in enumerate(("(clear a)", "(clear b)"), start=1):
+		results.append(
+			runner.validate(
+				agentspeak_code="""
+/* Initial Beliefs */
+
+/* Primitive Action Plans */
+
+/* HTN Method Plans */
++!idle_goal : true <-
+	true.
+""".strip(),
+				method_library=_sample_method_library(),
+				action_schemas=[
+					{
+						"functor": "pick_up",
+						"source_name": "pick-up",
+						"parameters": ["?x"],
+						"preconditions": [{"predicate": "clear", "args": ["?x"], "is_positive": True}],
+						"effects": [{"predicate": "clear", "args": ["?x"], "is_positive": False}],
+					},
+				],
+				seed_facts=(seed_fact,),
+				runtime_objects=(),
+				object_types={},
+				type_parent_map={},
+				domain_name="blocks",
+				problem_file=None,
+				output_dir=tmp_path / f"query_{query_index}",
+			),
+		)
+
+	assert len(compiled_dirs) == 1
+	assert [result.artifacts["environment_class_cache_hit"] for result in results] == [False, True]
+	assert "environment_compile_seconds" in results[0].timing_profile
+	assert "environment_compile_seconds" not in results[1].timing_profile
+	env_class = Path(results[1].artifacts["runtime_environment_class"])
+	assert env_class.parent.parent == tmp_path / ".class_cache" / "environment"
+	env_data = json.loads((tmp_path / "query_2" / "jason_environment.json").read_text())
+	assert env_data["seed_facts"] == ["clear(b)"]
+	assert env_data["actions"] == [
+		{
+			"functor": "pick_up",
+			"source_name": "pick-up",
+			"parameters": ["?x"],
+			"precondition_clauses": [[{"predicate": "clear", "positive": True, "args": ["?x"]}]],
+			"precondition_factors": [],
+			"effects": [{"predicate": "clear", "positive": False, "args": ["?x"]}],
+		},
+	]
+	mas2j_text = (tmp_path / "query_2" / "jason_runner.mas2j").read_text()
+	expected_data_path = (tmp_path / "query_2" / "jason_environment.json").resolve().as_posix()
+	assert f'environment: JasonPipelineEnvironment("{expected_data_path}")' in mas2j_text
+	assert "clear(b)" not in runner._build_environment_java_source()
+
+
+def test_jason_environment_pushes_only_percept_deltas() -> None:
+	source = JasonRunner()._build_environment_java_source()
+	sync_body = source.split("private void syncPercepts()", maxsplit=1)[1]
+
+	assert "clearPercepts(" not in sync_body
+	assert "for (String atom : active.removedSinceSync)" in sync_body
+	assert "for (String atom : active.addedSinceSync)" in sync_body
+	assert "active.world.add(" not in source
+	assert "active.world.remove(" not in source
+	assert "active.world.removeIf(" not in source
+
+
+def test_jason_environment_checks_factored_preconditions() -> None:
+	runner = JasonRunner()
+
+	def literal(predicate: str) -> dict[str, object]:
+		return {"predicate": predicate, "args": ["?x"], "is_positive": True}
+
+	env_data = runner._build_environment_data(
+		action_schemas=[
+			{
+				"functor": "fire",
+				"parameters": ["?x"],
+				"preconditions": [literal("ready")],
+				"precondition_clauses": [[literal("ready")]],
+				"precondition_factors": [[[literal("left")], [literal("right")]]],
+				"effects": [literal("done")],
+			},
+		],
+		seed_facts=[],
+	)
+	source = runner._build_environment_java_source()
+	execute_body = source.split("public synchronized boolean executeAction(", maxsplit=1)[1]
+
+	assert env_data["actions"][0]["precondition_factors"] == [
+		[
+			[{"predicate": "left", "positive": True, "args": ["?x"]}],
+			[{"predicate": "right", "positive": True, "args": ["?x"]}],
+		],
+	]
+	assert "checkPreconditionFactors(schema.preconditionFactors, bindings)" in execute_body
+	assert 'action.containsKey("precondition_factors")' in source
+
+
+_PERCEPT_PROBE_JAVA = """
+import jason.asSyntax.Literal;
+import jason.asSyntax.Structure;
+
+import java.util.ArrayList;
+import java.util.Collection;
+import java.util.Collections;
+import java.util.List;
+
+public class PerceptProbe {{
+	public static void main(String[] args) throws Exception {{
+		{env} env = new {env}();
+		env.init(new String[] {{args[0]}});
+		List<String> atoms = dump(env, "init", new ArrayList<>());
+		for (int i = 1; i < args.length; i++) {{
+			boolean ok = env.executeAction("probe", Structure.parse(args[i]));
+			atoms = dump(env, args[i] + (ok ? "" : " rejected"), atoms);
+		}}
+		env.stop();
+	}}
+
+	// getPercepts returns null while the agent is up to date with the last sync.
+	static List<String> dump({env} env, String label, List<String> previous) {{
+		Collection<Literal> percepts = env.getPercepts("probe");
+		List<String> atoms = previous;
+		if (percepts != null) {{
+			atoms = new ArrayList<>();
+			for (Literal percept : percepts) {{
+				atoms.add(percept.toString());
+			}}
+			Collections.sort(atoms);
+		}}
+		System.out.println("percepts " + label + " = " + String.join(" ", atoms));
+		return atoms;
+	}}
+}}
+"""
+
+
+def _compile_percept_probe(
+	tmp_path: Path,
+	probe_source: str,
+	class_name: str,
+) -> tuple[JasonToolchain, dict[str, object], str]:
+	runner = JasonRunner(runtime_dir=tmp_path / "runtime")
+	if not runner.toolchain_available():
+		pytest.skip("Jason toolchain (Java 17-23, javac and the Jason jar) is unavailable.")
+	toolchain = runner.resolve_toolchain()
+	env_class_dir, _ = runner._resolve_environment_class_dir(
+		java_bin=toolchain.java_bin,
+		java_major=toolchain.java_major,
+		javac_bin=toolchain.javac_bin,
+		jason_jar=toolchain.jason_jar,
+		env_source=runner._build_environment_java_source(),
+		timing_profile={},
+	)
+
+	def literal(predicate: str, *, positive: bool = True) -> dict[str, object]:
+		return {"predicate": predicate, "args": ["?x"], "is_positive": positive}
+
+	env_data = runner._build_environment_data(
+		action_schemas=[
+			{
+				"functor": "switch_on",
+				"parameters": ["?x"],
+				"preconditions": [literal("off")],
+				"effects": [literal("on"), literal("off", positive=False)],
+			},
+			{
+				"functor": "switch_off",
+				"parameters": ["?x"],
+				"preconditions": [literal("on")],
+				"effects": [literal("off"), literal("on", positive=False)],
+			},
+		],
+		seed_facts=["(off lamp)", "(filler f0)"],
+	)
+	probe_dir = tmp_path / "probe"
+	probe_dir.mkdir()
+	source_path = probe_dir / f"{class_name}.java"
+	source_path.write_text(probe_source.format(env=runner.environment_class_name))
+	classpath = os.pathsep.join([str(probe_dir), str(env_class_dir), str(toolchain.jason_jar)])
+	subprocess.run(
+		[toolchain.javac_bin, "-cp", classpath, "-d", str(probe_dir), str(source_path)],
+		check=True,
+		capture_output=True,
+		text=True,
+	)
+	return toolchain, env_data, classpath
+
+
+def _percept_lines(stdout: str) -> list[tuple[str, list[str]]]:
+	return [
+		(label, atoms.split())
+		for label, atoms in (
+			line.removeprefix("percepts ").split(" = ", 1)
+			for line in stdout.splitlines()
+			if line.startswith("percepts ")
+		)
+	]
+
+
+def test_jason_environment_percepts_track_world_through_add_delete_and_undo(
+	tmp_path: Path,
+) -> None:
+	toolchain, env_data, classpath = _compile_percept_probe(tmp_path, _PERCEPT_PROBE_JAVA, "PerceptProbe")
+	env_data_path = tmp_path / "jason_environment.json"
+	env_data_path.write_text(json.dumps(env_data))
+	steps = [
+		"switch_on(lamp)",
+		"runtime_snapshot(s1)",
+		"switch_off(lamp)",
+		"runtime_restore(s1)",
+		"runtime_commit(s1)",
+		"switch_on(lamp)",
+		"switch_off(lamp)",
+	]
+	completed = subprocess.run(
+		[toolchain.java_bin, "-cp", classpath, "PerceptProbe", str(env_data_path), *steps],
+		check=True,
+		capture_output=True,
+		text=True,
+		timeout=120,
+	)
+
+	assert _percept_lines(completed.stdout) == [
+		("init", ["filler(f0)", "off(lamp)"]),
+		("switch_on(lamp)", ["filler(f0)", "on(lamp)"]),
+		("runtime_snapshot(s1)", ["filler(f0)", "on(lamp)"]),
+		("switch_off(lamp)", ["filler(f0)", "off(lamp)"]),
+		("runtime_restore(s1)", ["filler(f0)", "on(lamp)"]),
+		("runtime_commit(s1)", ["filler(f0)", "on(lamp)"]),
+		("switch_on(lamp) rejected", ["filler(f0)", "on(lamp)"]),
+		("switch_off(lamp)", ["filler(f0)", "off(lamp)"]),
+	]
+
+
+_SECOND_AGENT_PROBE_JAVA = """
+import jason.asSyntax.Literal;
+import jason.asSyntax.Structure;
+
+import java.util.ArrayList;
+import java.util.Collection;
+import java.util.Collections;
+import java.util.List;
+
+public class SecondAgentProbe {{
+	public static void main(String[] args) throws Exception {{
+		{env} env = new {env}();
+		env.init(new String[] {{args[0]}});
+		env.executeAction("first", Structure.parse("switch_on(lamp)"));
+		dump(env, "second");
+		dump(env, "first");
+		env.stop();
+	}}
+
+	static void dump({env} env, String agent) {{
+		List<String> atoms = new ArrayList<>();
+		Collection<Literal> percepts = env.getPercepts(agent);
+		if (percepts != null) {{
+			for (Literal percept : percepts) {{
+				atoms.add(percept.toString());
+			}}
+		}}
+		Collections.sort(atoms);
+		System.out.println("percepts " + agent + " = " + String.join(" ", atoms));
+	}}
+}}
+"""
+
+
+def test_jason_environment_publishes_seed_state_to_lazily_created_agent_world(
+	tmp_path: Path,
+) -> None:
+	toolchain, env_data, classpath = _compile_percept_probe(
+		tmp_path,
+		_SECOND_AGENT_PROBE_JAVA,
+		"SecondAgentProbe",
+	)
+	env_data["agents"] = [{"name": "first", "seed_facts": list(env_data["seed_facts"])}]
+	env_data_path = tmp_path / "jason_environment.json"
+	env_data_path.write_text(json.dumps(env_data))
+	completed = subprocess.run(
+		[toolchain.java_bin, "-cp", classpath, "SecondAgentProbe", str(env_data_path)],
+		check=True,
+		capture_output=True,
+		text=True,
+		timeout=120,
+	)
+
+	# "second" has no seeded world; it must perceive the full seed state on first use.
+	assert _percept_lines(completed.stdout) == [
+		("second", ["filler(f0)", "off(lamp)"]),
+		("first", ["filler(f0)", "on(lamp)"]),
+	]
+
+
+def test_jason_environment_snapshots_are_undo_trail_marks() -> None:
+	source = JasonRunner()._build_environment_java_source()
+	control_source = source.split("private boolean handleRuntimeControlAction(", maxsplit=1)[1]
+
+	assert "final Map<String, LinkedHashMap<String, Long>> factsByPredicate" in source
+	assert "active.snapshot(key);" in control_source
+	assert "active.restore(key)" in control_source
+	assert "active.commit(key);" in control_source
+	assert "removeIf(" not in source
+	assert "new LinkedHashSet<>(active" not in source
+	assert 'active.latestWithPrefix("runtime_method_choice_point(")' in source
+
+
+def test_jason_runner_schema_replay_uses_the_bitset_simulator() -> None:
+	runner = JasonRunner()
+	action_schemas = [
+		{
+			"functor": "move",
+			"source_name": "move",
+			"parameters": ["?x", "?from", "?to"],
+			"precondition_clauses": [
+				[
+					{"predicate": "at", "args": ["?x", "?from"], "is_positive": True},
+					{"predicate": "=", "args": ["?from", "?to"], "is_positive": False},
+				],
+			],
+			"effects": [
+				{"predicate": "at", "args": ["?x", "?to"], "is_positive": True},
+				{"predicate": "at", "args": ["?x", "?from"], "is_positive": False},
+			],
+		},
+	]
+	seed_facts = ("(at truck depot)", "(road depot market)")
+
+	passed = runner._replay_action_path_against_schemas(
+		action_path=("move(truck,depot,market)", "move(truck,market,depot)"),
+		action_schemas=action_schemas,
+		seed_facts=seed_facts,
+	)
+	same_place = runner._replay_action_path_against_schemas(
+		action_path=("move(truck,depot,depot)",),
+		action_schemas=action_schemas,
+		seed_facts=seed_facts,
+	)
+	malformed = runner._replay_action_path_against_schemas(
+		action_path=("move(truck,depot,market)", "move(truck"),
+		action_schemas=action_schemas,
+		seed_facts=seed_facts,
+	)
+	wrong_arity = runner._replay_action_path_against_schemas(
+		action_path=("move(truck,depot)",),
+		action_schemas=action_schemas,
+		seed_facts=seed_facts,
+	)
+
+	assert passed["passed"] is True
+	assert passed["checked_steps"] == 2
+	assert passed["world_facts"] == ["at(truck,depot)", "road(depot,market)"]
+	assert same_place["failure_class"] == "action_path_precondition_violation"
+	assert same_place["message"] == (
+		"runtime action step #1 violates schema preconditions for 'move(truck, depot, depot)'"
+	)
+	assert malformed["failure_class"] == "action_path_malformed_step"
+	assert malformed["checked_steps"] == 1
+	assert malformed["world_facts"] == ["at(truck,market)", "road(depot,market)"]
+	assert wrong_arity["failure_class"] == "action_path_arity_mismatch"
+	assert wrong_arity["message"].endswith("expected 3")
+	assert runner._ground_simulator(action_schemas) is runner._ground_simulator(action_schemas)
+
+
+def test_runtime_atom_parsing_shares_one_symbol_table() -> None:
+	runner = JasonRunner()
+	symbols = runner._symbol_table()
+
+	assert runner._hddl_fact_to_atom("(at-robby truck-0 l1)") == 'at_robby("truck-0",l1)'
+	assert runner._parse_runtime_atom('at_robby("truck-0", l1)') == ("at_robby", ("truck-0", "l1"))
+	assert runner._parse_runtime_atom("on(a") is None
+	assert symbols.encode_agentspeak('at_robby("truck-0", l1)') == symbols.encode_hddl(
+		"(at-robby truck-0 l1)",
+	)
+	assert IPCPlanVerifier.render_primitive_only_plan(('put-down("b-1")', "noop")) == (
+		"==>\n0 put-down b-1\n1 noop\nroot\n"
+	)
+	with pytest.raises(ValueError, match="Invalid action_path step"):
+		IPCPlanVerifier.render_primitive_only_plan(("stack(a",))
+
+
+def test_jason_runner_keeps_schema_caches_per_thread() -> None:
+	runner = JasonRunner()
+	action_schemas = [
+		{
+			"functor": "noop",
+			"source_name": "noop",
+			"parameters": [],
+			"precondition_clauses": [[]],
+			"effects": [],
+		},
+	]
+	main_simulator = runner._ground_simulator(action_schemas)
+	main_lookup = runner._action_schema_lookup(action_schemas)
+
+	with ThreadPoolExecutor(max_workers=1) as executor:
+		worker_simulator, worker_lookup = executor.submit(
+			lambda: (
+				runner._ground_simulator(action_schemas),
+				runner._action_schema_lookup(action_schemas),
+			),
+		).result()
+
+	assert worker_simulator is not main_simulator
+	assert worker_lookup is not main_lookup
+	assert runner._ground_simulator(action_schemas) is main_simulator
+
+
+def test_jason_runner_validate_many_shares_toolchain_and_environment(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	runner = JasonRunner(runtime_dir=tmp_path)
+	jason_jar = tmp_path / "jason-cli-all-3.3.1.jar"
+	log_conf = tmp_path / "logging.properties"
+	jason_jar.write_text("")
+	log_conf.write_text("")
+	probes: list[str] = []
+	compiled_dirs: list[Path] = []
+
+	def fake_select_java_binary():
+		probes.append("java")
+		return "java", 17
+
+	def fake_compile_environment_java(**kwargs) -> None:
+		output_path = Path(str(kwargs["output_path"]))
+		compiled_dirs.append(output_path)
+		(output_path / f"{runner.environment_class_name}.class").write_text("")
+
+	monkeypatch.setattr(runner, "_select_java_binary", fake_select_java_binary)
+	monkeypatch.setattr(runner, "_select_javac_binary", lambda java_bin: "javac")
+	monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java_bin: jason_jar)
+	monkeypatch.setattr(runner, "_resolve_log_config", lambda: log_conf)
+	monkeypatch.setattr(runner, "_compile_environment_java", fake_compile_environment_java)
+	monkeypatch.setattr(
+		runner.environment_adapter,
+		"validate",
+		lambda *, stdout, stderr: EnvironmentAdapterResult(
+			success=True,
+			adapter_name="fake",
+			mode="test",
+			details={},
+		),
+	)
+	monkeypatch.setattr(runner, "_run_consistency_checks", lambda **kwargs: {})
+	monkeypatch.setattr(
+		"evaluation.jason_runtime.runner.subprocess.Popen",
+		_fake_jason_popen("runtime env ready\nexecute success\n"),
+	)
+	action_schemas = [
+		{
+			"functor": "pick_up",
+			"source_name": "pick-up",
+			"parameters": ["?x"],
+			"preconditions": [{"predicate": "clear", "args": ["?x"], "is_positive": True}],
+			"effects": [{"predicate": "clear", "args": ["?x"], "is_positive": False}],
+		},
+	]
+	jobs = [
+		JasonValidationJob(
+			agentspeak_code="/* HTN Method Plans */\n+!idle_goal : true <-\n\ttrue.",
+			action_schemas=action_schemas,
+			method_library=_sample_method_library(),
+			seed_facts=(f"(clear b{index})",),
+			domain_name="blocks",
+			output_dir=tmp_path / f"query_{index}",
+			job_id=f"query_{index}",
+		)
+		for index in range(1, 5)
+	]
+
+	outcomes = runner.validate_many(jobs, max_workers=3)
+
+	assert [outcome.job_id for outcome in outcomes] == ["query_1", "query_2", "query_3", "query_4"]
+	assert all(outcome.succeeded and outcome.error is None for outcome in outcomes)
+	assert probes == ["java"]
+	assert len(compiled_dirs) == 1
+	assert all(
+		outcome.result.artifacts["environment_class_cache_hit"] is True
+		and outcome.result.artifacts["toolchain_source"] == "shared"
+		and "total_seconds" in outcome.result.timing_profile
+		for outcome in outcomes
+	)
+	for index, outcome in enumerate(outcomes, start=1):
+		env_data = json.loads((Path(outcome.output_dir) / "jason_environment.json").read_text())
+		assert env_data["seed_facts"] == [f"clear(b{index})"]
+	with pytest.raises(JasonValidationError, match="distinct output directories"):
+		runner.validate_many([jobs[0], jobs[0]])
+
+
+def test_jason_runner_validate_packed_runs_queries_as_agents_of_one_mas(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	runner = JasonRunner(runtime_dir=tmp_path)
+	jason_jar = tmp_path / "jason-cli-all-3.3.1.jar"
+	log_conf = tmp_path / "logging.properties"
+	jason_jar.write_text("")
+	log_conf.write_text("")
+	commands: list[list[str]] = []
+
+	def fake_compile_environment_java(**kwargs) -> None:
+		output_path = Path(str(kwargs["output_path"]))
+		(output_path / f"{runner.environment_class_name}.class").write_text("")
+
+	monkeypatch.setattr(runner, "_select_java_binary", lambda: ("java", 17))
+	monkeypatch.setattr(runner, "_select_javac_binary", lambda java_bin: "javac")
+	monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java_bin: jason_jar)
+	monkeypatch.setattr(runner, "_resolve_log_config", lambda: log_conf)
+	monkeypatch.setattr(runner, "_compile_environment_java", fake_compile_environment_java)
+	monkeypatch.setattr(
+		runner.environment_adapter,
+		"validate",
+		lambda *, stdout, stderr: EnvironmentAdapterResult(
+			success=True,
+			adapter_name="fake",
+			mode="test",
+			details={},
+		),
+	)
+	monkeypatch.setattr(runner, "_run_consistency_checks", lambda **kwargs: {})
+	monkeypatch.setattr(
+		"evaluation.jason_runtime.runner.subprocess.Popen",
+		_fake_jason_popen(
+			"\n".join(
+				[
+					"runtime env ready",
+					"[query_1] runtime env action success pick-up(a)",
+					"[query_2] runtime env action failed pick-up(b) reason=precondition",
+					"[query_1] execute success",
+					"[query_2] execute failed",
+				],
+			)
+			+ "\n",
+			commands=commands,
+		),
+	)
+	action_schemas = [
+		{
+			"functor": "pick_up",
+			"source_name": "pick-up",
+			"parameters": ["?x"],
+			"preconditions": [{"predicate": "clear", "args": ["?x"], "is_positive": True}],
+			"effects": [{"predicate": "clear", "args": ["?x"], "is_positive": False}],
+		},
+	]
+	jobs = [
+		JasonValidationJob(
+			agentspeak_code="/* HTN Method Plans */\n+!idle_goal : true <-\n\ttrue.",
+			action_schemas=action_schemas,
+			method_library=_sample_method_library(),
+			seed_facts=(seed_fact,),
+			domain_name="blocks",
+			output_dir=tmp_path / job_id,
+			job_id=job_id,
+		)
+		for job_id, seed_fact in (("first", "(clear a)"), ("second", "(on b a)"))
+	]
+
+	outcomes = runner.validate_packed(jobs, output_dir=tmp_path / "pack")
+
+	assert len(commands) == 1
+	first, second = outcomes
+	assert first.job_id == "first" and first.succeeded
+	assert first.result.action_path == ["pick-up(a)"]
+	assert first.result.artifacts["packed_agent"] == "query_1"
+	assert "[query_2]" not in first.result.stdout
+	assert second.result is None
+	assert second.error.metadata["failure_class"] == "runtime_failure_marker"
+	assert second.error.metadata["action_path_count"] == 0
+	env_data = json.loads((tmp_path / "pack" / "jason_environment.json").read_text())
+	assert env_data["agents"] == [
+		{"name": "query_1", "seed_facts": ["clear(a)"]},
+		{"name": "query_2", "seed_facts": ["on(b,a)"]},
+	]
+	assert "agents: query_1; query_2;" in (tmp_path / "pack" / "jason_runner.mas2j").read_text()
+	packed_asl = (tmp_path / "pack" / "query_1.asl").read_text()
+	assert ".stopMAS" not in packed_asl and ".drop_all_intentions" in packed_asl
+	assert ".stopMAS" in (tmp_path / "first" / "agentspeak_generated.asl").read_text()
+
+
+def test_jason_runner_reuses_prebuilt_internal_action_jar_across_queries(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	runner = JasonRunner(runtime_dir=tmp_path)
+	jason_jar = tmp_path / "jason-cli-all-3.3.1.jar"
+	log_conf = tmp_path / "logging.properties"
+	jason_jar.write_text("")
+	log_conf.write_text("")
+	compiled_roots: list[Path] = []
+	commands: list[list[str]] = []
+
+	def fake_compile_environment_java(**kwargs) -> None:
+		output_path = Path(str(kwargs["output_path"]))
+		(output_path / f"{runner.environment_class_name}.class").write_text("")
+
+	def fake_compile_java_sources(**kwargs) -> None:
+		source_root = Path(str(kwargs["source_root"]))
+		compiled_roots.append(source_root)
+		for java_path in source_root.rglob("*.java"):
+			java_path.with_suffix(".class").write_bytes(b"\xca\xfe\xba\xbe")
+
+	monkeypatch.setattr(runner, "_select_java_binary", lambda: ("java", 17))
+	monkeypatch.setattr(runner, "_select_javac_binary", lambda java_bin: "javac")
+	monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java_bin: jason_jar)
+	monkeypatch.setattr(runner, "_resolve_log_config", lambda: log_conf)
+	monkeypatch.setattr(runner, "_compile_environment_java", fake_compile_environment_java)
+	monkeypatch.setattr(runner, "_compile_java_sources", fake_compile_java_sources)
+	monkeypatch.setattr(
+		runner,
+		"_build_runner_asl",
+		lambda *args, **kwargs: "+!g : pipeline.no_ancestor_goal(g) <- true.\n",
+	)
+	monkeypatch.setattr(
+		runner.environment_adapter,
+		"validate",
+		lambda *, stdout, stderr: EnvironmentAdapterResult(
+			success=True,
+			adapter_name="fake",
+			mode="test",
+			details={},
+		),
+	)
+	monkeypatch.setattr(runner, "_extract_action_path", lambda stdout: [])
+	monkeypatch.setattr(runner, "_extract_method_trace", lambda output: [])
+	monkeypatch.setattr(runner, "_run_consistency_checks", lambda **kwargs: {})
+	monkeypatch.setattr(
+		"evaluation.jason_runtime.runner.subprocess.Popen",
+		_fake_jason_popen("runtime env ready\nexecute success\n", commands=commands),
+	)
+
+	results = [
+		runner.validate(
+			agentspeak_code="+!g : true <- true.",
+			method_library=_sample_method_library(),
+			action_schemas=[{"name": "idle_action"}],
+			domain_name="blocks",
+			output_dir=tmp_path / f"query_{query_index}",
+		)
+		for query_index in (1, 2)
+	]
+
+	assert len(compiled_roots) == 1
+	assert [result.artifacts["internal_action_cache_hit"] for result in results] == [False, True]
+	jar_path = Path(results[1].artifacts["internal_action_jar"])
+	with zipfile.ZipFile(jar_path) as archive:
+		assert "pipeline/no_ancestor_goal.class" in archive.namelist()
+		assert "pipeline/choose_runtime_choice.class" in archive.namelist()
+	classpath = commands[-1][commands[-1].index("-cp") + 1].split(os.pathsep)
+	assert str(jar_path) in classpath
+	assert not list((tmp_path / "query_2").rglob("*.java"))
+
+
+def test_jason_toolchain_manifest_is_shared_and_invalidated_by_jar_changes(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	jar_dir = tmp_path / "jason_src" / "jason-cli" / "build" / "bin"
+	jar_dir.mkdir(parents=True)
+	jason_jar = jar_dir / "jason-cli-all-3.3.1.jar"
+	java_bin = tmp_path / "jdk" / "bin" / "java"
+	javac_bin = tmp_path / "jdk" / "bin" / "javac"
+	log_conf = tmp_path / "logging.properties"
+	java_bin.parent.mkdir(parents=True)
+	for path in (jason_jar, java_bin, javac_bin, log_conf):
+		path.write_text("")
+	probes: list[str] = []
+
+	def build_runner() -> JasonRunner:
+		runner = JasonRunner(runtime_dir=tmp_path)
+
+		def fake_select_java_binary():
+			probes.append("java")
+			return str(java_bin), 21
+
+		monkeypatch.setattr(runner, "_select_java_binary", fake_select_java_binary)
+		monkeypatch.setattr(runner, "_select_javac_binary", lambda java: str(javac_bin))
+		monkeypatch.setattr(runner, "_ensure_jason_jar", lambda java: jason_jar)
+		monkeypatch.setattr(runner, "_resolve_log_config", lambda: log_conf)
+		return runner
+
+	clear_toolchain_memo()
+	first, first_source = build_runner()._resolve_toolchain()
+	_, memo_source = build_runner()._resolve_toolchain()
+	clear_toolchain_memo()
+	persisted, manifest_source = build_runner()._resolve_toolchain()
+	stat = jason_jar.stat()
+	os.utime(jason_jar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+	_, rebuilt_source = build_runner()._resolve_toolchain()
+	shared_source = JasonRunner(runtime_dir=tmp_path, toolchain=first)._resolve_toolchain()[1]
+	clear_toolchain_memo()
+
+	assert (first_source, memo_source, manifest_source, rebuilt_source) == (
+		"probe",
+		"memory",
+		"manifest",
+		"probe",
+	)
+	assert shared_source == "shared"
+	assert probes == ["java", "java"]
+	assert persisted == first
+	assert persisted.java_major == 21
+	assert json.loads((tmp_path / ".class_cache" / "toolchain.json").read_text())["jason_jar"] == str(
+		jason_jar
+	)
+
+
+def test_method_trace_reconstruction_accepts_hyphenated_runtime_action_names(
+	tmp_path: Path,
+) -> None:
+	problem_file = tmp_path / "blocksworld_simple_put_on.hddl"
+	problem_file.write_text(
+		"""(define (problem BW-simple-put-on)
+(:domain BLOCKS)
+(:objects b2 b4 - block)
+(:htn :parameters () :ordered-subtasks (and
+(task1 (do_put_on b4 b2))
+))
+(:init
+(handempty)
+(ontable b2)
+(ontable b4)
+(clear b2)
+(clear b4)
+)
+\t(:goal (and
+(on b4 b2)
+\t))
+)
+""",
+		encoding="utf-8",
+	)
+	method_library = HTNMethodLibrary(
+		compound_tasks=[
+			HTNTask(name="do_put_on", parameters=("?x", "?y"), is_primitive=False),
+		],
+		primitive_tasks=[
+			HTNTask(name="pick_up", parameters=("?x",), is_primitive=True),
+			HTNTask(name="stack", parameters=("?x", "?y"), is_primitive=True),
+		],
+		methods=[
+			HTNMethod(
+				method_name="m_do_put_on_serial",
+				task_name="do_put_on",
+				parameters=("?x", "?y"),
+				task_args=("?x", "?y"),
+				subtasks=(
+					HTNMethodStep("s1", "pick_up", ("?x",), "primitive", action_name="pick_up"),
+					HTNMethodStep("s2", "stack", ("?x", "?y"), "primitive", action_name="stack"),
+				),
+				ordering=(("s1", "s2"),),
+			),
+		],
+		target_literals=[],
+		target_task_bindings=[],
+	)
+	runner = JasonRunner()
+
+	reconstruction = runner._check_method_trace_reconstruction(
+		action_path=("pick-up(b4)", "stack(b4,b2)"),
+		method_trace=({"method_name": "m_do_put_on_serial", "task_args": ("b4", "b2")},),
+		method_library=method_library,
+		problem_file=problem_file,
+	)
+	rendered_plan = IPCPlanVerifier()._render_supported_hierarchical_plan(
+		domain_file=problem_file,
+		problem_file=problem_file,
+		action_path=("pick-up(b4)", "stack(b4,b2)"),
+		method_library=method_library,
+		method_trace=({"method_name": "m_do_put_on_serial", "task_args": ("b4", "b2")},),
+	)
+
+	assert reconstruction == {
+		"passed": True,
+		"failure_class": None,
+		"message": None,
+	}
+	assert rendered_plan is not None
+	assert "pick-up b4" in rendered_plan
+	assert "stack b4 b2" in rendered_plan
+
+
+def test_hierarchical_plan_exporter_rejects_runtime_repair_suffix(tmp_path: Path) -> None:
+	problem_file = tmp_path / "blocksworld_repeated_runtime_roots.hddl"
+	problem_file.write_text(
+		"""(define (problem BW-repair-root)
+(:domain BLOCKS)
+(:objects b2 b4 - block)
+(:htn :parameters () :ordered-subtasks (and
+(task1 (do_put_on b4 b2))
+))
+(:init
+(handempty)
+(ontable b2)
+(ontable b4)
+(clear b2)
+(clear b4)
+)
+\t(:goal (and
+(on b4 b2)
+\t))
 )
 """,
 		encoding="utf-8",
@@ -3471,3 +4899,224 @@ def test_official_plan_verifier_result_dict_omits_full_process_output() -> None:
 	assert "stdout" not in payload
 	assert payload["stdout_chars"] == 10_000
 	assert "full text in output_file" in str(payload["stdout_preview"])
+
+
+def test_official_plan_verifier_prefilter_skips_non_executable_primitive_plans(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	domain_file = PROJECT_ROOT / "src" / "domains" / "blocksworld" / "domain.hddl"
+	problem_file = PROJECT_ROOT / "src" / "domains" / "blocksworld" / "problems" / "p01.hddl"
+	monkeypatch.setenv("IPC_VERIFIER_RESULT_CACHE_DIR", "off")
+	monkeypatch.setattr(IPCPlanVerifier, "tool_available", lambda self: True)
+	external_calls: list[list[str]] = []
+
+	def fake_run(command, **kwargs):
+		external_calls.append(list(command))
+		return type(
+			"Completed",
+			(),
+			{
+				"stdout": "Primitive plan only\nPrimitive plan alone executable: true\n",
+				"stderr": "",
+				"returncode": 0,
+			},
+		)()
+
+	monkeypatch.setattr("verification.official_plan_verifier.subprocess.run", fake_run)
+
+	rejected = IPCPlanVerifier(primitive_prefilter="on").verify_primitive_plan(
+		domain_file=domain_file,
+		problem_file=problem_file,
+		action_path=("stack(b1,b4)",),
+		output_dir=tmp_path / "rejected",
+	)
+	differential = IPCPlanVerifier(primitive_prefilter="differential").verify_primitive_plan(
+		domain_file=domain_file,
+		problem_file=problem_file,
+		action_path=("unstack(b2,b3)", "put-down(b2)"),
+		output_dir=tmp_path / "differential",
+	)
+	mistyped = IPCPlanVerifier(primitive_prefilter="on").verify_primitive_plan(
+		domain_file=domain_file,
+		problem_file=problem_file,
+		action_path=("stack(b1,floor)",),
+		output_dir=tmp_path / "mistyped",
+	)
+
+	assert rejected.primitive_plan_executable is False
+	assert rejected.reached_goal_state is False
+	assert rejected.metadata["primitive_prefilter"]["external_skipped"] is True
+	assert rejected.metadata["primitive_prefilter"]["failure"] == "precondition_violation"
+	assert rejected.metadata["primitive_prefilter"]["message"] == (
+		"primitive step #1 (stack b1 b4) is not applicable"
+	)
+	assert len(external_calls) == 2
+	assert mistyped.metadata["primitive_prefilter"]["external_skipped"] is False
+	assert mistyped.metadata["primitive_prefilter"]["failure"] == "parameter_type_mismatch"
+	assert mistyped.metadata["primitive_prefilter"]["executable"] is None
+	assert PrimitivePlanChecker.for_files(domain_file, problem_file)._compiled is compile_domain(
+		load_parsed_domain(domain_file),
+	)
+	assert differential.primitive_plan_executable is True
+	assert differential.metadata["primitive_prefilter"]["executable"] is True
+	assert differential.metadata["primitive_prefilter"]["agrees"] is False
+	assert differential.metadata["primitive_prefilter"]["missing_goal_facts"] == ["(on b1 b4)", "(on b3 b1)"]
+
+
+def test_official_plan_verifier_reuses_cached_verdicts_for_identical_inputs(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	domain_file = PROJECT_ROOT / "src" / "domains" / "blocksworld" / "domain.hddl"
+	problem_file = PROJECT_ROOT / "src" / "domains" / "blocksworld" / "problems" / "p01.hddl"
+	monkeypatch.setenv("IPC_VERIFIER_RESULT_CACHE_DIR", str(tmp_path / "cache"))
+	monkeypatch.setattr(IPCPlanVerifier, "tool_available", lambda self: True)
+	external_calls: list[list[str]] = []
+	verifier_stdout = (
+		"Primitive plan only\n"
+		+ "".join(f"checked step {index}\n" for index in range(500))
+		+ "Primitive plan alone executable: true\n"
+	)
+
+	def fake_run(command, **kwargs):
+		external_calls.append(list(command))
+		return type(
+			"Completed",
+			(),
+			{
+				"stdout": verifier_stdout,
+				"stderr": "",
+				"returncode": 0,
+			},
+		)()
+
+	monkeypatch.setattr("verification.official_plan_verifier.subprocess.run", fake_run)
+	plan_text = IPCPlanVerifier.render_primitive_only_plan(("unstack(b2,b3)", "put-down(b2)"))
+
+	fresh = IPCPlanVerifier().verify_plan_text(
+		domain_file=domain_file,
+		problem_file=problem_file,
+		plan_text=plan_text,
+		output_dir=tmp_path / "fresh",
+		plan_kind="primitive_only",
+	)
+	cached = IPCPlanVerifier().verify_plan_text(
+		domain_file=domain_file,
+		problem_file=problem_file,
+		plan_text=plan_text,
+		output_dir=tmp_path / "cached",
+		plan_kind="primitive_only",
+	)
+	changed = IPCPlanVerifier().verify_plan_text(
+		domain_file=domain_file,
+		problem_file=problem_file,
+		plan_text=plan_text + "\n",
+		output_dir=tmp_path / "changed",
+		plan_kind="primitive_only",
+	)
+
+	assert len(external_calls) == 2
+	assert fresh.metadata["verification_cache"]["hit"] is False
+	assert cached.metadata["verification_cache"] == {
+		"hit": True,
+		"key": fresh.metadata["verification_cache"]["key"],
+	}
+	assert changed.metadata["verification_cache"]["hit"] is False
+	assert cached.primitive_plan_executable is True
+	assert cached.reached_goal_state is fresh.reached_goal_state
+	assert Path(cached.output_file).read_text() == Path(fresh.output_file).read_text()
+	assert cached.stdout == verifier_stdout
+	assert cached.to_dict()["stdout_chars"] == len(verifier_stdout)
+
+
+def test_verification_result_cache_is_opt_in_and_size_bounded(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	monkeypatch.delenv("IPC_VERIFIER_RESULT_CACHE_DIR", raising=False)
+	assert configured_verification_cache_root() is None
+	assert IPCPlanVerifier().result_cache is None
+	monkeypatch.setenv("IPC_VERIFIER_RESULT_CACHE_DIR", "on")
+	assert configured_verification_cache_root() == DEFAULT_VERIFICATION_CACHE_ROOT
+
+	cache = IPCVerificationResultCache(tmp_path / "cache", max_bytes=600)
+	for index, key in enumerate(("aa" + "0" * 62, "bb" + "0" * 62)):
+		cache.put(key, {"stdout": "x" * 200, "index": index})
+		os.utime(cache.entry_path(key), ns=(index * 10**9, index * 10**9))
+	assert cache.stats["scans"] == 1
+	cache.put("cc" + "0" * 62, {"stdout": "x" * 200, "index": 2})
+	os.utime(cache.entry_path("cc" + "0" * 62), ns=(2 * 10**9, 2 * 10**9))
+	cache.put("dd" + "0" * 62, {"stdout": "x" * 200, "index": 3})
+
+	assert cache.get("aa" + "0" * 62) is None
+	assert cache.get("dd" + "0" * 62)["index"] == 3
+	assert cache.stats["evictions"] >= 1
+	assert sum(path.stat().st_size for path in (tmp_path / "cache").glob("*/*.json")) <= 600
+
+
+def test_official_plan_verifier_hierarchy_reconstruction_memoises_failed_subproblems(
+	monkeypatch: pytest.MonkeyPatch,
+) -> None:
+	method_library = HTNMethodLibrary(
+		compound_tasks=[
+			HTNTask(name="do_put_on", parameters=("?x", "?y"), is_primitive=False),
+		],
+		primitive_tasks=[
+			HTNTask(name="pick_up", parameters=("?x",), is_primitive=True),
+			HTNTask(name="stack", parameters=("?x", "?y"), is_primitive=True),
+		],
+		methods=[
+			HTNMethod(
+				method_name="m_do_put_on_serial",
+				task_name="do_put_on",
+				parameters=("?x", "?y"),
+				task_args=("?x", "?y"),
+				subtasks=(
+					HTNMethodStep("s1", "pick_up", ("?x",), "primitive", action_name="pick_up"),
+					HTNMethodStep("s2", "stack", ("?x", "?y"), "primitive", action_name="stack"),
+				),
+				ordering=(("s1", "s2"),),
+			),
+		],
+		target_literals=[],
+		target_task_bindings=[],
+	)
+	root_task = type("RootTask", (), {"task_name": "do_put_on", "args": ("b4", "b2")})()
+	trace_entries = IPCPlanVerifier._normalise_method_trace(
+		({"method_name": "m_do_put_on_serial", "task_args": ("b4", "b2")},),
+	)
+	verifier = IPCPlanVerifier()
+
+	with pytest.raises(ValueError, match="primitive step mismatch"):
+		verifier._reconstruct_hierarchy(
+			method_library=method_library,
+			root_tasks=(root_task, root_task),
+			actions=(("pick_up", ("b4",)), ("unstack", ("b4", "b2"))),
+			trace_entries=trace_entries,
+			root_tasks_ordered=False,
+		)
+	failed_stats = dict(verifier.last_hierarchy_reconstruction_stats)
+
+	monkeypatch.setenv("IPC_VERIFIER_HIERARCHY_STATE_LIMIT", "1")
+	reconstructed = verifier._reconstruct_hierarchy(
+		method_library=method_library,
+		root_tasks=(root_task,),
+		actions=(("pick_up", ("b4",)), ("stack", ("b4", "b2"))),
+		trace_entries=trace_entries,
+		root_tasks_ordered=True,
+	)
+
+	assert failed_stats["explored_states"] == 1
+	assert failed_stats["failed_states"] == 1
+	assert failed_stats["memo_hits"] == 1
+	assert reconstructed[1:] == (2, 1)
+	assert verifier.last_hierarchy_reconstruction_stats["state_limit"] == 1
+	with pytest.raises(ValueError, match="exceeded 1 explored states"):
+		verifier._reconstruct_hierarchy(
+			method_library=method_library,
+			root_tasks=(root_task, root_task),
+			actions=(("pick_up", ("b4",)), ("stack", ("b4", "b2"))) * 2,
+			trace_entries=trace_entries * 2,
+			root_tasks_ordered=True,
+		)
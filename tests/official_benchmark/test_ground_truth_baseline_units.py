@@ -14,6 +14,11 @@ SRC_ROOT = PROJECT_ROOT / "src"
 if str(SRC_ROOT) not in sys.path:
 	sys.path.insert(0, str(SRC_ROOT))
 
+from planning.artifact_cache import (
+	DEFAULT_PANDA_ARTIFACT_CACHE_ROOT,
+	PANDAArtifactCache,
+	configured_panda_artifact_cache,
+)
 from planning.primary_planner import LiftedPandaSatPlanner
 from planning.official_benchmark import OFFICIAL_BENCHMARK_PLANNING_TIMEOUT_SECONDS
 from planning.panda_sat import PANDAPlanner, PANDAPlanningError
@@ -25,6 +30,11 @@ from planning.process_capture import (
 )
 from planning.representations import PlanningRepresentation, RepresentationBuildResult
 from htn_evaluation.pipeline import HTNEvaluationPipeline
+from htn_evaluation.planning_worker_pool import (
+	PlanningWorkerPool,
+	PooledPlanningProcess,
+	PooledResultQueue,
+)
 from htn_evaluation.problem_root_evaluator import HTNProblemRootEvaluator
 import htn_evaluation.problem_root_evaluator as problem_root_evaluator
 import htn_evaluation.problem_root_runtime as problem_root_runtime
@@ -142,6 +152,100 @@ root
 	)
 
 
+def test_panda_planner_reuses_cached_parsed_and_grounded_models(tmp_path: Path) -> None:
+	calls_path = tmp_path / "calls.log"
+	tools: dict[str, Path] = {}
+	for tool_name, body in (
+		(
+			"parser",
+			"if sys.argv[1] == '-c':\n"
+			"    Path(sys.argv[3]).write_text(Path(sys.argv[2]).read_text())\n"
+			"else:\n"
+			"    Path(sys.argv[3]).write_text('parsed')\n",
+		),
+		("grounder", "Path(sys.argv[2]).write_text('grounded')\n"),
+		("engine", "print('==>')\nprint('root 0')\n"),
+	):
+		script = tmp_path / "bin" / tool_name
+		script.parent.mkdir(exist_ok=True)
+		script.write_text(
+			f"#!{sys.executable}\n"
+			"import sys\n"
+			"from pathlib import Path\n"
+			f"with open({str(calls_path)!r}, 'a') as handle:\n"
+			f"    handle.write({tool_name!r} + ' ' + ' '.join(sys.argv[1:2]) + '\\n')\n"
+			+ body,
+		)
+		script.chmod(0o755)
+		tools[tool_name] = script
+	with patch.dict(os.environ, {"PANDA_ARTIFACT_CACHE_DIR": str(tmp_path / "cache")}):
+		planner = PANDAPlanner(
+			workspace=tmp_path / "workspace",
+			parser_cmd=str(tools["parser"]),
+			grounder_cmd=str(tools["grounder"]),
+			engine_cmd=str(tools["engine"]),
+		)
+	domain_file = tmp_path / "domain.hddl"
+	problem_file = tmp_path / "problem.hddl"
+	domain_file.write_text("(define (domain d))")
+	problem_file.write_text("(define (problem p) (:domain d))")
+
+	results = [
+		planner.plan_hddl_files(
+			domain=SimpleNamespace(actions=[]),
+			domain_file=domain_file,
+			problem_file=problem_file,
+			task_name="root",
+			transition_name=f"run_{index}",
+			allow_empty_plan=True,
+		)
+		for index in range(2)
+	]
+
+	calls = calls_path.read_text().splitlines()
+	assert [call for call in calls if not call.startswith("parser -c")] == [
+		"parser " + str(tmp_path / "workspace" / "panda" / "run_0" / "domain.hddl"),
+		"grounder " + str(tmp_path / "workspace" / "panda" / "run_0" / "problem.psas"),
+		"engine -s",
+		"engine -s",
+	]
+	assert results[0].timing_profile["artifact_cache_stages"] == {
+		"parser": "miss",
+		"grounder": "miss",
+	}
+	assert results[1].timing_profile["artifact_cache_stages"] == {
+		"parser": "hit",
+		"grounder": "hit",
+	}
+	assert results[1].timing_profile["artifact_cache_hits"] == 2
+	second_work_dir = tmp_path / "workspace" / "panda" / "run_1"
+	assert (second_work_dir / "problem.psas.grounded").read_text() == "grounded"
+	assert results[1].grounder_stdout_path == str(second_work_dir / "grounder.stdout.log")
+
+
+def test_panda_artifact_cache_is_opt_in_and_evicts_least_recently_used(tmp_path: Path) -> None:
+	with patch.dict(os.environ, {"PANDA_ARTIFACT_CACHE_DIR": ""}):
+		assert configured_panda_artifact_cache() is None
+	with patch.dict(os.environ, {"PANDA_ARTIFACT_CACHE_DIR": "on"}):
+		assert configured_panda_artifact_cache().root == DEFAULT_PANDA_ARTIFACT_CACHE_ROOT
+
+	cache = PANDAArtifactCache(tmp_path / "cache", max_bytes=700)
+	source = tmp_path / "model.psas"
+	source.write_text("x" * 200)
+	keys = [f"{prefix}{'0' * 62}" for prefix in ("aa", "bb", "cc")]
+	cache.store(keys[0], {"model.psas": source})
+	cache.store(keys[1], {"model.psas": source})
+	os.utime(cache.entry_dir(keys[0]) / "manifest.json", ns=(0, 0))
+	os.utime(cache.entry_dir(keys[1]) / "manifest.json", ns=(10**9, 10**9))
+	assert cache.restore(keys[0], {"model.psas": tmp_path / "restored.psas"}) is True
+	cache.store(keys[2], {"model.psas": source})
+
+	assert cache.entry_dir(keys[0]).exists()
+	assert not cache.entry_dir(keys[1]).exists()
+	assert cache.entry_dir(keys[2]).exists()
+	assert cache.stats["evictions"] == 1
+
+
 def test_lifted_panda_primary_planner_uses_full_planning_timeout_budget() -> None:
 	planner = LiftedPandaSatPlanner()
 	planner.planner.plan_linearized_hddl_files = Mock(  # type: ignore[method-assign]
@@ -1090,6 +1194,98 @@ def test_sequential_full_baseline_resumes_from_existing_domain_summaries(
 	assert "transport" in summary["completed_domains"]
 
 
+def test_parallel_full_baseline_schedules_longest_first_and_resumes_from_checkpoints(
+	tmp_path: Path,
+) -> None:
+	def problem_row(query_id: str, seconds: float) -> dict[str, object]:
+		return {
+			"domain_key": "transport",
+			"query_id": query_id,
+			"problem_file": f"{query_id}.hddl",
+			"instruction": query_id,
+			"evaluation_mode": SINGLE_PLANNER_MODE,
+			"requested_planner_id": PRIMARY_HTN_PLANNER_ID,
+			"track_id": PRIMARY_HTN_PLANNER_ID,
+			"ipc_verified_success": True,
+			"outcome_bucket": "hierarchical_plan_verified",
+			"log_dir": f"/tmp/{query_id}",
+			"execution_time_seconds": seconds,
+			"plan_solve_time_seconds": seconds,
+			"plan_verification_time_seconds": 0.0,
+			"representation_build_seconds": 0.0,
+			"planner_wallclock_seconds": seconds,
+			"plan_solve_status": "success",
+			"plan_verification_status": "success",
+			"selected_solver_id": "sat",
+			"selected_planner_id": "lifted_panda_sat",
+			"selected_representation_id": "linearized_total_order",
+		}
+
+	runs_root = tmp_path / "runs"
+	previous_dir = runs_root / "previous" / "transport"
+	previous_dir.mkdir(parents=True)
+	(previous_dir / "problem_results.json").write_text(
+		json.dumps([problem_row("query_02", 5.0), problem_row("query_04", 50.0)]),
+	)
+	run_dir = runs_root / "current"
+	output_root = run_dir / "transport"
+	(output_root / "problem_checkpoints").mkdir(parents=True)
+	(output_root / "problem_checkpoints" / "query_01.json").write_text(
+		json.dumps(problem_row("query_01", 1.0)),
+	)
+	(output_root / "domain_summary.json").write_text(
+		json.dumps({"domain_gate_preflight": {"success": True, "validated_task_count": 3}}),
+	)
+	load_cases = Mock(
+		return_value={
+			query_id: {"problem_file": f"{query_id}.hddl", "instruction": query_id}
+			for query_id in ("query_01", "query_02", "query_03", "query_04")
+		},
+	)
+	run_case = Mock(side_effect=AssertionError("checkpointed problems must not rerun"))
+	launches: list[tuple[str, tuple[int, ...]]] = []
+
+	def fake_job_launcher(domain_key: str, query_id: str, cpu_ids: tuple[int, ...]) -> SimpleNamespace:
+		launches.append((query_id, tuple(cpu_ids)))
+		checkpoint_path = run_dir / domain_key / "problem_checkpoints" / f"{query_id}.json"
+		checkpoint_path.write_text(json.dumps(problem_row(query_id, 2.0)))
+		return SimpleNamespace(poll=lambda: 0)
+
+	original_domain_keys = baseline_runner.DOMAIN_KEYS
+	original_runs_root = baseline_runner.RUNS_ROOT
+	original_load = baseline_support.load_domain_query_cases
+	original_run_case = baseline_support.run_domain_problem_root_case
+	try:
+		baseline_runner.DOMAIN_KEYS = ("transport",)
+		baseline_runner.RUNS_ROOT = runs_root
+		baseline_support.load_domain_query_cases = load_cases
+		baseline_support.run_domain_problem_root_case = run_case
+		with patch.object(baseline_runner, "_cleanup_htn_evaluation_resources"):
+			summary = baseline_runner._run_parallel_full_baseline(
+				run_dir=run_dir,
+				evaluation_mode=SINGLE_PLANNER_MODE,
+				planner_id=PRIMARY_HTN_PLANNER_ID,
+				track_id=PRIMARY_HTN_PLANNER_ID,
+				max_jobs=1,
+				job_launcher=fake_job_launcher,
+			)
+	finally:
+		baseline_runner.DOMAIN_KEYS = original_domain_keys
+		baseline_runner.RUNS_ROOT = original_runs_root
+		baseline_support.load_domain_query_cases = original_load
+		baseline_support.run_domain_problem_root_case = original_run_case
+
+	# query_03 has no recorded timing and is treated as long as the slowest known problem.
+	assert [query_id for query_id, _ in launches] == ["query_04", "query_03", "query_02"]
+	assert all(len(cpu_ids) == 1 for _, cpu_ids in launches)
+	run_case.assert_not_called()
+	assert summary["complete"] is True
+	problem_rows = json.loads((output_root / "problem_results.json").read_text())
+	assert [row["query_id"] for row in problem_rows] == ["query_01", "query_02", "query_03", "query_04"]
+	schedule = json.loads((run_dir / "problem_schedule.json").read_text())
+	assert [entry["returncode"] for entry in schedule] == [0, 0, 0]
+
+
 def test_track_pass_matrix_writes_compact_pass_status(
 	tmp_path: Path,
 ) -> None:
@@ -1828,8 +2024,8 @@ def test_primary_planner_evaluation_runs_tasks_sequentially_to_cap_memory_pressu
 			return FakeProcess(kwargs=kwargs or {})
 
 	with patch.object(
-		problem_root_evaluator.multiprocessing,
-		"get_context",
+		problem_root_evaluator,
+		"planner_process_context",
 		return_value=FakeContext(),
 	):
 		result = evaluator.run_primary_planner_evaluation(
@@ -1841,6 +2037,217 @@ def test_primary_planner_evaluation_runs_tasks_sequentially_to_cap_memory_pressu
 	assert FakeProcess.max_active_count == 1
 
 
+def test_primary_planner_portfolio_cancels_losers_after_first_verified_plan(
+	tmp_path: Path,
+) -> None:
+	pipeline = HTNEvaluationPipeline(
+		domain_file=DOMAIN_FILES["transport"],
+		problem_file=str(
+			(PROJECT_ROOT / "src" / "domains" / "transport" / "problems" / "pfile01.hddl").resolve()
+		),
+	)
+	pipeline.output_dir = str(tmp_path / "official-eval")
+	evaluator = HTNProblemRootEvaluator(pipeline.context)
+
+	def make_task(task_id: str) -> SimpleNamespace:
+		representation = SimpleNamespace(
+			representation_id=f"rep_{task_id}",
+			to_dict=lambda: {"representation_id": f"rep_{task_id}"},
+		)
+		return SimpleNamespace(
+			task_id=task_id,
+			planner_id="lifted_panda_sat",
+			representation=representation,
+			to_dict=lambda: {
+				"task_id": task_id,
+				"planner_id": "lifted_panda_sat",
+				"representation": {"representation_id": f"rep_{task_id}"},
+			},
+		)
+
+	tasks = (make_task("task_a"), make_task("task_b"), make_task("task_c"))
+	evaluator.planning_tasks = Mock(return_value=tasks)  # type: ignore[method-assign]
+	pipeline.context._official_problem_root_planning_timeout_seconds = Mock(return_value=60.0)  # type: ignore[method-assign]
+
+	class FakeQueue:
+		def __init__(self) -> None:
+			self.items: list[dict[str, object]] = []
+
+		def put(self, item: dict[str, object]) -> None:
+			self.items.append(item)
+
+		def get(self, timeout: float | None = None) -> dict[str, object]:
+			if not self.items:
+				raise queue.Empty
+			return self.items.pop(0)
+
+		def close(self) -> None:
+			return None
+
+		def join_thread(self) -> None:
+			return None
+
+	class FakeProcess:
+		active_count = 0
+		max_active_count = 0
+		terminated: list[str] = []
+
+		def __init__(self, *, kwargs: dict[str, object]) -> None:
+			self.kwargs = kwargs
+			self.pid = id(self)
+			self._alive = False
+			self.task_id = str(dict(kwargs["task_payload"])["task_id"])  # type: ignore[index]
+
+		def start(self) -> None:
+			FakeProcess.active_count += 1
+			FakeProcess.max_active_count = max(
+				FakeProcess.max_active_count,
+				FakeProcess.active_count,
+			)
+			self._alive = True
+			if self.task_id != "task_b":
+				return
+			self.kwargs["result_queue"].put(  # type: ignore[index]
+				{
+					"message_type": "primary_planner_attempt",
+					"planner_id": "lifted_panda_sat",
+					"task_id": self.task_id,
+					"representation_id": "rep_task_b",
+					"output_dir": str(self.kwargs["output_dir"]),  # type: ignore[index]
+					"plan_solve_data": {"summary": {"status": "success"}, "artifacts": {}},
+					"plan_verification_data": {"summary": {"status": "success"}, "artifacts": {}},
+					"plan_solve_seconds": 1.0,
+					"plan_verification_seconds": 0.1,
+					"total_seconds": 1.1,
+					"success": True,
+					"selected_bucket": "hierarchical_plan_verified",
+					"stdout": "",
+					"stderr": "",
+				},
+			)
+
+		def join(self, timeout: float | None = None) -> None:
+			if self._alive and self.task_id == "task_b":
+				self._alive = False
+				FakeProcess.active_count -= 1
+
+		def is_alive(self) -> bool:
+			return self._alive
+
+		def terminate(self) -> None:
+			if self._alive:
+				FakeProcess.terminated.append(self.task_id)
+				self._alive = False
+				FakeProcess.active_count -= 1
+
+		def kill(self) -> None:
+			self.terminate()
+
+	class FakeContext:
+		def Queue(self) -> FakeQueue:
+			return FakeQueue()
+
+		def Process(self, target=None, kwargs=None):  # type: ignore[no-untyped-def]
+			return FakeProcess(kwargs=kwargs or {})
+
+	with patch.object(
+		problem_root_evaluator,
+		"planner_process_context",
+		return_value=FakeContext(),
+	), patch.dict(os.environ, {"HTN_EVAL_PLANNER_PORTFOLIO_WIDTH": "3"}):
+		result = evaluator.run_primary_planner_evaluation(
+			evaluation_mode=SINGLE_PLANNER_MODE,
+			planner_id="lifted_panda_sat",
+		)
+
+	assert FakeProcess.max_active_count == 3
+	assert sorted(FakeProcess.terminated) == ["task_a", "task_c"]
+	assert result["selected_attempt"]["task_id"] == "task_b"
+	assert [attempt["task_id"] for attempt in result["attempts"]] == ["task_a", "task_b", "task_c"]
+	portfolio = result["planner_portfolio"]
+	assert portfolio["width"] == 3
+	assert portfolio["winner_task_id"] == "task_b"
+	timings = {entry["task_id"]: entry for entry in portfolio["tasks"]}
+	assert timings["task_b"]["status"] == "solved"
+	assert timings["task_b"]["time_to_solution_seconds"] is not None
+	assert timings["task_a"]["status"] == "cancelled"
+	assert timings["task_c"]["time_to_solution_seconds"] is None
+	assert (
+		result["attempts"][0]["plan_solve_data"]["artifacts"]["failure_reason"]
+		== "planner_attempt_cancelled_after_portfolio_winner"
+	)
+
+
+def _pooled_planning_probe(
+	result_queue,  # type: ignore[no-untyped-def]
+	*,
+	domain_file: str,
+	problem_file: str,
+	sleep_seconds: float = 0.0,
+	domain: object = None,
+	problem: object = None,
+) -> None:
+	import time
+
+	time.sleep(sleep_seconds)
+	result_queue.put(
+		{
+			"pid": os.getpid(),
+			"process_group": os.getpgrp(),
+			"domain_name": getattr(domain, "name", None),
+			"domain_id": id(domain),
+			"problem_name": getattr(problem, "name", None),
+		},
+	)
+
+
+def test_planning_worker_pool_reuses_warm_workers_and_kills_timed_out_tasks() -> None:
+	domain_file = DOMAIN_FILES["transport"]
+	problem_file = str(PROJECT_ROOT / "src" / "domains" / "transport" / "problems" / "pfile01.hddl")
+	pool = PlanningWorkerPool()
+
+	def run_probe(sleep_seconds: float) -> tuple[PooledPlanningProcess, PooledResultQueue]:
+		result_queue = pool.Queue()
+		process = pool.Process(
+			target=_pooled_planning_probe,
+			kwargs={
+				"result_queue": result_queue,
+				"domain_file": domain_file,
+				"problem_file": problem_file,
+				"sleep_seconds": sleep_seconds,
+			},
+		)
+		process.start()
+		return process, result_queue
+
+	try:
+		results = []
+		for _ in range(2):
+			process, result_queue = run_probe(0.0)
+			results.append(result_queue.get(timeout=30.0))
+			process.join(timeout=5.0)
+			assert not process.is_alive()
+			HTNProblemRootEvaluator.close_planner_queue(result_queue)
+
+		assert results[0]["domain_name"] == "transport"
+		assert results[0]["problem_name"]
+		assert results[0]["pid"] != results[1]["pid"]
+		assert results[0]["process_group"] == results[0]["pid"]
+		# Both forks inherit the same parsed domain from the warm worker.
+		assert results[0]["domain_id"] == results[1]["domain_id"]
+		assert pool.stats["workers_started"] == 1
+		assert pool.stats["workers_reused"] == 1
+
+		process, result_queue = run_probe(60.0)
+		assert process.is_alive()
+		HTNProblemRootEvaluator.terminate_planner_process(process)  # type: ignore[arg-type]
+		assert not process.is_alive()
+		HTNProblemRootEvaluator.close_planner_queue(result_queue)
+		assert pool.stats["workers_retired"] == 1
+	finally:
+		pool.close()
+
+
 def test_run_subprocess_to_files_spools_large_outputs_without_returning_full_payload(
 	tmp_path: Path,
 ) -> None:
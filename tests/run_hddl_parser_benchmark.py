@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+	if str(path) not in sys.path:
+		sys.path.insert(0, str(path))
+RUNS_ROOT = PROJECT_ROOT / "tests" / "generated" / "hddl_parser_benchmark"
+DOMAINS_ROOT = PROJECT_ROOT / "src" / "domains"
+DEFAULT_FACT_COUNTS = (1250, 2500, 5000, 10000)
+
+
+def _timestamp() -> str:
+	return time.strftime("%Y%m%d_%H%M%S", time.localtime())
+
+
+def _best_seconds(parse: Callable[[], Any], repeats: int) -> float:
+	best = float("inf")
+	for _ in range(repeats):
+		started = time.perf_counter()
+		parse()
+		best = min(best, time.perf_counter() - started)
+	return best
+
+
+def synthetic_problem_text(fact_count: int) -> str:
+	"""Return a transport-style problem with `fact_count` init facts and comments."""
+
+	location_count = max(2, int(fact_count ** 0.5))
+	locations = [f"city-loc-{index}" for index in range(location_count)]
+	facts: List[str] = []
+	for index in range(fact_count):
+		source = locations[index % location_count]
+		target = locations[(index // location_count + 1 + index) % location_count]
+		facts.append(f"    (road {source} {target}) ; edge {index}")
+	return "\n".join(
+		[
+			"(define (problem synthetic-transport)",
+			" (:domain transport)",
+			" (:objects",
+			*[f"  {location} - location" for location in locations],
+			"  truck-0 - vehicle",
+			"  package-0 - package",
+			" )",
+			" (:htn",
+			"  :parameters ()",
+			"  :subtasks (and",
+			f"   (task0 (deliver package-0 {locations[-1]}))",
+			"  )",
+			"  :ordering (and)",
+			" )",
+			" (:init",
+			f"    (at truck-0 {locations[0]})",
+			f"    (at package-0 {locations[0]})",
+			*facts,
+			" )",
+			")",
+			"",
+		],
+	)
+
+
+def run_benchmark(
+	*,
+	run_dir: Path,
+	fact_counts: Sequence[int],
+	repeats: int,
+) -> Dict[str, Any]:
+	from utils.hddl_parser import HDDLParser
+
+	corpus_rows: List[Dict[str, Any]] = []
+	for domain_dir in sorted(path for path in DOMAINS_ROOT.iterdir() if (path / "domain.hddl").exists()):
+		domain_file = domain_dir / "domain.hddl"
+		corpus_rows.append(
+			{
+				"file": str(domain_file.relative_to(PROJECT_ROOT)),
+				"kind": "domain",
+				"bytes": domain_file.stat().st_size,
+				"seconds": _best_seconds(lambda: HDDLParser.parse_domain(str(domain_file)), repeats),
+			},
+		)
+		for problem_file in sorted((domain_dir / "problems").glob("*.hddl")):
+			corpus_rows.append(
+				{
+					"file": str(problem_file.relative_to(PROJECT_ROOT)),
+					"kind": "problem",
+					"bytes": problem_file.stat().st_size,
+					"seconds": _best_seconds(
+						lambda: HDDLParser.parse_problem(str(problem_file)),
+						repeats,
+					),
+				},
+			)
+
+	scaling_rows: List[Dict[str, Any]] = []
+	for fact_count in sorted(set(fact_counts)):
+		problem_file = run_dir / f"synthetic_{fact_count}.hddl"
+		problem_file.write_text(synthetic_problem_text(fact_count))
+		problem = HDDLParser.parse_problem(str(problem_file))
+		parsed_facts = len(problem.init_facts)
+		seconds = _best_seconds(lambda: HDDLParser.parse_problem(str(problem_file)), repeats)
+		scaling_rows.append(
+			{
+				"fact_count": fact_count,
+				"parsed_fact_count": parsed_facts,
+				"bytes": problem_file.stat().st_size,
+				"seconds": seconds,
+				"microseconds_per_fact": seconds / max(parsed_facts, 1) * 1e6,
+			},
+		)
+
+	per_fact = [row["microseconds_per_fact"] for row in scaling_rows]
+	return {
+		"benchmark": "hddl_parser",
+		"repeats": repeats,
+		"corpus_files": len(corpus_rows),
+		"corpus_seconds_total": sum(row["seconds"] for row in corpus_rows),
+		"corpus_rows": corpus_rows,
+		"scaling_rows": scaling_rows,
+		# Near 1.0 when parse time grows linearly with the number of facts.
+		"per_fact_cost_ratio_largest_to_smallest": (
+			per_fact[-1] / per_fact[0] if len(per_fact) >= 2 and per_fact[0] > 0 else None
+		),
+	}
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Time HDDLParser on every domain and problem under src/domains and on "
+			"synthetic problems of growing init size to check linear scaling."
+		),
+	)
+	parser.add_argument("--facts", type=int, action="append", default=[])
+	parser.add_argument("--repeats", type=int, default=5)
+	parser.add_argument("--run-dir")
+	args = parser.parse_args()
+
+	run_dir = Path(args.run_dir).resolve() if args.run_dir else (RUNS_ROOT / _timestamp())
+	run_dir.mkdir(parents=True, exist_ok=True)
+	summary = run_benchmark(
+		run_dir=run_dir,
+		fact_counts=tuple(args.facts or DEFAULT_FACT_COUNTS),
+		repeats=max(1, args.repeats),
+	)
+	(run_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+	print(
+		json.dumps(
+			{key: value for key, value in summary.items() if key != "corpus_rows"},
+			indent=2,
+		),
+	)
+	return 0
+
+
+if __name__ == "__main__":
+	raise SystemExit(main())
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+	if str(path) not in sys.path:
+		sys.path.insert(0, str(path))
+RUNS_ROOT = PROJECT_ROOT / "tests" / "generated" / "jason_percept_sync_benchmark"
+DEFAULT_FACT_COUNTS = (100, 1000, 10000)
+DEFAULT_ACTION_COUNTS = (20, 220)
+
+
+def _timestamp() -> str:
+	return time.strftime("%Y%m%d_%H%M%S", time.localtime())
+
+
+def _action_schemas() -> List[Dict[str, Any]]:
+	def literal(predicate: str, *, positive: bool = True) -> Dict[str, Any]:
+		return {"predicate": predicate, "args": ["?x"], "is_positive": positive}
+
+	return [
+		{
+			"functor": "switch_on",
+			"source_name": "switch-on",
+			"parameters": ["?x"],
+			"preconditions": [literal("off")],
+			"effects": [literal("on"), literal("off", positive=False)],
+		},
+		{
+			"functor": "switch_off",
+			"source_name": "switch-off",
+			"parameters": ["?x"],
+			"preconditions": [literal("on")],
+			"effects": [literal("off"), literal("on", positive=False)],
+		},
+	]
+
+
+def _agentspeak_code(action_count: int) -> str:
+	steps = [
+		f"\t!{'switch_on' if index % 2 == 0 else 'switch_off'}(lamp)"
+		for index in range(action_count)
+	]
+	body = [f"{step};" for step in steps[:-1]] + [f"{steps[-1]}."]
+	return "\n".join(
+		[
+			"/* Initial Beliefs */",
+			"",
+			"/* Primitive Action Plans */",
+			"+!switch_on(X) : true <-",
+			"\tswitch_on(X).",
+			"",
+			"+!switch_off(X) : true <-",
+			"\tswitch_off(X).",
+			"",
+			"/* HTN Method Plans */",
+			"+!sweep : true <-",
+			*body,
+			"",
+			"/* Failure Handlers */",
+		],
+	)
+
+
+def _seed_facts(fact_count: int) -> List[str]:
+	return ["(off lamp)", *(f"(filler f{index})" for index in range(fact_count))]
+
+
+def _mas_run_seconds(
+	runner: Any,
+	*,
+	fact_count: int,
+	action_count: int,
+	output_dir: Path,
+) -> float:
+	result = runner.validate(
+		agentspeak_code=_agentspeak_code(action_count),
+		action_schemas=_action_schemas(),
+		seed_facts=_seed_facts(fact_count),
+		query_goals=({"task_name": "sweep", "args": []},),
+		domain_name="percept_sync_benchmark",
+		output_dir=output_dir,
+	)
+	return float(result.timing_profile["mas_run_seconds"])
+
+
+def run_benchmark(
+	*,
+	fact_counts: Sequence[int],
+	action_counts: Sequence[int],
+	run_dir: Path,
+	repeats: int,
+) -> Dict[str, Any]:
+	from evaluation.jason_runtime import JasonRunner
+
+	runner = JasonRunner(timeout_seconds=600)
+	low_actions, high_actions = min(action_counts), max(action_counts)
+	rows: List[Dict[str, Any]] = []
+	for fact_count in fact_counts:
+		samples: Dict[int, List[float]] = {low_actions: [], high_actions: []}
+		for repeat in range(repeats):
+			for action_count in (low_actions, high_actions):
+				samples[action_count].append(
+					_mas_run_seconds(
+						runner,
+						fact_count=fact_count,
+						action_count=action_count,
+						output_dir=run_dir / f"facts_{fact_count}" / f"actions_{action_count}_{repeat}",
+					),
+				)
+		low_seconds = min(samples[low_actions])
+		high_seconds = min(samples[high_actions])
+		rows.append(
+			{
+				"fact_count": fact_count,
+				"mas_run_seconds": {
+					str(low_actions): low_seconds,
+					str(high_actions): high_seconds,
+				},
+				"per_action_seconds": (high_seconds - low_seconds) / max(1, high_actions - low_actions),
+			},
+		)
+	return {
+		"benchmark": "jason_percept_sync",
+		"action_counts": [low_actions, high_actions],
+		"repeats": repeats,
+		"rows": rows,
+	}
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Measure per-action Jason environment cost as the initial fact count grows. "
+			"Per-action cost is the mas_run_seconds difference between two plan lengths "
+			"divided by the extra actions, so JVM start-up cancels out. Percept deltas "
+			"avoid re-parsing the world, but Jason's percept list is still scanned per "
+			"changed atom, so some growth with the fact count is expected."
+		),
+	)
+	parser.add_argument("--facts", type=int, action="append", default=[])
+	parser.add_argument("--actions", type=int, nargs=2, default=list(DEFAULT_ACTION_COUNTS))
+	parser.add_argument("--repeats", type=int, default=3)
+	parser.add_argument("--run-dir")
+	args = parser.parse_args()
+
+	from evaluation.jason_runtime import JasonRunner
+
+	if not JasonRunner().toolchain_available():
+		print("Jason toolchain unavailable (Java 17-23 and the Jason CLI jar are required).", file=sys.stderr)
+		return 2
+	if len(set(args.actions)) != 2:
+		raise SystemExit("--actions needs two different plan lengths")
+
+	run_dir = Path(args.run_dir).resolve() if args.run_dir else (RUNS_ROOT / _timestamp())
+	run_dir.mkdir(parents=True, exist_ok=True)
+	summary = run_benchmark(
+		fact_counts=tuple(args.facts or DEFAULT_FACT_COUNTS),
+		action_counts=tuple(args.actions),
+		run_dir=run_dir,
+		repeats=max(1, args.repeats),
+	)
+	(run_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+	print(json.dumps(summary, indent=2))
+	return 0
+
+
+if __name__ == "__main__":
+	raise SystemExit(main())
@@ -54,6 +54,8 @@ def _build_controller_command(
 	query_ids: Sequence[str],
 	evaluation_mode: str,
 	planner_id: Optional[str],
+	parallel: bool = False,
+	max_jobs: Optional[int] = None,
 ) -> List[str]:
 	command = [
 		sys.executable,
@@ -72,6 +74,10 @@ def _build_controller_command(
 		command.extend(["--planner-id", planner_id])
 	for query_id in query_ids:
 		command.extend(["--query-id", query_id])
+	if parallel:
+		command.append("--parallel")
+	if max_jobs is not None:
+		command.extend(["--max-jobs", str(max_jobs)])
 	return command
 
 
@@ -171,6 +177,8 @@ def _launch_detached_controller(
 	query_ids: Sequence[str],
 	evaluation_mode: str,
 	planner_id: Optional[str],
+	parallel: bool = False,
+	max_jobs: Optional[int] = None,
 ) -> Dict[str, Any]:
 	run_dir.mkdir(parents=True, exist_ok=True)
 	existing_state = _read_controller_state(run_dir)
@@ -192,6 +200,8 @@ def _launch_detached_controller(
 		query_ids=query_ids,
 		evaluation_mode=evaluation_mode,
 		planner_id=planner_id,
+		parallel=parallel,
+		max_jobs=max_jobs,
 	)
 	log_file = _controller_log_path(run_dir)
 	env = dict(os.environ)
@@ -545,6 +555,175 @@ def _run_sequential_full_baseline(
 	)
 
 
+def _build_problem_job_command(
+	*,
+	run_dir: Path,
+	domain_key: str,
+	query_id: str,
+	evaluation_mode: str,
+	planner_id: Optional[str],
+) -> List[str]:
+	command = [
+		sys.executable,
+		"-u",
+		str(Path(__file__).resolve()),
+		"--problem-job",
+		"--run-dir",
+		str(run_dir),
+		"--domain",
+		domain_key,
+		"--query-id",
+		query_id,
+		"--evaluation-mode",
+		evaluation_mode,
+	]
+	if planner_id:
+		command.extend(["--planner-id", planner_id])
+	return command
+
+
+def _launch_problem_job(
+	*,
+	run_dir: Path,
+	domain_key: str,
+	query_id: str,
+	cpu_ids: Sequence[int],
+	evaluation_mode: str,
+	planner_id: Optional[str],
+) -> subprocess.Popen[bytes]:
+	from htn_evaluation.problem_scheduler import CPU_AFFINITY_ENV
+
+	log_dir = run_dir / domain_key / "problem_jobs"
+	log_dir.mkdir(parents=True, exist_ok=True)
+	env = dict(os.environ)
+	pythonpath_parts = [part for part in env.get("PYTHONPATH", "").split(os.pathsep) if part]
+	for required_path in (str(PROJECT_ROOT), str(PROJECT_ROOT / "src")):
+		if required_path not in pythonpath_parts:
+			pythonpath_parts.insert(0, required_path)
+	env["PYTHONPATH"] = os.pathsep.join(pythonpath_parts)
+	env[CPU_AFFINITY_ENV] = ",".join(str(cpu_id) for cpu_id in cpu_ids)
+	with (log_dir / f"{query_id}.out").open("a") as log_handle:
+		return subprocess.Popen(
+			_build_problem_job_command(
+				run_dir=run_dir,
+				domain_key=domain_key,
+				query_id=query_id,
+				evaluation_mode=evaluation_mode,
+				planner_id=planner_id,
+			),
+			cwd=PROJECT_ROOT,
+			env=env,
+			stdin=subprocess.DEVNULL,
+			stdout=log_handle,
+			stderr=log_handle,
+		)
+
+
+def _run_problem_job(domain_key: str, query_id: str, run_dir: Path) -> int:
+	from tests.support.htn_evaluation_support import run_official_problem_root_case_checkpoint
+
+	row = run_official_problem_root_case_checkpoint(
+		domain_key,
+		query_id,
+		evaluation_mode=_RUN_EVALUATION_MODE,
+		planner_id=_RUN_PLANNER_ID,
+		output_root=run_dir / domain_key,
+	)
+	print(json.dumps(row, indent=2))
+	return 0
+
+
+def _run_parallel_full_baseline(
+	*,
+	run_dir: Path,
+	evaluation_mode: str,
+	planner_id: Optional[str],
+	track_id: str,
+	max_jobs: Optional[int] = None,
+	job_launcher: Optional[
+		Callable[[str, str, Sequence[int]], Any]
+	] = None,
+	domain_runner: Optional[
+		Callable[[str, str, Optional[str]], Mapping[str, Any]]
+	] = None,
+) -> Dict[str, Any]:
+	"""Run every pending problem of all domains concurrently, then finalise per domain.
+
+	Problems run as `--problem-job` subprocesses that checkpoint their result
+	row. Finalising a domain reuses `run_official_problem_root_baseline_for_domain`,
+	which reads the checkpoints, so an interrupted sweep resumes per problem and
+	any problem whose job failed to checkpoint is retried in-process there.
+	"""
+
+	from htn_evaluation.problem_scheduler import (
+		HostCapacity,
+		ProblemRootScheduler,
+		ScheduledProblemJob,
+		previous_problem_seconds,
+	)
+	from tests.support.htn_evaluation_support import (
+		_load_existing_problem_rows,
+		load_domain_query_cases,
+		load_problem_checkpoints,
+	)
+
+	run_dir.mkdir(parents=True, exist_ok=True)
+	_cleanup_htn_evaluation_resources()
+	domain_summaries = _load_existing_domain_summaries(run_dir)
+	expected_seconds = previous_problem_seconds(
+		[*RUNS_ROOT.glob("**/problem_results.json"), *run_dir.glob("**/problem_results.json")],
+	)
+	jobs: List[ScheduledProblemJob] = []
+	for domain_key in DOMAIN_KEYS:
+		if domain_key in domain_summaries:
+			print(f"[TRACK] resume skip domain={domain_key}", flush=True)
+			continue
+		output_root = run_dir / domain_key
+		finished = {
+			*load_problem_checkpoints(output_root),
+			*_load_existing_problem_rows(output_root),
+		}
+		for query_id in sorted(load_domain_query_cases(domain_key)):
+			if query_id in finished:
+				continue
+			jobs.append(
+				ScheduledProblemJob(
+					domain_key=domain_key,
+					query_id=query_id,
+					expected_seconds=expected_seconds.get((domain_key, query_id)),
+				),
+			)
+	launcher = job_launcher or (
+		lambda domain_key, query_id, cpu_ids: _launch_problem_job(
+			run_dir=run_dir,
+			domain_key=domain_key,
+			query_id=query_id,
+			cpu_ids=cpu_ids,
+			evaluation_mode=evaluation_mode,
+			planner_id=planner_id,
+		)
+	)
+	scheduler = ProblemRootScheduler(HostCapacity.detect(max_jobs=max_jobs))
+	print(f"[TRACK] scheduling problems={len(jobs)} cpus={list(scheduler.capacity.cpu_ids)}", flush=True)
+	job_results = scheduler.run(
+		jobs,
+		launch=lambda job, cpu_ids: launcher(job.domain_key, job.query_id, cpu_ids),
+		on_finish=lambda result: print(
+			f"[TRACK] finished problem={result['domain_key']}/{result['query_id']}"
+			f" returncode={result['returncode']} seconds={result['seconds']:.1f}",
+			flush=True,
+		),
+	)
+	(run_dir / "problem_schedule.json").write_text(json.dumps(job_results, indent=2))
+	return _run_sequential_full_baseline(
+		run_dir=run_dir,
+		evaluation_mode=evaluation_mode,
+		planner_id=planner_id,
+		track_id=track_id,
+		domain_runner=domain_runner,
+	)
+
+
 _RUN_QUERY_IDS: List[str] = []
 _RUN_EVALUATION_MODE = "single_planner"
 _RUN_PLANNER_ID: str | None = "lifted_panda_sat"
@@ -565,7 +744,12 @@ def _track_specs() -> List[Dict[str, str | None]]:
 	return specs
 
 
-def _run_all_tracks(run_dir: Optional[Path] = None) -> int:
+def _run_all_tracks(
+	run_dir: Optional[Path] = None,
+	*,
+	parallel: bool = False,
+	max_jobs: Optional[int] = None,
+) -> int:
 	root_run_dir = run_dir or (RUNS_ROOT / _timestamp())
 	root_run_dir.mkdir(parents=True, exist_ok=True)
 	track_summaries: Dict[str, Dict[str, Any]] = {}
@@ -585,6 +769,15 @@ def _run_all_tracks(run_dir: Optional[Path] = None) -> int:
 		thread_result: Dict[str, Dict[str, Any]] = {}
 
 		def _thread_target() -> None:
+			if parallel:
+				thread_result["summary"] = _run_parallel_full_baseline(
+					run_dir=track_dir,
+					evaluation_mode=str(spec["evaluation_mode"]),
+					planner_id=spec["planner_id"],
+					track_id=track_id,
+					max_jobs=max_jobs,
+				)
+				return
 			thread_result["summary"] = _run_sequential_full_baseline(
 				run_dir=track_dir,
 				evaluation_mode=str(spec["evaluation_mode"]),
@@ -641,6 +834,13 @@ def main() -> int:
 	parser.add_argument("--planner-id", default=PRIMARY_HTN_PLANNER_ID)
 	parser.add_argument("--all-tracks", action="store_true")
 	parser.add_argument("--launch-detached", action="store_true")
+	parser.add_argument(
+		"--parallel",
+		action="store_true",
+		help="Run problems of all domains concurrently under the host CPU and memory budget.",
+	)
+	parser.add_argument("--max-jobs", type=int)
+	parser.add_argument("--problem-job", action="store_true", help=argparse.SUPPRESS)
 	args = parser.parse_args()
 	global _RUN_EVALUATION_MODE, _RUN_PLANNER_ID, _RUN_QUERY_IDS
 	_RUN_QUERY_IDS = list(args.query_id or [])
@@ -650,6 +850,11 @@ def main() -> int:
 		evaluation_mode=_RUN_EVALUATION_MODE,
 	)
 
+	if args.problem_job:
+		if not (args.domain and args.run_dir and len(_RUN_QUERY_IDS) == 1):
+			raise SystemExit("--problem-job requires --domain, --run-dir and one --query-id")
+		return _run_problem_job(args.domain, _RUN_QUERY_IDS[0], Path(args.run_dir).resolve())
+
 	if args.launch_detached:
 		if args.domain:
 			if not args.run_dir:
@@ -666,6 +871,8 @@ def main() -> int:
 			query_ids=tuple(_RUN_QUERY_IDS),
 			evaluation_mode=_RUN_EVALUATION_MODE,
 			planner_id=_RUN_PLANNER_ID,
+			parallel=bool(args.parallel),
+			max_jobs=args.max_jobs,
 		)
 		print(json.dumps(state, indent=2))
 		return 0
@@ -674,7 +881,11 @@ def main() -> int:
 		root_run_dir = Path(args.run_dir).resolve() if args.run_dir else None
 		if root_run_dir is not None:
 			_register_controller_runtime(root_run_dir)
-		return _run_all_tracks(run_dir=root_run_dir)
+		return _run_all_tracks(
+			run_dir=root_run_dir,
+			parallel=bool(args.parallel),
+			max_jobs=args.max_jobs,
+		)
 
 	if args.domain:
 		if not args.run_dir:
@@ -690,6 +901,15 @@ def main() -> int:
 		evaluation_mode=_RUN_EVALUATION_MODE,
 		planner_id=_RUN_PLANNER_ID,
 	)
+	if args.parallel:
+		summary = _run_parallel_full_baseline(
+			run_dir=run_dir,
+			evaluation_mode=_RUN_EVALUATION_MODE,
+			planner_id=_RUN_PLANNER_ID,
+			track_id=track_id,
+			max_jobs=args.max_jobs,
+		)
+		return 0 if summary["complete"] else 1
 	summary = _run_sequential_full_baseline(
 		run_dir=run_dir,
 		evaluation_mode=_RUN_EVALUATION_MODE,
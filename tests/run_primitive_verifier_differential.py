@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+	if str(path) not in sys.path:
+		sys.path.insert(0, str(path))
+RUNS_ROOT = PROJECT_ROOT / "tests" / "generated" / "primitive_verifier_differential"
+DOMAINS_ROOT = PROJECT_ROOT / "src" / "domains"
+
+PlanStep = Tuple[str, Tuple[str, ...]]
+
+
+def _timestamp() -> str:
+	return time.strftime("%Y%m%d_%H%M%S", time.localtime())
+
+
+def _objects_by_type(domain: Any, problem: Any) -> Dict[str, List[str]]:
+	from evaluation.runtime_context import build_type_parent_map_for_domain
+
+	parent_map = build_type_parent_map_for_domain(domain)
+	objects_by_type: Dict[str, List[str]] = {}
+	for object_name, type_name in sorted(problem.object_types.items()):
+		cursor: Optional[str] = type_name
+		seen = set()
+		while cursor and cursor not in seen:
+			seen.add(cursor)
+			objects_by_type.setdefault(cursor, []).append(object_name.lower())
+			cursor = parent_map.get(cursor)
+		objects_by_type.setdefault("object", []).append(object_name.lower())
+	return objects_by_type
+
+
+def _action_signatures(domain: Any) -> List[Tuple[str, Tuple[str, ...]]]:
+	from evaluation.runtime_context import parameter_type
+
+	return [
+		(action.name.lower(), tuple(parameter_type(parameter) for parameter in action.parameters))
+		for action in domain.actions
+	]
+
+
+def _random_walk(
+	checker: Any,
+	*,
+	signatures: Sequence[Tuple[str, Tuple[str, ...]]],
+	objects_by_type: Dict[str, List[str]],
+	steps: int,
+	samples_per_step: int,
+	rng: random.Random,
+) -> List[PlanStep]:
+	"""Sample an executable primitive plan by random applicable-action probing."""
+
+	simulator = checker.simulator
+	state = checker.initial_state()
+	plan: List[PlanStep] = []
+	for _ in range(steps):
+		for _ in range(samples_per_step):
+			name, types = rng.choice(signatures)
+			domains = [objects_by_type.get(type_name, ()) for type_name in types]
+			if any(not domain for domain in domains):
+				continue
+			args = tuple(rng.choice(domain) for domain in domains)
+			action = simulator.ground(name, args)
+			if action.applicable(state):
+				state = action.apply(state)
+				plan.append((name, args))
+				break
+		else:
+			break
+	return plan
+
+
+def _candidate_plans(
+	walk: Sequence[PlanStep],
+	*,
+	signatures: Sequence[Tuple[str, Tuple[str, ...]]],
+	objects_by_type: Dict[str, List[str]],
+	rng: random.Random,
+) -> Dict[str, List[PlanStep]]:
+	plans: Dict[str, List[PlanStep]] = {"empty": [], "walk": list(walk)}
+	if len(walk) >= 2:
+		dropped = rng.randrange(len(walk) - 1)
+		plans["walk_drop_step"] = [step for index, step in enumerate(walk) if index != dropped]
+		plans["walk_reversed"] = list(reversed(walk))
+	name, types = rng.choice(signatures)
+	if all(objects_by_type.get(type_name) for type_name in types):
+		random_step = (name, tuple(rng.choice(objects_by_type[type_name]) for type_name in types))
+		plans["walk_random_suffix"] = [*walk, random_step]
+	return plans
+
+
+def _render_plan(plan: Sequence[PlanStep]) -> str:
+	from verification.official_plan_verifier import IPCPlanVerifier
+
+	return IPCPlanVerifier.render_primitive_only_plan(
+		[f"{name}({','.join(args)})" if args else name for name, args in plan],
+	)
+
+
+def run_differential(
+	*,
+	domains: Sequence[str],
+	run_dir: Path,
+	steps: int,
+	samples_per_step: int,
+	seed: int,
+	problem_limit: Optional[int],
+) -> Dict[str, Any]:
+	from utils.hddl_parser import HDDLParser
+	from verification.official_plan_verifier import IPCPlanVerifier
+	from verification.primitive_plan_checker import PrimitivePlanChecker
+
+	verifier = IPCPlanVerifier(primitive_prefilter="differential")
+	rows: List[Dict[str, Any]] = []
+	disagreements: List[Dict[str, Any]] = []
+	for domain_key in domains:
+		domain_file = DOMAINS_ROOT / domain_key / "domain.hddl"
+		domain = HDDLParser.parse_domain(str(domain_file))
+		signatures = _action_signatures(domain)
+		problem_files = sorted((DOMAINS_ROOT / domain_key / "problems").glob("*.hddl"))
+		for problem_file in problem_files[:problem_limit]:
+			problem = HDDLParser.parse_problem(str(problem_file))
+			checker = PrimitivePlanChecker.for_files(domain_file, problem_file)
+			objects_by_type = _objects_by_type(domain, problem)
+			rng = random.Random(f"{seed}:{domain_key}:{problem_file.name}")
+			walk = _random_walk(
+				checker,
+				signatures=signatures,
+				objects_by_type=objects_by_type,
+				steps=steps,
+				samples_per_step=samples_per_step,
+				rng=rng,
+			)
+			plans = _candidate_plans(
+				walk,
+				signatures=signatures,
+				objects_by_type=objects_by_type,
+				rng=rng,
+			)
+			for plan_label, plan in plans.items():
+				result = verifier.verify_plan_text(
+					domain_file=domain_file,
+					problem_file=problem_file,
+					plan_text=_render_plan(plan),
+					output_dir=run_dir / domain_key / problem_file.stem / plan_label,
+					plan_kind="primitive_only",
+				)
+				prefilter = dict(result.metadata.get("primitive_prefilter") or {})
+				row = {
+					"domain": domain_key,
+					"problem": problem_file.name,
+					"plan": plan_label,
+					"plan_length": len(plan),
+					"agrees": prefilter.get("agrees"),
+					"checker_executable": prefilter.get("executable"),
+					"checker_goal_reached": prefilter.get("goal_reached"),
+					"external_executable": result.primitive_plan_executable,
+					"external_goal_reached": result.reached_goal_state,
+					"checker_failure": prefilter.get("failure"),
+				}
+				rows.append(row)
+				if row["agrees"] is False:
+					disagreements.append({**row, "output_file": result.output_file})
+	return {
+		"benchmark": "primitive_verifier_differential",
+		"seed": seed,
+		"cases": len(rows),
+		"agreements": sum(1 for row in rows if row["agrees"] is True),
+		"inconclusive": sum(1 for row in rows if row["agrees"] is None),
+		"disagreements": disagreements,
+		"rows": rows,
+	}
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(
+		description=(
+			"Run the in-process primitive plan checker and pandaPIparser -v on sampled "
+			"primitive plans for every benchmark problem and report disagreements."
+		),
+	)
+	parser.add_argument("--domain", action="append", default=[])
+	parser.add_argument("--steps", type=int, default=30)
+	parser.add_argument("--samples-per-step", type=int, default=200)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--problem-limit", type=int)
+	parser.add_argument("--run-dir")
+	args = parser.parse_args()
+
+	from verification.official_plan_verifier import IPCPlanVerifier
+
+	if not IPCPlanVerifier().tool_available():
+		print("pandaPIparser is unavailable; the differential run needs the external verifier.", file=sys.stderr)
+		return 2
+
+	run_dir = Path(args.run_dir).resolve() if args.run_dir else (RUNS_ROOT / _timestamp())
+	run_dir.mkdir(parents=True, exist_ok=True)
+	domains = tuple(args.domain) or tuple(
+		sorted(path.name for path in DOMAINS_ROOT.iterdir() if (path / "domain.hddl").exists())
+	)
+	summary = run_differential(
+		domains=domains,
+		run_dir=run_dir,
+		steps=max(0, args.steps),
+		samples_per_step=max(1, args.samples_per_step),
+		seed=args.seed,
+		problem_limit=args.problem_limit,
+	)
+	(run_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+	print(
+		json.dumps(
+			{key: value for key, value in summary.items() if key != "rows"},
+			indent=2,
+		),
+	)
+	return 1 if summary["disagreements"] else 0
+
+
+if __name__ == "__main__":
+	raise SystemExit(main())
@@ -63,6 +63,24 @@ def _load_existing_problem_rows(
 	return row_map
 
 
+def _problem_checkpoint_path(output_root: Path, query_id: str) -> Path:
+	return output_root / "problem_checkpoints" / f"{query_id}.json"
+
+
+def load_problem_checkpoints(output_root: Path) -> Dict[str, Dict[str, Any]]:
+	"""Return per-problem rows checkpointed by scheduled sweep jobs."""
+
+	row_map: Dict[str, Dict[str, Any]] = {}
+	for checkpoint_path in sorted((output_root / "problem_checkpoints").glob("*.json")):
+		try:
+			row = json.loads(checkpoint_path.read_text())
+		except Exception:
+			continue
+		if isinstance(row, dict) and str(row.get("query_id") or "").strip():
+			row_map[str(row["query_id"])] = dict(row)
+	return row_map
+
+
 def _load_domain_gate_preflight_from_existing_summary(
 	output_root: Path,
 ) -> Optional[Dict[str, Any]]:
@@ -194,7 +212,10 @@ def run_official_problem_root_baseline_for_domain(
 			/ domain_key
 		).resolve()
 	)
-	existing_problem_rows = _load_existing_problem_rows(output_root)
+	existing_problem_rows = {
+		**load_problem_checkpoints(output_root),
+		**_load_existing_problem_rows(output_root),
+	}
 	domain_gate_preflight = _load_domain_gate_preflight_from_existing_summary(output_root)
 	if domain_gate_preflight is None:
 		domain_gate_report = run_official_domain_gate_preflight(domain_key)
@@ -262,6 +283,49 @@ def run_official_problem_root_baseline_for_domain(
 	return summary
 
 
+def run_official_problem_root_case_checkpoint(
+	domain_key: str,
+	query_id: str,
+	*,
+	evaluation_mode: str = SINGLE_PLANNER_MODE,
+	planner_id: Optional[str] = PRIMARY_HTN_PLANNER_ID,
+	output_root: Path,
+) -> Dict[str, Any]:
+	"""Run one official problem and checkpoint its result row under `output_root`.
+
+	`run_official_problem_root_baseline_for_domain` picks the checkpoint up and
+	skips the problem, so scheduled sweeps resume per problem.
+	"""
+
+	mode = validate_evaluation_mode(evaluation_mode)
+	normalized_planner_id = validate_planner_id(
+		planner_id,
+		evaluation_mode=mode,
+	)
+	output_root = Path(output_root).resolve()
+	report = run_domain_problem_root_case(
+		domain_key,
+		query_id,
+		evaluation_mode=mode,
+		planner_id=normalized_planner_id,
+		logs_dir=output_root / "query_logs",
+	)
+	row = build_problem_result_row(
+		domain_key=domain_key,
+		query_id=str(report["query_id"]),
+		case=report["case"],
+		report=report,
+		evaluation_mode=mode,
+		planner_id=normalized_planner_id,
+	)
+	checkpoint_path = _problem_checkpoint_path(output_root, query_id)
+	checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+	staging_path = checkpoint_path.with_suffix(".json.tmp")
+	staging_path.write_text(json.dumps(row, indent=2))
+	staging_path.replace(checkpoint_path)
+	return row
+
+
 def run_generated_problem_root_case(
 	domain_key: str,
 	query_id: str,
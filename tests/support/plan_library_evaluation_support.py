@@ -4,6 +4,7 @@ import json
 import hashlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, MutableMapping, Optional, Sequence
 
@@ -15,6 +16,8 @@ if str(SRC_ROOT) in sys.path:
 sys.path.insert(0, str(SRC_ROOT))
 
 from execution_logging.execution_logger import ExecutionLogger
+from evaluation.jason_runtime import JasonRunner, JasonValidationError
+from evaluation.jason_runtime.runner import configured_batch_worker_count
 from evaluation.orchestrator import PlanLibraryEvaluationOrchestrator
 from evaluation.pipeline import _temporal_specification_to_grounding_result
 from evaluation.failure_signature import build_failure_signature
@@ -523,6 +526,7 @@ def run_plan_library_evaluation_case(
 	library_source: str = BENCHMARK_EVALUATION_LIBRARY_SOURCE,
 	runtime_backend: str = BENCHMARK_EVALUATION_RUNTIME_BACKEND,
 	logs_root: str | Path | None = None,
+	jason_runner: JasonRunner | None = None,
 ) -> Dict[str, Any]:
 	apply_evaluation_runtime_defaults()
 	query_cases = load_domain_query_cases(domain_key)
@@ -565,6 +569,7 @@ def run_plan_library_evaluation_case(
 		else GENERATED_LOGS_DIR
 	)
 	orchestrator.logger = ExecutionLogger(logs_dir=str(resolved_logs_root), run_origin="tests")
+	orchestrator.jason_runner = jason_runner
 	grounding_result = _temporal_specification_to_grounding_result(
 		temporal_specification=temporal_specification,
 		method_library=library_artifact.method_library,
@@ -891,6 +896,7 @@ def run_plan_library_evaluation_benchmark_for_domain(
 	output_root: str | Path | None = None,
 	run_id: str | None = None,
 	resume: bool = False,
+	max_workers: int | None = None,
 ) -> Dict[str, Any]:
 	normalized_library_source = str(library_source or BENCHMARK_EVALUATION_LIBRARY_SOURCE).strip().lower()
 	normalized_runtime_backend = str(runtime_backend or BENCHMARK_EVALUATION_RUNTIME_BACKEND).strip().lower()
@@ -933,18 +939,20 @@ def run_plan_library_evaluation_benchmark_for_domain(
 			query_reports_by_id[query_id] = cached_report
 			resumed_query_ids.append(query_id)
 
-	for query_id in selected_query_ids:
-		if query_id in query_reports_by_id:
-			continue
+	pending_query_ids = [
+		query_id
+		for query_id in selected_query_ids
+		if query_id not in query_reports_by_id
+	]
+	worker_count = max(
+		1,
+		min(len(pending_query_ids), max_workers or configured_batch_worker_count()),
+	)
+
+	def record_query_report(query_id: str, case_report: Dict[str, Any]) -> None:
 		query_report = _serialize_query_report(
 			{
-				**run_plan_library_evaluation_case(
-					domain_key,
-					query_id,
-					library_source=normalized_library_source,
-					runtime_backend=normalized_runtime_backend,
-					logs_root=domain_output_root / "logs",
-				),
+				**case_report,
 				"run_id": run_id,
 				"domain_key": domain_key,
 			},
@@ -978,6 +986,46 @@ def run_plan_library_evaluation_benchmark_for_domain(
 			summary=partial_summary,
 		)
 
+	if worker_count <= 1:
+		for query_id in pending_query_ids:
+			record_query_report(
+				query_id,
+				run_plan_library_evaluation_case(
+					domain_key,
+					query_id,
+					library_source=normalized_library_source,
+					runtime_backend=normalized_runtime_backend,
+					logs_root=domain_output_root / "logs",
+				),
+			)
+	else:
+		# Queries share one Jason runner; per-query log roots keep concurrent
+		# execution logs (named by timestamp and problem) from colliding.
+		try:
+			shared_jason_runner: JasonRunner | None = (
+				PlanLibraryEvaluationOrchestrator.build_jason_runner().prepare_shared_runtime()
+			)
+		except JasonValidationError:
+			shared_jason_runner = None
+		with ThreadPoolExecutor(
+			max_workers=worker_count,
+			thread_name_prefix="plan-library-evaluation",
+		) as executor:
+			futures = {
+				executor.submit(
+					run_plan_library_evaluation_case,
+					domain_key,
+					query_id,
+					library_source=normalized_library_source,
+					runtime_backend=normalized_runtime_backend,
+					logs_root=domain_output_root / "logs" / query_id,
+					jason_runner=shared_jason_runner,
+				): query_id
+				for query_id in pending_query_ids
+			}
+			for future in as_completed(futures):
+				record_query_report(futures[future], future.result())
+
 	query_reports = [
 		query_reports_by_id[query_id]
 		for query_id in selected_query_ids
@@ -0,0 +1,129 @@
+"""
+Focused tests for the interned bitset ground-action simulator.
+"""
+
+import sys
+from pathlib import Path
+
+_src_dir = str(Path(__file__).parent.parent.parent / "src")
+if _src_dir not in sys.path:
+	sys.path.insert(0, _src_dir)
+
+from utils.ground_simulator import GroundActionSimulator
+
+
+def _literal(predicate, *args, positive=True):
+	return {"predicate": predicate, "args": list(args), "is_positive": positive}
+
+
+def _switch_schemas():
+	return [
+		{
+			"functor": "switch_on",
+			"source_name": "switch-on",
+			"parameters": ["?x"],
+			"preconditions": [_literal("off", "?x")],
+			"effects": [_literal("on", "?x"), _literal("off", "?x", positive=False)],
+		},
+		{
+			"functor": "toggle",
+			"parameters": ["?x"],
+			"precondition_clauses": [
+				[_literal("off", "?x")],
+				[_literal("on", "?x")],
+			],
+			"effects": [_literal("off", "?x", positive=False), _literal("off", "?x")],
+		},
+	]
+
+
+def test_ground_actions_compile_once_to_precondition_and_effect_masks():
+	simulator = GroundActionSimulator(_switch_schemas(), syntax="hddl")
+	state = simulator.initial_state(["(off lamp)"])
+
+	action = simulator.ground("switch-on", ("lamp",))
+
+	assert simulator.ground("switch-on", ("lamp",)) is action
+	assert action.applicable(state) is True
+	assert simulator.state_atoms(action.apply(state)) == ("(on lamp)",)
+	assert action.applicable(action.apply(state)) is False
+
+
+def test_replay_reports_failures_and_keeps_add_after_delete():
+	simulator = GroundActionSimulator(_switch_schemas(), syntax="hddl")
+	state = simulator.initial_state(["(off lamp)"])
+
+	toggled = simulator.replay([("toggle", ("lamp",))], state)
+	repeated = simulator.replay([("switch_on", ("lamp",)), ("switch_on", ("lamp",))], state)
+	unknown = simulator.replay([("switch_on", ("lamp",)), ("dim", ("lamp",))], state)
+	skipped = simulator.replay([("dim", ("lamp",)), ("switch_on", ("lamp",))], state, skip_unknown=True)
+	wrong_arity = simulator.replay([("switch_on", ())], state)
+
+	assert toggled.passed and simulator.state_atoms(toggled.state) == ("(off lamp)",)
+	assert (repeated.failure, repeated.checked_steps) == ("precondition_violation", 1)
+	assert (unknown.failure, unknown.checked_steps) == ("unknown_action", 1)
+	assert skipped.passed and skipped.checked_steps == 2
+	assert wrong_arity.failure == "arity_mismatch"
+
+
+def test_goal_satisfaction_is_checked_over_a_whole_trace():
+	simulator = GroundActionSimulator(_switch_schemas(), syntax="hddl")
+	state = simulator.initial_state(["(off lamp)", "(off fan)"])
+	goal = simulator.goal_mask(["(on lamp)", "(on fan)"])
+
+	replay = simulator.replay(
+		[("switch_on", ("lamp",)), ("switch_on", ("fan",))],
+		state,
+		record_trace=True,
+	)
+
+	assert simulator.goals_satisfied(replay.trace, goal) == (False, True)
+	assert simulator.missing_goal_atoms(replay.trace[0], goal) == ("(on fan)",)
+
+
+def test_factored_preconditions_need_one_clause_per_factor():
+	schema = {
+		"functor": "start",
+		"parameters": ["?x"],
+		"precondition_clauses": [[_literal("ready", "?x")]],
+		"precondition_factors": [
+			[[_literal("fuel", "?x")], [_literal("power", "?x")]],
+			[[_literal("crew", "?x")], [_literal("autopilot", "?x")]],
+		],
+		"effects": [_literal("running", "?x")],
+	}
+	simulator = GroundActionSimulator([schema], syntax="hddl")
+	action = simulator.ground("start", ("ship",))
+
+	assert action.applicable(simulator.initial_state(["(ready ship)", "(power ship)", "(crew ship)"]))
+	assert not action.applicable(simulator.initial_state(["(ready ship)", "(power ship)"]))
+	assert not action.applicable(simulator.initial_state(["(power ship)", "(crew ship)"]))
+
+
+def test_agentspeak_simulator_reads_runtime_spellings_into_the_symbol_table():
+	schema = {
+		"functor": "board",
+		"source_name": "board-truck",
+		"parameters": ["?t"],
+		"preconditions": [_literal("at-robby", "?t")],
+		"effects": [_literal("in-truck", "?t")],
+	}
+	simulator = GroundActionSimulator(
+		[schema],
+		token=lambda text: text.strip().strip('"'),
+		atom_limit=2,
+	)
+	state = simulator.initial_state(['at_robby("truck-0")', simulator.table.encode_hddl("(parked truck-0)")])
+
+	replay = simulator.replay([("board-truck", ('"truck-0"',))], state)
+
+	assert replay.passed
+	assert simulator.state_atoms(replay.state) == (
+		'at_robby("truck-0")',
+		'parked("truck-0")',
+		'in_truck("truck-0")',
+	)
+	assert simulator.table.atoms(replay.state)[0] == simulator.table.encode_hddl("(at-robby truck-0)")
+	simulator.initial_state(())
+	assert simulator.table.atom_count == 0
+	assert simulator.encode("at_robby(x)") == simulator.table.encode_hddl("(at-robby x)")
@@ -11,7 +11,11 @@ if _src_dir not in sys.path:
 
 import pytest
 
-from utils.hddl_condition_parser import HDDLConditionParser, UnsupportedHDDLConstructError
+from utils.hddl_condition_parser import (
+	DNFClauseLimitExceeded,
+	HDDLConditionParser,
+	UnsupportedHDDLConstructError,
+)
 
 
 def test_condition_parser_keeps_equality_and_disequality_literals():
@@ -75,3 +79,63 @@ def test_condition_parser_fails_fast_on_disjunctive_effects():
 
 	with pytest.raises(UnsupportedHDDLConstructError, match="disjunctive_effect"):
 		parser.parse_action(action)
+
+
+def _branching_precondition(conjunct_count):
+	branches = " ".join(f"(or (p{index} ?x) (q{index} ?x))" for index in range(conjunct_count))
+	return f"(and (ready ?x) {branches})"
+
+
+def test_condition_parser_memoizes_dnf_and_actions_across_instances():
+	action = type(
+		"ActionStub",
+		(),
+		{
+			"name": "memo_action",
+			"parameters": ["?x - object"],
+			"preconditions": _branching_precondition(3),
+			"effects": "(and (done ?x))",
+		},
+	)()
+
+	first = HDDLConditionParser().parse_dnf(action.preconditions, action_name=action.name)
+
+	assert HDDLConditionParser().parse_dnf(action.preconditions, action_name=action.name) is first
+	assert len(first) == 8
+	assert HDDLConditionParser().parse_action(action) is HDDLConditionParser().parse_action(action)
+
+
+def test_condition_parser_factors_preconditions_past_the_clause_ceiling():
+	action = type(
+		"ActionStub",
+		(),
+		{
+			"name": "branching_action",
+			"parameters": ["?x - object"],
+			"preconditions": _branching_precondition(5),
+			"effects": "(and (done ?x))",
+		},
+	)()
+	parser = HDDLConditionParser(max_clauses=8)
+
+	with pytest.raises(DNFClauseLimitExceeded, match="branching_action"):
+		parser.parse_dnf(action.preconditions, action_name=action.name)
+	parsed = parser.parse_action(action)
+
+	assert [len(factor) for factor in parsed.precondition_factors] == [8, 4]
+	assert [item.predicate for item in parsed.preconditions] == ["ready"]
+	assert parsed.precondition_clauses == (parsed.preconditions,)
+	assert not parsed.precondition_is_exact
+	assert parsed.precondition_dnf_factors == (
+		parsed.precondition_clauses,
+		*parsed.precondition_factors,
+	)
+	assert parser.parse_literals(action.preconditions) == parsed.preconditions
+	exact = HDDLConditionParser(max_clauses=64).parse_action(action)
+	assert exact.precondition_factors == ()
+	assert exact.precondition_is_exact
+	assert exact.precondition_dnf_factors == (exact.precondition_clauses,)
+	assert len(exact.precondition_clauses) == 32
+	assert HDDLConditionParser(max_clauses=64).parse_factored_dnf(action.preconditions) == (
+		exact.precondition_clauses,
+	)
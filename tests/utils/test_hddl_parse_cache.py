@@ -0,0 +1,84 @@
+"""
+Focused tests for the process-wide HDDL parse cache.
+"""
+
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+
+_src_dir = str(Path(__file__).parent.parent.parent / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils.hddl_parse_cache import HDDLParseCache
+
+
+PROBLEM_TEMPLATE = """
+(define (problem demo) (:domain demo)
+ (:objects a b - block)
+ (:init (on {top} {bottom}))
+)
+"""
+
+
+def _write_problem(path, *, top, bottom, age_seconds=0.0):
+    path.write_text(PROBLEM_TEMPLATE.format(top=top, bottom=bottom))
+    if age_seconds:
+        stamp = time.time() - age_seconds
+        os.utime(path, (stamp, stamp))
+
+
+def test_parse_cache_shares_frozen_parses_until_the_file_changes(tmp_path):
+    problem_path = tmp_path / "problem.hddl"
+    _write_problem(problem_path, top="a", bottom="b", age_seconds=60.0)
+    cache = HDDLParseCache()
+
+    first = cache.problem(problem_path)
+    second = cache.problem(str(problem_path))
+
+    assert first is second
+    assert cache.stats == {"hits": 1, "misses": 1, "pickle_hits": 0}
+    try:
+        first.name = "changed"
+    except dataclasses.FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("cached parses must be frozen")
+
+    _write_problem(problem_path, top="b", bottom="a", age_seconds=30.0)
+    third = cache.problem(problem_path)
+
+    assert third is not first
+    assert third.init_facts[0].args == ["b", "a"]
+
+
+def test_parse_cache_rechecks_recently_modified_files_by_content(tmp_path):
+    problem_path = tmp_path / "problem.hddl"
+    _write_problem(problem_path, top="a", bottom="b")
+    cache = HDDLParseCache()
+    first = cache.problem(problem_path)
+    stat = problem_path.stat()
+
+    # Same size and modification time, different content.
+    _write_problem(problem_path, top="b", bottom="a")
+    os.utime(problem_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    second = cache.problem(problem_path)
+
+    assert first.init_facts[0].args == ["a", "b"]
+    assert second.init_facts[0].args == ["b", "a"]
+
+
+def test_parse_cache_pickle_layer_serves_other_cache_instances(tmp_path):
+    domain_path = Path(__file__).parent.parent.parent / "src" / "domains" / "blocksworld" / "domain.hddl"
+    pickle_root = tmp_path / "pickles"
+
+    parsed = HDDLParseCache(pickle_root=pickle_root).domain(domain_path)
+    reloaded_cache = HDDLParseCache(pickle_root=pickle_root)
+    reloaded = reloaded_cache.domain(domain_path)
+
+    assert list(pickle_root.glob("*/*.pickle"))
+    assert reloaded_cache.stats["pickle_hits"] == 1
+    assert reloaded_cache.stats["misses"] == 0
+    assert reloaded == parsed
@@ -219,3 +219,71 @@ def test_transport_hddl_domain_exposes_tasks_methods_and_actions():
     assert "deliver" in task_names
     assert "m-deliver" in method_names
     assert "drive" in action_names
+
+
+def test_domain_parser_drops_comments_and_keeps_formula_spelling(tmp_path):
+    domain_path = tmp_path / "commented_domain.hddl"
+    domain_path.write_text(
+        """
+(define (domain demo) ; trailing comment with (parens
+ (:requirements :typing :hierarchy)
+ (:types crate - object)
+ (:predicates (stored ?c - crate) (loose ?c - crate))
+ (:task store :parameters (?c - crate))
+ (:method m-store
+  :parameters (?c - crate)
+  :task (store ?c)
+  :ordered-subtasks (and (t1 (pack ?c)) (t2 (pack ?c)))
+ )
+ (:action pack
+  :parameters (?c - crate)
+  :precondition (and (loose ?c) ; unpacked crates only
+                     )
+  :effect (and (stored ?c)  (not (loose ?c)))
+ )
+)
+        """.strip()
+    )
+
+    domain = HDDLParser.parse_domain(str(domain_path))
+
+    assert domain.name == "demo"
+    assert domain.requirements == [":typing", ":hierarchy"]
+    assert domain.types == ["crate", "-", "object"]
+    assert [predicate.to_signature() for predicate in domain.predicates] == ["stored(C)", "loose(C)"]
+    assert domain.tasks[0].parameters == ["?c - crate"]
+    method = domain.methods[0]
+    assert (method.task_name, method.task_args, method.precondition) == ("store", ["?c"], "none")
+    assert method.ordering == [("t1", "t2")]
+    action = domain.actions[0]
+    assert action.preconditions == "(and (loose ?c) )"
+    assert action.effects == "(and (stored ?c) (not (loose ?c)))"
+
+
+def test_problem_parser_reads_large_init_sections(tmp_path):
+    problem_path = tmp_path / "large_problem.hddl"
+    facts = "\n".join(f"  (road l{index} l{index + 1}) ; edge {index}" for index in range(10000))
+    problem_path.write_text(
+        f"(define (problem big) (:domain transport)\n (:objects l0 l1 - location)\n"
+        f" (:init\n{facts}\n  (not (road l1 l0)))\n (:goal (and (road l0 l1))))\n"
+    )
+
+    problem = HDDLParser.parse_problem(str(problem_path))
+
+    assert len(problem.init_facts) == 10001
+    assert problem.init_facts[9999].args == ["l9999", "l10000"]
+    assert problem.init_facts[-1].to_signature() == "not road(l1, l0)"
+    assert [fact.to_signature() for fact in problem.goal_facts] == ["road(l0, l1)"]
+    assert problem.object_types == {"l0": "location", "l1": "location"}
+
+
+def test_parser_reports_unbalanced_parentheses(tmp_path):
+    problem_path = tmp_path / "broken_problem.hddl"
+    problem_path.write_text("(define (problem broken) (:domain demo) (:init (on a b)")
+
+    try:
+        HDDLParser.parse_problem(str(problem_path))
+    except ValueError as error:
+        assert "Unclosed HDDL block" in str(error)
+    else:
+        raise AssertionError("expected a ValueError for unbalanced parentheses")
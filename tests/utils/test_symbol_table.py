@@ -0,0 +1,87 @@
+"""
+Focused tests for the per-problem symbol table and integer-encoded atoms.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+_src_dir = str(Path(__file__).parent.parent.parent / "src")
+if _src_dir not in sys.path:
+	sys.path.insert(0, _src_dir)
+
+from utils.hddl_parser import HDDLParser
+from utils.symbol_normalizer import SymbolNormalizer
+from utils.symbol_table import GroundAtom, SymbolTable
+
+TRANSPORT_ROOT = Path(__file__).parent.parent.parent / "src" / "domains" / "transport"
+
+
+def test_symbol_table_encodes_every_textual_form_to_the_same_atom():
+	table = SymbolTable()
+
+	atom = table.encode_hddl("(at-robby truck-0 city-loc-1)")
+
+	assert isinstance(atom, GroundAtom)
+	assert atom.arity == 2
+	assert table.decode_args(atom) == ("truck-0", "city-loc-1")
+	assert table.encode_agentspeak('at_robby("truck-0","city-loc-1")') == atom
+	assert table.encode_agentspeak("at_robby('truck-0', 'city-loc-1')") == atom
+	assert table.decode_hddl(atom) == "(at-robby truck-0 city-loc-1)"
+	assert table.decode_agentspeak(atom) == 'at_robby("truck-0","city-loc-1")'
+	assert table.decode_propositional(atom) == SymbolNormalizer().create_propositional_symbol(
+		"at-robby",
+		["truck-0", "city-loc-1"],
+	)
+	assert table.encode_propositional(table.decode_propositional(atom)) == atom
+	assert table.encode_agentspeak("handempty") == table.encode_hddl("(handempty)")
+	assert table.encode_hddl("(not (handempty))") is None
+	assert table.encode_hddl("(= a b)") is None
+	assert pickle.loads(pickle.dumps(atom)) == atom
+
+
+def test_symbol_table_for_problem_interns_objects_types_and_facts():
+	domain = HDDLParser.parse_domain(str(TRANSPORT_ROOT / "domain.hddl"))
+	problem_file = sorted((TRANSPORT_ROOT / "problems").glob("*.hddl"))[0]
+	problem = HDDLParser.parse_problem(str(problem_file))
+
+	table = SymbolTable.for_problem(problem, domain)
+	size = len(table)
+
+	for fact in problem.init_facts:
+		atom = table.encode_fact(fact)
+		assert table.encode_hddl(table.decode_hddl(atom)) == atom
+		assert table.encode_agentspeak(table.decode_agentspeak(atom)) == atom
+	assert len(table) == size
+	assert all(code < size for code in table.encode_fact(problem.init_facts[0]))
+	first_object = problem.objects[0]
+	assert table.object_type(first_object) == problem.object_types[first_object]
+
+
+def test_symbol_table_numbers_atoms_for_bitsets_and_parses_written_functors():
+	table = SymbolTable()
+	on_ab = table.encode_agentspeak("on(a, b)")
+	put_down = table.encode_agentspeak('put-down("b-1", f(x, y))')
+
+	assert table.symbol(put_down.predicate_id) == "put-down"
+	assert table.decode_args(put_down) == ("b-1", "f(x, y)")
+	assert table.encode_agentspeak("on(a") is None
+	assert table.encode_agentspeak("not on(a)") is None
+	assert table.atoms(table.mask([put_down, on_ab])) == (put_down, on_ab)
+	assert table.bit(on_ab) == 2 and table.atom_count == 2
+	assert table.find("on", ("a", "b")) == on_ab
+	assert table.find("on", ("a", "c")) is None
+	size = len(table)
+	table.clear()
+	assert len(table) == 0 and table.atom_count == 0 and size > 0
+	assert table.encode_agentspeak("on(a, b)") == GroundAtom(0, (1, 2))
+
+
+def test_symbol_normalizer_parses_predicate_strings_through_its_table():
+	normalizer = SymbolNormalizer()
+
+	assert normalizer.parse_predicate_string('at("truck-0", l1)') == ("at", ["truck-0", "l1"])
+	assert normalizer.parse_predicate_string("handempty") == ("handempty", [])
+	assert normalizer.symbols.encode_agentspeak("at(truck-0,l1)") == normalizer.symbols.encode_agentspeak(
+		'at("truck-0", l1)',
+	)